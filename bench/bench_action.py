@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"""Time the element matrix of a bilinear form against its action.
+
+The action on a vector of trial function dofs is generated with the
+FFC parameter generate_action, for Lagrange elements of increasing
+degree.
+
+For example:
+
+    python bench_action.py --cells tetrahedron hexahedron --degrees 1 2 3 4
+
+The bilinear form is (1 + f^2) grad(u).grad(v) dx, compiled with the
+default parameters and with enable_tensor_factorization, which sum
+factorises the evaluation of the trial function and the contraction
+with the test function in the action kernel. The time of the product
+of the element matrix with the vector is not included in the time of
+tabulate_tensor.
+"""
+
+import argparse
+
+import ffc.codegeneration.jit
+import ufl
+from bench_kernels import time_form
+from utils import print_table
+
+
+def weighted_laplace_form(cellname, degree):
+    element = ufl.FiniteElement("Lagrange", getattr(ufl, cellname), degree)
+    u = ufl.TrialFunction(element)
+    v = ufl.TestFunction(element)
+    f = ufl.Coefficient(element)
+    return (1 + f**2) * ufl.inner(ufl.grad(u), ufl.grad(v)) * ufl.dx
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cells", nargs="+", default=["tetrahedron", "hexahedron"],
+                        choices=["triangle", "tetrahedron", "quadrilateral", "hexahedron"])
+    parser.add_argument("--degrees", type=int, nargs="+", default=[1, 2, 3, 4])
+    parser.add_argument("-n", "--num-calls", type=int, default=1000,
+                        help="number of kernel calls to average over")
+    parser.add_argument("--cache-dir", type=str, default="bench_cache")
+    args = parser.parse_args()
+
+    variants = [("", {}), (" factorized", {"enable_tensor_factorization": True})]
+
+    table = {}
+    i = 0
+    for cellname in args.cells:
+        for degree in args.degrees:
+            form = weighted_laplace_form(cellname, degree)
+            row = "{} P{}".format(cellname, degree)
+            for j, (vname, vparameters) in enumerate(variants):
+                parameters = dict(vparameters, generate_action=True, cache_dir=args.cache_dir)
+                compiled_forms, module = ffc.codegeneration.jit.compile_forms([form], parameters=parameters)
+                timings = time_form(compiled_forms[0], form, args.num_calls, args.cache_dir)
+                table[(i, 2 * j)] = (row, "tensor" + vname, "{:.3g} us".format(1e6 * timings["cell"]))
+                table[(i, 2 * j + 1)] = (row, "action" + vname, "{:.3g} us".format(1e6 * timings["cell_action"]))
+            i += 1
+
+    print_table(table, "tabulate_tensor")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"""Time cell kernels of Lagrange elements with and without sum factorisation.
+
+The elements are of increasing degree.
+
+For example:
+
+    python bench_degree_sweep.py --cell tetrahedron --degrees 2 3 4 5 6
+
+For each degree p the bilinear form (1 + f^2) grad(u).grad(v) dx and
+the linear form f^3 v dx + grad(f).grad(v) dx are compiled with the
+default parameters and with enable_tensor_factorization, which on
+triangles and tetrahedra applies to quadrature degrees above 6 where
+the default rule is a collapsed Gauss-Jacobi rule. There the dense
+change of basis to the element dofs keeps the cost of the same order as
+the default kernels, so only a constant factor is gained.
+"""
+
+import argparse
+
+import ffc.codegeneration.jit
+import ufl
+from bench_kernels import time_form
+from utils import print_table
+
+
+def sweep_forms(cellname, degree):
+    element = ufl.FiniteElement("Lagrange", getattr(ufl, cellname), degree)
+    u = ufl.TrialFunction(element)
+    v = ufl.TestFunction(element)
+    f = ufl.Coefficient(element)
+    a = (1 + f**2) * ufl.inner(ufl.grad(u), ufl.grad(v)) * ufl.dx
+    L = f**3 * v * ufl.dx + ufl.inner(ufl.grad(f), ufl.grad(v)) * ufl.dx
+    return [("bilinear", a), ("linear", L)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cell", default="tetrahedron",
+                        choices=["triangle", "tetrahedron", "quadrilateral", "hexahedron"])
+    parser.add_argument("--degrees", type=int, nargs="+", default=[2, 3, 4, 5, 6])
+    parser.add_argument("-n", "--num-calls", type=int, default=1000,
+                        help="number of kernel calls to average over")
+    parser.add_argument("--cache-dir", type=str, default="bench_cache")
+    args = parser.parse_args()
+
+    variants = [("default", {}), ("factorized", {"enable_tensor_factorization": True})]
+
+    table = {}
+    i = 0
+    for degree in args.degrees:
+        for name, form in sweep_forms(args.cell, degree):
+            for j, (vname, vparameters) in enumerate(variants):
+                parameters = dict(vparameters, cache_dir=args.cache_dir)
+                compiled_forms, module = ffc.codegeneration.jit.compile_forms([form], parameters=parameters)
+                timings = time_form(compiled_forms[0], form, args.num_calls, args.cache_dir)
+                row = "{} P{} {}".format(args.cell, degree, name)
+                table[(i, j)] = (row, vname, "{:.3g} us".format(1e6 * timings["cell"]))
+            i += 1
+
+    print_table(table, "tabulate_tensor")
+
+
+if __name__ == "__main__":
+    main()
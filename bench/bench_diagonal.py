@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"""Time the element matrix of a bilinear form against its diagonal.
+
+The diagonal is generated with the FFC parameter generate_diagonal,
+for Lagrange elements of increasing degree.
+
+For example:
+
+    python bench_diagonal.py --cells tetrahedron hexahedron --degrees 1 2 3 4
+
+The bilinear forms are the mass matrix, with all blocks preintegrated,
+and (1 + f^2) grad(u).grad(v) dx, with blocks accumulated in the
+quadrature loop. The element matrix is compiled with the default
+parameters and with enable_tensor_factorization.
+"""
+
+import argparse
+
+import ffc.codegeneration.jit
+import ufl
+from bench_kernels import time_form
+from utils import print_table
+
+
+def mass_form(cellname, degree):
+    element = ufl.FiniteElement("Lagrange", getattr(ufl, cellname), degree)
+    u = ufl.TrialFunction(element)
+    v = ufl.TestFunction(element)
+    return u * v * ufl.dx
+
+
+def weighted_laplace_form(cellname, degree):
+    element = ufl.FiniteElement("Lagrange", getattr(ufl, cellname), degree)
+    u = ufl.TrialFunction(element)
+    v = ufl.TestFunction(element)
+    f = ufl.Coefficient(element)
+    return (1 + f**2) * ufl.inner(ufl.grad(u), ufl.grad(v)) * ufl.dx
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cells", nargs="+", default=["tetrahedron", "hexahedron"],
+                        choices=["triangle", "tetrahedron", "quadrilateral", "hexahedron"])
+    parser.add_argument("--degrees", type=int, nargs="+", default=[1, 2, 3, 4])
+    parser.add_argument("-n", "--num-calls", type=int, default=1000,
+                        help="number of kernel calls to average over")
+    parser.add_argument("--cache-dir", type=str, default="bench_cache")
+    args = parser.parse_args()
+
+    forms = [("mass", mass_form), ("weighted Laplace", weighted_laplace_form)]
+    variants = [("", {}), (" factorized", {"enable_tensor_factorization": True})]
+
+    table = {}
+    i = 0
+    for fname, form_fn in forms:
+        for cellname in args.cells:
+            for degree in args.degrees:
+                form = form_fn(cellname, degree)
+                row = "{} {} P{}".format(fname, cellname, degree)
+                for j, (vname, vparameters) in enumerate(variants):
+                    parameters = dict(vparameters, generate_diagonal=True, cache_dir=args.cache_dir)
+                    compiled_forms, module = ffc.codegeneration.jit.compile_forms([form], parameters=parameters)
+                    timings = time_form(compiled_forms[0], form, args.num_calls, args.cache_dir)
+                    table[(i, j)] = (row, "tensor" + vname, "{:.3g} us".format(1e6 * timings["cell"]))
+                # The diagonal kernel does not depend on the variant
+                table[(i, len(variants))] = (row, "diagonal", "{:.3g} us".format(1e6 * timings["cell_diagonal"]))
+                i += 1
+
+    print_table(table, "tabulate_tensor")
+
+
+if __name__ == "__main__":
+    main()
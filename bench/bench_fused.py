@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"""Time the cell kernels of a Newton iteration, separate and fused.
+
+The element vector of a residual F and the element matrix of its
+Jacobian J = derivative(F, u) are computed by separate kernels and by
+the fused kernel generated with the FFC parameter fuse_forms.
+
+For example:
+
+    python bench_fused.py --degrees 1 2
+
+The forms are a hyperelastic St. Venant-Kirchhoff material on
+tetrahedra and a nonlinear Poisson equation on triangles.
+"""
+
+import argparse
+
+import ffc.codegeneration.jit
+import ufl
+from bench_kernels import time_form
+from utils import print_table
+
+
+def hyperelasticity_forms(degree):
+    cell = ufl.tetrahedron
+    element = ufl.VectorElement("Lagrange", cell, degree)
+    v = ufl.TestFunction(element)
+    u = ufl.Coefficient(element)
+    B = ufl.Coefficient(element)
+    mu = ufl.Constant(cell)
+    lmbda = ufl.Constant(cell)
+
+    I = ufl.Identity(3)  # noqa: E741
+    F = I + ufl.grad(u)
+    E = ufl.variable((F.T * F - I) / 2)
+    psi = lmbda / 2 * ufl.tr(E)**2 + mu * ufl.tr(E * E)
+    S = ufl.diff(psi, E)
+    L = ufl.inner(F * S, ufl.grad(v)) * ufl.dx - ufl.inner(B, v) * ufl.dx
+    return L, ufl.derivative(L, u)
+
+
+def nonlinear_poisson_forms(degree):
+    cell = ufl.triangle
+    element = ufl.FiniteElement("Lagrange", cell, degree)
+    v = ufl.TestFunction(element)
+    u = ufl.Coefficient(element)
+    f = ufl.Coefficient(element)
+    L = (1 + u**2) * ufl.inner(ufl.grad(u), ufl.grad(v)) * ufl.dx - f * v * ufl.dx
+    return L, ufl.derivative(L, u)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--degrees", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("-n", "--num-calls", type=int, default=1000,
+                        help="number of kernel calls to average over")
+    parser.add_argument("--cache-dir", type=str, default="bench_cache")
+    args = parser.parse_args()
+
+    cases = [("hyperelasticity", hyperelasticity_forms), ("nonlinear Poisson", nonlinear_poisson_forms)]
+
+    table = {}
+    i = 0
+    for name, forms in cases:
+        for degree in args.degrees:
+            L, a = forms(degree)
+            parameters = {"fuse_forms": True, "cache_dir": args.cache_dir}
+            compiled_forms, module = ffc.codegeneration.jit.compile_forms([a, L], parameters=parameters)
+            timings = time_form(compiled_forms[0][0], a, args.num_calls, args.cache_dir, residual=L)
+            residual_timings = time_form(compiled_forms[1][0], L, args.num_calls, args.cache_dir)
+
+            row = "{} P{}".format(name, degree)
+            separate = timings["cell"] + residual_timings["cell"]
+            table[(i, 0)] = (row, "J", "{:.3g} us".format(1e6 * timings["cell"]))
+            table[(i, 1)] = (row, "F", "{:.3g} us".format(1e6 * residual_timings["cell"]))
+            table[(i, 2)] = (row, "J + F", "{:.3g} us".format(1e6 * separate))
+            table[(i, 3)] = (row, "fused", "{:.3g} us".format(1e6 * timings["cell_fused"]))
+            table[(i, 4)] = (row, "speedup", "{:.2f}".format(separate / timings["cell_fused"]))
+            i += 1
+
+    print_table(table, "tabulate_tensor")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"""Measure the time and peak memory of computing the intermediate representation.
+
+The forms are read from the form files given on the command line.
+
+For example:
+
+    python bench_ir.py HyperElasticity.ufl Convection_3D_2.ufl -r 3
+
+The IR time is the best of several runs. The peak memory is the
+largest amount of memory allocated by Python, as reported by
+tracemalloc, while computing the IR in a separate run.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import ufl
+from ffc.analysis import analyze_ufl_objects
+from ffc.ir.representation import compute_ir
+from ffc.parameters import validate_parameters
+from utils import print_table
+
+
+def ir_time_and_memory(forms, parameters, repeat):
+    """Return (seconds, peak bytes) of compute_ir for forms."""
+    seconds = []
+    for i in range(repeat):
+        analysis = analyze_ufl_objects(forms, parameters)
+        t0 = time.perf_counter()
+        compute_ir(analysis, {}, "bench", parameters)
+        seconds.append(time.perf_counter() - t0)
+
+    analysis = analyze_ufl_objects(forms, parameters)
+    tracemalloc.start()
+    compute_ir(analysis, {}, "bench", parameters)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(seconds), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("ufl_file", nargs="+", help="UFL form files to benchmark")
+    parser.add_argument("-f", action="append", default=[], nargs=2, dest="f",
+                        metavar=("name", "value"), help="FFC parameter")
+    parser.add_argument("-r", "--repeat", type=int, default=3,
+                        help="number of runs to take the best time from")
+    args = parser.parse_args()
+
+    parameters = validate_parameters(dict(args.f))
+
+    table = {}
+    for i, filename in enumerate(args.ufl_file):
+        forms = ufl.algorithms.load_ufl_file(filename).forms
+        seconds, peak = ir_time_and_memory(forms, parameters, args.repeat)
+        table[(i, 0)] = (filename, "IR time", "{:.3f} s".format(seconds))
+        table[(i, 1)] = (filename, "peak memory", "{:.1f} MB".format(peak / 2**20))
+
+    print_table(table, "compute_ir")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+r"""Time generated tabulate_tensor kernels for the form files given on the command line.
+
+The kernels are compiled for one or more sets of FFC parameters.
+
+For example:
+
+    python bench_kernels.py Poisson_3D_2.ufl HyperElasticity.ufl \
+        -f quadrature_degree 8 \
+        --variant default quadrature_rule=default \
+        --variant symmetric quadrature_rule=symmetric
+
+Each cell and exterior facet integral is JIT compiled with cffi and
+called repeatedly from a C loop on a reference cell with random
+coefficient values, so that the Python call overhead is not measured.
+
+Cell integrals compiled with tabulate_tensor_batch, e.g. with
+
+    python bench_kernels.py Poisson_2D_1.ufl --variant batch batch_width=4
+
+are also timed on a batch of cells, reported per cell as cell_batch.
+Cell integrals of bilinear forms compiled with tabulate_tensor_fused,
+with the FFC parameter fuse_forms, are timed by bench_fused.py, and
+those compiled with tabulate_action, with the FFC parameter
+generate_action, are timed as cell_action. The diagonal of the element
+matrix, compiled with the FFC parameter generate_diagonal, is timed as
+cell_diagonal.
+"""
+
+import argparse
+import time
+
+import cffi
+import numpy
+
+import ffc.codegeneration.jit
+import ufl
+from ffc.fiatinterface import create_element, reference_cell_vertices
+from utils import print_table
+
+_timer_source = """
+#include <time.h>
+
+typedef void (*cell_kernel)(void* A, const void* w, const double* coordinate_dofs,
+                            int cell_orientation);
+typedef void (*exterior_facet_kernel)(void* A, const void* w, const double* coordinate_dofs,
+                                      int facet, int cell_orientation);
+typedef void (*cell_batch_kernel)(void* A, const void* w, const double* coordinate_dofs,
+                                  const int* cell_orientations, int num_cells);
+typedef void (*cell_fused_kernel)(void* A, void* b, const void* w, const double* coordinate_dofs,
+                                  int cell_orientation);
+typedef void (*cell_action_kernel)(void* A, const void* x, const void* w,
+                                   const double* coordinate_dofs, int cell_orientation);
+
+static double elapsed(struct timespec t0, struct timespec t1)
+{
+  return (t1.tv_sec - t0.tv_sec) + 1e-9 * (t1.tv_nsec - t0.tv_nsec);
+}
+
+double time_cell_kernel(uintptr_t f, void* A, const void* w, const double* coordinate_dofs,
+                        int num_facets, int n)
+{
+  struct timespec t0, t1;
+  clock_gettime(CLOCK_MONOTONIC, &t0);
+  for (int i = 0; i < n; ++i)
+    ((cell_kernel)f)(A, w, coordinate_dofs, 0);
+  clock_gettime(CLOCK_MONOTONIC, &t1);
+  return elapsed(t0, t1) / n;
+}
+
+double time_exterior_facet_kernel(uintptr_t f, void* A, const void* w,
+                                  const double* coordinate_dofs, int num_facets, int n)
+{
+  struct timespec t0, t1;
+  clock_gettime(CLOCK_MONOTONIC, &t0);
+  for (int i = 0; i < n; ++i)
+    ((exterior_facet_kernel)f)(A, w, coordinate_dofs, i % num_facets, 0);
+  clock_gettime(CLOCK_MONOTONIC, &t1);
+  return elapsed(t0, t1) / n;
+}
+
+double time_cell_batch_kernel(uintptr_t f, void* A, const void* w,
+                              const double* coordinate_dofs, int num_cells, int n)
+{
+  struct timespec t0, t1;
+  clock_gettime(CLOCK_MONOTONIC, &t0);
+  for (int i = 0; i < n; ++i)
+    ((cell_batch_kernel)f)(A, w, coordinate_dofs, NULL, num_cells);
+  clock_gettime(CLOCK_MONOTONIC, &t1);
+  return elapsed(t0, t1) / n / num_cells;
+}
+
+double time_cell_fused_kernel(uintptr_t f, void* A, void* b, const void* w,
+                              const double* coordinate_dofs, int n)
+{
+  struct timespec t0, t1;
+  clock_gettime(CLOCK_MONOTONIC, &t0);
+  for (int i = 0; i < n; ++i)
+    ((cell_fused_kernel)f)(A, b, w, coordinate_dofs, 0);
+  clock_gettime(CLOCK_MONOTONIC, &t1);
+  return elapsed(t0, t1) / n;
+}
+
+double time_cell_action_kernel(uintptr_t f, void* A, const void* x, const void* w,
+                               const double* coordinate_dofs, int n)
+{
+  struct timespec t0, t1;
+  clock_gettime(CLOCK_MONOTONIC, &t0);
+  for (int i = 0; i < n; ++i)
+    ((cell_action_kernel)f)(A, x, w, coordinate_dofs, 0);
+  clock_gettime(CLOCK_MONOTONIC, &t1);
+  return elapsed(t0, t1) / n;
+}
+"""
+
+_timer_cdef = """
+double time_cell_kernel(uintptr_t f, void* A, const void* w, const double* coordinate_dofs,
+                        int num_facets, int n);
+double time_exterior_facet_kernel(uintptr_t f, void* A, const void* w,
+                                  const double* coordinate_dofs, int num_facets, int n);
+double time_cell_batch_kernel(uintptr_t f, void* A, const void* w,
+                              const double* coordinate_dofs, int num_cells, int n);
+double time_cell_fused_kernel(uintptr_t f, void* A, void* b, const void* w,
+                              const double* coordinate_dofs, int n);
+double time_cell_action_kernel(uintptr_t f, void* A, const void* x, const void* w,
+                               const double* coordinate_dofs, int n);
+"""
+
+_timer_lib = None
+
+
+def timer_lib(cache_dir):
+    """Build (once) and return the C timing loops."""
+    global _timer_lib
+    if _timer_lib is None:
+        import importlib
+        import sys
+        ffibuilder = cffi.FFI()
+        ffibuilder.set_source("_ffc_bench_timer", _timer_source, extra_compile_args=["-O2"])
+        ffibuilder.cdef(_timer_cdef)
+        ffibuilder.compile(tmpdir=cache_dir, verbose=False)
+        sys.path.insert(0, cache_dir)
+        _timer_lib = importlib.import_module("_ffc_bench_timer")
+    return _timer_lib
+
+
+def form_arrays(form, scalar_type=numpy.float64):
+    """Allocate element tensor, coefficient and coordinate arrays for form."""
+    shape = [create_element(a.ufl_element()).space_dimension() for a in form.arguments()]
+    num_w = sum(create_element(c.ufl_element()).space_dimension() for c in form.coefficients())
+    cellname = form.ufl_domain().ufl_cell().cellname()
+    coords = numpy.array(reference_cell_vertices(cellname), dtype=numpy.float64)
+    # Perturb vertices slightly to avoid hitting special cases
+    coords = coords + 0.01 * numpy.random.random(coords.shape)
+    A = numpy.zeros(shape, dtype=scalar_type)
+    w = numpy.random.random(max(num_w, 1)).astype(scalar_type)
+    return A, w, coords.flatten()
+
+
+def batch_arrays(A, w, coords, num_cells):
+    """Replicate single cell arrays for num_cells cells, cell index innermost."""
+    return tuple(numpy.repeat(x.reshape(-1, 1), num_cells, axis=1) for x in (A, w, coords))
+
+
+def time_form(ufc_form, form, num_calls, cache_dir, num_cells=64, residual=None):
+    """Return {integral_type: seconds per call} for the default integrals of ufc_form.
+
+    Batched cell integrals are timed on num_cells cells and reported
+    per cell as "cell_batch". If the linear form residual is given, the
+    fused cell integral computing the element tensors of both forms is
+    reported as "cell_fused". The action of cell integrals of bilinear
+    forms is reported as "cell_action", and their diagonal as
+    "cell_diagonal".
+    """
+    lib = timer_lib(cache_dir)
+    ffi = lib.ffi
+    A, w, coords = form_arrays(form)
+    A_ptr = ffi.cast("void *", ffi.from_buffer(A))
+    w_ptr = ffi.cast("void *", ffi.from_buffer(w))
+    c_ptr = ffi.cast("double *", ffi.from_buffer(coords))
+    num_facets = form.ufl_domain().ufl_cell().num_facets()
+    timings = {}
+    integral_types = [("cell", lib.lib.time_cell_kernel),
+                      ("exterior_facet", lib.lib.time_exterior_facet_kernel)]
+    for integral_type, timer in integral_types:
+        if getattr(ufc_form, "num_{}_integrals".format(integral_type)) == 0:
+            continue
+        integral = getattr(ufc_form, "create_{}_integral".format(integral_type))(-1)
+        if integral == ffi.NULL:
+            continue
+        f = int(ffi.cast("uintptr_t", integral.tabulate_tensor))
+        timer(f, A_ptr, w_ptr, c_ptr, num_facets, max(num_calls // 10, 1))  # warm up
+        timings[integral_type] = timer(f, A_ptr, w_ptr, c_ptr, num_facets, num_calls)
+
+        if integral_type == "cell" and integral.tabulate_tensor_batch != ffi.NULL:
+            A_batch, w_batch, c_batch = batch_arrays(A, w, coords, num_cells)
+            f = int(ffi.cast("uintptr_t", integral.tabulate_tensor_batch))
+            args = (ffi.cast("void *", ffi.from_buffer(A_batch)),
+                    ffi.cast("void *", ffi.from_buffer(w_batch)),
+                    ffi.cast("double *", ffi.from_buffer(c_batch)), num_cells)
+            num_batch_calls = max(num_calls // num_cells, 1)
+            lib.lib.time_cell_batch_kernel(f, *args, max(num_batch_calls // 10, 1))  # warm up
+            timings["cell_batch"] = lib.lib.time_cell_batch_kernel(f, *args, num_batch_calls)
+
+        if integral_type == "cell" and residual is not None and integral.tabulate_tensor_fused != ffi.NULL:
+            # The fused kernel takes the coefficients of the residual
+            b, w_fused, _ = form_arrays(residual)
+            f = int(ffi.cast("uintptr_t", integral.tabulate_tensor_fused))
+            args = (A_ptr, ffi.cast("void *", ffi.from_buffer(b)),
+                    ffi.cast("void *", ffi.from_buffer(w_fused)), c_ptr)
+            lib.lib.time_cell_fused_kernel(f, *args, max(num_calls // 10, 1))  # warm up
+            timings["cell_fused"] = lib.lib.time_cell_fused_kernel(f, *args, num_calls)
+
+        if integral_type == "cell" and integral.tabulate_action != ffi.NULL:
+            x = numpy.random.random(A.shape[1]).astype(A.dtype)
+            f = int(ffi.cast("uintptr_t", integral.tabulate_action))
+            args = (A_ptr, ffi.cast("void *", ffi.from_buffer(x)), w_ptr, c_ptr)
+            lib.lib.time_cell_action_kernel(f, *args, max(num_calls // 10, 1))  # warm up
+            timings["cell_action"] = lib.lib.time_cell_action_kernel(f, *args, num_calls)
+
+        if integral_type == "cell" and integral.tabulate_diagonal != ffi.NULL:
+            f = int(ffi.cast("uintptr_t", integral.tabulate_diagonal))
+            timer(f, A_ptr, w_ptr, c_ptr, num_facets, max(num_calls // 10, 1))  # warm up
+            timings["cell_diagonal"] = timer(f, A_ptr, w_ptr, c_ptr, num_facets, num_calls)
+    return timings
+
+
+def parse_variant(name, assignments):
+    parameters = {}
+    for assignment in assignments:
+        key, value = assignment.split("=", 1)
+        parameters[key] = value
+    return name, parameters
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("ufl_file", nargs="+", help="UFL form files to benchmark")
+    parser.add_argument("-f", action="append", default=[], nargs=2, dest="f",
+                        metavar=("name", "value"), help="parameter common to all variants")
+    parser.add_argument("--variant", action="append", default=[], nargs="+",
+                        metavar="NAME [KEY=VALUE ...]", help="named set of parameters")
+    parser.add_argument("-n", "--num-calls", type=int, default=20000,
+                        help="number of kernel calls to average over")
+    parser.add_argument("--cache-dir", type=str, default="bench_cache")
+    args = parser.parse_args()
+
+    variants = [parse_variant(v[0], v[1:]) for v in args.variant] or [("default", {})]
+    common = dict(args.f)
+    common["cache_dir"] = args.cache_dir
+
+    table = {}
+    rows = []
+    for j, (vname, vparameters) in enumerate(variants):
+        parameters = dict(common)
+        parameters.update(vparameters)
+        for filename in args.ufl_file:
+            ufd = ufl.algorithms.load_ufl_file(filename)
+            t0 = time.time()
+            compiled_forms, module = ffc.codegeneration.jit.compile_forms(
+                ufd.forms, parameters=parameters)
+            compile_time = time.time() - t0
+            for k, (form, compiled) in enumerate(zip(ufd.forms, compiled_forms)):
+                timings = time_form(compiled, form, args.num_calls, args.cache_dir)
+                for integral_type, seconds in sorted(timings.items()):
+                    row = "{} form {} {}".format(filename, k, integral_type)
+                    if row not in rows:
+                        rows.append(row)
+                    i = rows.index(row)
+                    table[(i, j)] = (row, vname, "{:.3g} us".format(1e6 * seconds))
+            print("{} [{}]: compiled in {:.2f} s".format(filename, vname, compile_time))
+
+    # Not all variants time the same kernels
+    for i, row in enumerate(rows):
+        for j, (vname, vparameters) in enumerate(variants):
+            table.setdefault((i, j), (row, vname, "-"))
+
+    print_table(table, "tabulate_tensor")
+
+
+if __name__ == "__main__":
+    main()
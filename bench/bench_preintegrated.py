@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"""Compare preintegrated blocks added in unrolled code and in loops.
+
+The size of the generated C code, the JIT compile time and the kernel
+time of linear elasticity on tetrahedra are compared, with
+preintegrated blocks added to the element tensor in unrolled code and
+in loops.
+
+For example:
+
+    python bench_preintegrated.py --degrees 1 2 3
+
+The variants are the default parameters, all blocks unrolled and all
+blocks in loops over the preintegrated tables.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import ffc.codegeneration.jit
+import ufl
+from bench_kernels import time_form
+from utils import print_table
+
+
+def elasticity_form(degree):
+    element = ufl.VectorElement("Lagrange", ufl.tetrahedron, degree)
+    u = ufl.TrialFunction(element)
+    v = ufl.TestFunction(element)
+    E = ufl.Constant(ufl.tetrahedron)
+    nu = ufl.Constant(ufl.tetrahedron)
+    mu = E / (2 * (1 + nu))
+    lmbda = E * nu / ((1 + nu) * (1 - 2 * nu))
+
+    def epsilon(w):
+        return ufl.sym(ufl.grad(w))
+
+    def sigma(w):
+        return 2 * mu * epsilon(w) + lmbda * ufl.tr(epsilon(w)) * ufl.Identity(3)
+
+    return ufl.inner(sigma(u), epsilon(v)) * ufl.dx
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--degrees", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("-n", "--num-calls", type=int, default=1000,
+                        help="number of kernel calls to average over")
+    parser.add_argument("--cache-dir", type=str, default="bench_cache")
+    args = parser.parse_args()
+
+    variants = [("default", {}), ("unrolled", {"max_unrolled_block_size": 2**31 - 1}),
+                ("loops", {"max_unrolled_block_size": 0})]
+
+    os.makedirs(args.cache_dir, exist_ok=True)
+    sizes, compile_times, kernel_times = {}, {}, {}
+    for i, degree in enumerate(args.degrees):
+        form = elasticity_form(degree)
+        row = "elasticity P{}".format(degree)
+        for j, (vname, vparameters) in enumerate(variants):
+            # Compile in a new cache directory to time the compilation
+            cache_dir = tempfile.mkdtemp(dir=args.cache_dir)
+            parameters = dict(vparameters, cache_dir=cache_dir)
+            t = time.time()
+            compiled_forms, module = ffc.codegeneration.jit.compile_forms([form], parameters=parameters)
+            compile_time = time.time() - t
+            size = sum(os.path.getsize(os.path.join(cache_dir, name))
+                       for name in os.listdir(cache_dir) if name.endswith(".c"))
+            timings = time_form(compiled_forms[0], form, args.num_calls, cache_dir)
+
+            sizes[(i, j)] = (row, vname, "{:.0f} kB".format(size / 1000))
+            compile_times[(i, j)] = (row, vname, "{:.3g} s".format(compile_time))
+            kernel_times[(i, j)] = (row, vname, "{:.3g} us".format(1e6 * timings["cell"]))
+
+    print_table(sizes, "C code size")
+    print_table(compile_times, "JIT compile time")
+    print_table(kernel_times, "tabulate_tensor")
+
+
+if __name__ == "__main__":
+    main()
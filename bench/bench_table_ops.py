@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"""Time clamping of small numbers and stripping of zero columns of tables.
+
+The tables are large tables of high order elements, and the vectorised
+table operations are compared to per number and per column reference
+implementations.
+
+For example:
+
+    python bench_table_ops.py -d 4 6 8 -r 10
+"""
+
+import argparse
+import time
+
+import numpy
+
+from ffc.fiatinterface import create_element, create_quadrature
+from ffc.ir.uflacs.elementtables import (clamp_table_small_numbers, default_atol, default_rtol,
+                                         strip_table_zeros)
+from ufl import FiniteElement, VectorElement, tetrahedron
+from utils import print_table
+
+
+def reference_clamp_table_small_numbers(table, rtol=default_rtol, atol=default_atol,
+                                        numbers=(-1.0, -0.5, 0.0, 0.5, 1.0)):
+    table = numpy.asarray(table)
+    for n in numbers:
+        table[numpy.where(numpy.isclose(table, n, rtol=rtol, atol=atol))] = n
+    return table
+
+
+def reference_nonzero_columns(table, rtol=default_rtol, atol=default_atol):
+    z = numpy.zeros(table.shape[:-1])
+    return tuple(i for i in range(table.shape[-1])
+                 if not numpy.allclose(z, table[..., i], rtol=rtol, atol=atol))
+
+
+def derivative_tables(degree):
+    """Tables (entity, point, dof) of first derivatives of a vector Lagrange element.
+
+    The tables are of the first component of the element on a
+    tetrahedron, one per derivative direction.
+    """
+    element = create_element(VectorElement(FiniteElement("Lagrange", tetrahedron, degree)))
+    points, weights = create_quadrature("tetrahedron", 2 * degree, "default")
+    values = element.tabulate(1, points)
+    return [values[d][:, 0, :].transpose()[numpy.newaxis, ...]
+            for d in [(1, 0, 0), (0, 1, 0), (0, 0, 1)]]
+
+
+def best_time(f, tables, repeat):
+    seconds = []
+    for i in range(repeat):
+        copies = [t.copy() for t in tables]
+        t0 = time.perf_counter()
+        for t in copies:
+            f(t)
+        seconds.append(time.perf_counter() - t0)
+    return min(seconds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-d", "--degree", type=int, nargs="+", default=[4, 6, 8],
+                        help="Lagrange element degrees")
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+                        help="number of runs to take the best time from")
+    args = parser.parse_args()
+
+    table = {}
+    for i, degree in enumerate(args.degree):
+        tables = derivative_tables(degree)
+        row = "P{} {}".format(degree, "x".join(str(n) for n in tables[0].shape))
+
+        for t in tables:
+            clamped = clamp_table_small_numbers(t.copy())
+            assert numpy.array_equal(clamped, reference_clamp_table_small_numbers(t.copy()))
+            assert strip_table_zeros(clamped, True)[1] == reference_nonzero_columns(clamped)
+
+        results = [("clamp", clamp_table_small_numbers),
+                   ("clamp (reference)", reference_clamp_table_small_numbers),
+                   ("strip zeros", lambda t: strip_table_zeros(t, True)),
+                   ("strip zeros (reference)", reference_nonzero_columns)]
+        for j, (name, f) in enumerate(results):
+            seconds = best_time(f, tables, args.repeat)
+            table[(i, j)] = (row, name, "{:.2f} ms".format(1e3 * seconds))
+
+    print_table(table, "table operations")
+
+
+if __name__ == "__main__":
+    main()
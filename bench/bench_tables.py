@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"""Measure the scaling of element table deduplication with the number of tables.
+
+build_unique_tables is compared to pairwise comparison of each table
+with all unique tables found before it.
+
+For example:
+
+    python bench_tables.py -n 100 200 400 800 1600
+"""
+
+import argparse
+import time
+
+import numpy
+
+from ffc.ir.uflacs.elementtables import build_unique_tables, equal_tables
+from utils import print_table
+
+
+def pairwise_unique_tables(tables):
+    """Reference deduplication comparing each table to all unique tables."""
+    unique = []
+    mapping = {}
+    for k, t in enumerate(tables):
+        for i, u in enumerate(unique):
+            if equal_tables(u, t):
+                break
+        else:
+            i = len(unique)
+            unique.append(t)
+        mapping[k] = i
+    return unique, mapping
+
+
+def make_tables(n, seed=0):
+    """Make n tables of a few shapes.
+
+    Half of the tables are copies of others with perturbations within
+    the comparison tolerance.
+    """
+    rng = numpy.random.RandomState(seed)
+    shapes = [(1, 6, 3), (1, 6, 6), (3, 4, 3), (4, 12, 10)]
+    tables = []
+    for k in range(n):
+        if k % 2 and tables:
+            t = tables[rng.randint(len(tables))]
+            tables.append(t * (1.0 + 1e-7 * rng.uniform(-1.0, 1.0, t.shape)))
+        else:
+            tables.append(rng.uniform(-1.0, 1.0, shapes[k % len(shapes)]))
+    return tables
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, nargs="+", default=[100, 200, 400, 800, 1600],
+                        help="numbers of tables")
+    args = parser.parse_args()
+
+    table = {}
+    for i, n in enumerate(args.n):
+        tables = make_tables(n)
+        t0 = time.perf_counter()
+        unique, mapping = build_unique_tables(tables)
+        t1 = time.perf_counter()
+        reference_unique, reference_mapping = pairwise_unique_tables(tables)
+        t2 = time.perf_counter()
+        assert mapping == reference_mapping
+        table[(i, 0)] = ("{} tables".format(n), "unique", str(len(unique)))
+        table[(i, 1)] = ("{} tables".format(n), "build_unique_tables", "{:.4f} s".format(t1 - t0))
+        table[(i, 2)] = ("{} tables".format(n), "pairwise", "{:.4f} s".format(t2 - t1))
+
+    print_table(table, "table deduplication")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,7 @@ from collections import namedtuple
 import numpy
 
 import ufl
+from ffc.ir.representationutils import create_quadrature_points_and_weights
 
 logger = logging.getLogger(__name__)
 
@@ -205,6 +206,10 @@ def _analyze_form(form: ufl.form.Form, parameters: typing.Dict) -> ufl.algorithm
         estimated_quadrature_degrees = [integral.metadata()["estimated_polynomial_degree"]
                                         for integral in integral_data.integrals]
 
+        # Integrals with estimated degree, to be split into terms
+        # integrated with separate degrees if requested
+        split_degrees = False
+
         if isinstance(parameters["quadrature_degree"], int):
             # Quadrature degree is forced by FFC paramaters
             qd = parameters["quadrature_degree"]
@@ -215,17 +220,16 @@ def _analyze_form(form: ufl.form.Form, parameters: typing.Dict) -> ufl.algorithm
             # and UFL estimated different degrees we pick maximum
             #
             # Quadrature degree is then unnecessary high for some integrals
-            # in this integral data group, but no approximation error is introduced
-            # TODO: Possibly add warning for user
+            # in this integral data group, but no approximation error is
+            # introduced, unless terms are integrated separately
             qd = max(estimated_quadrature_degrees)
+            split_degrees = (parameters["split_quadrature_degrees"]
+                             and integral_data.integral_type not in ufl.custom_integral_types)
         elif len(quadrature_degrees) > 1:
             raise RuntimeError("Only one quadrature degree allowed within integrals grouped by subdomain.")
         else:
             raise RuntimeError("Unable to determine quadrature degree.")
 
-        tdim = integral_data.domain.topological_dimension()
-        _check_quadrature_degree(qd, tdim)
-
         # ----- Extract common quadrature rule
         #
         # The priority of quadrature rule determination is following
@@ -268,22 +272,117 @@ def _analyze_form(form: ufl.form.Form, parameters: typing.Dict) -> ufl.algorithm
         else:
             raise RuntimeError("Unable to determine quadrature degree.")
 
-        integral_data.metadata["quadrature_degree"] = qd
-        integral_data.metadata["quadrature_rule"] = qr
-        integral_data.metadata["precision"] = p
-
         # Reconstruct integrals to avoid modifying the input integral,
         # which would affect the signature computation if the integral
         # was used again in the user program.  Modifying attributes of
         # form_data.integral_data is less problematic since it's
         # lifetime is internal to the form compiler pipeline.
-        for i, integral in enumerate(integral_data.integrals):
-            integral_data.integrals[i] = integral.reconstruct(
-                metadata={"quadrature_degree": qd, "quadrature_rule": qr, "precision": p})
+        integrals = []
+        for integral in integral_data.integrals:
+            # ----- Extract quadrature point budget
+            #
+            # The priority of quadrature point budget determination is following
+            #
+            # 1. parameters["max_quadrature_points"]
+            # 2. specified in metadata of integral
+            if isinstance(parameters["max_quadrature_points"], int):
+                max_points = parameters["max_quadrature_points"]
+            else:
+                max_points = integral.metadata().get("max_quadrature_points", None)
+
+            if split_degrees:
+                integrands = sorted(_split_integrand_by_degree(integral.integrand(), qd,
+                                                               form_data.element_replace_map).items())
+            else:
+                integrands = [(qd, integral.integrand())]
+            for degree, integrand in integrands:
+                capped_degree = _cap_quadrature_degree(degree, max_points,
+                                                       integral_data.integral_type,
+                                                       integral_data.domain.ufl_cell(), qr)
+                md = {"quadrature_degree": capped_degree, "quadrature_rule": qr, "precision": p}
+                if capped_degree != degree:
+                    md["estimated_quadrature_degree"] = degree
+                integrals.append(integral.reconstruct(integrand=integrand, metadata=md))
+        integral_data.integrals = integrals
+
+        if any("estimated_quadrature_degree" in integral.metadata() for integral in integrals):
+            integral_data.metadata["estimated_quadrature_degree"] = qd
+            qd = max(integral.metadata()["quadrature_degree"] for integral in integrals)
+        integral_data.metadata["quadrature_degree"] = qd
+        integral_data.metadata["quadrature_rule"] = qr
+        integral_data.metadata["precision"] = p
+
+        tdim = integral_data.domain.topological_dimension()
+        _check_quadrature_degree(qd, tdim)
 
     return form_data
 
 
+def _split_integrand_by_degree(integrand, max_degree, element_replace_map):
+    """Split integrand into sums of terms with equal estimated degree.
+
+    Returns {degree: integrand}.
+
+    The integrand has been pulled back and lowered, which raises the
+    estimated degrees, so the degrees are capped at max_degree, the
+    degree estimated by UFL for the integral group.
+
+    """
+    terms = {}
+    for term in _integrand_terms(integrand):
+        degree = ufl.algorithms.estimate_total_polynomial_degree(term, default_degree=1,
+                                                                 element_replace_map=element_replace_map)
+        terms.setdefault(min(degree, max_degree), []).append(term)
+    return {degree: sum(ts[1:], ts[0]) for degree, ts in terms.items()}
+
+
+def _integrand_terms(expr):
+    """Return list of terms of a scalar expression.
+
+    Products and divisions with a single term are distributed over sums
+    (e.g. integral scaling factors).
+    """
+    if isinstance(expr, ufl.classes.Sum):
+        return [t for op in expr.ufl_operands for t in _integrand_terms(op)]
+    elif isinstance(expr, ufl.classes.Product):
+        a, b = [_integrand_terms(op) for op in expr.ufl_operands]
+        if len(a) == 1:
+            return [a[0] * t for t in b]
+        elif len(b) == 1:
+            return [t * b[0] for t in a]
+    elif isinstance(expr, ufl.classes.Division):
+        a, b = expr.ufl_operands
+        return [t / b for t in _integrand_terms(a)]
+    elif isinstance(expr, ufl.classes.Conj):
+        return [ufl.conj(t) for t in _integrand_terms(expr.ufl_operands[0])]
+    return [expr]
+
+
+def _cap_quadrature_degree(degree: int, max_points: typing.Optional[int], integral_type: str,
+                           cell: ufl.Cell, rule: str) -> int:
+    """Return the highest quadrature degree with at most max_points points.
+
+    The returned degree is not above degree.
+
+    """
+    if max_points is None or integral_type in ufl.custom_integral_types:
+        return degree
+
+    capped_degree = degree
+    while capped_degree > 0:
+        points, weights = create_quadrature_points_and_weights(integral_type, cell, capped_degree, rule)
+        if len(weights) <= max_points:
+            break
+        capped_degree -= 1
+
+    if capped_degree != degree:
+        warnings.warn(
+            "Quadrature degree {} of {} integral capped to {} to use at most {} "
+            "integration points ('max_quadrature_points').".format(degree, integral_type,
+                                                                   capped_degree, max_points))
+    return capped_degree
+
+
 def _has_custom_integrals(o) -> bool:
     """Check for custom integrals"""
     if isinstance(o, ufl.integral.Integral):
@@ -78,7 +78,7 @@ class FFCBackendAccess(object):
             return self.symbols.coefficient_dof_access(mt.terminal, idof)
         else:
             # Return symbol, see definitions for computation
-            return self.symbols.coefficient_value(mt)  # , num_points)
+            return self.symbols.point_value(self.symbols.coefficient_value(mt), num_points)
 
     def spatial_coordinate(self, e, mt, tabledata, num_points):
         if mt.global_derivatives:
@@ -102,7 +102,7 @@ class FFCBackendAccess(object):
         else:
             # Physical coordinates are computed by code generated in
             # definitions
-            return self.symbols.x_component(mt)
+            return self.symbols.point_value(self.symbols.x_component(mt), num_points)
 
     def cell_coordinate(self, e, mt, tabledata, num_points):
         if mt.global_derivatives:
@@ -169,7 +169,7 @@ class FFCBackendAccess(object):
             raise RuntimeError("Not expecting global derivatives of Jacobian.")
         if mt.averaged:
             raise RuntimeError("Not expecting average of Jacobian.")
-        return self.symbols.J_component(mt)
+        return self.symbols.point_value(self.symbols.J_component(mt), num_points)
 
     def reference_cell_volume(self, e, mt, tabledata, access):
         L = self.language
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"""Empirical autotuning of uflacs code generation parameters.
+
+Each variant of the uflacs parameters is JIT compiled with cffi, and
+tabulate_tensor of each integral is timed from a C loop on a perturbed
+reference cell with random coefficients. The parameters of the fastest
+variant of each integral are stored in the tuning database, see
+ffc.ir.uflacs.tuningdb, which is consulted by later compilations.
+"""
+
+import importlib
+import logging
+import pathlib
+import sys
+
+import cffi
+import numpy
+
+import ffc.codegeneration.jit
+from ffc.analysis import analyze_ufl_objects
+from ffc.fiatinterface import create_element
+from ffc.ir.representation import compute_ir
+from ffc.ir.uflacs.tuningdb import (load_tuning_db, store_tuned_parameters,
+                                    tunable_parameters)
+
+logger = logging.getLogger(__name__)
+
+# Variants of the default uflacs parameters timed by default
+default_variants = [
+    {},
+    {"tensor_init_mode": "direct"},
+    {"tensor_init_mode": "upfront"},
+    {"alignas": 0},
+    {"padlen": 4},
+    {"vectorize": True, "padlen": 4},
+    {"vectorize_points": 4},
+    {"use_symbol_array": False},
+    {"enable_premultiplication": True},
+    {"enable_sum_factorization": False},
+    {"enable_preintegration": False},
+    {"enable_tensor_factorization": True},
+    {"gemm_block_points": 4},
+    {"max_unrolled_block_size": 0},
+    {"enable_symmetry": True},
+]
+
+_timer_source = """
+#include <time.h>
+
+typedef void (*cell_kernel)(void* A, const void* w, const double* coordinate_dofs,
+                            int cell_orientation);
+typedef void (*exterior_facet_kernel)(void* A, const void* w, const double* coordinate_dofs,
+                                      int facet, int cell_orientation);
+typedef void (*interior_facet_kernel)(void* A, const void* w, const double* coordinate_dofs_0,
+                                      const double* coordinate_dofs_1, int facet_0, int facet_1,
+                                      int cell_orientation_0, int cell_orientation_1);
+
+static double elapsed(struct timespec t0, struct timespec t1)
+{
+  return (t1.tv_sec - t0.tv_sec) + 1e-9 * (t1.tv_nsec - t0.tv_nsec);
+}
+
+double time_cell_kernel(uintptr_t f, void* A, const void* w, const double* coordinate_dofs,
+                        int num_facets, int n)
+{
+  struct timespec t0, t1;
+  clock_gettime(CLOCK_MONOTONIC, &t0);
+  for (int i = 0; i < n; ++i)
+    ((cell_kernel)f)(A, w, coordinate_dofs, 0);
+  clock_gettime(CLOCK_MONOTONIC, &t1);
+  return elapsed(t0, t1) / n;
+}
+
+double time_exterior_facet_kernel(uintptr_t f, void* A, const void* w,
+                                  const double* coordinate_dofs, int num_facets, int n)
+{
+  struct timespec t0, t1;
+  clock_gettime(CLOCK_MONOTONIC, &t0);
+  for (int i = 0; i < n; ++i)
+    ((exterior_facet_kernel)f)(A, w, coordinate_dofs, i % num_facets, 0);
+  clock_gettime(CLOCK_MONOTONIC, &t1);
+  return elapsed(t0, t1) / n;
+}
+
+double time_interior_facet_kernel(uintptr_t f, void* A, const void* w,
+                                  const double* coordinate_dofs, int num_facets, int n)
+{
+  struct timespec t0, t1;
+  clock_gettime(CLOCK_MONOTONIC, &t0);
+  for (int i = 0; i < n; ++i)
+    ((interior_facet_kernel)f)(A, w, coordinate_dofs, coordinate_dofs, i % num_facets,
+                               i % num_facets, 0, 0);
+  clock_gettime(CLOCK_MONOTONIC, &t1);
+  return elapsed(t0, t1) / n;
+}
+"""
+
+_timer_cdef = """
+double time_cell_kernel(uintptr_t f, void* A, const void* w, const double* coordinate_dofs,
+                        int num_facets, int n);
+double time_exterior_facet_kernel(uintptr_t f, void* A, const void* w,
+                                  const double* coordinate_dofs, int num_facets, int n);
+double time_interior_facet_kernel(uintptr_t f, void* A, const void* w,
+                                  const double* coordinate_dofs, int num_facets, int n);
+"""
+
+# Integral types which can be timed
+_timed_integral_types = ("cell", "exterior_facet", "interior_facet")
+
+
+def _timer_module(cache_dir):
+    """Build (once) and return the C timing loops."""
+    module_name = "_ffc_autotune_timer"
+    cache_dir = str(cache_dir)
+    sys.path.insert(0, cache_dir)
+    try:
+        try:
+            return importlib.import_module(module_name)
+        except ImportError:
+            ffibuilder = cffi.FFI()
+            ffibuilder.set_source(module_name, _timer_source, extra_compile_args=["-O2"])
+            ffibuilder.cdef(_timer_cdef)
+            ffibuilder.compile(tmpdir=cache_dir, verbose=False)
+            return importlib.import_module(module_name)
+    finally:
+        sys.path.remove(cache_dir)
+
+
+def _cell_coordinates(form, rng):
+    """Return coordinate dofs of a perturbed reference cell for form."""
+    domain = form.ufl_domain()
+    gdim = domain.geometric_dimension()
+    element = create_element(domain.ufl_coordinate_element().sub_elements()[0])
+    points = [sorted(node.get_point_dict().keys())[0] for node in element.dual_basis()]
+    coords = numpy.zeros((len(points), gdim))
+    coords[:, :len(points[0])] = points
+    # Perturb nodes slightly to avoid hitting special cases
+    coords += 0.01 * rng.random_sample(coords.shape)
+    return coords.flatten()
+
+
+def time_integrals(compiled_form, form, integral_irs, num_calls, cache_dir):
+    """Time tabulate_tensor of the given integrals of compiled_form.
+
+    Returns {(integral_type, subdomain_id): (seconds per call, element tensor)}.
+    """
+    timer = _timer_module(cache_dir)
+    ffi = timer.ffi
+    rng = numpy.random.RandomState(1)
+    coords = _cell_coordinates(form, rng)
+    num_facets = form.ufl_domain().ufl_cell().num_facets()
+
+    # Random coefficients, large enough for two cells
+    num_w = sum(create_element(c.ufl_element()).space_dimension() for c in form.coefficients())
+    w = rng.random_sample(max(2 * num_w, 1))
+
+    timings = {}
+    for ir in integral_irs:
+        create = getattr(compiled_form, "create_{}_integral".format(ir.integral_type))
+        integral = create(-1 if ir.subdomain_id == "otherwise" else ir.subdomain_id)
+        if integral == ffi.NULL:
+            continue
+        A = numpy.zeros(max(1, int(numpy.prod(ir.tensor_shape))))
+        f = int(ffi.cast("uintptr_t", integral.tabulate_tensor))
+        kernel_timer = getattr(timer.lib, "time_{}_kernel".format(ir.integral_type))
+        args = (ffi.from_buffer(A), ffi.from_buffer(w), ffi.cast("double *", ffi.from_buffer(coords)),
+                num_facets)
+
+        # Element tensor on the first entity, to check the variant
+        kernel_timer(f, *args, 1)
+        values = A.copy()
+
+        kernel_timer(f, *args, max(num_calls // 10, 1))  # warm up
+        seconds = kernel_timer(f, *args, num_calls)
+        timings[(ir.integral_type, ir.subdomain_id)] = (seconds, values)
+    return timings
+
+
+def autotune_forms(forms, parameters, variants=None, num_calls=10000):
+    """Time uflacs parameter variants for integrals missing from the tuning database.
+
+    The fastest variant of each integral of forms is stored.
+
+    Variants are dicts of uflacs parameters overriding parameters,
+    default_variants if not given. Variants computing a different
+    element tensor than the first one are discarded.
+    """
+    tuning_db = parameters["tuning_db"]
+    if variants is None:
+        variants = default_variants
+    for variant in variants:
+        for key in variant:
+            if key not in tunable_parameters:
+                raise RuntimeError("Parameter {} can not be tuned.".format(key))
+
+    # Compute IR to find the signatures of the integrals of each form
+    p = dict(parameters, autotune=False)
+    analysis = analyze_ufl_objects(forms, p)
+    ir = compute_ir(analysis, {}, "JIT", p)
+    tuned = load_tuning_db(tuning_db)
+    integral_irs = [[] for form in forms]
+    for integral_ir in ir.integrals:
+        if (integral_ir.integral_type in _timed_integral_types
+                and integral_ir.tuning_signature not in tuned):
+            integral_irs[integral_ir.form_id].append(integral_ir)
+    if not any(integral_irs):
+        return
+
+    # Compile and time each variant
+    cache_dir = pathlib.Path(parameters.get("cache_dir", "compile_cache")).expanduser()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    results = {}
+    reference = {}
+    for variant in variants:
+        p = dict(parameters, autotune=False, tuning_db=None, **variant)
+        compiled_forms, module = ffc.codegeneration.jit.compile_forms(forms, parameters=p)
+        for i, (form, compiled_form) in enumerate(zip(forms, compiled_forms)):
+            timings = time_integrals(compiled_form, form, integral_irs[i], num_calls, cache_dir)
+            for integral_ir in integral_irs[i]:
+                key = (i, integral_ir.integral_type, integral_ir.subdomain_id)
+                if key[1:] not in timings:
+                    continue
+                seconds, values = timings[key[1:]]
+                if key not in reference:
+                    reference[key] = values
+                elif not numpy.allclose(values, reference[key], rtol=1e-10, atol=1e-12):
+                    logger.warning("Discarding variant {} computing a different element tensor.".format(variant))
+                    continue
+                logger.info("Variant {} of {} integral: {:.3g} us".format(
+                    variant, integral_ir.integral_type, 1e6 * seconds))
+                signature = integral_ir.tuning_signature
+                if signature not in results or seconds < results[signature][1]:
+                    results[signature] = (dict(variant), seconds)
+
+    store_tuned_parameters(tuning_db, results)
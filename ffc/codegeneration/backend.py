@@ -6,13 +6,49 @@
 # SPDX-License-Identifier:    LGPL-3.0-or-later
 """Collection of FFC specific pieces for the code generation phase."""
 
+import ufl
 import ffc.codegeneration.C.cnodes
 from ffc.codegeneration.access import FFCBackendAccess
+from ffc.codegeneration.C.cnodes import pad_dim
 from ffc.codegeneration.C.ufl_to_cnodes import UFL2CNodesTranslatorCpp
 from ffc.codegeneration.definitions import FFCBackendDefinitions
+from ffc.codegeneration.smallgemm import is_gemm_block
 from ffc.codegeneration.symbols import FFCBackendSymbols
 
 
+def vectorized_quadrature_loops(ir):
+    """Return the padded number of points of quadrature loops vectorised over points.
+
+    The result maps num_points to the number of points padded to a
+    multiple of the SIMD width vectorize_points, for each quadrature
+    loop of ir vectorised over quadrature points.
+
+    Quadrature loops with tables computed by sum factorisation are
+    vectorised over the points of the tensor product rule, unpadded.
+    Without vectorize_points, quadrature loops with blocks computed by
+    matrix products over all points are vectorised unpadded.
+    """
+    width = ir.params["vectorize_points"]
+    skip = ufl.measure.custom_integral_types + ufl.measure.point_integral_types
+    if ir.integral_type in skip:
+        return {}
+    # Quadrature element dofs can not be padded
+    if "quadrature" in ir.unique_table_types.values():
+        width = 0
+    padded_num_points = {}
+    for num_points in ir.all_num_points:
+        if ir.varying_irs[num_points]["tensor_factors"]:
+            padded_num_points[num_points] = num_points
+        elif width and num_points > 1:
+            padded_num_points[num_points] = pad_dim(num_points, width)
+        elif num_points > 1 and any(is_gemm_block(blockdata, ir.params["gemm_block_points"])
+                                    for contributions in
+                                    ir.varying_irs[num_points]["block_contributions"].values()
+                                    for blockdata in contributions):
+            padded_num_points[num_points] = num_points
+    return padded_num_points
+
+
 class FFCBackend(object):
     """Class collecting all aspects of the FFC backend."""
 
@@ -26,7 +62,8 @@ class FFCBackend(object):
         coefficient_numbering = ir.coefficient_numbering
         coefficient_offsets = ir.coefficient_offsets
         self.symbols = FFCBackendSymbols(self.language, coefficient_numbering,
-                                         coefficient_offsets)
+                                         coefficient_offsets, vectorized_quadrature_loops(ir),
+                                         ir.action_coefficient)
         self.definitions = FFCBackendDefinitions(ir, self.language,
                                                  self.symbols, parameters)
         self.access = FFCBackendAccess(ir, self.language, self.symbols,
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"""Transformation of a single cell tabulate_tensor body into a batched body.
+
+The element tensor A, the coefficients w and the coordinate_dofs of
+the batch are stored with the cell index innermost, i.e. entry k of
+cell ib is at X[k*stride + ib]. Every local scalar becomes an array
+over the cells of the batch and runs of scalar statements are fused
+into a single loop over the batch, which the C compiler can vectorise.
+"""
+
+import numpy
+
+from ffc.codegeneration.C.cnodes import StatementList, pad_innermost_dim
+
+# Per-cell arguments of tabulate_tensor, stored with the cell index innermost
+batch_arguments = ("A", "w", "coordinate_dofs")
+
+
+class BatchingNotSupported(Exception):
+    """Raised for code constructs that can not be batched."""
+
+
+class CellBatchGenerator(object):
+    """Generate tabulate_tensor_batch from tabulate_tensor of a cell integral.
+
+    Raises BatchingNotSupported for code constructs that can not be batched.
+    """
+
+    def __init__(self, language, width, vectorize=False):
+        self.L = language
+        self.width = width
+        self.vectorize = vectorize
+
+        self.cell = language.Symbol("ib")
+        self.stride = language.Symbol("stride")
+        self.cell_orientations = language.Symbol("cell_orientations")
+
+        # Names of local variables, which get an innermost batch dimension
+        self.local_names = set()
+
+    def generate(self, parts):
+        """Return the batched statements computing parts."""
+        return self.L.StatementList(self.transform_statements([parts]))
+
+    def transform_statements(self, statements):
+        L = self.L
+        code = []
+        decls = []
+        body = []
+
+        def flush():
+            # Declarations of a run of scalar statements go before
+            # the loop over the batch computing them
+            code.extend(decls)
+            if body:
+                code.append(L.ForRange(self.cell, 0, self.width, body=list(body),
+                                       vectorize=self.vectorize))
+            del decls[:]
+            del body[:]
+
+        for s in _flatten_statements(statements):
+            if isinstance(s, L.VariableDecl):
+                value = None if s.value is None else self.transform_expr(s.value)
+                self.local_names.add(s.symbol.name)
+                typename = s.typename.replace("const ", "")
+                decls.append(L.ArrayDecl(typename, s.symbol, (self.width, )))
+                if value is not None:
+                    body.append(L.Assign(s.symbol[self.cell], value))
+            elif isinstance(s, L.ArrayDecl):
+                decls.append(self.transform_array_decl(s))
+            elif isinstance(s, L.Statement):
+                body.append(L.Statement(self.transform_expr(s.expr)))
+            elif isinstance(s, L.Comment):
+                flush()
+                code.append(s)
+            elif isinstance(s, L.ForRange):
+                flush()
+                if (self.transform_expr(s.begin) != s.begin
+                        or self.transform_expr(s.end) != s.end):
+                    raise BatchingNotSupported("Loop range depending on the cell.")
+                loop = L.ForRange(s.index, s.begin, s.end,
+                                  body=self.transform_statements([s.body]),
+                                  index_type=s.index_type)
+                code.append(loop)
+            elif isinstance(s, L.Scope):
+                flush()
+                code.append(L.Scope(self.transform_statements([s.body])))
+            else:
+                raise BatchingNotSupported("Can not batch statement of type %s."
+                                           % (type(s).__name__, ))
+        flush()
+        return code
+
+    def transform_array_decl(self, decl):
+        L = self.L
+        if "static" in decl.typename.split():
+            # Tables are shared by all cells
+            return decl
+
+        self.local_names.add(decl.symbol.name)
+        sizes = pad_innermost_dim(decl.sizes, decl.padlen)
+        values = decl.values
+        if values is not None and numpy.any(values):
+            padded = numpy.zeros(sizes, dtype=numpy.asarray(values).dtype)
+            padded[tuple(slice(0, n) for n in decl.sizes)] = values
+            values = numpy.repeat(padded[..., None], self.width, axis=-1)
+        return L.ArrayDecl(decl.typename, decl.symbol, sizes + (self.width, ), values,
+                           alignas=decl.alignas)
+
+    def transform_expr(self, e):
+        L = self.L
+        if isinstance(e, L.Symbol):
+            if e.name in self.local_names:
+                return e[self.cell]
+            elif e.name == "cell_orientation":
+                return self.cell_orientations[self.cell]
+            elif e.name in batch_arguments:
+                raise BatchingNotSupported("Can not batch pointer %s." % (e.name, ))
+            return e
+        elif isinstance(e, L.CExprLiteral):
+            return e
+        elif isinstance(e, L.ArrayAccess):
+            name = e.array.name
+            indices = [self.transform_expr(i) for i in e.indices]
+            if name in batch_arguments:
+                if len(indices) != 1:
+                    raise BatchingNotSupported("Expecting flat access to %s." % (name, ))
+                return e.array[indices[0] * self.stride + self.cell]
+            elif name in self.local_names:
+                return L.ArrayAccess(e.array, indices + [self.cell])
+            return L.ArrayAccess(e.array, indices)
+        elif isinstance(e, L.Conditional):
+            return L.Conditional(self.transform_expr(e.condition), self.transform_expr(e.true),
+                                 self.transform_expr(e.false))
+        elif isinstance(e, L.Call):
+            return L.Call(e.function, [self.transform_expr(arg) for arg in e.arguments])
+        elif isinstance(e, L.UnaryOp):
+            return type(e)(self.transform_expr(e.arg))
+        elif isinstance(e, L.BinOp):
+            return type(e)(self.transform_expr(e.lhs), self.transform_expr(e.rhs))
+        elif isinstance(e, L.NaryOp):
+            return type(e)([self.transform_expr(arg) for arg in e.args])
+        raise BatchingNotSupported("Can not batch expression of type %s." % (type(e).__name__, ))
+
+
+def _flatten_statements(statements):
+    for s in statements:
+        if isinstance(s, list):
+            yield from _flatten_statements(s)
+        elif isinstance(s, StatementList):
+            yield from _flatten_statements(s.statements)
+        else:
+            yield s
@@ -21,11 +21,12 @@ from ffc.codegeneration.coordinate_mapping import \
 from ffc.codegeneration.dofmap import generator as dofmap_generator
 from ffc.codegeneration.form import generator as form_generator
 from ffc.codegeneration.integrals import generator as integral_generator
+from ffc.codegeneration.tables import TableRegistry
 
 logger = logging.getLogger(__name__)
 
 code_blocks = namedtuple('code_blocks', ['elements', 'dofmaps',
-                                         'coordinate_mappings', 'integrals', 'forms'])
+                                         'coordinate_mappings', 'tables', 'integrals', 'forms'])
 
 
 def generate_code(ir, parameters):
@@ -47,14 +48,16 @@ def generate_code(ir, parameters):
     logger.debug("Generating code for {} coordinate_mapping(s)".format(len(ir.coordinate_mappings)))
     code_coordinate_mappings = [coordinate_mapping_generator(cmap_ir, parameters) for cmap_ir in ir.coordinate_mappings]
 
-    # Generate code for integrals
+    # Generate code for integrals, collecting static tables shared by all integrals
     logger.debug("Generating code for integrals")
-    code_integrals = [integral_generator(integral_ir, parameters) for integral_ir in ir.integrals]
+    table_registry = TableRegistry()
+    code_integrals = [integral_generator(integral_ir, parameters, table_registry) for integral_ir in ir.integrals]
+    code_tables = table_registry.generate()
 
     # Generate code for forms
     logger.debug("Generating code for forms")
     code_forms = [form_generator(form_ir, parameters) for form_ir in ir.forms]
 
     return code_blocks(elements=code_finite_elements, dofmaps=code_dofmaps,
-                       coordinate_mappings=code_coordinate_mappings, integrals=code_integrals,
+                       coordinate_mappings=code_coordinate_mappings, tables=code_tables, integrals=code_integrals,
                        forms=code_forms)
@@ -9,6 +9,8 @@
 import logging
 
 import ufl
+from ffc.codegeneration.tensorcontraction import generate_basis_change, generate_tensor_contraction
+from ffc.ir.uflacs.elementtables import uses_tensor_factors
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +56,16 @@ class FFCBackendDefinitions(object):
         self.language = language
         self.symbols = symbols
         self.parameters = parameters
+        self.alignas = ir.params["alignas"]
+        self.vectorize = ir.params["vectorize"]
+
+        # Factor tables and bases of the tables of each quadrature loop
+        # computed by sum factorisation, by num_points
+        self.unique_tables = ir.unique_tables
+        self.tensor_factors = {num_points: ir.varying_irs[num_points]["tensor_factors"]
+                               for num_points in ir.all_num_points}
+        self.tensor_bases = {num_points: ir.varying_irs[num_points]["tensor_bases"]
+                             for num_points in ir.all_num_points}
 
         # Lookup table for handler to call when the "get" method (below) is
         # called, depending on the first argument type.
@@ -108,7 +120,38 @@ class FFCBackendDefinitions(object):
 
         unroll = len(tabledata.dofmap) != end - begin
         # unroll = True
-        if unroll:
+        num_padded_points = self.symbols.padded_num_points.get(num_points)
+        if uses_tensor_factors(mt, tabledata, self.tensor_factors.get(num_points, {}),
+                               self.tensor_bases.get(num_points, {})):
+            # Sum factorised contraction of table and dofs
+            code = [L.ArrayDecl("ufc_scalar_t", access.array, num_points, 0, alignas=self.alignas)]
+            code += self._tensor_contraction(
+                tabledata, num_points, access,
+                lambda k: self.symbols.coefficient_dof_access(mt.terminal, k + begin))
+        elif num_padded_points:
+            # Dense contraction of table and dofs over all points,
+            # with the loop over points innermost
+            iq = self.symbols.quadrature_loop_index()
+            if unroll:
+                values = [
+                    self.symbols.coefficient_dof_access(mt.terminal, idof) * FE[i]
+                    for i, idof in enumerate(tabledata.dofmap)
+                ]
+                body = L.Assign(access, L.Sum(values))
+                code = [
+                    L.ArrayDecl("ufc_scalar_t", access.array, num_padded_points, alignas=self.alignas),
+                    L.ForRange(iq, 0, num_padded_points, body=body, vectorize=self.vectorize)
+                ]
+            else:
+                ic = self.symbols.coefficient_dof_sum_index()
+                dof_access = self.symbols.coefficient_dof_access(mt.terminal, ic + begin)
+                body = L.ForRange(iq, 0, num_padded_points, body=L.AssignAdd(access, dof_access * FE[ic]),
+                                  vectorize=self.vectorize)
+                code = [
+                    L.ArrayDecl("ufc_scalar_t", access.array, num_padded_points, 0, alignas=self.alignas),
+                    L.ForRange(ic, 0, end - begin, body=body)
+                ]
+        elif unroll:
             # TODO: Could also use a generated constant dofmap here like in block code
             # Unrolled loop to accumulate linear combination of dofs and tables
             values = [
@@ -158,8 +201,66 @@ class FFCBackendDefinitions(object):
         # Inlined version (we know this is bounded by a small number)
         dof_access = self.symbols.domain_dofs_access(gdim, num_scalar_dofs, mt.restriction)
         value = L.Sum([dof_access[idof] * FE[i] for i, idof in enumerate(tabledata.dofmap)])
-        code = [L.VariableDecl("const double", access, value)]
+        num_padded_points = self.symbols.padded_num_points.get(num_points)
+        if uses_tensor_factors(mt, tabledata, self.tensor_factors.get(num_points, {}),
+                               self.tensor_bases.get(num_points, {})):
+            # Sum factorised contraction of table and the dofs of one
+            # component, which are contiguous in the table
+            component, first = divmod(begin, num_scalar_dofs)
+            code = [L.ArrayDecl("double", access.array, num_points, 0, alignas=self.alignas)]
+            code += self._tensor_contraction(
+                tabledata, num_points, access,
+                lambda k: self.symbols.domain_dof_access(k + first, component, gdim, num_scalar_dofs,
+                                                         mt.restriction), "double")
+        elif num_padded_points:
+            # Compute value in all points
+            iq = self.symbols.quadrature_loop_index()
+            code = [
+                L.ArrayDecl("double", access.array, num_padded_points, alignas=self.alignas),
+                L.ForRange(iq, 0, num_padded_points, body=L.Assign(access, value), vectorize=self.vectorize)
+            ]
+        else:
+            code = [L.VariableDecl("const double", access, value)]
+
+        return code
+
+    def _tensor_contraction(self, tabledata, num_points, access, dof_access, typename="ufc_scalar_t"):
+        """Return code computing access in all points by sum factorisation.
+
+        The dofs given by dof_access are contracted with the factor
+        tables of tabledata.
+        """
+        factors = []
+        for name in self.tensor_factors[num_points][tabledata.name]:
+            FT = self.symbols.element_table_symbol(name)
+            num_points_1d, num_dofs_1d = self.unique_tables[name].shape
+            factors.append((lambda iq, ic, FT=FT: FT[iq][ic], num_points_1d, num_dofs_1d))
+        temps = ("%s_t%d" % (access.array.name, d) for d in range(len(factors)))
+        indices = self.symbols.tensor_contraction_indices()
+
+        code = []
+        basis = self.tensor_bases[num_points].get(tabledata.name)
+        if basis is not None:
+            # Change from the element basis to the tensor product basis
+            # in collapsed coordinates
+            FB = self.symbols.element_table_symbol(basis)
+            num_polys, num_dofs = self.unique_tables[basis].shape
+            T = self.language.Symbol("%s_b" % (access.array.name, ))
+            code += [self.language.ArrayDecl(typename, T, num_polys, 0)]
+            # Dofs of the nonzero columns of the table, which are
+            # gathered in an unrolled sum if not contiguous
+            dofmap = [idof - tabledata.dofrange[0] for idof in tabledata.dofmap]
+            unroll = dofmap != list(range(num_dofs))
+            code += generate_basis_change(self.language, lambda k, ic: FB[k][ic], num_polys, num_dofs,
+                                          lambda ic: dof_access(dofmap[ic] if unroll else ic),
+                                          T.__getitem__, indices[1:3], self.vectorize, unroll)
+            src = T.__getitem__
+        else:
+            src = dof_access
 
+        code += generate_tensor_contraction(self.language, factors, src, access.array.__getitem__,
+                                            lambda: self.language.Symbol(next(temps)), indices,
+                                            typename, self.vectorize)
         return code
 
     def spatial_coordinate(self, e, mt, tabledata, num_points, access):
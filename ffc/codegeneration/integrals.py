@@ -8,11 +8,17 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with UFLACS. If not, see <http://www.gnu.org/licenses/>.
 
+import numpy
+
 from ffc.codegeneration import integrals_template as ufc_integrals
 
 
-def generator(ir, parameters):
-    """Generate UFC code for an integral"""
+def generator(ir, parameters, table_registry=None):
+    """Generate UFC code for an integral.
+
+    Static tables are added to table_registry, if given, to be shared
+    by all integrals in the module.
+    """
     factory_name = ir.classname
     integral_type = ir.integral_type
 
@@ -20,27 +26,112 @@ def generator(ir, parameters):
     declaration = ufc_integrals.declaration.format(
         type=integral_type, factory_name=factory_name)
 
+    # Generate code
     if ir.representation == "uflacs":
         from ffc.codegeneration.uflacsgenerator import generate_integral_code
+        code = generate_integral_code(ir, parameters, table_registry)
     elif ir.representation == "tsfc":
         from ffc.codegeneration.tsfcgenerator import generate_integral_code
+        code = generate_integral_code(ir, parameters)
     else:
         raise RuntimeError("Unknown representation: {}".format(ir.representation))
 
-    # Generate code
-    code = generate_integral_code(ir, parameters)
-
     # Format tabulate tensor body
     tabulate_tensor_declaration = ufc_integrals.tabulate_implementation[
         integral_type]
     tabulate_tensor_fn = tabulate_tensor_declaration.format(
         factory_name=factory_name, tabulate_tensor=code["tabulate_tensor"])
 
+    # Format batched tabulate tensor of cell integrals
+    cell_members = ""
+    if integral_type == "cell":
+        if code.get("tabulate_tensor_batch") is None:
+            cell_members = "\n  integral->tabulate_tensor_batch = NULL;"
+        else:
+            tabulate_tensor_fn += generate_tabulate_tensor_batch(ir, code)
+            cell_members = "\n  integral->tabulate_tensor_batch = tabulate_tensor_batch_{};".format(
+                factory_name)
+
+        # Format fused tabulate tensor of cell integrals of bilinear forms
+        if ir.fused is None:
+            cell_members += "\n  integral->tabulate_tensor_fused = NULL;"
+        else:
+            tabulate_tensor_fn += generate_tabulate_tensor_fused(ir.fused, parameters, table_registry)
+            cell_members += "\n  integral->tabulate_tensor_fused = tabulate_tensor_fused_{};".format(
+                factory_name)
+
+        # Format action of cell integrals of bilinear forms
+        if ir.action is None:
+            cell_members += "\n  integral->tabulate_action = NULL;"
+        else:
+            tabulate_tensor_fn += generate_tabulate_action(ir.action, parameters, table_registry)
+            cell_members += "\n  integral->tabulate_action = tabulate_action_{};".format(factory_name)
+
+        # Format diagonal of cell integrals of bilinear forms
+        if ir.diagonal is None:
+            cell_members += "\n  integral->tabulate_diagonal = NULL;"
+        else:
+            tabulate_tensor_fn += generate_tabulate_diagonal(ir.diagonal, parameters, table_registry)
+            cell_members += "\n  integral->tabulate_diagonal = tabulate_diagonal_{};".format(factory_name)
+
     # Format implementation code
     implementation = ufc_integrals.factory.format(
         type=integral_type,
         factory_name=factory_name,
         enabled_coefficients=code["enabled_coefficients"],
-        tabulate_tensor=tabulate_tensor_fn)
+        tabulate_tensor=tabulate_tensor_fn,
+        cell_members=cell_members,
+        symmetric="true" if ir.symmetric else "false")
 
     return declaration, implementation
+
+
+def generate_tabulate_tensor_fused(ir, parameters, table_registry=None):
+    """Format tabulate_tensor_fused of a cell integral.
+
+    It computes the element tensors of a bilinear and a linear form in
+    one kernel.
+    """
+    from ffc.codegeneration.uflacsgenerator import generate_integral_code
+    code = generate_integral_code(ir, parameters, table_registry)
+    return ufc_integrals.tabulate_fused_implementation.format(
+        factory_name=ir.classname, tabulate_tensor=code["tabulate_tensor"])
+
+
+def generate_tabulate_action(ir, parameters, table_registry=None):
+    """Format tabulate_action of a cell integral.
+
+    It computes the product of the element tensor of a bilinear form
+    with a vector.
+    """
+    from ffc.codegeneration.uflacsgenerator import generate_integral_code
+    code = generate_integral_code(ir, parameters, table_registry)
+    return ufc_integrals.tabulate_action_implementation.format(
+        factory_name=ir.classname, tabulate_tensor=code["tabulate_tensor"])
+
+
+def generate_tabulate_diagonal(ir, parameters, table_registry=None):
+    """Format tabulate_diagonal of a cell integral.
+
+    It computes the diagonal of the element tensor of a bilinear form.
+    """
+    from ffc.codegeneration.uflacsgenerator import generate_integral_code
+    code = generate_integral_code(ir, parameters, table_registry)
+    return ufc_integrals.tabulate_diagonal_implementation.format(
+        factory_name=ir.classname, tabulate_tensor=code["tabulate_tensor"])
+
+
+def generate_tabulate_tensor_batch(ir, code):
+    """Format tabulate_tensor_batch of a cell integral.
+
+    It computes a batch of cells at a time with the cell index innermost.
+    """
+    num_w = sum(ir.element_dimensions[c.ufl_element()] for c in ir.coefficient_offsets)
+    return ufc_integrals.tabulate_batch_implementation.format(
+        factory_name=ir.classname,
+        tabulate_tensor_batch=code["tabulate_tensor_batch"],
+        batch_width=ir.params["batch_width"],
+        A_size=int(numpy.prod(ir.tensor_shape, dtype=int)),
+        num_w=num_w,
+        w_size=max(num_w, 1),
+        x_size=ir.num_coordinate_dofs)
@@ -62,6 +62,82 @@ void tabulate_tensor_{factory_name}(ufc_scalar_t* restrict A, const ufc_scalar_t
 """
 }
 
+tabulate_fused_implementation = """
+void tabulate_tensor_fused_{factory_name}(ufc_scalar_t* restrict A, ufc_scalar_t* restrict b,
+                                          const ufc_scalar_t* w,
+                                          const double* restrict coordinate_dofs,
+                                          int cell_orientation)
+{{
+{tabulate_tensor}
+}}
+"""
+
+tabulate_action_implementation = """
+void tabulate_action_{factory_name}(ufc_scalar_t* restrict A, const ufc_scalar_t* restrict x,
+                                    const ufc_scalar_t* w,
+                                    const double* restrict coordinate_dofs,
+                                    int cell_orientation)
+{{
+{tabulate_tensor}
+}}
+"""
+
+tabulate_diagonal_implementation = """
+void tabulate_diagonal_{factory_name}(ufc_scalar_t* restrict A, const ufc_scalar_t* w,
+                                      const double* restrict coordinate_dofs,
+                                      int cell_orientation)
+{{
+{tabulate_tensor}
+}}
+"""
+
+tabulate_batch_implementation = """
+static void tabulate_tensor_batch_block_{factory_name}(ufc_scalar_t* restrict A,
+                                                const ufc_scalar_t* restrict w,
+                                                const double* restrict coordinate_dofs,
+                                                const int* restrict cell_orientations,
+                                                int stride)
+{{
+{tabulate_tensor_batch}
+}}
+
+void tabulate_tensor_batch_{factory_name}(ufc_scalar_t* restrict A, const ufc_scalar_t* restrict w,
+                                          const double* restrict coordinate_dofs,
+                                          const int* restrict cell_orientations,
+                                          int num_cells)
+{{
+  // Full batches of {batch_width} cells
+  int c0 = 0;
+  for (; c0 + {batch_width} <= num_cells; c0 += {batch_width})
+    tabulate_tensor_batch_block_{factory_name}(A + c0, w + c0, coordinate_dofs + c0,
+                                               cell_orientations ? cell_orientations + c0 : NULL,
+                                               num_cells);
+  if (c0 == num_cells)
+    return;
+
+  // Remaining cells, padded to a full batch by repeating the last cell
+  ufc_scalar_t A_batch[{A_size} * {batch_width}] = {{ 0 }};
+  ufc_scalar_t w_batch[{w_size} * {batch_width}];
+  double coordinate_dofs_batch[{x_size} * {batch_width}];
+  int cell_orientations_batch[{batch_width}] = {{ 0 }};
+  for (int ib = 0; ib < {batch_width}; ++ib)
+  {{
+    const int c = c0 + ib < num_cells ? c0 + ib : num_cells - 1;
+    for (int k = 0; k < {num_w}; ++k)
+      w_batch[k * {batch_width} + ib] = w[k * num_cells + c];
+    for (int k = 0; k < {x_size}; ++k)
+      coordinate_dofs_batch[k * {batch_width} + ib] = coordinate_dofs[k * num_cells + c];
+    if (cell_orientations)
+      cell_orientations_batch[ib] = cell_orientations[c];
+  }}
+  tabulate_tensor_batch_block_{factory_name}(A_batch, w_batch, coordinate_dofs_batch,
+                                             cell_orientations_batch, {batch_width});
+  for (int ib = 0; ib < num_cells - c0; ++ib)
+    for (int k = 0; k < {A_size}; ++k)
+      A[k * num_cells + c0 + ib] = A_batch[k * {batch_width} + ib];
+}}
+"""
+
 factory = """
 // Code for {type}_integral {factory_name}
 
@@ -73,7 +149,8 @@ ufc_{type}_integral* create_{factory_name}(void)
 
   ufc_{type}_integral* integral = malloc(sizeof(*integral));
   integral->enabled_coefficients = enabled;
-  integral->tabulate_tensor = tabulate_tensor_{factory_name};
+  integral->tabulate_tensor = tabulate_tensor_{factory_name};{cell_members}
+  integral->symmetric = {symmetric};
   return integral;
 }};
 
@@ -138,6 +138,19 @@ const bool* enabled_coefficients;
 void (*tabulate_tensor)(ufc_scalar_t* restrict A, const ufc_scalar_t* w,
                         const double* restrict coordinate_dofs,
                         int cell_orientation);
+void (*tabulate_tensor_batch)(ufc_scalar_t* restrict A, const ufc_scalar_t* restrict w,
+                              const double* restrict coordinate_dofs,
+                              const int* restrict cell_orientations, int num_cells);
+void (*tabulate_tensor_fused)(ufc_scalar_t* restrict A, ufc_scalar_t* restrict b,
+                              const ufc_scalar_t* w, const double* restrict coordinate_dofs,
+                              int cell_orientation);
+void (*tabulate_action)(ufc_scalar_t* restrict A, const ufc_scalar_t* restrict x,
+                        const ufc_scalar_t* w, const double* restrict coordinate_dofs,
+                        int cell_orientation);
+void (*tabulate_diagonal)(ufc_scalar_t* restrict A, const ufc_scalar_t* w,
+                          const double* restrict coordinate_dofs,
+                          int cell_orientation);
+bool symmetric;
 } ufc_cell_integral;
 
 typedef struct ufc_exterior_facet_integral
@@ -146,6 +159,7 @@ const bool* enabled_coefficients;
 void (*tabulate_tensor)(ufc_scalar_t* restrict A, const ufc_scalar_t* w,
                         const double* restrict coordinate_dofs, int facet,
                         int cell_orientation);
+bool symmetric;
 } ufc_exterior_facet_integral;
 
 typedef struct ufc_interior_facet_integral
@@ -156,6 +170,7 @@ void (*tabulate_tensor)(ufc_scalar_t* restrict A, const ufc_scalar_t* w,
                         const double* restrict coordinate_dofs_1,
                         int facet_0, int facet_1, int cell_orientation_0,
                         int cell_orientation_1);
+bool symmetric;
 } ufc_interior_facet_integral;
 
 typedef struct ufc_vertex_integral
@@ -164,6 +179,7 @@ const bool* enabled_coefficients;
 void (*tabulate_tensor)(ufc_scalar_t* restrict A, const ufc_scalar_t* w,
                         const double* restrict coordinate_dofs, int vertex,
                         int cell_orientation);
+bool symmetric;
 } ufc_vertex_integral;
 
 typedef struct ufc_custom_integral
@@ -176,6 +192,7 @@ void (*tabulate_tensor)(ufc_scalar_t* restrict A, const ufc_scalar_t* w,
                         const double* restrict quadrature_weights,
                         const double* restrict facet_normals,
                         int cell_orientation);
+bool symmetric;
 } ufc_custom_integral;
 """
 
@@ -291,6 +308,12 @@ def compile_forms(forms, module_name=None, parameters=None):
 
     logger.info('Compiling forms: ' + str(forms))
 
+    # Tune integrals missing from the tuning database, before the
+    # module signature depending on the database is computed
+    if p["autotune"] and p["tuning_db"] is not None:
+        from ffc.codegeneration.autotune import autotune_forms
+        autotune_forms(forms, p)
+
     # Get a signature for these forms
     module_name = 'libffc_forms_' + ffc.classname.compute_signature(forms, '', p)
 
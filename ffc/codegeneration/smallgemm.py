@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"""Matrix products over the quadrature points.
+
+Accumulating a block B[i][j] += fw[q] * u[q][i] * v[q][j] point by point
+is a sequence of rank one updates of B, loading and storing all of B for
+each point. Over all points it is the matrix product B = U^T diag(fw) V,
+which is computed here after fw has been computed in all points, by
+rank k updates of B accumulating k points at a time. The weighted
+values fw[q] * u[q][i] of the k points are collected in a small panel
+first, and the sum over the k points is unrolled, such that each entry
+of B is loaded and stored once for every k points and the innermost
+loop over the columns of B is left for the C compiler to vectorise.
+"""
+
+
+def is_gemm_block(blockdata, gemm_block_points):
+    """Check if the block is computed by a matrix product over all points."""
+    return (gemm_block_points > 0 and blockdata.block_mode in ("full", "partial")
+            and len(blockdata.ma_data) > 0 and not blockdata.transposed and "quadrature" not in blockdata.ttypes)
+
+
+def generate_small_gemm(L, a, b, c, shape, num_points, block_points, indices, temp):
+    """Generate code accumulating c(i, j) += sum_q a(q, i) * b(q, j).
+
+    Input:
+      a, b, c      - functions returning the code for the entries of
+                     a, b and c at the given indices
+      shape        - the number of rows and columns (m, n) of c
+      block_points - number of points accumulated by each update of c
+      indices      - three loop index symbols, over the blocks of
+                     points and the rows and columns of c
+      temp         - function returning a new symbol for the panels
+
+    Points not filling a whole block are accumulated by a last, smaller
+    update of c.
+    """
+    m, n = shape
+    qb, i, j = indices
+
+    # Blocks covering the points, as (first, size, count)
+    blocks = []
+    if num_points >= block_points:
+        blocks.append((0, block_points, num_points // block_points))
+    if num_points % block_points:
+        blocks.append((num_points - num_points % block_points, num_points % block_points, 1))
+
+    def loop(index, size, body):
+        return L.ForRange(index, 0, size, body=body) if size > 1 else body
+
+    if m == 1:
+        i = L.LiteralInt(0)
+    if n == 1:
+        j = L.LiteralInt(0)
+
+    code = []
+    for first, size, count in blocks:
+        if count > 1:
+            points = [qb * size + k for k in range(size)]
+        else:
+            points = [first + k for k in range(size)]
+
+        # Panel of the values of a in the points of the block
+        panel = temp()
+        fill = loop(i, m, [L.Assign(panel[k][i], a(q, i)) for k, q in enumerate(points)])
+
+        # Rank k update of c
+        update = L.AssignAdd(c(i, j), L.Sum([panel[k][i] * b(q, j) for k, q in enumerate(points)]))
+        update = loop(i, m, loop(j, n, update))
+
+        body = [L.ArrayDecl("ufc_scalar_t", panel, (size, m)), fill, update]
+        if count > 1:
+            body = [L.ForRange(qb, 0, count, body=body)]
+        code += body
+    return code
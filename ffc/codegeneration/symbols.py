@@ -52,12 +52,27 @@ def format_mt_name(basename, mt):
 class FFCBackendSymbols(object):
     """FFC specific symbol definitions. Provides non-ufl symbols."""
 
-    def __init__(self, language, coefficient_numbering, coefficient_offsets):
+    def __init__(self, language, coefficient_numbering, coefficient_offsets,
+                 padded_num_points=None, action_coefficient=None):
         self.L = language
         self.S = self.L.Symbol
         self.coefficient_numbering = coefficient_numbering
         self.coefficient_offsets = coefficient_offsets
 
+        # Coefficient replacing the trial function of action kernels,
+        # with dofs in x instead of w
+        self.action_coefficient = action_coefficient
+
+        # Padded number of points of the quadrature loops vectorised
+        # over points, by num_points
+        self.padded_num_points = padded_num_points or {}
+
+        # Names of element tables shared at module level, by table name
+        self.table_names = {}
+
+        # Interned symbols of element tables, by symbol name
+        self.table_symbols = {}
+
         # Used for padding variable names based on restriction
 #        self.restriction_postfix = {r: ufc_restriction_postfix(r) for r in ("+", "-", None)}
 
@@ -70,6 +85,10 @@ class FFCBackendSymbols(object):
         """Symbol for the element tensor itself."""
         return self.S("A")
 
+    def residual_tensor(self):
+        """Symbol for the element vector of the linear form of fused kernels."""
+        return self.S("b")
+
     def entity(self, entitytype, restriction):
         """Entity index for lookup in element tables."""
         if entitytype == "cell":
@@ -104,6 +123,31 @@ class FFCBackendSymbols(object):
         assumed not to be nested."""
         return self.S("iq")
 
+    def tensor_contraction_indices(self):
+        """Loop indices of sum factorised contractions.
+
+        See generate_tensor_contraction. The indices are assumed to never
+        be used in two nested contractions.
+        """
+        return (self.S("ka"), self.S("ku"), self.S("ks"), self.S("kb"))
+
+    def gemm_indices(self):
+        """Loop indices over point blocks, rows and columns of matrix products.
+
+        See generate_small_gemm.
+        """
+        return (self.S("gq"), self.S("gi"), self.S("gj"))
+
+    def point_value(self, symbol, num_points):
+        """Access to a value varying over the quadrature points.
+
+        The value is an array over all points in quadrature loops
+        vectorised over points.
+        """
+        if num_points in self.padded_num_points:
+            return symbol[self.quadrature_loop_index()]
+        return symbol
+
     def num_custom_quadrature_points(self):
         """Number of quadrature points, argument to custom integrals."""
         return self.S("num_quadrature_points")
@@ -159,6 +203,8 @@ class FFCBackendSymbols(object):
     def coefficient_dof_access(self, coefficient, dof_number):
         # TODO: Add domain number?
         offset = self.coefficient_offsets[coefficient]
+        if coefficient == self.action_coefficient:
+            return self.S("x")[offset + dof_number]
         w = self.S("w")
         return w[offset + dof_number]
 
@@ -168,7 +214,7 @@ class FFCBackendSymbols(object):
         c = self.coefficient_numbering[mt.terminal]
         return self.S(format_mt_name("w%d" % (c, ), mt))
 
-    def element_table(self, tabledata, entitytype, restriction):
+    def element_table(self, tabledata, entitytype, restriction, iq=None):
         if tabledata.is_uniform:
             entity = 0
         else:
@@ -176,8 +222,17 @@ class FFCBackendSymbols(object):
 
         if tabledata.is_piecewise:
             iq = 0
-        else:
+        elif iq is None:
             iq = self.quadrature_loop_index()
 
         # Return direct access to element table
-        return self.S(tabledata.name)[entity][iq]
+        return self.element_table_symbol(tabledata.name)[entity][iq]
+
+    def element_table_symbol(self, name):
+        """Symbol for element table, using the shared name if the table is defined at module level."""
+        name = self.table_names.get(name, name)
+        s = self.table_symbols.get(name)
+        if s is None:
+            s = self.S(name)
+            self.table_symbols[name] = s
+        return s
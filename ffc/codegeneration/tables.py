@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"""Static element tables shared by all kernels in a generated module."""
+
+from ffc.codegeneration.C.format_lines import format_indented_lines
+
+
+class TableRegistry(object):
+    """Collection of static tables emitted once at file scope.
+
+    Tables are identified by their contents, so the same table used by
+    several integrals, in one or more forms, is declared once and every
+    kernel refers to the shared symbol.
+    """
+
+    def __init__(self):
+        # Shared symbol name for each table key
+        self.names = {}
+        self.taken = set()
+
+        # Formatted declarations, in the order the tables were added
+        self.declarations = []
+
+    def add(self, L, name, table, alignas, padlen, precision):
+        """Add table and return the name of the shared symbol.
+
+        The name of the first table added with given contents is kept,
+        later tables with a clashing name get a numbered suffix.
+        """
+        key = (table.shape, table.dtype.str, table.tobytes(), alignas, padlen, precision)
+        shared_name = self.names.get(key)
+        if shared_name is None:
+            shared_name = name
+            count = 0
+            while shared_name in self.taken:
+                count += 1
+                shared_name = "{}_{}".format(name, count)
+            self.names[key] = shared_name
+            self.taken.add(shared_name)
+
+            decl = L.ArrayDecl(
+                "static const ufc_scalar_t", shared_name, table.shape, table, alignas=alignas, padlen=padlen)
+            self.declarations.append(format_indented_lines(decl.cs_format(precision)))
+        return shared_name
+
+    def generate(self):
+        """Return the file scope declarations of all tables."""
+        if not self.declarations:
+            return ""
+        lines = [
+            "",
+            "// Precomputed values of basis functions and precomputations",
+            "// shared by the integrals below",
+            "// FE* dimensions: [entities][points][dofs]",
+            "// PI* dimensions: [entities][dofs][dofs] or [entities][dofs]",
+            "// PM* dimensions: [entities][dofs][dofs]",
+        ]
+        lines += self.declarations
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"""Sum factorised contraction of arrays over tensor product index spaces.
+
+Values in the points of a tensor product quadrature rule and dofs of a
+tensor product element are stored in flat arrays in lexicographic
+ordering, with the first direction running slowest. Contracting such an
+array with the Kronecker product of the factor tables of each direction
+is done one direction at a time, at the cost of O(n^(d+1)) instead of
+O(n^(2d)) operations for n points and dofs in each of d directions.
+
+On simplices the contraction is done in collapsed coordinates, where
+the element dofs are related to the tensor product basis by a change of
+basis before or after the contraction. The change of basis is dense, so
+on simplices the cost remains O(n^(2d)) per vector.
+"""
+
+import ufl
+
+
+def generate_tensor_contraction(L, factors, src, dst, temps, indices, typename="ufc_scalar_t",
+                                vectorize=False):
+    """Generate code accumulating dst[i] += sum_j prod_d F_d[i_d, j_d] src[j].
+
+    Input:
+      factors - list of (F, num_out, num_in) for each direction d, where
+                F(i_d, j_d) returns the code for the factor table entry
+      src     - function returning the code for src at a flat index j
+      dst     - function returning the code for dst at a flat index i
+      temps   - function returning a new symbol for an intermediate array
+      indices - four loop index symbols, for the indices of the
+                directions before d, the output and summed indices of
+                direction d, and the indices of the directions after d
+      typename - type of the intermediate arrays
+
+    The last direction is contracted first, the intermediate arrays
+    hold the input indices of the directions not yet contracted and the
+    output indices of the directions already contracted. The innermost
+    loop runs over the latter, with unit stride.
+    """
+    num_out = [n for F, n, m in factors]
+    num_in = [m for F, n, m in factors]
+    outer_index, out_index, sum_index, inner_index = indices
+
+    def loop_index(index, n):
+        return index if n > 1 else L.LiteralInt(0)
+
+    code = []
+    source = src
+    for d in reversed(range(len(factors))):
+        F = factors[d][0]
+        outer = ufl.product(num_in[:d])
+        inner = ufl.product(num_out[d + 1:])
+        a = loop_index(outer_index, outer)
+        i = loop_index(out_index, num_out[d])
+        j = loop_index(sum_index, num_in[d])
+        b = loop_index(inner_index, inner)
+
+        if d == 0:
+            target = dst
+        else:
+            T = temps()
+            code.append(L.ArrayDecl(typename, T, outer * num_out[d] * inner, 0))
+            target = T.__getitem__
+
+        body = L.AssignAdd(target((a * num_out[d] + i) * inner + b),
+                           F(i, j) * source((a * num_in[d] + j) * inner + b))
+        for index, n in ((inner_index, inner), (sum_index, num_in[d]),
+                         (out_index, num_out[d]), (outer_index, outer)):
+            if n > 1:
+                body = L.ForRange(index, 0, n, body=body, vectorize=vectorize and index is inner_index)
+        code.append(body)
+
+        if d > 0:
+            source = T.__getitem__
+    return code
+
+
+def generate_basis_change(L, basis, num_out, num_in, src, dst, indices, vectorize=False, unroll=False):
+    """Generate code accumulating dst[i] += sum_j B[i, j] src[j].
+
+    Input:
+      basis   - function B(i, j) returning the code for the basis table entry
+      src     - function returning the code for src at an index j
+      dst     - function returning the code for dst at an index i
+      indices - two loop index symbols, for i and j
+      unroll  - unroll the sum over j, for src defined only at integer j
+
+    The loop over i is innermost, such that the change of basis of
+    each entry of src is an independent update of dst.
+    """
+    i, j = indices
+    if unroll:
+        body = L.AssignAdd(dst(i), L.Sum([basis(i, k) * src(k) for k in range(num_in)]))
+        return [L.ForRange(i, 0, num_out, body=body)]
+    body = L.AssignAdd(dst(i), basis(i, j) * src(j))
+    body = L.ForRange(i, 0, num_out, body=body, vectorize=vectorize)
+    return [L.ForRange(j, 0, num_in, body=body)]
@@ -386,6 +386,54 @@ extern "C"
     void (*tabulate_tensor)(ufc_scalar_t* restrict A, const ufc_scalar_t* w,
                             const double* restrict coordinate_dofs,
                             int cell_orientation);
+
+    /// Tabulate the tensors of num_cells cells at once, or NULL if
+    /// not generated. A, w and coordinate_dofs hold the arguments
+    /// of tabulate_tensor for all cells with the cell index
+    /// innermost, i.e. entry k of cell c is at X[k*num_cells + c].
+    /// cell_orientations may be NULL if the integral does not
+    /// depend on the cell orientation.
+    void (*tabulate_tensor_batch)(ufc_scalar_t* restrict A,
+                                  const ufc_scalar_t* restrict w,
+                                  const double* restrict coordinate_dofs,
+                                  const int* restrict cell_orientations,
+                                  int num_cells);
+
+    /// Tabulate the element tensor A of this bilinear form together
+    /// with the element vector b of a linear form with the same test
+    /// function, e.g. a residual and its Jacobian, sharing the
+    /// computations of both, or NULL if not generated. w holds the
+    /// coefficients of the linear form, which include all
+    /// coefficients of the bilinear form.
+    void (*tabulate_tensor_fused)(ufc_scalar_t* restrict A,
+                                  ufc_scalar_t* restrict b,
+                                  const ufc_scalar_t* w,
+                                  const double* restrict coordinate_dofs,
+                                  int cell_orientation);
+
+    /// Tabulate the element vector A of the action of this bilinear
+    /// form on a function with trial space element dofs x, i.e. the
+    /// product of the element tensor with x, without computing the
+    /// element tensor, or NULL if not generated.
+    void (*tabulate_action)(ufc_scalar_t* restrict A,
+                            const ufc_scalar_t* restrict x,
+                            const ufc_scalar_t* w,
+                            const double* restrict coordinate_dofs,
+                            int cell_orientation);
+
+    /// Tabulate only the diagonal A[i] of the element tensor A[i][i]
+    /// of this bilinear form with both arguments in the same space,
+    /// e.g. for Jacobi smoothers, or NULL if not generated.
+    void (*tabulate_diagonal)(ufc_scalar_t* restrict A,
+                              const ufc_scalar_t* w,
+                              const double* restrict coordinate_dofs,
+                              int cell_orientation);
+
+    /// True if the element tensor is symmetric, A[i][j] == A[j][i],
+    /// for a bilinear form with both arguments in the same function
+    /// space and a form symmetric in the two arguments. Assemblers
+    /// may then insert only one triangle of A into a symmetric matrix.
+    bool symmetric;
   } ufc_cell_integral;
 
   typedef struct ufc_exterior_facet_integral
@@ -394,6 +442,9 @@ extern "C"
     void (*tabulate_tensor)(ufc_scalar_t* restrict A, const ufc_scalar_t* w,
                             const double* restrict coordinate_dofs, int facet,
                             int cell_orientation);
+
+    /// True if the element tensor is symmetric, see ufc_cell_integral
+    bool symmetric;
   } ufc_exterior_facet_integral;
 
   typedef struct ufc_interior_facet_integral
@@ -404,6 +455,9 @@ extern "C"
                             const double* restrict coordinate_dofs_1,
                             int facet_0, int facet_1, int cell_orientation_0,
                             int cell_orientation_1);
+
+    /// True if the element tensor is symmetric, see ufc_cell_integral
+    bool symmetric;
   } ufc_interior_facet_integral;
 
   typedef struct ufc_vertex_integral
@@ -412,6 +466,9 @@ extern "C"
     void (*tabulate_tensor)(ufc_scalar_t* restrict A, const ufc_scalar_t* w,
                             const double* restrict coordinate_dofs, int vertex,
                             int cell_orientation);
+
+    /// True if the element tensor is symmetric, see ufc_cell_integral
+    bool symmetric;
   } ufc_vertex_integral;
 
   typedef struct ufc_custom_integral
@@ -424,6 +481,9 @@ extern "C"
                             const double* restrict quadrature_weights,
                             const double* restrict facet_normals,
                             int cell_orientation);
+
+    /// True if the element tensor is symmetric, see ufc_cell_integral
+    bool symmetric;
   } ufc_custom_integral;
 
   /// This class defines the interface for the assembly of the global
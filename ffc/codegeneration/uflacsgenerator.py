@@ -11,17 +11,23 @@ import collections
 import itertools
 import logging
 
+import numpy
+
 import ufl
 from ffc.codegeneration.backend import FFCBackend
+from ffc.codegeneration.cellbatch import BatchingNotSupported, CellBatchGenerator
 from ffc.codegeneration.C.cnodes import pad_dim, pad_innermost_dim
 from ffc.codegeneration.C.format_lines import format_indented_lines
+from ffc.codegeneration.smallgemm import generate_small_gemm, is_gemm_block
+from ffc.codegeneration.tensorcontraction import generate_basis_change, generate_tensor_contraction
 from ffc.ir.representationutils import initialize_integral_code
+from ffc.ir.uflacs.analysis.graph import PIECEWISE, VARYING
 from ffc.ir.uflacs.elementtables import piecewise_ttypes
 
 logger = logging.getLogger(__name__)
 
 
-def generate_integral_code(ir, parameters):
+def generate_integral_code(ir, parameters, table_registry=None):
     """Generate code for integral from intermediate representation."""
 
     logger.info("Generating code from ffc.ir.uflacs representation")
@@ -33,7 +39,7 @@ def generate_integral_code(ir, parameters):
     backend = FFCBackend(ir, parameters)
 
     # Configure kernel generator
-    ig = IntegralGenerator(ir, backend, precision)
+    ig = IntegralGenerator(ir, backend, precision, table_registry)
 
     # Generate code ast for the tabulate_tensor body
     parts = ig.generate()
@@ -45,14 +51,47 @@ def generate_integral_code(ir, parameters):
     code = initialize_integral_code(ir, parameters)
     code["tabulate_tensor"] = body
 
+    # Generate the tabulate_tensor_batch body computing a batch of cells
+    code["tabulate_tensor_batch"] = None
+    width = ir.params["batch_width"]
+    if (ir.integral_type == "cell" and width > 0 and ir.residual_shape is None
+            and ir.action_coefficient is None and ir.diagonal_shape is None):
+        batch = CellBatchGenerator(backend.language, width, ir.params["vectorize"])
+        try:
+            batch_parts = batch.generate(parts)
+        except BatchingNotSupported as e:
+            logger.info("Not generating tabulate_tensor_batch: {}".format(e))
+        else:
+            code["tabulate_tensor_batch"] = format_indented_lines(batch_parts.cs_format(precision), 1)
+
     return code
 
 
+def is_diagonal_block(blockdata):
+    """Check if block couples two arguments collocated with the same quadrature points."""
+    return blockdata.block_mode == "quadrature" and blockdata.ttypes == ("quadrature", "quadrature")
+
+
+def diagonal_dof_pairs(blockmap):
+    """Return the pairs (i, j) of block indices mapped to the same dof.
+
+    These are the entries of a block of a bilinear form on the diagonal
+    of the element tensor.
+    """
+    dofmap0, dofmap1 = blockmap
+    columns = {dof: j for j, dof in enumerate(dofmap1)}
+    return [(i, columns[dof]) for i, dof in enumerate(dofmap0) if dof in columns]
+
+
 class IntegralGenerator(object):
-    def __init__(self, ir, backend, precision):
+    def __init__(self, ir, backend, precision, table_registry=None):
         # Store ir
         self.ir = ir
 
+        # Module level registry of static tables, tables are declared
+        # locally in tabulate_tensor if None
+        self.table_registry = table_registry
+
         # Formatting precision
         self.precision = precision
 
@@ -73,47 +112,45 @@ class IntegralGenerator(object):
         # Cache
         self.shared_symbols = {}
 
+        # Computations of the factors of each quadrature loop
+        # vectorised over points, by num_points
+        self.point_parts = collections.defaultdict(list)
+
+        # Sum factorised contractions and matrix products of blocks
+        # following the computation of the factors, by num_points
+        self.contraction_parts = collections.defaultdict(list)
+
         # Block contributions collected during generation to be added to A at the end
         self.finalization_blocks = collections.defaultdict(list)
+        self.finalization_diagonal_blocks = collections.defaultdict(list)
+
+        # Blocks of symmetric forms added to A transposed, in addition
+        # to being added to A[blockmap] as finalization blocks
+        self.finalization_transposed_blocks = collections.defaultdict(list)
 
         # Set of counters used for assigning names to intermediate variables
         self.symbol_counters = collections.defaultdict(int)
 
     def init_scopes(self):
-        """Initialize variable scope dicts."""
-        # Reset variables, separate sets for quadrature loop
-        self.scopes = {num_points: {} for num_points in self.ir.all_num_points}
-        self.scopes[None] = {}
-
-    def set_var(self, num_points, v, vaccess):
-        """Set a new variable in variable scope dicts.
-
-        Scope is determined by num_points which identifies the
-        quadrature loop scope or None if outside quadrature loops.
-
-        v is the ufl expression and vaccess is the CNodes
-        expression to access the value in the code.
-
-        """
-        self.scopes[num_points][v] = vaccess
-
-    def get_var(self, num_points, v):
-        """Lookup ufl expression v in variable scope dicts.
+        """Initialize variable scopes."""
+        # Access expressions for the nodes of the factorization of each
+        # quadrature loop, indexed by node number
+        self.scopes = {
+            num_points: [None] * self.ir.varying_irs[num_points]["factorization"].number_of_nodes()
+            for num_points in self.ir.all_num_points
+        }
 
-        Scope is determined by num_points which identifies the
-        quadrature loop scope or None if outside quadrature loops.
+        # Access expressions for nodes outside quadrature loops by
+        # expression, for reuse between the factorizations of different
+        # quadrature loops
+        self.piecewise_scope = {}
 
-        If v is not found in quadrature loop scope, the piecewise
-        scope (None) is checked.
+    def get_var(self, num_points, i):
+        """Lookup node i of the factorization for num_points in variable scopes.
 
         Returns the CNodes expression to access the value in the code.
         """
-        if v._ufl_is_literal_:
-            return self.backend.ufl_to_language.get(v)
-        f = self.scopes[num_points].get(v)
-        if f is None:
-            f = self.scopes[None][v]
-        return f
+        return self.scopes[num_points][i]
 
     def new_temp_symbol(self, basename):
         """Create a new code symbol named basename + running counter."""
@@ -140,10 +177,14 @@ class IntegralGenerator(object):
         L = self.backend.language
 
         # Assert that scopes are empty: expecting this to be called only once
-        assert not any(d for d in self.scopes.values())
+        assert not self.piecewise_scope
+        assert all(vaccess is None for scope in self.scopes.values() for vaccess in scope)
 
         parts = []
 
+        # Note quadrature degrees reduced to stay within the point budget
+        parts += self.generate_capped_degree_comments()
+
         # Generate the tables of quadrature points and weights
         parts += self.generate_quadrature_tables()
 
@@ -199,6 +240,16 @@ class IntegralGenerator(object):
 
         return L.StatementList(parts)
 
+    def generate_capped_degree_comments(self):
+        """Generate comments listing quadrature degrees capped by max_quadrature_points."""
+        L = self.backend.language
+
+        degrees = sorted(set((md["estimated_quadrature_degree"], md["quadrature_degree"])
+                             for md in self.ir.integral_metadata
+                             if "estimated_quadrature_degree" in md))
+        return [L.Comment("Quadrature degree {} capped to {} by max_quadrature_points".format(*d))
+                for d in degrees]
+
     def generate_quadrature_tables(self):
         """Generate static tables of quadrature points and weights."""
         L = self.backend.language
@@ -221,12 +272,20 @@ class IntegralGenerator(object):
             assert num_points == len(weights)
             assert num_points == points.shape[0]
 
+            # Pad rule of loops vectorised over points with zero
+            # weights at the last point
+            num_padded_points = self.backend.symbols.padded_num_points.get(num_points, num_points)
+            if num_padded_points > num_points:
+                pad = num_padded_points - num_points
+                weights = numpy.concatenate((weights, numpy.zeros(pad)))
+                points = numpy.concatenate((points, numpy.repeat(points[-1:], pad, axis=0)))
+
             # Generate quadrature weights array
             if varying_ir["need_weights"]:
                 wsym = self.backend.symbols.weights_table(num_points)
                 parts += [
                     L.ArrayDecl(
-                        "static const ufc_scalar_t", wsym, num_points, weights, alignas=alignas)
+                        "static const ufc_scalar_t", wsym, num_padded_points, weights, alignas=alignas)
                 ]
 
             # Generate quadrature points array
@@ -252,7 +311,7 @@ class IntegralGenerator(object):
 
         tables = self.ir.unique_tables
         table_types = self.ir.unique_table_types
-        inline_tables = self.ir.integral_type == "cell"
+        inline_tables = self.ir.integral_type == "cell" or not self.ir.tensor_shape
 
         alignas = self.ir.params["alignas"]
         padlen = self.ir.params["padlen"]
@@ -264,6 +323,13 @@ class IntegralGenerator(object):
             # Define all tables
             table_names = sorted(tables)
 
+        padded_num_points = self.backend.symbols.padded_num_points
+
+        # Preintegrated tables of blocks added to A in loop nests
+        looped_tables = set(blockdata.name for blockmap, blockdata, factor_indices
+                            in self.get_preintegrated_blocks()
+                            if self.ir.tensor_shape and not self.is_unrolled_block(blockmap))
+
         for name in table_names:
             table = tables[name]
 
@@ -273,8 +339,21 @@ class IntegralGenerator(object):
             else:
                 p = padlen
 
+                # Repeat the last point of tables in loops vectorised over points
+                num_points = table.shape[1]
+                if (table_types[name] not in piecewise_ttypes + ("tensor_factor", )
+                        and num_points in padded_num_points):
+                    pad = padded_num_points[num_points] - num_points
+                    table = numpy.concatenate((table, numpy.repeat(table[:, -1:, :], pad, axis=1)), axis=1)
+
             # Skip tables that are inlined in code generation
-            if inline_tables and name[:2] == "PI":
+            if inline_tables and name[:2] == "PI" and name not in looped_tables:
+                continue
+
+            if self.table_registry is not None:
+                # Share table with other kernels in the module
+                shared_name = self.table_registry.add(L, name, table, alignas, p, self.precision)
+                self.backend.symbols.table_names[name] = shared_name
                 continue
 
             decl = L.ArrayDecl(
@@ -285,6 +364,8 @@ class IntegralGenerator(object):
         parts = L.commented_code_list(parts, [
             "Precomputed values of basis functions and precomputations",
             "FE* dimensions: [entities][points][dofs]",
+            "FT* dimensions: [points][dofs] of one direction of a tensor product",
+            "FB* dimensions: [tensor product dofs][dofs] in collapsed coordinates",
             "PI* dimensions: [entities][dofs][dofs] or [entities][dofs]",
             "PM* dimensions: [entities][dofs][dofs]",
         ])
@@ -303,6 +384,30 @@ class IntegralGenerator(object):
         # will be placed before or after quadloop
         preparts, quadparts, postparts = \
             self.generate_dofblock_partition(num_points)
+
+        num_padded_points = self.backend.symbols.padded_num_points.get(num_points)
+        if num_padded_points:
+            # The varying partition computes arrays over all points,
+            # split the loop computing the factors times weights from
+            # the loop accumulating the blocks
+            iq = self.backend.symbols.quadrature_loop_index()
+            point_parts = self.point_parts[num_points]
+            if point_parts:
+                body += [L.ForRange(iq, 0, num_padded_points, body=point_parts,
+                                    vectorize=self.ir.params["vectorize"])]
+            body += self.contraction_parts[num_points]
+            if quadparts:
+                body += [L.ForRange(iq, 0, num_points, body=quadparts)]
+            if body:
+                body = [L.Scope(body)]
+            if num_padded_points > num_points:
+                comment = "Quadrature loop vectorised over {0} points padded to {1}".format(
+                    num_points, num_padded_points)
+            else:
+                comment = "Quadrature loop vectorised over {0} points".format(num_points)
+            quadparts = L.commented_code_list(body, comment)
+            return preparts, quadparts, postparts
+
         body += quadparts
 
         # Wrap body in loop or scope
@@ -435,61 +540,90 @@ class IntegralGenerator(object):
     def generate_unstructured_piecewise_partition(self):
         L = self.backend.language
 
-        # Get annotated graph of factorisation
-        F = self.ir.piecewise_ir["factorization"]
-
-        arraysymbol = L.Symbol("sp")
-        num_points = None
-        parts = self.generate_partition(arraysymbol, F, "piecewise", num_points)
+        parts = []
+        for num_points in self.ir.all_num_points:
+            # Piecewise nodes already defined for another quadrature
+            # loop are reused
+            if len(self.ir.all_num_points) == 1:
+                arraysymbol = L.Symbol("sp")
+            else:
+                arraysymbol = L.Symbol("sp%d" % num_points)
+            parts += self.generate_partition(arraysymbol, num_points, PIECEWISE)
         parts = L.commented_code_list(parts, "Unstructured piecewise computations")
         return parts
 
     def generate_unstructured_varying_partition(self, num_points):
         L = self.backend.language
 
-        # Get annotated graph of factorisation
-        F = self.ir.varying_irs[num_points]["factorization"]
-
         arraysymbol = L.Symbol("sv%d" % num_points)
-        parts = self.generate_partition(arraysymbol, F, "varying", num_points)
+        parts = self.generate_partition(arraysymbol, num_points, VARYING)
         parts = L.commented_code_list(parts, "Unstructured varying computations for num_points=%d" %
                                       (num_points, ))
         return parts
 
-    def generate_partition(self, symbol, F, mode, num_points):
+    def generate_partition(self, symbol, num_points, mode):
+        """Generate code for the nodes with status mode in the factorization.
+
+        The factorization is that of the quadrature loop with num_points.
+        """
         L = self.backend.language
 
+        # Get annotated graph of factorisation and the scope of its nodes
+        F = self.ir.varying_irs[num_points]["factorization"]
+        scope = self.scopes[num_points]
+        if mode == VARYING:
+            access_num_points = num_points
+        else:
+            access_num_points = None
+
         definitions = []
         intermediates = []
 
-        for i, attr in F.nodes.items():
-            if attr['status'] != mode:
-                continue
-            v = attr['expression']
-            mt = attr.get('mt')
+        # Intermediates of loops vectorised over points are arrays over all points
+        num_padded_points = None
+        if mode == VARYING:
+            num_padded_points = self.backend.symbols.padded_num_points.get(num_points)
+        iq = self.backend.symbols.quadrature_loop_index()
+        alignas = self.ir.params["alignas"]
+        declarations = []
+
+        for i in numpy.flatnonzero(F.status == mode).tolist():
+            attr = F.nodes[i]
+            v = attr.expression
+            mt = attr.mt
+
+            if mode != VARYING:
+                # Reuse definition from another quadrature loop
+                vaccess = self.piecewise_scope.get(v)
+                if vaccess is not None:
+                    scope[i] = vaccess
+                    continue
 
             if v._ufl_is_literal_:
                 vaccess = self.backend.ufl_to_language.get(v)
             elif mt is not None:
                 # All finite element based terminals have table data, as well
                 # as some, but not all, of the symbolic geometric terminals
-                tabledata = attr.get('tr')
+                tabledata = attr.tr
 
                 # Backend specific modified terminal translation
-                vaccess = self.backend.access.get(mt.terminal, mt, tabledata, num_points)
-                vdef = self.backend.definitions.get(mt.terminal, mt, tabledata, num_points, vaccess)
+                vaccess = self.backend.access.get(mt.terminal, mt, tabledata, access_num_points)
+                vdef = self.backend.definitions.get(mt.terminal, mt, tabledata, access_num_points,
+                                                    vaccess)
 
                 # Store definitions of terminals in list
                 assert isinstance(vdef, list)
                 definitions.extend(vdef)
             else:
-                # Get previously visited operands
-                vops = [self.get_var(num_points, op) for op in v.ufl_operands]
+                # Get previously visited operands, the out edges of the
+                # node are its operands in order
+                vops = [scope[j] for j in F.out_edges(i).tolist()]
 
                 # get parent operand
-                pid = F.in_edges[i][0] if F.in_edges[i] else -1
+                parents = F.in_edges(i)
+                pid = parents[0] if len(parents) else -1
                 if pid and pid > i:
-                    parent_exp = F.nodes.get(pid)['expression']
+                    parent_exp = F.nodes[pid].expression
                 else:
                     parent_exp = None
 
@@ -518,13 +652,23 @@ class IntegralGenerator(object):
                     j = len(intermediates)
                     if self.ir.params["use_symbol_array"]:
                         vaccess = symbol[j]
+                        if num_padded_points:
+                            vaccess = vaccess[iq]
+                        intermediates.append(L.Assign(vaccess, vexpr))
+                    elif num_padded_points:
+                        vsymbol = L.Symbol("%s_%d" % (symbol.name, j))
+                        declarations.append(L.ArrayDecl("ufc_scalar_t", vsymbol, num_padded_points,
+                                                        alignas=alignas))
+                        vaccess = vsymbol[iq]
                         intermediates.append(L.Assign(vaccess, vexpr))
                     else:
                         vaccess = L.Symbol("%s_%d" % (symbol.name, j))
                         intermediates.append(L.VariableDecl("const ufc_scalar_t", vaccess, vexpr))
 
             # Store access node for future reference
-            self.set_var(num_points, v, vaccess)
+            scope[i] = vaccess
+            if mode != VARYING:
+                self.piecewise_scope[v] = vaccess
 
         # Join terminal computation, array of intermediate expressions,
         # and intermediate computations
@@ -533,9 +677,16 @@ class IntegralGenerator(object):
             parts += definitions
         if intermediates:
             if self.ir.params["use_symbol_array"]:
-                alignas = self.ir.params["alignas"]
-                parts += [L.ArrayDecl("ufc_scalar_t", symbol, len(intermediates), alignas=alignas)]
-            parts += intermediates
+                sizes = (len(intermediates), )
+                if num_padded_points:
+                    sizes += (num_padded_points, )
+                parts += [L.ArrayDecl("ufc_scalar_t", symbol, sizes, alignas=alignas)]
+            if num_padded_points:
+                parts += declarations
+                parts += [L.ForRange(iq, 0, num_padded_points, body=intermediates,
+                                     vectorize=self.ir.params["vectorize"])]
+            else:
+                parts += intermediates
         return parts
 
     def generate_dofblock_partition(self, num_points):
@@ -555,8 +706,14 @@ class IntegralGenerator(object):
         for blockmap, blockdata in blocks:
 
             # Define code for block depending on mode
-            B, block_preparts, block_quadparts, block_postparts = \
-                self.generate_block_parts(num_points, blockmap, blockdata)
+            if self.ir.diagonal_shape is not None:
+                block = self.generate_diagonal_block_parts(num_points, blockmap, blockdata)
+                if block is None:
+                    continue
+                blockmap, B, block_preparts, block_quadparts, block_postparts = block
+            else:
+                B, block_preparts, block_quadparts, block_postparts = \
+                    self.generate_block_parts(num_points, blockmap, blockdata)
 
             # Add definitions
             preparts.extend(block_preparts)
@@ -567,8 +724,16 @@ class IntegralGenerator(object):
             # Add finalization
             postparts.extend(block_postparts)
 
-            # Add A[blockmap] += B[...] to finalization
-            self.finalization_blocks[blockmap].append(B)
+            # Add A[blockmap] += B[...] to finalization, and the
+            # transpose of B for blocks standing in for their mirror
+            if is_diagonal_block(blockdata):
+                self.finalization_diagonal_blocks[blockmap].append(B)
+                if blockdata.symmetry == "pair":
+                    self.finalization_diagonal_blocks[blockmap[::-1]].append(B)
+            else:
+                self.finalization_blocks[blockmap].append(B)
+                if blockdata.symmetry == "pair":
+                    self.finalization_transposed_blocks[blockmap].append(B)
 
         return preparts, quadparts, postparts
 
@@ -603,10 +768,7 @@ class IntegralGenerator(object):
         for i in range(block_rank):
             mad = blockdata.ma_data[i]
             td = mad.tabledata
-            if td.is_piecewise:
-                scope = self.ir.piecewise_ir["modified_arguments"]
-            else:
-                scope = self.ir.varying_irs[num_points]["modified_arguments"]
+            scope = self.ir.varying_irs[blockdata.num_points]["modified_arguments"]
             mt = scope[mad.ma_index]
 
             # Translate modified terminal to code
@@ -614,14 +776,15 @@ class IntegralGenerator(object):
             #       Not using self.backend.access.argument() here
             #       now because it assumes too much about indices.
 
-            table = self.backend.symbols.element_table(td, self.ir.entitytype, mt.restriction)
+            table = self.backend.symbols.element_table(td, self.ir.entitytype, mt.restriction, iq)
 
             assert td.ttype != "zeros"
 
             if td.ttype == "ones":
                 arg_factor = L.LiteralFloat(1.0)
-            elif td.ttype == "quadrature":  # TODO: Revisit all quadrature ttype checks
-                arg_factor = table[iq]
+            elif td.ttype == "quadrature":
+                # Identity table, argument is indexed by iq in the block
+                arg_factor = L.LiteralFloat(1.0)
             else:
                 # Assuming B sparsity follows element table sparsity
                 arg_factor = table[indices[i]]
@@ -653,6 +816,7 @@ class IntegralGenerator(object):
             "full": "TF",
             "safe": "TS",
             "quadrature": "TQ",
+            "factorized": "TT",
         }
         blocknames = {
             # "preintegrated": "BI",
@@ -661,6 +825,7 @@ class IntegralGenerator(object):
             "full": "BF",
             "safe": "BS",
             "quadrature": "BQ",
+            "factorized": "BT",
         }
 
         tempname = tempnames.get(blockdata.block_mode)
@@ -672,6 +837,12 @@ class IntegralGenerator(object):
         blockdims = tuple(len(dofmap) for dofmap in blockmap)
         padded_blockdims = pad_innermost_dim(blockdims, padlen)
 
+        # Only store the diagonal B[iq] of B[iq, iq]
+        diagonal = is_diagonal_block(blockdata)
+        if diagonal:
+            assert blockdims[0] == blockdims[1]
+            blockdims = blockdims[:1]
+
         ttypes = blockdata.ttypes
         if "zeros" in ttypes:
             raise RuntimeError("Not expecting zero arguments to be left in dofblock generation.")
@@ -693,6 +864,8 @@ class IntegralGenerator(object):
             else:
                 B_indices.append(arg_indices[i])
         B_indices = tuple(B_indices)
+        if diagonal:
+            B_indices = B_indices[:1]
 
         # Define unique block symbol
         blockname = blocknames.get(blockdata.block_mode)
@@ -704,12 +877,12 @@ class IntegralGenerator(object):
                 L.ArrayDecl("ufc_scalar_t", B, blockdims, 0, alignas=alignas, padlen=padlen))
 
         # Get factor expression
-        if blockdata.factor_is_piecewise:
-            F = self.ir.piecewise_ir["factorization"]
-        else:
-            F = self.ir.varying_irs[num_points]["factorization"]
-        v = F.nodes[blockdata.factor_index]['expression']
-        f = self.get_var(num_points, v)
+        f = self.get_var(blockdata.num_points, blockdata.factor_index)
+
+        # Key for temporaries depending on the factor, factor_index is
+        # only unique within the factorization of one quadrature loop
+        factor_key = (num_points, blockdata.num_points, blockdata.factor_index,
+                      blockdata.factor_is_piecewise)
 
         # Quadrature weight was removed in representation, add it back now
         if num_points is None:
@@ -721,36 +894,46 @@ class IntegralGenerator(object):
             weights = self.backend.symbols.weights_table(num_points)
             weight = weights[iq]
 
+        # Blocks computed by a matrix product over all points
+        gemm = (is_gemm_block(blockdata, self.ir.params["gemm_block_points"])
+                and num_points in self.backend.symbols.padded_num_points)
+
         # Define fw = f * weight
-        if blockdata.block_mode in ("safe", "full", "partial"):
+        if blockdata.block_mode == "factorized":
+            # Array over all points, computed in a separate loop over
+            # the points before the contractions of the blocks
+            fw_rhs = L.float_product([f, weight])
+            fw, defined = self.get_temp_symbol("fw", factor_key)
+            if not defined:
+                preparts.append(L.ArrayDecl("ufc_scalar_t", fw, num_points, alignas=alignas))
+                self.point_parts[num_points].append(L.Assign(fw[iq], fw_rhs))
+
+        elif blockdata.block_mode in ("safe", "full", "partial", "quadrature"):
             assert not blockdata.transposed, "Not handled yet"
 
             # Fetch code to access modified arguments
             arg_factors = self.get_arg_factors(blockdata, block_rank, num_points, iq, B_indices)
 
             fw_rhs = L.float_product([f, weight])
-            if not isinstance(fw_rhs, L.Product):
+            if not isinstance(fw_rhs, L.Product) and not gemm:
                 fw = fw_rhs
             else:
                 # Define and cache scalar temp variable
-                key = (num_points, blockdata.factor_index, blockdata.factor_is_piecewise)
+                key = factor_key
                 fw, defined = self.get_temp_symbol("fw", key)
-                if not defined:
+                num_padded_points = self.backend.symbols.padded_num_points.get(num_points)
+                if num_padded_points:
+                    # Array over all points, computed in a separate
+                    # loop over the padded quadrature rule
+                    if not defined:
+                        preparts.append(L.ArrayDecl("ufc_scalar_t", fw, num_padded_points,
+                                                    alignas=alignas))
+                        self.point_parts[num_points].append(L.Assign(fw[iq], fw_rhs))
+                    fw_points = fw
+                    fw = fw[iq]
+                elif not defined:
                     quadparts.append(L.VariableDecl("const ufc_scalar_t", fw, fw_rhs))
 
-                # Plan for vectorization of fw computations over iq:
-                # 1) Define fw as arrays e.g. "double fw0[nq];" outside quadloop
-                # 2) Access as fw0[iq] of course
-                # 3) Split quadrature loops, one for fw computation and one for blocks
-                # 4) Pad quadrature rule with 0 weights and last point
-
-                # Plan for vectorization of coefficient evaluation over iq:
-                # 1) Define w0_c1 etc as arrays e.g. "double w0_c1[nq] = {};" outside quadloop
-                # 2) Access as w0_c1[iq] of course
-                # 3) Splitquadrature loops, coefficients before fw computation
-                # 4) Possibly swap loops over iq and ic:
-                #    for(ic) for(iq) w0_c1[iq] = w[0][ic] * FE[iq][ic];
-
         if blockdata.block_mode == "safe":
             # Naively accumulate integrand for this block in the innermost loop
             assert not blockdata.transposed
@@ -763,6 +946,45 @@ class IntegralGenerator(object):
             # Define rhs expression for A[blockmap[arg_indices]] += A_rhs
             A_rhs = B[arg_indices]
 
+        elif gemm:
+            # Accumulate the block by a matrix product over all points
+            # after the computation of fw in all points
+            def arg_factor(k, q, index):
+                return self.get_arg_factors(blockdata, k + 1, num_points, q, (index, ) * (k + 1))[k]
+
+            if blockdata.block_mode == "full" and block_rank == 2:
+                gemm_args = (lambda q, i: fw_points[q] * arg_factor(0, q, i), lambda q, j: arg_factor(1, q, j),
+                             lambda i, j: B[i][j], blockdims)
+            elif blockdata.block_mode == "full":
+                gemm_args = (lambda q, i: fw_points[q], lambda q, j: arg_factor(0, q, j),
+                             lambda i, j: B[j], (1, blockdims[0]))
+            else:
+                # P[:] = sum_q weight * f * other_argument[:], shared
+                # by blocks with the same factor and other argument
+                k = 1 - blockdata.piecewise_ma_index
+                key = factor_key + (arg_factors[k].ce_format(self.precision), )
+                P, defined = self.get_temp_symbol(tempname, key)
+                gemm_args = None
+                if not defined:
+                    preparts.append(
+                        L.ArrayDecl("ufc_scalar_t", P, blockdims[k], 0, alignas=alignas, padlen=padlen))
+                    gemm_args = (lambda q, i: fw_points[q], lambda q, j: arg_factor(k, q, j),
+                                 lambda i, j: P[j], (1, blockdims[k]))
+
+            if gemm_args is not None:
+                a, b, c, shape = gemm_args
+                code = generate_small_gemm(L, a, b, c, shape, num_points, self.ir.params["gemm_block_points"],
+                                           self.backend.symbols.gemm_indices(),
+                                           lambda: self.new_temp_symbol("PG"))
+                self.contraction_parts[num_points] += L.commented_code_list(
+                    code, "UFLACS block mode: {}, matrix product over points".format(blockdata.block_mode))
+
+            # Define rhs expression for A[blockmap[arg_indices]] += A_rhs
+            if blockdata.block_mode == "full":
+                A_rhs = B[arg_indices]
+            else:
+                A_rhs = arg_factors[blockdata.piecewise_ma_index] * P[arg_indices[k]]
+
         elif blockdata.block_mode == "full":
             assert not blockdata.transposed, "Not handled yet"
 
@@ -777,8 +999,7 @@ class IntegralGenerator(object):
 
                 P_index = B_indices[i]
 
-                key = (num_points, blockdata.factor_index, blockdata.factor_is_piecewise,
-                       arg_factors[i].ce_format(self.precision))
+                key = factor_key + (arg_factors[i].ce_format(self.precision), )
                 P, defined = self.get_temp_symbol(tempname, key)
                 if not defined:
                     # TODO: If FE table is varying and only used in contexts
@@ -800,16 +1021,26 @@ class IntegralGenerator(object):
 
                 B_rhs = P[P_index] * arg_factors[j]
 
+            # Compute only the upper triangle of symmetric blocks,
+            # and copy it to the lower triangle after the quadloop
+            triangular = blockdata.symmetry == "self" and block_rank == 2 and "quadrature" not in ttypes
+
             # Add result to block inside quadloop
             body = L.AssignAdd(B[B_indices], B_rhs)  # NB! += not =
             for i in reversed(range(block_rank)):
                 # Vectorize only the innermost loop
                 vectorize = self.ir.params["vectorize"] and (i == block_rank - 1)
+                begin = B_indices[0] if triangular and i == 1 else 0
                 if ttypes[i] != "quadrature":
                     body = L.ForRange(
-                        B_indices[i], 0, padded_blockdims[i], body=body, vectorize=vectorize)
+                        B_indices[i], begin, padded_blockdims[i], body=body, vectorize=vectorize)
             quadparts += [body]
 
+            if triangular:
+                body = L.Assign(B[B_indices], B[B_indices[::-1]])
+                body = L.ForRange(B_indices[1], 0, B_indices[0], body=body)
+                postparts += [L.ForRange(B_indices[0], 1, blockdims[0], body=body)]
+
             # Define rhs expression for A[blockmap[arg_indices]] += A_rhs
             A_rhs = B[arg_indices]
 
@@ -824,8 +1055,7 @@ class IntegralGenerator(object):
 
             P_index = arg_indices[not_piecewise_index]
 
-            key = (num_points, blockdata.factor_index, blockdata.factor_is_piecewise,
-                   arg_factors[not_piecewise_index].ce_format(self.precision))
+            key = factor_key + (arg_factors[not_piecewise_index].ce_format(self.precision), )
             P, defined = self.get_temp_symbol(tempname, key)
             if not defined:
                 # Declare P table in preparts
@@ -848,6 +1078,69 @@ class IntegralGenerator(object):
             # Define rhs expression for A[blockmap[arg_indices]] += A_rhs
             A_rhs = B_rhs
 
+        elif blockdata.block_mode == "factorized":
+            # Contract fw, times the first argument if any, with the
+            # factor tables of the last argument one direction at a time
+            mad = blockdata.ma_data[-1]
+            factors = []
+            for name in self.ir.varying_irs[num_points]["tensor_factors"][mad.tabledata.name]:
+                FT = self.backend.symbols.element_table_symbol(name)
+                num_points_1d, num_dofs_1d = self.ir.unique_tables[name].shape
+                factors.append((lambda ic, iq, FT=FT: FT[iq][ic], num_dofs_1d, num_points_1d))
+            indices = self.backend.symbols.tensor_contraction_indices()
+            vectorize = self.ir.params["vectorize"]
+            basis = self.ir.varying_irs[num_points]["tensor_bases"].get(mad.tabledata.name)
+
+            def contract(src, dst):
+                if basis is None:
+                    return generate_tensor_contraction(
+                        L, factors, src, dst, lambda: self.new_temp_symbol(tempname), indices,
+                        vectorize=vectorize)
+                # Contraction in collapsed coordinates, followed by the
+                # change to the element basis
+                FB = self.backend.symbols.element_table_symbol(basis)
+                num_polys, num_dofs = self.ir.unique_tables[basis].shape
+                T = self.new_temp_symbol(tempname)
+                code = [L.ArrayDecl("ufc_scalar_t", T, num_polys, 0, alignas=alignas)]
+                code += generate_tensor_contraction(
+                    L, factors, src, T.__getitem__, lambda: self.new_temp_symbol(tempname), indices,
+                    vectorize=vectorize)
+                code += generate_basis_change(L, lambda ic, k: FB[k][ic], num_dofs, num_polys,
+                                              T.__getitem__, dst, indices[1:3], vectorize)
+                return code
+
+            if block_rank == 1:
+                contraction = contract(fw.__getitem__, B.__getitem__)
+            else:
+                # Contraction for each dof of the first argument
+                arg_factors = self.get_arg_factors(blockdata, 1, num_points, iq, B_indices)
+                P = self.new_temp_symbol(tempname)
+                body = [
+                    L.ArrayDecl("ufc_scalar_t", P, num_points, alignas=alignas),
+                    L.ForRange(iq, 0, num_points, body=L.Assign(P[iq], fw[iq] * arg_factors[0]),
+                               vectorize=vectorize)
+                ]
+                body += contract(P.__getitem__, B[B_indices[0]].__getitem__)
+                contraction = [L.ForRange(B_indices[0], 0, blockdims[0], body=body)]
+            self.contraction_parts[num_points] += L.commented_code_list(
+                contraction, "UFLACS block mode: factorized")
+
+            # Define rhs expression for A[blockmap[arg_indices]] += A_rhs
+            A_rhs = B[arg_indices]
+
+        elif blockdata.block_mode == "quadrature":
+            # Arguments with identity tables are nonzero only for dof
+            # iq, so their dof loops are dropped and B accumulated at iq
+            B_rhs = L.float_product([fw] + arg_factors)
+            body = L.AssignAdd(B[B_indices], B_rhs)  # NB! += not =
+            for i in reversed(range(block_rank)):
+                if ttypes[i] != "quadrature":
+                    body = L.ForRange(B_indices[i], 0, padded_blockdims[i], body=body)
+            quadparts += [body]
+
+            # Define rhs expression for A[blockmap[arg_indices]] += A_rhs
+            A_rhs = B[arg_indices[:len(B_indices)]]
+
         elif blockdata.block_mode in ("premultiplied", "preintegrated"):
             P_ii = self.get_entities(blockdata)
             if blockdata.transposed:
@@ -860,11 +1153,11 @@ class IntegralGenerator(object):
                 assert num_points is None
 
                 # Define B = B_rhs = f * PI where PI = sum_q weight * u * v
-                PI = L.Symbol(blockdata.name)[P_ii]
+                PI = self.backend.symbols.element_table_symbol(blockdata.name)[P_ii]
                 B_rhs = L.float_product([f, PI])
 
             elif blockdata.block_mode == "premultiplied":
-                key = (num_points, blockdata.factor_index, blockdata.factor_is_piecewise)
+                key = factor_key
                 FI, defined = self.get_temp_symbol(tempname, key)
                 if not defined:
                     # Declare FI = 0 before quadloop
@@ -873,7 +1166,7 @@ class IntegralGenerator(object):
                     quadparts += [L.AssignAdd(FI, L.float_product([weight, f]))]
 
                 # Define B_rhs = FI * PM where FI = sum_q weight*f, and PM = u * v
-                PM = L.Symbol(blockdata.name)[P_ii]
+                PM = self.backend.symbols.element_table_symbol(blockdata.name)[P_ii]
                 B_rhs = L.float_product([FI, PM])
 
             # Define rhs expression for A[blockmap[arg_indices]] += A_rhs
@@ -887,59 +1180,191 @@ class IntegralGenerator(object):
 
         return A_rhs, preparts, quadparts, postparts
 
-    def generate_preintegrated_dofblock_partition(self):
-        # FIXME: Generalize this to unrolling all A[] += ... loops,
-        # or all loops with noncontiguous DM??
+    def generate_diagonal_block_parts(self, num_points, blockmap, blockdata):
+        """Generate code parts for the diagonal entries of a block in diagonal kernels.
+
+        Returns the blockmap into the diagonal and the parts as
+        generate_block_parts, or None if the block has no entries on
+        the diagonal. Entry k of the diagonal block accumulates the
+        product of the arguments at the k-th pair of dofs mapped to
+        the same dof, at a cost linear in the number of dofs.
+        """
         L = self.backend.language
 
-        block_contributions = self.ir.piecewise_ir["block_contributions"]
+        pairs = diagonal_dof_pairs(blockmap)
+        if not pairs:
+            return None
 
-        blocks = [(blockmap, blockdata)
-                  for blockmap, contributions in sorted(block_contributions.items())
-                  for blockdata in contributions if blockdata.block_mode == "preintegrated"]
+        if (blockdata.block_mode not in ("safe", "full", "partial") or blockdata.transposed
+                or "quadrature" in blockdata.ttypes):
+            raise RuntimeError("Not expecting block mode {} in diagonal kernels.".format(blockdata.block_mode))
 
-        # Get symbol, dimensions, and loop index symbols for A
-        A_shape = self.ir.tensor_shape
-        A_size = ufl.product(A_shape)
-        A_rank = len(A_shape)
+        preparts = []
+        quadparts = []
 
-        # TODO: there's something like shape2strides(A_shape) somewhere
-        # A_strides = ufl.utils.indexflattening.shape_to_strides(A_shape)
+        if num_points is None:
+            iq = None
+        elif num_points == 1:
+            iq = 0
+        else:
+            iq = self.backend.symbols.quadrature_loop_index()
 
-        A_strides = [1] * A_rank
-        for i in reversed(range(0, A_rank - 1)):
-            A_strides[i] = A_strides[i + 1] * A_shape[i + 1]
+        # Map the diagonal block index to the indices of the pairs into
+        # the block, through static tables unless contiguous, sharing
+        # the table of both arguments if equal
+        k = self.backend.symbols.argument_loop_index(0)
+        indices = {}
+        for index in zip(*pairs):
+            if index in indices:
+                continue
+            if index == tuple(range(index[0], index[0] + len(index))):
+                indices[index] = k + index[0]
+            else:
+                DI = self.new_temp_symbol("DI")
+                preparts.append(L.ArrayDecl("static const int", DI, len(index), index))
+                indices[index] = DI[k]
+        arg_indices = [indices[index] for index in zip(*pairs)]
+        arg_factors = self.get_arg_factors(blockdata, 2, num_points, iq, arg_indices)
 
-        A_values = [0.0] * A_size
+        # Define fw = f * weight
+        f = self.get_var(blockdata.num_points, blockdata.factor_index)
+        if num_points is None:
+            weight = L.LiteralFloat(1.0)
+        else:
+            weight = self.backend.symbols.weights_table(num_points)[iq]
+        fw = L.float_product([f, weight])
+        if isinstance(fw, L.Product):
+            key = (num_points, blockdata.num_points, blockdata.factor_index, blockdata.factor_is_piecewise)
+            fw_rhs = fw
+            fw, defined = self.get_temp_symbol("fw", key)
+            if not defined:
+                quadparts.append(L.VariableDecl("const ufc_scalar_t", fw, fw_rhs))
 
-        for blockmap, blockdata in blocks:
+        # Accumulate the diagonal block in the quadrature loop
+        B = self.new_temp_symbol("BD")
+        preparts.append(L.ArrayDecl("ufc_scalar_t", B, len(pairs), 0, alignas=self.ir.params["alignas"]))
+        body = L.AssignAdd(B[k], L.float_product([fw] + arg_factors))
+        quadparts.append(L.ForRange(k, 0, len(pairs), body=body))
+
+        diagonal_blockmap = (tuple(blockmap[0][i] for i, j in pairs), )
+        return diagonal_blockmap, B[k], preparts, quadparts, []
+
+    def get_element_tensor(self, block_rank):
+        """Return the symbol and shape of the element tensor for blocks of block_rank.
+
+        In fused kernels this is the element vector of the linear form
+        for blocks of its rank, and in diagonal kernels the diagonal of
+        the element tensor.
+        """
+        if self.ir.diagonal_shape is not None:
+            return self.backend.symbols.element_tensor(), self.ir.diagonal_shape
+        residual_shape = self.ir.residual_shape
+        if residual_shape is not None and block_rank == len(residual_shape):
+            return self.backend.symbols.residual_tensor(), residual_shape
+        return self.backend.symbols.element_tensor(), self.ir.tensor_shape
+
+    def get_preintegrated_blocks(self):
+        """Return the preintegrated blocks as a list of (blockmap, blockdata, factors).
+
+        Blocks with the same blockmap and preintegrated table are merged
+        into one with a sum of factors.
+        """
+        block_contributions = self.ir.piecewise_ir["block_contributions"]
+
+        blocks = collections.OrderedDict()
+        for blockmap, contributions in sorted(block_contributions.items()):
+            for blockdata in contributions:
+                if blockdata.block_mode == "preintegrated":
+                    key = (blockmap, blockdata.name, blockdata.transposed, blockdata.restrictions,
+                           blockdata.is_uniform, blockdata.symmetry)
+                    if key not in blocks:
+                        blocks[key] = (blockmap, blockdata, [])
+                    blocks[key][2].append(blockdata.factor_index)
+        return list(blocks.values())
+
+    def is_unrolled_block(self, blockmap):
+        """Check if a preintegrated block is added in unrolled code.
+
+        Otherwise it is added to the element tensor in a loop nest. The
+        entries on the diagonal of diagonal kernels are always unrolled.
+        """
+        if self.ir.diagonal_shape is not None:
+            return True
+        return ufl.product([len(DM) for DM in blockmap]) <= self.ir.params["max_unrolled_block_size"]
+
+    def generate_preintegrated_dofblock_partition(self):
+        # FIXME: Generalize this to unrolling all A[] += ... loops,
+        # or all loops with noncontiguous DM??
+        L = self.backend.language
+
+        # Values of A, and of the element vector of the linear form of
+        # fused kernels, by rank
+        tensors = [self.get_element_tensor(len(self.ir.tensor_shape))]
+        if self.ir.residual_shape is not None:
+            tensors.append(self.get_element_tensor(len(self.ir.residual_shape)))
+        tensor_values = {len(A_shape): [0.0] * ufl.product(A_shape) for A, A_shape in tensors}
+
+        for blockmap, blockdata, factor_indices in self.get_preintegrated_blocks():
             # Accumulate A[blockmap[...]] += f*PI[...]
 
+            # Get symbol, dimensions, and loop index symbols for A
+            A_shape = self.get_element_tensor(len(blockmap))[1]
+            A_rank = len(A_shape)
+            A_values = tensor_values[A_rank]
+
+            # TODO: there's something like shape2strides(A_shape) somewhere
+            # A_strides = ufl.utils.indexflattening.shape_to_strides(A_shape)
+
+            A_strides = [1] * A_rank
+            for i in reversed(range(0, A_rank - 1)):
+                A_strides[i] = A_strides[i + 1] * A_shape[i + 1]
+
             # Get table for inlining
             tables = self.ir.unique_tables
             table = tables[blockdata.name]
-            inline_table = self.ir.integral_type == "cell"
+            unroll = A_rank == 0 or self.is_unrolled_block(blockmap)
+            inline_table = unroll and (self.ir.integral_type == "cell" or A_rank == 0)
 
-            # Get factor expression
-            v = self.ir.piecewise_ir["factorization"].nodes[blockdata.factor_index]['expression']
-            f = self.get_var(None, v)
+            # Get factor expression, summing the factors of blocks with
+            # the same table
+            factors = [self.get_var(blockdata.num_points, factor_index) for factor_index in factor_indices]
+            f = factors[0] if len(factors) == 1 else L.Sum(factors)
 
             # Define rhs expression for A[blockmap[arg_indices]] += A_rhs
             # A_rhs = f * PI where PI = sum_q weight * u * v
-            PI = L.Symbol(blockdata.name)
+            PI = self.backend.symbols.element_table_symbol(blockdata.name)
 
             # Define indices into preintegrated block
             P_entity_indices = self.get_entities(blockdata)
             if inline_table:
-                assert P_entity_indices == (L.LiteralInt(0), )
+                assert all(e == L.LiteralInt(0) for e in P_entity_indices)
                 assert table.shape[0] == 1
 
-            # Unroll loop
-            blockshape = [len(DM) for DM in blockmap]
-            blockrange = [range(d) for d in blockshape]
+            if not unroll:
+                # Add f*PI to A in a loop nest over the block together
+                # with the other blocks with this blockmap
+                arg_indices = tuple(self.backend.symbols.argument_loop_index(i) for i in range(A_rank))
+                if blockdata.transposed:
+                    P_arg_indices = (arg_indices[1], arg_indices[0])
+                else:
+                    P_arg_indices = arg_indices
+                self.finalization_blocks[blockmap].append(f * PI[P_entity_indices + P_arg_indices])
+                if blockdata.symmetry == "pair":
+                    self.finalization_transposed_blocks[blockmap].append(
+                        f * PI[P_entity_indices + P_arg_indices])
+                continue
+
+            # Unroll loop, over the entries on the diagonal of A in
+            # diagonal kernels
+            if self.ir.diagonal_shape is not None:
+                entries = [(ii, blockmap[0][ii[0]]) for ii in diagonal_dof_pairs(blockmap)]
+            else:
+                blockshape = [len(DM) for DM in blockmap]
+                blockrange = [range(d) for d in blockshape]
+                entries = [(ii, sum(A_strides[i] * blockmap[i][ii[i]] for i in range(len(ii))))
+                           for ii in itertools.product(*blockrange)]
 
-            for ii in itertools.product(*blockrange):
-                A_ii = sum(A_strides[i] * blockmap[i][ii[i]] for i in range(len(ii)))
+            for ii, A_ii in entries:
                 if blockdata.transposed:
                     P_arg_indices = (ii[1], ii[0])
                 else:
@@ -957,15 +1382,31 @@ class IntegralGenerator(object):
                     A_rhs = f * PI[P_ii]
 
                 A_values[A_ii] = A_values[A_ii] + A_rhs
+                if blockdata.symmetry == "pair":
+                    A_ii = A_strides[0] * blockmap[1][ii[1]] + A_strides[1] * blockmap[0][ii[0]]
+                    A_values[A_ii] = A_values[A_ii] + A_rhs
+
+        code = []
+        for A, A_shape in tensors:
+            # Copy values of A equal to a previous value instead of
+            # computing the same sum again
+            A_values = tensor_values[len(A_shape)]
+            first = {}
+            for i, value in enumerate(A_values):
+                if isinstance(value, L.CExprOperator):
+                    key = value.ce_format(self.precision)
+                    if key in first:
+                        A_values[i] = A[first[key]]
+                    else:
+                        first[key] = i
 
-        code = self.generate_tensor_value_initialization(A_values)
+            code += self.generate_tensor_value_initialization(A, A_values)
         return L.commented_code_list(code, "UFLACS block mode: preintegrated")
 
-    def generate_tensor_value_initialization(self, A_values):
+    def generate_tensor_value_initialization(self, A, A_values):
         parts = []
 
         L = self.backend.language
-        A = self.backend.symbols.element_tensor()
         A_size = len(A_values)
 
         init_mode = self.ir.params["tensor_init_mode"]
@@ -1024,7 +1465,7 @@ class IntegralGenerator(object):
         parts = []
 
         # Get symbol, dimensions, and loop index symbols for A
-        A_shape = self.ir.tensor_shape
+        A_shape = self.get_element_tensor(len(self.ir.tensor_shape))[1]
         A_rank = len(A_shape)
 
         Asym = self.backend.symbols.element_tensor()
@@ -1032,40 +1473,42 @@ class IntegralGenerator(object):
 
         indices = [self.backend.symbols.argument_loop_index(i) for i in range(A_rank)]
 
+        # Blocks of the element vector of the linear form of fused kernels
+        residual_blocks = {}
+        if self.ir.residual_shape is not None:
+            residual_blocks = {blockmap: contributions
+                               for blockmap, contributions in self.finalization_blocks.items()
+                               if len(blockmap) == len(self.ir.residual_shape)}
+
         dofmap_parts = []
         dofmaps = {}
+
+        def dofmap_index(dofmap, index):
+            """Map B index to A index along one axis."""
+            begin = dofmap[0]
+            end = dofmap[-1] + 1
+            if dofmap == tuple(range(begin, end)):
+                # Dense insertion, offset B index to index A
+                return index + begin
+            else:
+                # Sparse insertion, map B index through dofmap
+                DM = dofmaps.get(dofmap)
+                if DM is None:
+                    DM = L.Symbol("DM%d" % len(dofmaps))
+                    dofmaps[dofmap] = DM
+                    dofmap_parts.append(L.ArrayDecl("static const int", DM, len(dofmap), dofmap))
+                return DM[index]
+
         for blockmap, contributions in sorted(self.finalization_blocks.items()):
+            if blockmap in residual_blocks:
+                continue
 
             # Define mapping from B indices to A indices
-            A_indices = []
-            for i in range(A_rank):
-                dofmap = blockmap[i]
-                begin = dofmap[0]
-                end = dofmap[-1] + 1
-                if len(dofmap) == end - begin:
-                    # Dense insertion, offset B index to index A
-                    j = indices[i] + begin
-                else:
-                    # Sparse insertion, map B index through dofmap
-                    DM = dofmaps.get(dofmap)
-                    if DM is None:
-                        DM = L.Symbol("DM%d" % len(dofmaps))
-                        dofmaps[dofmap] = DM
-                        dofmap_parts.append(
-                            L.ArrayDecl("static const int", DM, len(dofmap), dofmap))
-                    j = DM[indices[i]]
-                A_indices.append(j)
-            A_indices = tuple(A_indices)
+            A_indices = tuple(dofmap_index(blockmap[i], indices[i]) for i in range(A_rank))
 
             # Sum up all blocks contributing to this blockmap
             term = L.Sum([B_rhs for B_rhs in contributions])
 
-            # TODO: need ttypes associated with this block to deal
-            # with loop dropping for quadrature elements:
-            ttypes = ()
-            if ttypes == ("quadrature", "quadrature"):
-                logger.debug("quadrature element block insertion not optimized")
-
             # Add components of all B's to A component in loop nest
             body = L.AssignAdd(A[A_indices], term)
             for i in reversed(range(A_rank)):
@@ -1074,6 +1517,35 @@ class IntegralGenerator(object):
             # Add this block to parts
             parts.append(body)
 
+        for blockmap, contributions in sorted(self.finalization_transposed_blocks.items()):
+
+            # Add transposed blocks B[i][j] to A[blockmap[1][j], blockmap[0][i]],
+            # looping over the rows of A outermost
+            i, j = indices
+            A_indices = (dofmap_index(blockmap[1], j), dofmap_index(blockmap[0], i))
+            term = L.Sum([B_rhs for B_rhs in contributions])
+            body = L.AssignAdd(A[A_indices], term)
+            body = L.ForRange(i, 0, len(blockmap[0]), body=body)
+            parts.append(L.ForRange(j, 0, len(blockmap[1]), body=body))
+
+        for blockmap, contributions in sorted(self.finalization_diagonal_blocks.items()):
+
+            # Add diagonal blocks B[i] to A[blockmap[0][i], blockmap[1][i]]
+            i = indices[0]
+            A_indices = tuple(dofmap_index(dofmap, i) for dofmap in blockmap)
+            term = L.Sum([B_rhs for B_rhs in contributions])
+            body = L.AssignAdd(A[A_indices], term)
+            parts.append(L.ForRange(i, 0, len(blockmap[0]), body=body))
+
+        for blockmap, contributions in sorted(residual_blocks.items()):
+
+            # Add blocks B[i] to b[blockmap[0][i]]
+            i = indices[0]
+            b = self.backend.symbols.residual_tensor()
+            term = L.Sum([B_rhs for B_rhs in contributions])
+            body = L.AssignAdd(b[dofmap_index(blockmap[0], i)], term)
+            parts.append(L.ForRange(i, 0, len(blockmap[0]), body=body))
+
         # Place static dofmap tables first
         parts = dofmap_parts + parts
 
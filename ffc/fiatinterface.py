@@ -5,6 +5,7 @@
 #
 # SPDX-License-Identifier:    LGPL-3.0-or-later
 
+import itertools
 import logging
 import warnings
 
@@ -24,9 +25,10 @@ logger = logging.getLogger(__name__)
 # Element families supported by FFC
 supported_families = ("Brezzi-Douglas-Marini", "Brezzi-Douglas-Fortin-Marini", "Crouzeix-Raviart",
                       "Discontinuous Lagrange", "Discontinuous Raviart-Thomas", "HDiv Trace",
-                      "Lagrange", "Lobatto", "Nedelec 1st kind H(curl)", "Nedelec 2nd kind H(curl)",
-                      "Radau", "Raviart-Thomas", "Real", "Bubble", "Quadrature", "Regge",
-                      "Hellan-Herrmann-Johnson", "Q", "DQ", "TensorProductElement")
+                      "Lagrange", "Lobatto", "Gauss-Lobatto-Legendre", "Nedelec 1st kind H(curl)",
+                      "Nedelec 2nd kind H(curl)", "Radau", "Raviart-Thomas", "Real", "Bubble",
+                      "Quadrature", "Regge", "Hellan-Herrmann-Johnson", "Q", "DQ",
+                      "TensorProductElement")
 
 # Cache for computed elements
 _cache = {}
@@ -195,12 +197,79 @@ def create_quadrature(shape, degree, scheme="default"):
             # Trapezoidal rule.
             return (numpy.array([[0.0], [1.0]]), numpy.array([1.0 / 2.0, 1.0 / 2.0]))
 
+    if scheme == "symmetric":
+        # Fully symmetric rules with positive weights and interior
+        # points, using far fewer points than the collapsed
+        # Gauss-Jacobi rules FIAT falls back to for higher degrees. On
+        # cells or degrees without a tabulated rule, the default scheme
+        # is used (Gauss-Jacobi is already optimal on intervals, and
+        # tensor product Gauss rules on quadrilaterals and hexahedra).
+        rule = _create_symmetric_quadrature(shape, degree)
+        if rule is not None:
+            return rule
+        scheme = "default"
+
+    if scheme == "GLL":
+        # Tensor product Gauss-Lobatto-Legendre rule. The points
+        # coincide with the nodes of Lobatto and low order Q elements,
+        # so that element tables become identity matrices and mass
+        # matrices become diagonal. A rule with m points per direction
+        # is only exact for degree 2m - 3, so the quadrature degree
+        # must be set to 2k - 1 to collocate with degree k elements.
+        return _create_gll_quadrature(shape, degree)
+
     quad_rule = FIAT.create_quadrature(reference_cell(shape), degree, scheme)
     points = numpy.asarray(quad_rule.get_points())
     weights = numpy.asarray(quad_rule.get_weights())
     return points, weights
 
 
+def _create_symmetric_quadrature(shape, degree):
+    """Return tabulated symmetric quadrature rule (points, weights).
+
+    The rule is on the simplex 'shape', or None if no rule is available.
+    """
+    from ffc.xg_quadrature import tetrahedron_table, triangle_table
+    tables = {"triangle": triangle_table, "tetrahedron": tetrahedron_table}
+    table = tables.get(shape)
+    if table is None:
+        return None
+
+    # The lowest tabulated rule (midpoint rule) is exact for degree 1
+    rule = table.get(max(degree, 1))
+    if rule is None:
+        logger.debug("No symmetric quadrature rule of degree {} on {}, "
+                     "using default scheme.".format(degree, shape))
+        return None
+
+    points, weights = rule
+    return numpy.array(points), numpy.array(weights)
+
+
+def _create_gll_quadrature(shape, degree):
+    """Return tensor product Gauss-Lobatto-Legendre rule (points, weights).
+
+    The rule is on the interval, quadrilateral or hexahedron 'shape',
+    exact for polynomials of the given degree in each direction.
+    """
+    tdims = {"interval": 1, "quadrilateral": 2, "hexahedron": 3}
+    if shape not in tdims:
+        raise RuntimeError("GLL quadrature is not available on cell {}.".format(shape))
+
+    # Smallest number of points m with 2m - 3 >= degree
+    m = max((degree + 4) // 2, 2)
+    line_rule = FIAT.quadrature.GaussLobattoLegendreQuadratureLineRule(reference_cell("interval"), m)
+    line_points = numpy.asarray(line_rule.get_points())[:, 0]
+    line_weights = numpy.asarray(line_rule.get_weights())
+
+    # Lexicographic ordering with the first coordinate running slowest,
+    # matching the vertex numbering of UFC quadrilaterals and hexahedra
+    tdim = tdims[shape]
+    points = numpy.array(list(itertools.product(line_points, repeat=tdim)))
+    weights = numpy.array([numpy.prod(w) for w in itertools.product(line_weights, repeat=tdim)])
+    return points, weights
+
+
 def map_facet_points(points, facet, cellname):
     """Map points from the e (UFC) reference simplex of dimension d - 1
     to a given facet on the (UFC) reference simplex of dimension d. This
@@ -100,6 +100,9 @@ def format_code(code: namedtuple, wrapper_code, prefix, parameters):
     code_h += "".join([c[0] for c in code.coordinate_mappings])
     code_c += "".join([c[1] for c in code.coordinate_mappings])
 
+    # Add static tables shared by integrals
+    code_c += code.tables
+
     # Add code for integrals
     code_h += "".join([integral[0] for integral in code.integrals])
     code_c += "".join([integral[1] for integral in code.integrals])
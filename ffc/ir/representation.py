@@ -68,12 +68,14 @@ ir_coordinate_map = namedtuple('ir_coordinate_map', ['id', 'classname', 'signatu
                                                      'scalar_coordinate_finite_element_classname'])
 ir_integral = namedtuple('ir_integral', ['representation', 'integral_type', 'subdomain_id',
                                          'form_id', 'rank', 'geometric_dimension', 'topological_dimension',
-                                         'entitytype', 'num_facets', 'num_vertices', 'needs_oriented',
-                                         'enabled_coefficients', 'classnames', 'element_dimensions',
+                                         'entitytype', 'num_facets', 'num_vertices', 'num_coordinate_dofs',
+                                         'needs_oriented', 'enabled_coefficients', 'classnames', 'element_dimensions',
                                          'tensor_shape', 'quadrature_rules', 'coefficient_numbering',
                                          'coefficient_offsets', 'params', 'unique_tables', 'unique_table_types',
-                                         'piecewise_ir', 'varying_irs', 'all_num_points', 'classname',
-                                         'prefix', 'integrals_metadata', 'integral_metadata'])
+                                         'piecewise_ir', 'varying_irs', 'all_num_points', 'block_mode_costs',
+                                         'symmetric', 'residual_shape', 'fused', 'action_coefficient', 'action',
+                                         'diagonal_shape', 'diagonal', 'tuning_signature', 'classname', 'prefix',
+                                         'integrals_metadata', 'integral_metadata'])
 ir_tabulate_dof_coordinates = namedtuple('ir_tabulate_dof_coordinates', ['tdim', 'gdim', 'points', 'cell_shape'])
 ir_evaluate_dof = namedtuple('ir_evaluate_dof', ['mappings', 'reference_value_size', 'physical_value_size',
                                                  'geometric_dimension', 'topological_dimension', 'dofs',
@@ -144,10 +146,16 @@ def compute_ir(analysis: namedtuple, object_names, prefix, parameters):
         for e in analysis.unique_coordinate_elements
     ]
 
+    # Find the linear forms computed together with bilinear forms
+    residual_forms = {}
+    if parameters["fuse_forms"]:
+        residual_forms = _find_residual_forms(analysis.form_data)
+
     # Compute and flatten representation of integrals
     logger.info("Computing representation of integrals")
     irs = [
-        _compute_integral_ir(fd, i, prefix, analysis.element_numbers, classnames, parameters)
+        _compute_integral_ir(fd, i, prefix, analysis.element_numbers, classnames, parameters,
+                             residual_forms.get(i))
         for (i, fd) in enumerate(analysis.form_data)
     ]
     ir_integrals = list(itertools.chain(*irs))
@@ -337,8 +345,41 @@ def _num_global_support_dofs(fiat_element):
     return num_reals
 
 
-def _compute_integral_ir(form_data, form_index, prefix, element_numbers, classnames, parameters):
-    """Compute intermediate represention for form integrals."""
+def _find_residual_forms(form_data):
+    """Map the index of each bilinear form to the form data of its residual.
+
+    The residual is the first linear form with the same test function
+    and all coefficients of the bilinear form, e.g. a residual F and its
+    Jacobian derivative(F, u), whose cell integrals are computed by
+    fused kernels.
+    """
+    residual_forms = {}
+    for i, fd in enumerate(form_data):
+        if fd.rank != 2 or fd.representation != "uflacs":
+            continue
+        form = fd.original_form
+        for rd in form_data:
+            residual = rd.original_form
+            if (rd.rank == 1 and rd.representation == "uflacs"
+                    and residual.arguments()[0] == form.arguments()[0]
+                    and residual.ufl_domains() == form.ufl_domains()
+                    and set(form.coefficients()) <= set(residual.coefficients())):
+                residual_forms[i] = rd
+                break
+    return residual_forms
+
+
+def _compute_integral_ir(form_data, form_index, prefix, element_numbers, classnames, parameters,
+                         residual_form_data=None):
+    """Compute intermediate represention for form integrals.
+
+    If residual_form_data is given, the cell integrals also get the
+    representation of the fused kernel computing the element vector of
+    the cell integral of this linear form with the same subdomain.
+    With the parameters generate_action and generate_diagonal, the cell
+    integrals of bilinear forms also get the representation of the
+    action and diagonal kernels.
+    """
     if form_data.representation == "uflacs":
         from ffc.ir.uflacs.uflacsrepresentation import compute_integral_ir
     elif form_data.representation == "tsfc":
@@ -346,6 +387,13 @@ def _compute_integral_ir(form_data, form_index, prefix, element_numbers, classna
     else:
         raise RuntimeError("Unknown representation: {}".format(form_data.representation))
 
+    # Cell integrals of the linear form, by subdomain
+    residual_integral_data = {}
+    if residual_form_data is not None:
+        residual_integral_data = {itg_data.subdomain_id: itg_data
+                                  for itg_data in residual_form_data.integral_data
+                                  if itg_data.integral_type == "cell"}
+
     # Iterate over integrals
     irs = []
     for itg_data in form_data.integral_data:
@@ -353,23 +401,66 @@ def _compute_integral_ir(form_data, form_index, prefix, element_numbers, classna
         # Compute representation
         ir = compute_integral_ir(itg_data, form_data, form_index, element_numbers, classnames, parameters)
 
-        # Build classname
-        ir["classname"] = classname.make_integral_name(prefix, itg_data.integral_type, form_index,
-                                                       itg_data.subdomain_id)
-        ir["classnames"] = classnames  # FIXME XXX: Use this everywhere needed?
+        # Compute representation of the fused kernel
+        ir["fused"] = None
+        residual_itg_data = None
+        if itg_data.integral_type == "cell":
+            residual_itg_data = residual_integral_data.get(itg_data.subdomain_id)
+        if residual_itg_data is not None:
+            fused = compute_integral_ir(itg_data, form_data, form_index, element_numbers, classnames,
+                                        parameters, residual=(residual_itg_data, residual_form_data))
+            fused["fused"] = None
+            fused["action"] = None
+            fused["diagonal"] = None
+            ir["fused"] = _complete_integral_ir(fused, itg_data, form_index, prefix, classnames)
+
+        # Compute representation of the action kernel
+        ir["action"] = None
+        if (parameters["generate_action"] and itg_data.integral_type == "cell"
+                and form_data.rank == 2 and form_data.representation == "uflacs"):
+            action = compute_integral_ir(itg_data, form_data, form_index, element_numbers, classnames,
+                                         parameters, action=True)
+            action["fused"] = None
+            action["action"] = None
+            action["diagonal"] = None
+            ir["action"] = _complete_integral_ir(action, itg_data, form_index, prefix, classnames)
+
+        # Compute representation of the diagonal kernel, of bilinear
+        # forms with both arguments in the same space
+        ir["diagonal"] = None
+        if (parameters["generate_diagonal"] and itg_data.integral_type == "cell"
+                and form_data.rank == 2 and form_data.representation == "uflacs"
+                and form_data.argument_elements[0] == form_data.argument_elements[1]
+                and form_data.argument_elements[0].family() != "Quadrature"):
+            diagonal = compute_integral_ir(itg_data, form_data, form_index, element_numbers, classnames,
+                                           parameters, diagonal=True)
+            diagonal["fused"] = None
+            diagonal["action"] = None
+            diagonal["diagonal"] = None
+            ir["diagonal"] = _complete_integral_ir(diagonal, itg_data, form_index, prefix, classnames)
+
+        irs.append(_complete_integral_ir(ir, itg_data, form_index, prefix, classnames))
 
-        # Storing prefix here for reconstruction of classnames on code
-        # generation side
-        ir["prefix"] = prefix  # FIXME: Drop this?
+    return irs
 
-        # Store metadata for later reference (eg. printing as comment)
-        # NOTE: We make a commitment not to modify it!
-        ir["integrals_metadata"] = itg_data.metadata
-        ir["integral_metadata"] = [integral.metadata() for integral in itg_data.integrals]
 
-        irs.append(ir_integral(**ir))
+def _complete_integral_ir(ir, itg_data, form_index, prefix, classnames):
+    """Add names and metadata to the representation of an integral."""
+    # Build classname
+    ir["classname"] = classname.make_integral_name(prefix, itg_data.integral_type, form_index,
+                                                   itg_data.subdomain_id)
+    ir["classnames"] = classnames  # FIXME XXX: Use this everywhere needed?
 
-    return irs
+    # Storing prefix here for reconstruction of classnames on code
+    # generation side
+    ir["prefix"] = prefix  # FIXME: Drop this?
+
+    # Store metadata for later reference (eg. printing as comment)
+    # NOTE: We make a commitment not to modify it!
+    ir["integrals_metadata"] = itg_data.metadata
+    ir["integral_metadata"] = [integral.metadata() for integral in itg_data.integrals]
+
+    return ir_integral(**ir)
 
 
 def _compute_form_ir(form_data, form_id, prefix, element_numbers,
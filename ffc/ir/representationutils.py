@@ -118,6 +118,8 @@ def initialize_integral_ir(representation, itg_data, form_data, form_id):
         "entitytype": entitytype,
         "num_facets": cell.num_facets(),
         "num_vertices": cell.num_vertices(),
+        "num_coordinate_dofs": create_element(
+            itg_data.domain.ufl_coordinate_element()).space_dimension(),
         "needs_oriented": needs_oriented_jacobian(form_data),
         "enabled_coefficients": itg_data.enabled_coefficients
     }
@@ -9,6 +9,8 @@
 import logging
 from functools import singledispatch
 
+import numpy
+
 from ffc.ir.uflacs.analysis.graph import ExpressionGraph
 from ffc.ir.uflacs.analysis.modified_terminals import (analyse_modified_terminal,
                                                        strip_modified_terminal)
@@ -23,8 +25,8 @@ def build_argument_indices(S):
     """Build ordered list of indices to modified arguments."""
 
     arg_indices = []
-    for i, v in S.nodes.items():
-        arg = strip_modified_terminal(v['expression'])
+    for i, v in enumerate(S.nodes):
+        arg = strip_modified_terminal(v.expression)
         if isinstance(arg, Argument):
             arg_indices.append(i)
 
@@ -32,7 +34,7 @@ def build_argument_indices(S):
     def arg_ordering_key(i):
         """Return a key for sorting argument vertex indices based on
         the properties of the modified terminal."""
-        mt = analyse_modified_terminal(S.nodes[i]['expression'])
+        mt = analyse_modified_terminal(S.nodes[i].expression)
         return mt.argument_ordering_key()
 
     ordered_arg_indices = sorted(arg_indices, key=arg_ordering_key)
@@ -43,9 +45,7 @@ def graph_insert(F, expr):
     """Add new expression expr to factorisation graph or return existing index"""
     fi = F.e2i.get(expr)
     if fi is None:
-        fi = F.number_of_nodes()
-        F.add_node(fi, expression=expr)
-        F.e2i[expr] = fi
+        fi = F.add_node(expr)
     return fi
 
 
@@ -74,13 +74,11 @@ def handle_sum(v, fac, sf, F):
     argkeys = set(fac0) | set(fac1)
 
     if argkeys:  # f*arg + g*arg = (f+g)*arg
+        # Summands of different argument rank are kept apart, the rank
+        # of the final factors is checked by compute_argument_factorization
         argkeys = sorted(argkeys)
-        keylen = len(argkeys[0])
         factors = {}
         for argkey in argkeys:
-            if len(argkey) != keylen:
-                raise RuntimeError("Expecting equal argument rank terms among summands.")
-
             fi0 = fac0.get(argkey)
             fi1 = fac1.get(argkey)
             if fi0 is None:
@@ -88,8 +86,8 @@ def handle_sum(v, fac, sf, F):
             elif fi1 is None:
                 fisum = fi0
             else:
-                f0 = F.nodes[fi0]['expression']
-                f1 = F.nodes[fi1]['expression']
+                f0 = F.nodes[fi0].expression
+                f1 = F.nodes[fi1].expression
                 fisum = graph_insert(F, f0 + f1)
             factors[argkey] = fisum
 
@@ -114,7 +112,7 @@ def handle_product(v, fac, sf, F):
         f0 = sf[0]
         factors = {}
         for k1 in sorted(fac1):
-            f1 = F.nodes[fac1[k1]]['expression']
+            f1 = F.nodes[fac1[k1]].expression
             factors[k1] = graph_insert(F, f0 * f1)
 
     elif not fac1:  # arg * non-arg
@@ -122,16 +120,16 @@ def handle_product(v, fac, sf, F):
         f1 = sf[1]
         factors = {}
         for k0 in sorted(fac0):
-            f0 = F.nodes[fac0[k0]]['expression']
+            f0 = F.nodes[fac0[k0]].expression
             factors[k0] = graph_insert(F, f1 * f0)
 
     else:  # arg * arg
         # Record products of each factor of arg-dependent operand
         factors = {}
         for k0 in sorted(fac0):
-            f0 = F.nodes[fac0[k0]]['expression']
+            f0 = F.nodes[fac0[k0]].expression
             for k1 in sorted(fac1):
-                f1 = F.nodes[fac1[k1]]['expression']
+                f1 = F.nodes[fac1[k1]].expression
                 argkey = tuple(sorted(k0 + k1))  # sort key for canonical representation
                 factors[argkey] = graph_insert(F, f0 * f1)
 
@@ -145,7 +143,7 @@ def handle_conj(v, fac, sf, F):
     if fac:
         factors = {}
         for k in fac:
-            f0 = F.nodes[fac[k]]['expression']
+            f0 = F.nodes[fac[k]].expression
             factors[k] = graph_insert(F, Conj(f0))
     else:
         raise RuntimeError("No arguments")
@@ -164,7 +162,7 @@ def handle_division(v, fac, sf, F):
         f1 = sf[1]
         factors = {}
         for k0 in sorted(fac0):
-            f0 = F.nodes[fac0[k0]]['expression']
+            f0 = F.nodes[fac0[k0]].expression
             factors[k0] = graph_insert(F, f0 / f1)
 
     else:  # non-arg / non-arg
@@ -202,18 +200,23 @@ def handle_conditional(v, fac, sf, F):
         for k in mas:
             fi1 = fac1.get(k)
             fi2 = fac2.get(k)
-            f1 = z if fi1 is None else F.nodes[fi1]['expression']
-            f2 = z if fi2 is None else F.nodes[fi2]['expression']
+            f1 = z if fi1 is None else F.nodes[fi1].expression
+            f2 = z if fi2 is None else F.nodes[fi2].expression
             factors[k] = graph_insert(F, conditional(f0, f1, f2))
 
     return factors
 
 
-def compute_argument_factorization(S, rank):
+def compute_argument_factorization(S, rank, residual_rank=None):
     """Factorizes a scalar expression graph w.r.t. scalar Argument
     components.
 
-    The result is a triplet (AV, FV, IM):
+    If residual_rank is given, the integrand is the sum of integrands of
+    two forms of rank and residual_rank with the same test function,
+    and the factorization has terms of both ranks.
+
+    The result is the graph F of non-argument factors and the
+    factorization of the target, representing the triplet (AV, FV, IM):
 
       - The scalar argument component subgraph:
 
@@ -243,12 +246,10 @@ def compute_argument_factorization(S, rank):
     """
     # Extract argument component subgraph
     arg_indices = build_argument_indices(S)
-    AV = [S.nodes[i]['expression'] for i in arg_indices]
+    AV = [S.nodes[i].expression for i in arg_indices]
 
     # Data structure for building non-argument factors
     F = ExpressionGraph()
-    # Attach a quick lookup dict for expression to index
-    F.e2i = {}
 
     # Insert arguments as first entries in factorisation graph
     # They will not be connected to other nodes, but will be available
@@ -268,17 +269,19 @@ def compute_argument_factorization(S, rank):
     # SV_factors[si] = { argkey1: fi1, argkey2: fi2, ... } # if SV[si]
     # is a linear combination of multiple argkey configurations
 
+    S_factors = [None] * S.number_of_nodes()
+
     # Factorize each subexpression in order:
-    for si, attr in S.nodes.items():
-        deps = S.out_edges[si]
-        v = attr['expression']
+    for si, attr in enumerate(S.nodes):
+        deps = S.out_edges(si)
+        v = attr.expression
 
         if si in arg_indices:
             assert len(deps) == 0
             # v is a modified Argument
             factors = {(si, ): one_index}
         else:
-            fac = [S.nodes[d]['factors'] for d in deps]
+            fac = [S_factors[d] for d in deps]
             if not any(fac):
                 # Entirely scalar (i.e. no arg factors)
                 # Just add unchanged to F
@@ -292,25 +295,25 @@ def compute_argument_factorization(S, rank):
                     if fac[i]:
                         sf.append(None)
                     else:
-                        sf.append(S.nodes[d]['expression'])
+                        sf.append(S.nodes[d].expression)
                 # Use appropriate handler to deal with Sum, Product, etc.
                 factors = handler(v, fac, sf, F)
 
-        attr['factors'] = factors
+        S_factors[si] = factors
 
     assert len(F.nodes) == len(F.e2i)
 
     # Find the (only) node in S that is marked as 'target'
     # Should always be the last one.
-    S_targets = [i for i, v in S.nodes.items() if v.get('target', False)]
+    S_targets = numpy.flatnonzero(S.target)
     assert len(S_targets) == 1
     S_target = S_targets[0]
 
     # Get the factorizations of the target values
-    if S.nodes[S_target]['factors'] == {}:
+    if S_factors[S_target] == {}:
         if rank == 0:
             # Functionals and expressions: store as no args * factor
-            factors = {(): F.e2i[S.nodes[S_target]['expression']]}
+            factors = {(): F.e2i[S.nodes[S_target].expression]}
         else:
             # Zero form of arity 1 or higher: make factors empty
             factors = {}
@@ -320,25 +323,56 @@ def compute_argument_factorization(S, rank):
         # and resort keys for canonical representation
         factors = {
             tuple(sorted(arg_indices.index(si) for si in argkey)): fi
-            for argkey, fi in S.nodes[S_target]['factors'].items()
+            for argkey, fi in S_factors[S_target].items()
         }
-    # Expecting all term keys to have length == rank
-    # (this assumption will eventually have to change if we
-    # implement joint bilinear+linear form factorization here)
-    assert all(len(k) == rank for k in factors)
+    # Expecting all term keys to have length == rank, or residual_rank
+    # for joint bilinear+linear form factorization
+    assert all(len(k) in (rank, residual_rank) for k in factors)
 
     # Indices into F that are needed for final result
-    for i in factors.values():
-        F.nodes[i]['target'] = []
-    for k in factors:
-        i = factors[k]
-        F.nodes[i]['target'] += [k]
+    F.target = numpy.zeros(F.number_of_nodes(), dtype=bool)
+    F.target[list(factors.values())] = True
 
     # Compute dependencies in FV
-    for i, v in F.nodes.items():
-        expr = v['expression']
-        if not expr._ufl_is_terminal_ and not expr._ufl_is_terminal_modifier_:
-            for o in expr.ufl_operands:
-                F.add_edge(i, F.e2i[o])
+    F_deps = []
+    for v in F.nodes:
+        expr = v.expression
+        if expr._ufl_is_terminal_ or expr._ufl_is_terminal_modifier_:
+            F_deps.append(())
+        else:
+            F_deps.append([F.e2i[o] for o in expr.ufl_operands])
+    F.set_edges(F_deps)
 
-    return F
+    return F, factors
+
+
+def compute_argument_mirrors(F, argument_factorization):
+    """Map each factorization term of a bilinear integrand to its mirror.
+
+    The mirror of a term is the term with the two arguments swapped.
+
+    The term with modified arguments (u, v) is mirrored by the term
+    with the test function modified as v and the trial function modified
+    as u. Returns None if the integrand is not symmetric, i.e. if the
+    arguments are in different function spaces or a term and its mirror
+    have different factors, and the dict of mirrors otherwise.
+    """
+    if not argument_factorization or any(len(key) != 2 for key in argument_factorization):
+        return None
+
+    mts = {i: analyse_modified_terminal(F.nodes[i].expression)
+           for key in argument_factorization for i in key}
+    if len(set(mt.terminal.ufl_function_space() for mt in mts.values())) != 1:
+        return None
+
+    # Modified argument of each number by the key without the number
+    indices = {(mt.terminal.number(), mt.argument_ordering_key()[1:]): i for i, mt in mts.items()}
+
+    mirrors = {}
+    for (i, j), fi in argument_factorization.items():
+        mirror = (indices.get((0, mts[j].argument_ordering_key()[1:])),
+                  indices.get((1, mts[i].argument_ordering_key()[1:])))
+        if argument_factorization.get(mirror) != fi:
+            return None
+        mirrors[(i, j)] = mirror
+    return mirrors
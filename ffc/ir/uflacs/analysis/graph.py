@@ -6,6 +6,7 @@
 # SPDX-License-Identifier:    LGPL-3.0-or-later
 """Linearized data structure for the computational graph."""
 
+import itertools
 import logging
 
 import numpy
@@ -18,34 +19,86 @@ from ffc.ir.uflacs.analysis.valuenumbering import ValueNumberer
 logger = logging.getLogger(__name__)
 
 
+# Node status codes set by dependency analysis of the factorization
+# graph: nodes not needed for the targets, and nodes needed for the
+# targets that are piecewise constant or varying over quadrature points.
+INACTIVE, ACTIVE, PIECEWISE, VARYING = range(4)
+
+
+class Node(object):
+    """A graph node: the expression and its properties from analysis."""
+
+    __slots__ = ("expression", "mt", "tr")
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.mt = None  # Modified terminal data, for modified terminals
+        self.tr = None  # Table reference, for terminals with tables
+
+
 class ExpressionGraph(object):
     """A directed multi-edge graph, allowing multiple edges
     between the same nodes, and respecting the insertion order
-    of nodes and edges."""
+    of nodes and edges.
+
+    Nodes are numbered in insertion order. The edges are stored in
+    compressed sparse row format and set all at once by set_edges,
+    after all nodes have been added."""
 
     def __init__(self):
 
-        # Data structures for directed multi-edge graph
-        self.nodes = {}
-        self.out_edges = {}
-        self.in_edges = {}
+        # Node records and lookup of node index from expression
+        self.nodes = []
+        self.e2i = {}
+
+        # Per node flags, set by analysis passes
+        self.target = numpy.zeros(0, dtype=bool)
+        self.status = numpy.zeros(0, dtype=numpy.int8)
+
+        # Edges in compressed sparse row format
+        self._out_offsets = numpy.zeros(1, dtype=numpy.int32)
+        self._out_indices = numpy.zeros(0, dtype=numpy.int32)
+        self._in_offsets = numpy.zeros(1, dtype=numpy.int32)
+        self._in_indices = numpy.zeros(0, dtype=numpy.int32)
 
     def number_of_nodes(self):
         return len(self.nodes)
 
-    def add_node(self, key, **kwargs):
-        """Add a node with optional properties"""
-        self.nodes[key] = kwargs
-        self.out_edges[key] = []
-        self.in_edges[key] = []
-
-    def add_edge(self, node1, node2):
-        """Add a directed edge from node1 to node2"""
-        if node1 not in self.nodes or node2 not in self.nodes:
+    def add_node(self, expression):
+        """Add a node for expression and return its index"""
+        i = len(self.nodes)
+        self.nodes.append(Node(expression))
+        self.e2i[expression] = i
+        return i
+
+    def set_edges(self, out_edges):
+        """Set all edges, given the nodes each node has directed edges to."""
+        n = len(self.nodes)
+        if len(out_edges) != n:
+            raise RuntimeError("Expecting edges for each node.")
+
+        counts = numpy.fromiter((len(e) for e in out_edges), dtype=numpy.int32, count=n)
+        self._out_offsets = numpy.zeros(n + 1, dtype=numpy.int32)
+        numpy.cumsum(counts, out=self._out_offsets[1:])
+        self._out_indices = numpy.fromiter(itertools.chain.from_iterable(out_edges),
+                                           dtype=numpy.int32, count=self._out_offsets[-1])
+        if numpy.any(self._out_indices >= n) or numpy.any(self._out_indices < 0):
             raise KeyError("Adding edge to unknown node")
 
-        self.out_edges[node1] += [node2]
-        self.in_edges[node2] += [node1]
+        # Transpose, keeping in-edges of each node ordered by source node
+        sources = numpy.repeat(numpy.arange(n, dtype=numpy.int32), counts)
+        order = numpy.argsort(self._out_indices, kind="stable")
+        self._in_indices = sources[order]
+        self._in_offsets = numpy.zeros(n + 1, dtype=numpy.int32)
+        numpy.cumsum(numpy.bincount(self._out_indices, minlength=n), out=self._in_offsets[1:])
+
+    def out_edges(self, i):
+        """Return array of nodes node i has edges to."""
+        return self._out_indices[self._out_offsets[i]:self._out_offsets[i + 1]]
+
+    def in_edges(self, i):
+        """Return array of nodes with edges to node i."""
+        return self._in_indices[self._in_offsets[i]:self._in_offsets[i + 1]]
 
 
 def build_graph_vertices(expression, scalar=False):
@@ -59,12 +112,12 @@ def build_graph_vertices(expression, scalar=False):
     GV = sorted(G.e2i, key=G.e2i.get)
 
     # Add nodes to 'new' graph structure
-    for i, v in enumerate(GV):
-        G.add_node(i, expression=v)
+    G.nodes = [Node(v) for v in GV]
 
     # Get vertex index representing input expression root
     V_target = G.e2i[expression]
-    G.nodes[V_target]['target'] = True
+    G.target = numpy.zeros(len(G.nodes), dtype=bool)
+    G.target[V_target] = True
 
     return G
 
@@ -82,20 +135,47 @@ def build_scalar_graph(expression):
 
     # Build new list representation of graph where all
     # vertices of V represent single scalar operations
+    return _build_scalar_expression_graph(scalar_expression)
+
+
+def substitute_scalar_graph(S, replacements):
+    """Return the scalar graph S with the expressions of some nodes substituted.
+
+    The nodes and their expressions are given by replacements (dict of
+    node index to expression), e.g. zero for terminals with tables of
+    zeros.
+
+    The substitutions are propagated through the dependent nodes in a
+    single pass, without rebuilding the scalar subexpressions.
+    """
+    expressions = []
+    for i, v in enumerate(S.nodes):
+        expr = replacements.get(i)
+        if expr is None:
+            expr = v.expression
+            ops = [expressions[j] for j in S.out_edges(i)]
+            if any(op is not o for op, o in zip(ops, expr.ufl_operands)):
+                expr = expr._ufl_expr_reconstruct_(*ops)
+        expressions.append(expr)
+
+    S_target, = numpy.flatnonzero(S.target)
+    return _build_scalar_expression_graph(expressions[S_target])
+
+
+def _build_scalar_expression_graph(scalar_expression):
+    """Build graph of scalar expression, with one node per scalar operation."""
     G = build_graph_vertices(scalar_expression, scalar=True)
 
     # Compute graph edges
     V_deps = []
-    for i, v in G.nodes.items():
-        expr = v['expression']
+    for v in G.nodes:
+        expr = v.expression
         if expr._ufl_is_terminal_ or expr._ufl_is_terminal_modifier_:
             V_deps.append(())
         else:
             V_deps.append([G.e2i[o] for o in expr.ufl_operands])
 
-    for i, edges in enumerate(V_deps):
-        for j in edges:
-            G.add_edge(i, j)
+    G.set_edges(V_deps)
 
     return G
 
@@ -123,8 +203,8 @@ def rebuild_with_scalar_subexpressions(G):
     W = numpy.empty(total_unique_symbols, dtype=object)
 
     # Iterate over each graph node in order
-    for i, v in G.nodes.items():
-        expr = v['expression']
+    for i, v in enumerate(G.nodes):
+        expr = v.expression
         # Find symbols of v components
         vs = V_symbols[i]
 
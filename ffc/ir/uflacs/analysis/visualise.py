@@ -22,8 +22,8 @@ def visualise(Gx, filename):
         return
 
     G = pgv.AGraph(strict=False, directed=True)
-    for nd, v in Gx.nodes.items():
-        ex = v['expression']
+    for nd, v in enumerate(Gx.nodes):
+        ex = v.expression
         label = ex.__class__.__name__
         if isinstance(ex, Sum):
             label = '+'
@@ -41,14 +41,12 @@ def visualise(Gx, filename):
         if isinstance(arg, Argument):
             G.get_node(nd).attr['shape'] = 'box'
 
-        t = v.get('target')
-        if t:
-            G.get_node(nd).attr['label'] += ':' + str(t)
+        if Gx.target[nd]:
             G.get_node(nd).attr['shape'] = 'hexagon'
 
-    for nd, eds in Gx.out_edges.items():
-        for ed in eds:
-            G.add_edge(nd, ed)
+    for nd in range(Gx.number_of_nodes()):
+        for ed in Gx.out_edges(nd):
+            G.add_edge(nd, int(ed))
 
     G.layout(prog='dot')
     G.draw(filename)
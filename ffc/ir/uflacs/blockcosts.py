@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"""Static cost model for choosing the block mode of each argument factorization term."""
+
+import collections
+
+import ufl
+from ffc.ir.uflacs.elementtables import piecewise_ttypes
+
+# Estimated cost of computing one block per tabulate_tensor call:
+# flops: floating point operations, memory: scalars read from tables,
+# table_size: scalars of static tables needed by the block mode
+block_cost_t = collections.namedtuple("block_cost_t", ["flops", "memory", "table_size"])
+
+# Block modes in order of preference when the estimated costs are equal
+block_modes = ("preintegrated", "premultiplied", "partial", "factorized", "full", "safe")
+
+
+def valid_block_modes(ttypes, factor_is_piecewise, factorized=False):
+    """Return the block modes that can compute a block, in order of preference.
+
+    factorized tells if the table of the last argument is a tensor
+    product of tables on the interval, see build_tensor_factor_tables.
+    """
+    if "quadrature" in ttypes:
+        # Dof loops collapse onto the quadrature loop, no alternatives
+        return ("quadrature", )
+
+    rank = len(ttypes)
+    args_piecewise = [tt in piecewise_ttypes for tt in ttypes]
+    modes = []
+    if factor_is_piecewise:
+        modes.append("preintegrated")
+    if rank > 0 and all(args_piecewise):
+        modes.append("premultiplied")
+    if rank == 2 and any(args_piecewise):
+        modes.append("partial")
+    if rank > 0 and factorized:
+        modes.append("factorized")
+    modes.append("full")
+    modes.append("safe")
+    return tuple(modes)
+
+
+def enabled_block_modes(p):
+    """Return the block modes enabled by the uflacs parameters p."""
+    modes = {"safe", "quadrature"}
+    if p["enable_preintegration"]:
+        modes.add("preintegrated")
+    if p["enable_premultiplication"]:
+        modes.add("premultiplied")
+    if p["enable_sum_factorization"]:
+        modes.update(("partial", "full"))
+    if p["enable_tensor_factorization"]:
+        modes.add("factorized")
+    return modes
+
+
+def tensor_contraction_flops(factor_shape):
+    """Return the number of floating point operations of a sum factorised contraction.
+
+    An array over the points of a tensor product quadrature rule is
+    contracted with the factor tables of shape (num_points, num_dofs)
+    of each direction, one direction at a time.
+    """
+    flops = 0
+    for d, (nq, n) in enumerate(factor_shape):
+        # Points of the directions before d, dofs of the directions after d
+        outer = ufl.product([s[0] for s in factor_shape[:d]])
+        inner = ufl.product([s[1] for s in factor_shape[d + 1:]])
+        flops += 2 * outer * n * nq * inner
+    return flops
+
+
+def estimate_block_costs(modes, ttypes, num_dofs, num_points, num_entities, integral_type,
+                         factor_shape=None, basis_shape=None):
+    """Estimate the cost of computing a block in each of the given modes.
+
+    ttypes and num_dofs hold the table type and number of dofs of each
+    argument, num_entities is the number of entities the tables depend on.
+    factor_shape holds the shape of the factor table of each direction
+    of the last argument, if its table is a tensor product, and
+    basis_shape the shape of the change of basis following the
+    contraction, if any.
+
+    Writing the block to the element tensor is the same for all modes
+    and not counted.
+    """
+    rank = len(num_dofs)
+    block_size = ufl.product(num_dofs)
+    if integral_type == "interior_facet":
+        # Tables are built for each pair of facets
+        precomputed_size = num_entities**rank * block_size
+    else:
+        precomputed_size = num_entities * block_size
+    table_points = [1 if tt in piecewise_ttypes else num_points for tt in ttypes]
+    fe_table_size = sum(num_entities * nq * n for nq, n in zip(table_points, num_dofs))
+    Q = num_points
+
+    costs = {}
+    for mode in modes:
+        if mode == "preintegrated":
+            # A[i,j] += f * PI[i,j]
+            cost = block_cost_t(2 * block_size, block_size, precomputed_size)
+        elif mode == "premultiplied":
+            # FI += weight * f in the quadrature loop, A[i,j] += FI * PM[i,j]
+            cost = block_cost_t(2 * Q + 2 * block_size, Q + block_size, precomputed_size)
+        elif mode == "partial":
+            # P[i] += (weight * f) * u[i] in the quadrature loop,
+            # A[i,j] += P[i] * v[j] where v is constant over the cell
+            k = 0 if ttypes[0] in piecewise_ttypes else 1
+            n_varying = num_dofs[1 - k]
+            cost = block_cost_t(Q * (1 + 2 * n_varying) + 2 * block_size,
+                                Q * (1 + n_varying) + num_dofs[k], fe_table_size)
+        elif mode == "factorized":
+            # fw = weight * f in all points, and B[i,:] += sum_q (fw * u[i])[q] * v[:][q]
+            # by contraction with the factor tables of v one direction at a time
+            contraction = tensor_contraction_flops(factor_shape)
+            factor_table_size = sum(nq * n for nq, n in factor_shape)
+            if basis_shape is not None:
+                # B[i,:] += sum_k BT[i,k] * FB[k,:]
+                contraction += 2 * basis_shape[0] * basis_shape[1]
+                factor_table_size += basis_shape[0] * basis_shape[1]
+            if rank < 2:
+                cost = block_cost_t(Q + contraction + block_size, Q + contraction // 2,
+                                    factor_table_size)
+            else:
+                cost = block_cost_t(Q + num_dofs[0] * (Q + contraction) + block_size,
+                                    Q + num_dofs[0] * (Q + contraction // 2),
+                                    num_entities * table_points[0] * num_dofs[0] + factor_table_size)
+        elif mode == "full":
+            # P[i] = (weight * f) * u[i] in the quadrature loop,
+            # B[i,j] += P[i] * v[j], and A[i,j] += B[i,j]
+            if rank < 2:
+                # Same operations as "safe"
+                flops = Q * (1 + (rank + 1) * block_size) + block_size
+            else:
+                flops = Q * (1 + num_dofs[0] + 2 * block_size) + block_size
+            cost = block_cost_t(flops, Q * (1 + sum(num_dofs)), fe_table_size)
+        elif mode == "safe":
+            # B[i,j] += (weight * f) * u[i] * v[j] in the quadrature loop,
+            # and A[i,j] += B[i,j]
+            flops = Q * (1 + (rank + 1) * block_size) + block_size
+            cost = block_cost_t(flops, Q * (1 + sum(num_dofs)), fe_table_size)
+        else:
+            raise RuntimeError("No cost estimate for block mode %s" % (mode, ))
+        costs[mode] = cost
+    return costs
+
+
+def select_block_mode(costs):
+    """Return the mode with the lowest estimated cost.
+
+    The cost of a mode is its flops plus memory traffic. Ties are
+    broken by static table size and then by the order of block_modes.
+    """
+    def key(mode):
+        c = costs[mode]
+        return (c.flops + c.memory, c.table_size, block_modes.index(mode))
+    return min(costs, key=key)
+
+
+def format_block_mode_report(block_mode_costs):
+    """Format the estimates and the chosen mode of each block as lines of text."""
+    lines = []
+    for record in block_mode_costs:
+        lines.append("  {} points, arguments {}: {}".format(
+            record["num_points"], ", ".join(record["arguments"]) or "none", record["block_mode"]))
+        for mode in block_modes:
+            cost = record["costs"].get(mode)
+            if cost is not None:
+                lines.append("    {:<14} flops {:>8}  memory {:>8}  tables {:>8}".format(
+                    mode, cost["flops"], cost["memory"], cost["table_size"]))
+    return "\n".join(lines)
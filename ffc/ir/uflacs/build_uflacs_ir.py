@@ -13,16 +13,22 @@ import logging
 import numpy
 
 import ufl
-from ffc.ir.uflacs.analysis.factorization import compute_argument_factorization
-from ffc.ir.uflacs.analysis.graph import build_scalar_graph
+from ffc.ir.uflacs.analysis.factorization import (compute_argument_factorization,
+                                                  compute_argument_mirrors)
+from ffc.ir.uflacs.analysis.graph import (ACTIVE, INACTIVE, PIECEWISE, VARYING,
+                                          build_scalar_graph, substitute_scalar_graph)
 from ffc.ir.uflacs.analysis.modified_terminals import (analyse_modified_terminal,
                                                        is_modified_terminal)
 from ffc.ir.uflacs.analysis.visualise import visualise
-from ffc.ir.uflacs.elementtables import (build_optimized_tables,
-                                         clamp_table_small_numbers,
-                                         piecewise_ttypes)
+from ffc.ir.uflacs.blockcosts import (enabled_block_modes, estimate_block_costs,
+                                      select_block_mode, valid_block_modes)
+from ffc.ir.uflacs.elementtables import (build_collapsed_factor_tables, build_optimized_tables,
+                                         build_tensor_factor_tables, clamp_table_small_numbers,
+                                         collapsed_line_points, tensor_product_line_points,
+                                         uses_tensor_factors)
 from ufl.algorithms.balancing import balance_modifiers
 from ufl.checks import is_cellwise_constant
+from ufl.corealg.traversal import unique_pre_traversal
 from ufl.classes import CellCoordinate, FacetCoordinate, QuadratureWeight
 from ufl.measure import (custom_integral_types, facet_integral_types,
                          point_integral_types)
@@ -33,7 +39,8 @@ ma_data_t = collections.namedtuple("ma_data_t", ["ma_index", "tabledata"])
 
 block_data_t = collections.namedtuple("block_data_t",
                                       ["block_mode",
-                                       # "safe" | "full" | "preintegrated" | "premultiplied"
+                                       # "safe" | "full" | "partial" | "preintegrated" |
+                                       # "premultiplied" | "quadrature"
                                        "ttypes",  # list of table types for each block rank
                                        "factor_index",  # int: index of factor in vertex array
                                        "factor_is_piecewise",
@@ -44,8 +51,13 @@ block_data_t = collections.namedtuple("block_data_t",
                                        "transposed",  # block is the transpose of another
                                        "is_uniform",  # used in "preintegrated" and "premultiplied"
                                        "name",  # used in "preintegrated" and "premultiplied"
-                                       "ma_data",  # used in "full", "safe" and "partial"
-                                       "piecewise_ma_index"  # used in "partial"
+                                       "ma_data",  # used in "full", "safe", "partial" and "quadrature"
+                                       "piecewise_ma_index",  # used in "partial"
+                                       "num_points",  # quadrature loop whose factorization
+                                                      # factor_index and ma_data refer to
+                                       "symmetry"  # None | "pair": the transpose of the block
+                                                   # is added to the swapped blockmap | "self":
+                                                   # the block is symmetric
                                        ])
 
 
@@ -102,7 +114,8 @@ def multiply_block(point_index, unames, ttypes, unique_tables, unique_table_num_
         elif rank == 1:
             ptable[entity, :] = vectors[0]
         else:
-            raise RuntimeError("Nothing to multiply!")
+            # Functional, the block is a scalar for each entity
+            ptable[entity] = 1.0
 
     return ptable
 
@@ -160,12 +173,42 @@ def uflacs_default_parameters(optimize):
         "enable_block_transpose_reuse": False,
         "enable_table_zero_compression": False,
 
+        # Sum factorisation with the factors on the interval of tensor
+        # product elements on quadrilaterals and hexahedra, and of
+        # elements on simplices in collapsed coordinates
+        "enable_tensor_factorization": False,
+
+        # Compute only one of each pair of blocks of symmetric bilinear
+        # forms mirrored by swapping the arguments, and only the upper
+        # triangle of symmetric blocks
+        "enable_symmetry": False,
+
         # Code generation parameters
         "vectorize": False,
         "alignas": 0,
         "padlen": 1,
         "use_symbol_array": True,
         "tensor_init_mode": "upfront",  # interleaved | direct | upfront
+
+        # Number of entries of preintegrated blocks up to which the
+        # blocks are added to the element tensor in unrolled code,
+        # larger blocks are added in loops over the static tables
+        "max_unrolled_block_size": 128,
+
+        # SIMD width to pad quadrature rules to when splitting
+        # quadrature loops into loops vectorised over points,
+        # 0 to keep a single loop over points
+        "vectorize_points": 0,
+
+        # Number of points accumulated together by each update of
+        # "full" and "partial" blocks, computed by matrix products over
+        # all points after the quadrature loop, 0 to accumulate the
+        # blocks point by point
+        "gemm_block_points": 0,
+
+        # Number of cells computed together by tabulate_tensor_batch
+        # of cell integrals, 0 to not generate tabulate_tensor_batch
+        "batch_width": 0,
     }
     if optimize:
         # Override defaults if optimization is turned on
@@ -177,6 +220,8 @@ def uflacs_default_parameters(optimize):
             "enable_sum_factorization": True,
             "enable_block_transpose_reuse": True,
             "enable_table_zero_compression": True,
+            "enable_tensor_factorization": False,
+            "enable_symmetry": False,
 
             # Code generation parameters
             "vectorize": False,
@@ -222,7 +267,14 @@ def parse_uflacs_optimization_parameters(parameters, integral_type):
 
 
 def build_uflacs_ir(cell, integral_type, entitytype, integrands, tensor_shape,
-                    quadrature_rules, parameters):
+                    quadrature_rules, parameters, residual_shape=None):
+    """Build the uflacs IR of an integral.
+
+    If residual_shape is given, the integrands are sums of the
+    integrands of a bilinear form and of a linear form with the same
+    test function, and the terms of the linear form are blocks of the
+    element vector of this shape, fused into the same kernel.
+    """
     # The intermediate representation dict we're building and returning
     # here
     ir = {}
@@ -238,10 +290,9 @@ def build_uflacs_ir(cell, integral_type, entitytype, integrands, tensor_shape,
     ir["unique_tables"] = {}
     ir["unique_table_types"] = {}
 
-    # Shared piecewise expr_ir for all quadrature loops
-    ir["piecewise_ir"] = {"factorization": None,
-                          "modified_arguments": [],
-                          "preintegrated_blocks": {},
+    # Shared piecewise expr_ir for all quadrature loops, the piecewise
+    # nodes are found in the factorization of each quadrature loop
+    ir["piecewise_ir"] = {"preintegrated_blocks": {},
                           "premultiplied_blocks": {},
                           "preintegrated_contributions": collections.defaultdict(list),
                           "block_contributions": collections.defaultdict(list)}
@@ -249,6 +300,16 @@ def build_uflacs_ir(cell, integral_type, entitytype, integrands, tensor_shape,
     # { num_points: expr_ir for one integrand }
     ir["varying_irs"] = {"factorization": None}
 
+    # Whether the element tensor is symmetric, for bilinear forms with
+    # both arguments in the same function space and a symmetric
+    # factorization of all integrands
+    ir["symmetric"] = len(tensor_shape) == 2 and residual_shape is None
+
+    # Estimated costs of the block modes considered for each block,
+    # and the block mode chosen
+    ir["block_mode_costs"] = []
+    enabled_modes = enabled_block_modes(p)
+
     # Whether we expect the quadrature weight to be applied or not (in
     # some cases it's just set to 1 in ufl integral scaling)
     tdim = cell.topological_dimension()
@@ -274,9 +335,6 @@ def build_uflacs_ir(cell, integral_type, entitytype, integrands, tensor_shape,
 
         # Build initial scalar list-based graph representation
         S = build_scalar_graph(expression)
-        S_targets = [i for i, v in S.nodes.items() if v.get('target', False)]
-        assert len(S_targets) == 1
-        S_target = S_targets[0]
 
         # Build terminal_data from V here before factorization. Then we
         # can use it to derive table properties for all modified
@@ -284,9 +342,9 @@ def build_uflacs_ir(cell, integral_type, entitytype, integrands, tensor_shape,
         # efficiently before argument factorization. We can build
         # terminal_data again after factorization if that's necessary.
 
-        initial_terminals = {i: analyse_modified_terminal(v['expression'])
-                             for i, v in S.nodes.items()
-                             if is_modified_terminal(v['expression'])}
+        initial_terminals = {i: analyse_modified_terminal(v.expression)
+                             for i, v in enumerate(S.nodes)
+                             if is_modified_terminal(v.expression)}
 
         unique_tables, unique_table_types, unique_table_num_dofs, mt_unique_table_reference = build_optimized_tables(
             num_points,
@@ -300,27 +358,40 @@ def build_uflacs_ir(cell, integral_type, entitytype, integrands, tensor_shape,
             rtol=p["table_rtol"],
             atol=p["table_atol"])
 
-        # If there are any 'zero' tables, replace symbolically and rebuild graph
+        # If there are any 'zero' tables, replace symbolically and
+        # propagate through the graph
         if 'zeros' in unique_table_types.values():
+            zero_terminals = {}
             for i, mt in initial_terminals.items():
                 # Set modified terminals with zero tables to zero
                 tr = mt_unique_table_reference.get(mt)
                 if tr is not None and tr.ttype == "zeros":
-                    S.nodes[i]['expression'] = ufl.as_ufl(0.0)
-
-            # Propagate expression changes using dependency list
-            for i, v in S.nodes.items():
-                deps = [S.nodes[j]['expression'] for j in S.out_edges[i]]
-                if deps:
-                    v['expression'] = v['expression']._ufl_expr_reconstruct_(*deps)
-
-            # Rebuild scalar target expressions and graph (this may be
-            # overkill and possible to optimize away if it turns out to be
-            # costly)
-            expression = S.nodes[S_target]['expression']
-
-            # Rebuild scalar list-based graph representation
-            S = build_scalar_graph(expression)
+                    zero_terminals[i] = ufl.as_ufl(0.0)
+            S = substitute_scalar_graph(S, zero_terminals)
+
+        # Factor tables of tensor product elements varying over the
+        # points of a tensor product rule, or of elements on simplices
+        # varying over the points of a collapsed rule, for sum
+        # factorisation
+        tensor_factors = {}
+        tensor_bases = {}
+        if p["enable_tensor_factorization"] and integral_type == "cell" and num_points > 1:
+            points = quadrature_rules[num_points][0]
+            if cell.cellname() in ("triangle", "tetrahedron"):
+                line_points = collapsed_line_points(points, rtol=p["table_rtol"], atol=p["table_atol"])
+                if line_points is not None:
+                    factor_tables, tensor_factors, tensor_bases = build_collapsed_factor_tables(
+                        num_points, line_points, initial_terminals.values(), mt_unique_table_reference,
+                        unique_tables, rtol=p["table_rtol"], atol=p["table_atol"])
+            else:
+                line_points = tensor_product_line_points(points, rtol=p["table_rtol"], atol=p["table_atol"])
+                if line_points is not None:
+                    factor_tables, tensor_factors = build_tensor_factor_tables(
+                        num_points, line_points, initial_terminals.values(), mt_unique_table_reference,
+                        unique_tables, rtol=p["table_rtol"], atol=p["table_atol"])
+            if tensor_factors:
+                unique_tables.update(factor_tables)
+                unique_table_types.update((name, "tensor_factor") for name in factor_tables)
 
         # Output diagnostic graph as pdf
         if parameters['visualise']:
@@ -328,14 +399,15 @@ def build_uflacs_ir(cell, integral_type, entitytype, integrands, tensor_shape,
 
         # Compute factorization of arguments
         rank = len(tensor_shape)
-        F = compute_argument_factorization(S, rank)
+        residual_rank = None if residual_shape is None else len(residual_shape)
+        F, argument_factorization = compute_argument_factorization(S, rank, residual_rank)
 
-        # Get the 'target' nodes that are factors of arguments, and insert in dict
-        FV_targets = [i for i, v in F.nodes.items() if v.get('target', False)]
-        argument_factorization = {}
-        for i in FV_targets:
-            for w in F.nodes[i]['target']:
-                argument_factorization[w] = i
+        # Mirrors of the terms of symmetric bilinear integrands
+        mirrors = None
+        if rank == 2 and residual_shape is None:
+            mirrors = compute_argument_mirrors(F, argument_factorization)
+        if mirrors is None:
+            ir["symmetric"] = False
 
         # Get list of indices in F which are the arguments (should be at start)
         argkeys = set()
@@ -349,29 +421,31 @@ def build_uflacs_ir(cell, integral_type, entitytype, integrands, tensor_shape,
 
         # Build set of modified_terminals for each mt factorized vertex in F
         # and attach tables, if appropriate
-        for i, v in F.nodes.items():
-            expr = v['expression']
+        for v in F.nodes:
+            expr = v.expression
             if is_modified_terminal(expr):
-                mt = analyse_modified_terminal(expr)
-                F.nodes[i]['mt'] = mt
-                tr = mt_unique_table_reference.get(mt)
-                if tr is not None:
-                    F.nodes[i]['tr'] = tr
+                v.mt = analyse_modified_terminal(expr)
+                v.tr = mt_unique_table_reference.get(v.mt)
 
-        # Attach 'status' to each node: 'inactive', 'piecewise' or 'varying'
+        # Set status of each node: INACTIVE, PIECEWISE or VARYING
         analyse_dependencies(F, mt_unique_table_reference)
 
-        # Save the factorisation graph to the piecewise IR
-        ir["piecewise_ir"]["factorization"] = F
-        ir["piecewise_ir"]["modified_arguments"] = [F.nodes[i]['mt']
-                                                    for i in argkeys]
-
         # Loop over factorization terms
         block_contributions = collections.defaultdict(list)
         for ma_indices, fi in sorted(argument_factorization.items()):
-            # Get a bunch of information about this term
-            assert rank == len(ma_indices)
-            trs = tuple(F.nodes[ai]['tr'] for ai in ma_indices)
+            # Skip the second term of each pair of mirrored terms, the
+            # first is added to A together with its transpose
+            symmetry = None
+            if p["enable_symmetry"] and mirrors is not None:
+                if mirrors[ma_indices] < ma_indices:
+                    continue
+                symmetry = "self" if mirrors[ma_indices] == ma_indices else "pair"
+
+            # Get a bunch of information about this term, of the
+            # linear form if its rank is residual_rank
+            term_rank = len(ma_indices)
+            assert term_rank in (rank, residual_rank)
+            trs = tuple(F.nodes[ai].tr for ai in ma_indices)
 
             unames = tuple(tr.name for tr in trs)
             ttypes = tuple(tr.ttype for tr in trs)
@@ -388,65 +462,41 @@ def build_uflacs_ir(cell, integral_type, entitytype, integrands, tensor_shape,
                 if trs[i].is_uniform:
                     r = None
                 else:
-                    r = F.nodes[ai]['mt'].restriction
+                    r = F.nodes[ai].mt.restriction
                 block_restrictions.append(r)
             block_restrictions = tuple(block_restrictions)
 
-            factor_is_piecewise = F.nodes[fi]['status'] == 'piecewise'
-
-            # TODO: Add separate block modes for quadrature
-            # Both arguments in quadrature elements
-            """
-            for iq
-                fw = f*w
-                #for i
-                #    for j
-                #        B[i,j] = fw*U[i]*V[j] = 0 if i != iq or j != iq
-                BQ[iq] = B[iq,iq] = fw
-            for (iq)
-                A[iq+offset0, iq+offset1] = BQ[iq]
-            """
-            # One argument in quadrature element
-            """
-            for iq
-                fw[iq] = f*w
-                #for i
-                #    for j
-                #        B[i,j] = fw*UQ[i]*V[j] = 0 if i != iq
-                for j
-                    BQ[iq,j] = fw[iq]*V[iq,j]
-            for (iq) for (j)
-                A[iq+offset, j+offset] = BQ[iq,j]
-            """
-
-            # Decide how to handle code generation for this block
-            if p["enable_preintegration"] and (factor_is_piecewise and rank > 0
-                                               and "quadrature" not in ttypes):
-                # - Piecewise factor is an absolute prerequisite
-                # - Could work for rank 0 as well but currently doesn't
-                # - Haven't considered how quadrature elements work out
-                block_mode = "preintegrated"
-            elif p["enable_premultiplication"] and (rank > 0 and all(tt in piecewise_ttypes
-                                                                     for tt in ttypes)):
-                # Integrate functional in quadloop, scale block after
-                # quadloop
-                block_mode = "premultiplied"
-            elif p["enable_sum_factorization"]:
-                if (rank == 2 and any(tt in piecewise_ttypes for tt in ttypes)):
-                    # Partial computation in quadloop of f*u[i], compute
-                    # (f*u[i])*v[i] outside quadloop, (or with u,v
-                    # swapped)
-                    block_mode = "partial"
-                else:
-                    # Full runtime integration of f*u[i]*v[j], can still
-                    # do partial computation in quadloop of f*u[i] but
-                    # must compute (f*u[i])*v[i] as well inside
-                    # quadloop.  (or with u,v swapped)
-                    block_mode = "full"
+            factor_is_piecewise = bool(F.status[fi] == PIECEWISE)
+
+            # Decide how to handle code generation for this block, by
+            # estimating the cost of each valid and enabled block mode
+            factorized = term_rank > 0 and unames[-1] in tensor_factors
+            modes = [mode for mode in valid_block_modes(ttypes, factor_is_piecewise, factorized)
+                     if mode in enabled_modes]
+            if modes == ["quadrature"]:
+                # Arguments with identity tables (quadrature elements or
+                # elements with nodes collocated with the quadrature
+                # points), dof loops collapse onto the quadrature loop
+                block_mode = "quadrature"
+                costs = {}
             else:
-                # Use full runtime integration with nothing fancy going
-                # on
-                block_mode = "safe"
+                num_dofs = tuple(unique_table_num_dofs[name] for name in unames)
+                num_entities = max([1] + [unique_tables[name].shape[0]
+                                          for name in unames if name in unique_tables])
+                factor_shape = None
+                basis_shape = None
+                if factorized:
+                    factor_shape = tuple(unique_tables[name].shape for name in tensor_factors[unames[-1]])
+                    if unames[-1] in tensor_bases:
+                        basis_shape = unique_tables[tensor_bases[unames[-1]]].shape
+                costs = estimate_block_costs(modes, ttypes, num_dofs, num_points, num_entities,
+                                             integral_type, factor_shape, basis_shape)
+                block_mode = select_block_mode(costs)
+            ir["block_mode_costs"].append({
+                "num_points": num_points,
+                "arguments": unames,
+                "block_mode": block_mode,
+                "costs": {mode: cost._asdict() for mode, cost in costs.items()}})
 
             # Carry out decision
             if block_mode == "preintegrated":
@@ -470,7 +520,7 @@ def build_uflacs_ir(cell, integral_type, entitytype, integrands, tensor_shape,
                 if pname is None:
                     # Cache miss, precompute block
                     weights = quadrature_rules[num_points][1]
-                    if integral_type == "interior_facet":
+                    if integral_type == "interior_facet" and term_rank > 0:
                         ptable = integrate_block_interior_facets(
                             weights, unames, ttypes, unique_tables, unique_table_num_dofs)
                     else:
@@ -489,7 +539,7 @@ def build_uflacs_ir(cell, integral_type, entitytype, integrands, tensor_shape,
                 blockdata = block_data_t(
                     block_mode, ttypes, fi, factor_is_piecewise, block_unames,
                     block_restrictions, block_is_transposed, block_is_uniform, pname,
-                    None, None)
+                    None, None, num_points, symmetry)
                 block_is_piecewise = True
 
             elif block_mode == "premultiplied":
@@ -527,7 +577,8 @@ def build_uflacs_ir(cell, integral_type, entitytype, integrands, tensor_shape,
                 block_unames = (pname, )
                 blockdata = block_data_t(
                     block_mode, ttypes, fi, factor_is_piecewise, block_unames,
-                    block_restrictions, block_is_transposed, block_is_uniform, pname, None, None)
+                    block_restrictions, block_is_transposed, block_is_uniform, pname, None, None,
+                    num_points, symmetry)
                 block_is_piecewise = False
 
 #           elif block_mode == "scaled":
@@ -541,7 +592,7 @@ def build_uflacs_ir(cell, integral_type, entitytype, integrands, tensor_shape,
 #               # premultiplied, except no P table name or values)
 #               block_is_piecewise = False
 
-            elif block_mode in ("partial", "full", "safe"):
+            elif block_mode in ("partial", "full", "safe", "quadrature", "factorized"):
                 block_is_piecewise = factor_is_piecewise and not expect_weight
                 ma_data = []
                 for i, ma in enumerate(ma_indices):
@@ -558,27 +609,32 @@ def build_uflacs_ir(cell, integral_type, entitytype, integrands, tensor_shape,
                     # A[blockmap] += B[...];           generated after quadloop
 
                     # Find first piecewise index TODO: Is last better? just reverse range here
-                    for i in range(rank):
+                    for i in range(term_rank):
                         if trs[i].is_piecewise:
                             piecewise_ma_index = i
                             break
-                    assert rank == 2
+                    assert term_rank == 2
                     not_piecewise_ma_index = 1 - piecewise_ma_index
                     block_unames = (unames[not_piecewise_ma_index], )
                     blockdata = block_data_t(block_mode, ttypes, fi,
                                              factor_is_piecewise, block_unames,
                                              block_restrictions, block_is_transposed,
-                                             None, None, tuple(ma_data), piecewise_ma_index)
-                elif block_mode in ("full", "safe"):
+                                             None, None, tuple(ma_data), piecewise_ma_index,
+                                             num_points, symmetry)
+                elif block_mode in ("full", "safe", "quadrature", "factorized"):
                     # Add to contributions:
                     # B[i] = sum_q weight * f * u[i] * v[j];  generated inside quadloop
                     # A[blockmap] += B[i];                    generated after quadloop
+                    # (in "quadrature" mode, i = iq and/or j = iq and B is
+                    # diagonal if both arguments are collocated, in
+                    # "factorized" mode the sum over q is computed after
+                    # the quadrature loop by sum factorisation over v)
 
                     block_unames = unames
                     blockdata = block_data_t(block_mode, ttypes, fi,
                                              factor_is_piecewise, block_unames,
                                              block_restrictions, block_is_transposed,
-                                             None, None, tuple(ma_data), None)
+                                             None, None, tuple(ma_data), None, num_points, symmetry)
             else:
                 raise RuntimeError("Invalid block_mode %s" % (block_mode, ))
 
@@ -592,10 +648,14 @@ def build_uflacs_ir(cell, integral_type, entitytype, integrands, tensor_shape,
         # Figure out which table names are referenced in unstructured
         # partition
         active_table_names = set()
-        for i, v in F.nodes.items():
-            tr = v.get('tr')
-            if tr is not None and F.nodes[i]['status'] != 'inactive':
-                active_table_names.add(tr.name)
+        for i, v in enumerate(F.nodes):
+            if v.tr is not None and F.status[i] != INACTIVE:
+                if uses_tensor_factors(v.mt, v.tr, tensor_factors, tensor_bases):
+                    active_table_names.update(tensor_factors[v.tr.name])
+                    if v.tr.name in tensor_bases:
+                        active_table_names.add(tensor_bases[v.tr.name])
+                else:
+                    active_table_names.add(v.tr.name)
 
         # Figure out which table names are referenced in blocks
         for blockmap, contributions in itertools.chain(
@@ -603,9 +663,16 @@ def build_uflacs_ir(cell, integral_type, entitytype, integrands, tensor_shape,
             for blockdata in contributions:
                 if blockdata.block_mode in ("preintegrated", "premultiplied"):
                     active_table_names.add(blockdata.name)
-                elif blockdata.block_mode in ("partial", "full", "safe"):
+                elif blockdata.block_mode in ("partial", "full", "safe", "quadrature"):
                     for mad in blockdata.ma_data:
                         active_table_names.add(mad.tabledata.name)
+                elif blockdata.block_mode == "factorized":
+                    for mad in blockdata.ma_data[:-1]:
+                        active_table_names.add(mad.tabledata.name)
+                    name = blockdata.ma_data[-1].tabledata.name
+                    active_table_names.update(tensor_factors[name])
+                    if name in tensor_bases:
+                        active_table_names.add(tensor_bases[name])
 
         # Record all table types before dropping tables
         ir["unique_table_types"].update(unique_table_types)
@@ -631,10 +698,9 @@ def build_uflacs_ir(cell, integral_type, entitytype, integrands, tensor_shape,
 
         # Analyse active terminals to check what we'll need to generate code for
         active_mts = []
-        for i, v in F.nodes.items():
-            mt = v.get('mt', False)
-            if mt and F.nodes[i]['status'] != 'inactive':
-                active_mts.append(mt)
+        for i, v in enumerate(F.nodes):
+            if v.mt is not None and F.status[i] != INACTIVE:
+                active_mts.append(v.mt)
 
         # Figure out if we need to access CellCoordinate to avoid
         # generating quadrature point table otherwise
@@ -674,39 +740,39 @@ def build_uflacs_ir(cell, integral_type, entitytype, integrands, tensor_shape,
         # Build IR dict for the given expressions
         # Store final ir for this num_points
         ir["varying_irs"][num_points] = {"factorization": F,
-                                         "modified_arguments": [F.nodes[i]['mt'] for i in argkeys],
+                                         "modified_arguments": [F.nodes[i].mt for i in argkeys],
                                          "block_contributions": block_contributions,
                                          "need_points": need_points,
-                                         "need_weights": need_weights}
+                                         "need_weights": need_weights,
+                                         "tensor_factors": tensor_factors,
+                                         "tensor_bases": tensor_bases}
     return ir
 
 
 def analyse_dependencies(F, mt_unique_table_reference):
-    # Sets 'status' of all nodes to either: 'inactive', 'piecewise' or 'varying'
-    # Children of 'target' nodes are either 'piecewise' or 'varying'.
-    # All other nodes are 'inactive'.
-    # Varying nodes are identified by their tables ('tr'). All their parent
-    # nodes are also set to 'varying' - any remaining active nodes are 'piecewise'.
-
-    # Set targets, and dependencies to 'active'
-    targets = [i for i, v in F.nodes.items() if v.get('target')]
-    for i, v in F.nodes.items():
-        v['status'] = 'inactive'
-
+    # Sets status of all nodes to either: INACTIVE, PIECEWISE or VARYING
+    # Children of target nodes are either PIECEWISE or VARYING.
+    # All other nodes are INACTIVE.
+    # Varying nodes are identified by their tables (tr). All their parent
+    # nodes are also set to VARYING - any remaining active nodes are PIECEWISE.
+    status = numpy.full(F.number_of_nodes(), INACTIVE, dtype=numpy.int8)
+
+    # Set targets, and dependencies to ACTIVE
+    targets = list(numpy.flatnonzero(F.target))
     while targets:
         s = targets.pop()
-        F.nodes[s]['status'] = 'active'
-        for j in F.out_edges[s]:
-            if F.nodes[j]['status'] == 'inactive':
+        status[s] = ACTIVE
+        for j in F.out_edges(s):
+            if status[j] == INACTIVE:
                 targets.append(j)
 
     # Build piecewise/varying markers for factorized_vertices
     varying_ttypes = ("varying", "uniform", "quadrature")
     varying_indices = []
-    for i, v in F.nodes.items():
-        if v.get('mt') is None:
+    for i, v in enumerate(F.nodes):
+        if v.mt is None:
             continue
-        tr = v.get('tr')
+        tr = v.tr
         if tr is not None:
             ttype = tr.ttype
             # Check if table computations have revealed values varying over points
@@ -717,24 +783,22 @@ def analyse_dependencies(F, mt_unique_table_reference):
                 if ttype not in ("fixed", "piecewise", "ones", "zeros"):
                     raise RuntimeError("Invalid ttype %s" % (ttype, ))
 
-        elif not is_cellwise_constant(v['expression']):
+        elif not is_cellwise_constant(v.expression):
             raise RuntimeError("Error")
             # Keeping this check to be on the safe side,
             # not sure which cases this will cover (if any)
             # varying_indices.append(i)
 
-    # Set all parents of active varying nodes to 'varying'
+    # Set all parents of active varying nodes to VARYING
     while varying_indices:
         s = varying_indices.pop()
-        if F.nodes[s]['status'] == 'active':
-            F.nodes[s]['status'] = 'varying'
-            for j in F.in_edges[s]:
-                varying_indices.append(j)
+        if status[s] == ACTIVE:
+            status[s] = VARYING
+            varying_indices.extend(F.in_edges(s))
 
-    # Any remaining active nodes must be 'piecewise'
-    for i, v in F.nodes.items():
-        if v['status'] == 'active':
-            v['status'] = 'piecewise'
+    # Any remaining active nodes must be PIECEWISE
+    status[status == ACTIVE] = PIECEWISE
+    F.status = status
 
 
 def replace_quadratureweight(expression):
@@ -747,12 +811,8 @@ def replace_quadratureweight(expression):
 
 
 def _find_terminals_in_ufl_expression(e, etype):
-    """Recursively search expression for terminals of type etype."""
-    r = []
-    for op in e.ufl_operands:
-        if is_modified_terminal(op) and isinstance(op, etype):
-            r.append(op)
-        else:
-            r += _find_terminals_in_ufl_expression(op, etype)
+    """Search expression for terminals of type etype.
 
-    return r
+    Each unique subexpression is visited once.
+    """
+    return [o for o in unique_pre_traversal(e) if isinstance(o, etype)]
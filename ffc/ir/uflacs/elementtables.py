@@ -7,12 +7,15 @@
 """Tools for precomputed tables of terminal values."""
 
 import collections
+import functools
 import logging
 
 import numpy
 
 import ufl
 import ufl.utils.derivativetuples
+from FIAT.mixed import MixedElement
+from FIAT.tensor_product import FlattenedDimensions, TensorProductElement
 from ffc.fiatinterface import create_element
 from ffc.ir.representationutils import (create_quadrature_points_and_weights,
                                         integral_type_to_entity_dim,
@@ -60,10 +63,14 @@ def clamp_table_small_numbers(table,
                               atol=default_atol,
                               numbers=(-1.0, -0.5, 0.0, 0.5, 1.0)):
     """Clamp almost 0,1,-1 values to integers. Returns new table."""
-    # Get shape of table and number of columns, defined as the last axis
+    # Find the nearest of the numbers for each table value, and clamp
+    # the values that are close to it
     table = numpy.asarray(table)
-    for n in numbers:
-        table[numpy.where(numpy.isclose(table, n, rtol=rtol, atol=atol))] = n
+    numbers = numpy.sort(numpy.asarray(numbers, dtype=numpy.float64))
+    midpoints = 0.5 * (numbers[1:] + numbers[:-1])
+    nearest = numbers[numpy.searchsorted(midpoints, table)]
+    close = numpy.abs(table - nearest) <= atol + rtol * numpy.abs(nearest)
+    numpy.copyto(table, nearest, where=close, casting="unsafe")
     return table
 
 
@@ -73,10 +80,9 @@ def strip_table_zeros(table, compress_zeros, rtol=default_rtol, atol=default_ato
     table = numpy.asarray(table)
     sh = table.shape
 
-    # Find nonzero columns
-    z = numpy.zeros(sh[:-1])  # Correctly shaped zero table
-    dofmap = tuple(
-        i for i in range(sh[-1]) if not numpy.allclose(z, table[..., i], rtol=rtol, atol=atol))
+    # Find nonzero columns, i.e. columns not close to zero everywhere
+    columns = numpy.abs(table.reshape(-1, sh[-1]))
+    dofmap = tuple(numpy.flatnonzero(numpy.any(columns > atol + rtol * columns, axis=0)).tolist())
     if dofmap:
         # Find first nonzero column
         begin = dofmap[0]
@@ -96,9 +102,38 @@ def strip_table_zeros(table, compress_zeros, rtol=default_rtol, atol=default_ato
     return dofrange, dofmap, stripped_table
 
 
+def collocated_table_permutation(table, rtol=default_rtol, atol=default_atol):
+    """Return column ordering that turns table into an identity matrix on each entity.
+
+    Returns None if the table is not a permutation of the identity.
+    This is the case when element nodes coincide with the quadrature
+    points, but are numbered differently.
+    """
+    num_entities, num_points, num_dofs = table.shape
+    if num_points != num_dofs:
+        return None
+    perm = numpy.argmax(numpy.abs(table[0]), axis=1)
+    if len(set(perm)) != num_dofs:
+        return None
+    Id = numpy.eye(num_points)
+    if all(numpy.allclose(table[i][:, perm], Id, rtol=rtol, atol=atol) for i in range(num_entities)):
+        return perm
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def table_projection_weights(size):
+    """Return fixed pseudo-random weights in [0.5, 1] for projecting tables of given size."""
+    return numpy.random.RandomState(size).uniform(0.5, 1.0, size)
+
+
 def build_unique_tables(tables, rtol=default_rtol, atol=default_atol):
     """Given a list or dict of tables, return a list of unique tables
-    and a dict of unique table indices for each input table key."""
+    and a dict of unique table indices for each input table key.
+
+    Tables are bucketed by shape and quantised projection of their
+    values, such that each table is only compared to tables in the
+    buckets where tables equal to it within tolerance can be found."""
     unique = []
     mapping = {}
 
@@ -107,17 +142,39 @@ def build_unique_tables(tables, rtol=default_rtol, atol=default_atol):
     elif isinstance(tables, dict):
         keys = sorted(tables.keys())
 
+    # Project the values of each table t onto fixed weights w in
+    # [0.5, 1]. If allclose(u, t), then |w.u - w.t| <= sum(w*|u - t|)
+    # <= size*atol + rtol*sum(|t|), which bounds the distance between
+    # the projections of tables equal within tolerance
+    projections = {}
+    bounds = {}
+    for k in keys:
+        t = numpy.asarray(tables[k]).ravel()
+        projections[k] = numpy.dot(table_projection_weights(t.size), t)
+        bounds[k] = (1.0 + 1e-8) * (t.size * atol + rtol * numpy.sum(numpy.abs(t))) \
+            + 4 * t.size * numpy.finfo(numpy.float64).eps * numpy.sum(numpy.abs(t))
+
+    # Using the largest bound as bucket width, candidate equal tables
+    # are in the same or neighbouring buckets
+    width = max(bounds.values(), default=0.0) or 1.0
+    buckets = collections.defaultdict(list)
+
     for k in keys:
         t = tables[k]
+        shape = numpy.shape(t)
+        first = int(numpy.floor((projections[k] - bounds[k]) / width))
+        last = int(numpy.floor((projections[k] + bounds[k]) / width))
+        candidates = sorted(i for b in range(first, last + 1) for i in buckets.get((shape, b), ()))
         found = -1
-        for i, u in enumerate(unique):
-            if equal_tables(u, t, rtol=rtol, atol=atol):
+        for i in candidates:
+            if equal_tables(unique[i], t, rtol=rtol, atol=atol):
                 found = i
                 break
         if found == -1:
-            i = len(unique)
+            found = len(unique)
             unique.append(t)
-        mapping[k] = i
+            buckets[(shape, int(numpy.floor(projections[k] / width)))].append(found)
+        mapping[k] = found
 
     return unique, mapping
 
@@ -384,13 +441,15 @@ def optimize_element_tables(tables,
                             table_origins,
                             compress_zeros,
                             rtol=default_rtol,
-                            atol=default_atol):
+                            atol=default_atol,
+                            argument_table_names=()):
     """Optimize tables and make unique set.
 
     Steps taken:
 
       - clamp values that are very close to -1, 0, +1 to those values
       - remove dofs from beginning and end of tables where values are all zero
+      - reorder dofs of argument tables that are permuted identity matrices
       - for each modified terminal, provide the dof range that a given table corresponds to
 
     Terminology:
@@ -402,6 +461,7 @@ def optimize_element_tables(tables,
     Input:
       tables - { name: table }
       table_origins - FIXME
+      argument_table_names - names of tables whose dofs may be reordered
 
     Output:
       unique_tables - { unique_name: stripped_table }
@@ -427,6 +487,15 @@ def optimize_element_tables(tables,
         # Strip contiguous zero blocks at the ends of all tables
         dofrange, dofmap, tbl = strip_table_zeros(tbl, compress_zeros, rtol=rtol, atol=atol)
 
+        # Reorder dofs of argument tables collocated with the
+        # quadrature points to get identity tables, the dofmap
+        # keeps track of the element dof ordering
+        if name in argument_table_names:
+            perm = collocated_table_permutation(tbl, rtol=rtol, atol=atol)
+            if perm is not None:
+                tbl = tbl[..., perm]
+                dofmap = tuple(dofmap[i] for i in perm)
+
         compressed_tables[name] = tbl
         table_ranges[name] = dofrange
         table_dofmaps[name] = dofmap
@@ -559,9 +628,17 @@ def build_optimized_tables(num_points,
         rtol=rtol,
         atol=atol)
 
+    # Tables used only by arguments can be reordered, the block
+    # dofmaps absorb the permutation
+    argument_table_names = set(name for mt, name in mt_table_names.items()
+                               if isinstance(mt.terminal, ufl.classes.Argument))
+    argument_table_names -= set(name for mt, name in mt_table_names.items()
+                                if not isinstance(mt.terminal, ufl.classes.Argument))
+
     # Optimize tables and get table name and dofrange for each modified terminal
     unique_tables, unique_table_origins, table_unames, table_ranges, table_dofmaps, table_original_num_dofs = \
-        optimize_element_tables(tables, table_origins, compress_zeros, rtol=rtol, atol=atol)
+        optimize_element_tables(tables, table_origins, compress_zeros, rtol=rtol, atol=atol,
+                                argument_table_names=argument_table_names)
 
     # Get num_dofs for all tables before they can be deleted later
     unique_table_num_dofs = {uname: tbl.shape[2] for uname, tbl in unique_tables.items()}
@@ -606,6 +683,7 @@ def build_optimized_tables(num_points,
         del unique_tables[uname]
         unique_table_ttypes[ename] = unique_table_ttypes[uname]
         del unique_table_ttypes[uname]
+        unique_table_num_dofs[ename] = unique_table_num_dofs.pop(uname)
 
     # Build mapping from modified terminal to unique table with metadata
     # { mt: (unique name,
@@ -642,3 +720,231 @@ def build_optimized_tables(num_points,
             ttype in piecewise_ttypes, ttype in uniform_ttypes)
 
     return unique_tables, unique_table_ttypes, unique_table_num_dofs, mt_unique_table_reference
+
+
+def tensor_product_line_points(points, rtol=default_rtol, atol=default_atol):
+    """Return the points of each direction of a tensor product quadrature rule.
+
+    Returns None if points is not a tensor product grid.
+
+    The grid is expected in lexicographic ordering with the first
+    coordinate running slowest and increasing coordinates in each
+    direction, as in the quadrature rules on quadrilaterals and
+    hexahedra.
+    """
+    points = numpy.asarray(points)
+    num_points, tdim = points.shape
+    line_points = []
+    for d in range(tdim):
+        x = numpy.sort(points[:, d])
+        distinct = numpy.concatenate(([True], ~numpy.isclose(x[1:], x[:-1], rtol=rtol, atol=atol)))
+        line_points.append(x[distinct])
+    if ufl.product([len(x) for x in line_points]) != num_points:
+        return None
+    grid = numpy.stack(numpy.meshgrid(*line_points, indexing="ij"), axis=-1)
+    if not numpy.allclose(grid.reshape(num_points, tdim), points, rtol=rtol, atol=atol):
+        return None
+    return line_points
+
+
+def _tensor_product_factor_elements(fiat_element, flat_component):
+    """Return the FIAT factor elements on the interval of a tensor product element.
+
+    Their tensor product is the scalar subelement of fiat_element with
+    flat_component. Returns None if there are no such elements.
+    """
+    if isinstance(fiat_element, MixedElement):
+        for e in fiat_element.elements():
+            size = ufl.product(e.value_shape())
+            if flat_component < size:
+                return _tensor_product_factor_elements(e, flat_component)
+            flat_component -= size
+        return None
+    if fiat_element.value_shape() != () or fiat_element.mapping()[0] != "affine":
+        return None
+    if isinstance(fiat_element, FlattenedDimensions):
+        return _tensor_product_factor_elements(fiat_element.element, flat_component)
+    if isinstance(fiat_element, TensorProductElement):
+        A = _tensor_product_factor_elements(fiat_element.A, 0)
+        B = _tensor_product_factor_elements(fiat_element.B, 0)
+        if A is None or B is None:
+            return None
+        return A + B
+    if fiat_element.get_reference_element().get_spatial_dimension() == 1:
+        return [fiat_element]
+    return None
+
+
+def get_tensor_factor_values(line_points, ufl_element, derivative_counts, flat_component):
+    """Return the tables of the factors on the interval of a tensor product element.
+
+    The tables have axes (quadrature point number, dof number). Returns
+    None if the element is not a tensor product.
+
+    The table of the element in the points of the tensor product rule
+    with line_points in each direction is the Kronecker product of the
+    factor tables, up to the dof ordering.
+    """
+    factors = _tensor_product_factor_elements(create_element(ufl_element), flat_component)
+    if factors is None or len(factors) != len(line_points):
+        return None
+    return [e.tabulate(d, x.reshape(-1, 1))[(d, )].T
+            for e, x, d in zip(factors, line_points, derivative_counts)]
+
+
+def uses_tensor_factors(mt, tr, tensor_factors, tensor_bases=()):
+    """Check if the value of modified terminal mt is computed by sum factorisation.
+
+    This applies to coefficients and geometric quantities with table
+    reference tr, with the factor tables in tensor_factors and the bases
+    in tensor_bases.
+
+    Without a change of basis, the dofs are contracted in a loop and
+    must be contiguous.
+    """
+    return (tr.name in tensor_factors and not mt.restriction and not mt.averaged
+            and isinstance(mt.terminal, (ufl.classes.Coefficient, ufl.classes.SpatialCoordinate,
+                                         ufl.classes.Jacobian))
+            and (tr.name in tensor_bases or tuple(tr.dofmap) == tuple(range(*tr.dofrange))))
+
+
+def build_tensor_factor_tables(num_points, line_points, modified_terminals,
+                               mt_unique_table_reference, unique_tables,
+                               rtol=default_rtol, atol=default_atol):
+    """Factor element tables on a tensor product rule for sum factorisation.
+
+    Tables varying over the points of a tensor product quadrature rule
+    are factored into tables on the interval.
+
+    Only tables equal to the Kronecker product of their factor tables,
+    with the dofs in the same order, are factored.
+
+    Output:
+      factor_tables - { name: table }, with axes (points, dofs) of one direction
+      tensor_factors - { unique_name: (factor table name of each direction) }
+    """
+    factor_tables = {}
+    tensor_factors = {}
+    for mt in modified_terminals:
+        tr = mt_unique_table_reference.get(mt)
+        if tr is None or tr.ttype not in ("varying", "uniform") or tr.name in tensor_factors:
+            continue
+        element, avg, local_derivatives, flat_component = get_modified_terminal_element(mt)
+        values = get_tensor_factor_values(line_points, element, local_derivatives, flat_component)
+        if values is None:
+            continue
+        values = [clamp_table_small_numbers(v, rtol=rtol, atol=atol) for v in values]
+        product = functools.reduce(numpy.kron, values)
+        table = unique_tables[tr.name]
+        if table.shape != (1, ) + product.shape or not equal_tables(table[0], product, rtol=rtol, atol=atol):
+            continue
+
+        tensor_factors[tr.name] = tuple(_add_factor_table(factor_tables, "FT", num_points, v, rtol, atol)
+                                        for v in values)
+    return factor_tables, tensor_factors
+
+
+def _add_factor_table(factor_tables, prefix, num_points, values, rtol, atol):
+    """Return the name of the table in factor_tables equal to values.
+
+    The table is added if there is none.
+    """
+    for name, t in sorted(factor_tables.items()):
+        if name.startswith(prefix) and t.shape == values.shape and equal_tables(t, values, rtol=rtol, atol=atol):
+            return name
+    name = "%s%d_Q%d" % (prefix, len(factor_tables), num_points)
+    factor_tables[name] = values
+    return name
+
+
+def collapsed_line_points(points, rtol=default_rtol, atol=default_atol):
+    """Return the collapsed coordinates of each direction of a rule on a simplex.
+
+    Returns None if the points are not the image of a tensor product
+    grid under the collapsed coordinate map.
+
+    The collapsed coordinate (Duffy) map from the unit cube to the
+    reference simplex is x_{d-1} = s_{d-1} and
+    x_k = s_k (1 - x_{k+1} - ... - x_{d-1}), as used by the collapsed
+    Gauss-Jacobi rules of FIAT for high degrees.
+    """
+    points = numpy.asarray(points)
+    collapsed = numpy.empty_like(points)
+    for k in range(points.shape[1]):
+        rest = 1.0 - points[:, k + 1:].sum(axis=1)
+        if numpy.any(rest <= atol):
+            return None
+        collapsed[:, k] = points[:, k] / rest
+    return tensor_product_line_points(collapsed, rtol=rtol, atol=atol)
+
+
+def get_collapsed_factor_values(line_points, degree):
+    """Return the tables of Legendre polynomials in each collapsed coordinate.
+
+    The polynomials are on [0, 1] up to degree, and the tables have axes
+    (quadrature point number, polynomial number).
+
+    Polynomials of total degree n on the simplex are polynomials of
+    degree n in each collapsed coordinate, so the table of an element of
+    degree n is the Kronecker product of these tables times a matrix of
+    basis coefficients.
+    """
+    return [numpy.polynomial.legendre.legvander(2 * x - 1, degree) for x in line_points]
+
+
+def build_collapsed_factor_tables(num_points, line_points, modified_terminals,
+                                  mt_unique_table_reference, unique_tables,
+                                  rtol=default_rtol, atol=default_atol):
+    """Factor element tables on a collapsed simplex rule for sum factorisation.
+
+    Tables varying over the points of a collapsed quadrature rule on a
+    simplex are factored into tables of Legendre polynomials in each
+    collapsed coordinate and a change of basis to the element dofs.
+
+    Tables are factored if the degree of the element is below the number
+    of points in each direction, and the factorization reproduces the
+    compressed table.
+
+    The change of basis is a dense matrix between the element dofs and
+    the tensor product polynomials, as for any modal basis of a nodal
+    element. Applying it costs O(n^(2d)) operations per vector and
+    O(n^(3d)) per bilinear block for degree n in d dimensions, the same
+    order as without factorisation, so the gain is a constant factor.
+
+    Output:
+      factor_tables - { name: table }, with axes (points, polynomials) of
+                      one direction, or (polynomials, dofs) for a basis
+      tensor_factors - { unique_name: (factor table name of each direction) }
+      tensor_bases - { unique_name: basis table name }
+    """
+    factor_tables = {}
+    tensor_factors = {}
+    tensor_bases = {}
+    for mt in modified_terminals:
+        tr = mt_unique_table_reference.get(mt)
+        if tr is None or tr.ttype not in ("varying", "uniform") or tr.name in tensor_factors:
+            continue
+        element, avg, local_derivatives, flat_component = get_modified_terminal_element(mt)
+        degree = element.degree()
+        if degree is None:
+            continue
+        degree = max(degree - sum(local_derivatives), 0)
+        if any(len(x) <= degree + 1 for x in line_points):
+            continue
+
+        # Basis coefficients by least squares, exact if the table is
+        # in the span of the factors
+        values = get_collapsed_factor_values(line_points, degree)
+        table = unique_tables[tr.name]
+        if table.shape[:2] != (1, num_points):
+            continue
+        pinv = functools.reduce(numpy.kron, [numpy.linalg.pinv(v) for v in values])
+        basis = clamp_table_small_numbers(numpy.dot(pinv, table[0]), rtol=rtol, atol=atol)
+        product = numpy.dot(functools.reduce(numpy.kron, values), basis)
+        if not equal_tables(table[0], product, rtol=rtol, atol=atol):
+            continue
+
+        tensor_factors[tr.name] = tuple(_add_factor_table(factor_tables, "FT", num_points, v, rtol, atol)
+                                        for v in values)
+        tensor_bases[tr.name] = _add_factor_table(factor_tables, "FB", num_points, basis, rtol, atol)
+    return factor_tables, tensor_factors, tensor_bases
@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"""Persistent cache of the uflacs intermediate representation.
+
+The output of build_uflacs_ir is stored in a versioned numpy .npz
+file per integral: tables and graph structure as numpy arrays, and the
+remaining data as JSON. Expressions are stored as operator names and
+operand node numbers, and terminals by their argument and coefficient
+numbers, so no UFL objects are pickled. Loading maps the terminals back
+onto those of the integrand being compiled.
+
+Files are named by a signature of the integrands, quadrature rules and
+the parameters used in building the IR, so parameters only used in
+code generation can be changed without rebuilding the IR.
+"""
+
+import collections
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+import numpy
+
+import ufl
+from ffc import __version__ as FFC_VERSION
+from ffc.ir.uflacs.analysis.graph import ExpressionGraph
+from ffc.ir.uflacs.analysis.modified_terminals import (analyse_modified_terminal,
+                                                       is_modified_terminal)
+from ffc.ir.uflacs.build_uflacs_ir import block_data_t, ma_data_t
+from ffc.ir.uflacs.elementtables import unique_table_reference_t
+from ufl.algorithms.signature import compute_expression_signature
+from ufl.corealg.traversal import unique_pre_traversal
+
+logger = logging.getLogger(__name__)
+
+# Increase when the format or contents of the cached IR change
+CACHE_FORMAT_VERSION = 6
+
+# uflacs parameters only used in code generation, not in building the IR
+codegen_parameters = ("vectorize", "alignas", "padlen", "use_symbol_array", "tensor_init_mode",
+                      "chunk_size", "batch_width", "vectorize_points", "gemm_block_points",
+                      "max_unrolled_block_size")
+
+
+class UncacheableIR(Exception):
+    """Raised for IR containing expressions the cache cannot represent."""
+
+
+def uflacs_ir_signature(integral_type, entitytype, cell, integrands, tensor_shape,
+                        quadrature_rules, coefficient_numbering, p):
+    """Compute signature identifying the IR built from the given arguments."""
+    renumbering = dict(coefficient_numbering)
+    for integrand in integrands.values():
+        for domain in ufl.domain.extract_domains(integrand):
+            renumbering.setdefault(domain, len(renumbering))
+
+    h = hashlib.sha1()
+    h.update(repr((CACHE_FORMAT_VERSION, FFC_VERSION, integral_type, entitytype, cell.cellname(),
+                   tuple(tensor_shape))).encode("utf-8"))
+    h.update(repr(sorted((k, v) for k, v in p.items() if k not in codegen_parameters)).encode("utf-8"))
+    for num_points in sorted(integrands):
+        points, weights = quadrature_rules[num_points]
+        h.update(repr(num_points).encode("utf-8"))
+        h.update(numpy.ascontiguousarray(points, dtype=numpy.float64).tobytes())
+        h.update(numpy.ascontiguousarray(weights, dtype=numpy.float64).tobytes())
+        h.update(compute_expression_signature(integrands[num_points], renumbering).encode("utf-8"))
+    return h.hexdigest()
+
+
+def cached_build_uflacs_ir(cache_dir, build, cell, integral_type, entitytype, integrands,
+                           tensor_shape, quadrature_rules, parameters, p, coefficient_numbering):
+    """Return build(...) for the given arguments, cached in cache_dir.
+
+    The IR is loaded if it has been built before and stored otherwise.
+    """
+    signature = uflacs_ir_signature(integral_type, entitytype, cell, integrands, tensor_shape,
+                                    quadrature_rules, coefficient_numbering, p)
+    filename = os.path.join(os.path.expanduser(cache_dir), "uflacs_ir", signature + ".npz")
+
+    if os.path.exists(filename):
+        try:
+            ir = load_uflacs_ir(filename, integrands, coefficient_numbering)
+        except Exception:
+            logger.warning("Failed to load cached IR from {}, rebuilding.".format(filename))
+        else:
+            logger.info("Loaded cached IR from {}".format(filename))
+            ir["params"] = p
+            return ir
+
+    ir = build(cell, integral_type, entitytype, integrands, tensor_shape, quadrature_rules, parameters)
+
+    try:
+        save_uflacs_ir(filename, ir, coefficient_numbering)
+    except UncacheableIR as e:
+        logger.info("Not caching IR: {}".format(e))
+    except OSError as e:
+        logger.warning("Failed to write cached IR to {}: {}".format(filename, e))
+    return ir
+
+
+def save_uflacs_ir(filename, ir, coefficient_numbering):
+    """Write IR, as built by build_uflacs_ir, to filename."""
+    arrays = {}
+    references = {}
+    header = {"version": CACHE_FORMAT_VERSION, "all_num_points": ir["all_num_points"]}
+
+    header["unique_tables"] = sorted(ir["unique_tables"])
+    for i, name in enumerate(header["unique_tables"]):
+        arrays["table%d" % i] = ir["unique_tables"][name]
+    header["unique_table_types"] = ir["unique_table_types"]
+    header["block_mode_costs"] = ir["block_mode_costs"]
+    header["symmetric"] = ir["symmetric"]
+
+    def encode_tr(tr):
+        if tr is None:
+            return -1
+        k = references.get(id(tr))
+        if k is None:
+            k = len(references)
+            references[id(tr)] = k
+            header.setdefault("table_references", []).append(
+                [tr.name, tr.dofrange, tr.dofmap, tr.original_dim, tr.ttype, tr.is_piecewise,
+                 tr.is_uniform])
+            arrays["reference%d" % k] = numpy.asarray(tr.values)
+        return k
+
+    def encode_blocks(block_contributions):
+        blocks = []
+        for blockmap, contributions in block_contributions.items():
+            encoded = []
+            for blockdata in contributions:
+                b = blockdata._asdict()
+                if blockdata.ma_data is not None:
+                    b["ma_data"] = [(mad.ma_index, encode_tr(mad.tabledata)) for mad in blockdata.ma_data]
+                encoded.append(b)
+            blocks.append([blockmap, encoded])
+        return blocks
+
+    piecewise_ir = ir["piecewise_ir"]
+    header["piecewise_ir"] = {
+        "preintegrated_blocks": list(piecewise_ir["preintegrated_blocks"].items()),
+        "premultiplied_blocks": list(piecewise_ir["premultiplied_blocks"].items()),
+        "block_contributions": encode_blocks(piecewise_ir["block_contributions"]),
+    }
+    if any(piecewise_ir["preintegrated_contributions"].values()):
+        raise UncacheableIR("preintegrated contributions are not supported")
+
+    header["varying_irs"] = []
+    for k, num_points in enumerate(ir["all_num_points"]):
+        expr_ir = ir["varying_irs"][num_points]
+        F = expr_ir["factorization"]
+        arrays["status%d" % k] = F.status
+        arrays["target%d" % k] = F.target
+        arrays["out_offsets%d" % k] = F._out_offsets
+        arrays["out_indices%d" % k] = F._out_indices
+        header["varying_irs"].append({
+            "nodes": [_encode_expression(v.expression, F.e2i, coefficient_numbering) for v in F.nodes],
+            "tables": [encode_tr(v.tr) for v in F.nodes],
+            "modified_arguments": [F.e2i[mt.expr] for mt in expr_ir["modified_arguments"]],
+            "block_contributions": encode_blocks(expr_ir["block_contributions"]),
+            "need_points": expr_ir["need_points"],
+            "need_weights": expr_ir["need_weights"],
+            "tensor_factors": expr_ir["tensor_factors"],
+            "tensor_bases": expr_ir["tensor_bases"],
+        })
+
+    try:
+        arrays["header"] = numpy.array(json.dumps(header, default=_json_default))
+    except TypeError as e:
+        raise UncacheableIR(str(e))
+
+    # Write to a temporary file first, so that concurrent compilations
+    # never see a partially written file
+    dirname = os.path.dirname(filename)
+    os.makedirs(dirname, exist_ok=True)
+    fd, tmpname = tempfile.mkstemp(suffix=".npz", dir=dirname)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            numpy.savez_compressed(f, **arrays)
+        os.replace(tmpname, filename)
+    except Exception:
+        os.remove(tmpname)
+        raise
+
+
+def load_uflacs_ir(filename, integrands, coefficient_numbering):
+    """Read IR written by save_uflacs_ir.
+
+    Expressions are rebuilt from the terminals of integrands. The
+    'params' entry is not stored.
+    """
+    with numpy.load(filename, allow_pickle=False) as data:
+        arrays = dict(data.items())
+    header = json.loads(str(arrays["header"]))
+    if header["version"] != CACHE_FORMAT_VERSION:
+        raise RuntimeError("Cached IR format version mismatch.")
+
+    # Terminals of the integrands, by the keys used in the cache
+    terminals = {}
+    for integrand in integrands.values():
+        for o in unique_pre_traversal(integrand):
+            if o._ufl_is_terminal_ and not o._ufl_is_literal_:
+                key = _terminal_key(o, coefficient_numbering)
+                if key is not None:
+                    terminals[key] = o
+    domain = ufl.domain.extract_unique_domain(next(iter(integrands.values())))
+
+    ir = {}
+    ir["all_num_points"] = header["all_num_points"]
+    ir["unique_tables"] = {name: arrays["table%d" % i] for i, name in enumerate(header["unique_tables"])}
+    ir["unique_table_types"] = header["unique_table_types"]
+    ir["block_mode_costs"] = header["block_mode_costs"]
+    ir["symmetric"] = header["symmetric"]
+
+    references = []
+    for k, (name, dofrange, dofmap, original_dim, ttype, is_piecewise, is_uniform) in enumerate(
+            header.get("table_references", [])):
+        references.append(unique_table_reference_t(
+            name, arrays["reference%d" % k], tuple(dofrange), tuple(dofmap), original_dim, ttype,
+            is_piecewise, is_uniform))
+
+    def decode_tr(k):
+        return None if k < 0 else references[k]
+
+    def decode_blocks(blocks):
+        block_contributions = collections.defaultdict(list)
+        for blockmap, contributions in blocks:
+            blockmap = tuple(tuple(dofmap) for dofmap in blockmap)
+            for b in contributions:
+                for field in ("ttypes", "unames", "restrictions"):
+                    b[field] = tuple(b[field])
+                if b["ma_data"] is not None:
+                    b["ma_data"] = tuple(ma_data_t(ma_index, decode_tr(k)) for ma_index, k in b["ma_data"])
+                block_contributions[blockmap].append(block_data_t(**b))
+        return block_contributions
+
+    piecewise_ir = header["piecewise_ir"]
+    ir["piecewise_ir"] = {
+        "preintegrated_blocks": {tuple(key): name for key, name in piecewise_ir["preintegrated_blocks"]},
+        "premultiplied_blocks": {tuple(key): name for key, name in piecewise_ir["premultiplied_blocks"]},
+        "preintegrated_contributions": collections.defaultdict(list),
+        "block_contributions": decode_blocks(piecewise_ir["block_contributions"]),
+    }
+
+    ir["varying_irs"] = {"factorization": None}
+    for k, num_points in enumerate(ir["all_num_points"]):
+        expr_ir = header["varying_irs"][k]
+        F = ExpressionGraph()
+        for code in expr_ir["nodes"]:
+            F.add_node(_decode_expression(code, F.nodes, terminals, domain))
+        for v, tr in zip(F.nodes, expr_ir["tables"]):
+            if is_modified_terminal(v.expression):
+                v.mt = analyse_modified_terminal(v.expression)
+            v.tr = decode_tr(tr)
+        out_offsets = arrays["out_offsets%d" % k]
+        F.set_edges(numpy.split(arrays["out_indices%d" % k], out_offsets[1:-1]))
+        F.status = arrays["status%d" % k]
+        F.target = arrays["target%d" % k]
+
+        ir["varying_irs"][num_points] = {
+            "factorization": F,
+            "modified_arguments": [F.nodes[i].mt for i in expr_ir["modified_arguments"]],
+            "block_contributions": decode_blocks(expr_ir["block_contributions"]),
+            "need_points": expr_ir["need_points"],
+            "need_weights": expr_ir["need_weights"],
+            "tensor_factors": {name: tuple(factors) for name, factors in expr_ir["tensor_factors"].items()},
+            "tensor_bases": expr_ir["tensor_bases"],
+        }
+    return ir
+
+
+def _terminal_key(t, coefficient_numbering):
+    """Key identifying a terminal in the cache, or None if not supported."""
+    if isinstance(t, ufl.classes.Argument):
+        return ("Argument", t.number(), t.part())
+    elif isinstance(t, ufl.classes.Coefficient):
+        number = coefficient_numbering.get(t)
+        return None if number is None else ("Coefficient", number)
+    elif isinstance(t, ufl.classes.GeometricQuantity):
+        return ("GeometricQuantity", t._ufl_class_.__name__)
+    return None
+
+
+def _encode_expression(e, e2i, coefficient_numbering):
+    """Encode expression in terms of the node numbers of its operands."""
+    if e._ufl_is_literal_:
+        if isinstance(e, ufl.classes.Zero) and not e.ufl_shape and not e.ufl_free_indices:
+            return ["Zero"]
+        elif isinstance(e, ufl.classes.ComplexValue):
+            return ["ComplexValue", e.value().real, e.value().imag]
+        elif isinstance(e, (ufl.classes.FloatValue, ufl.classes.IntValue)):
+            return [e._ufl_class_.__name__, e.value()]
+    elif is_modified_terminal(e):
+        # Encode the chain of terminal modifiers from the outside in
+        modifiers = []
+        while not e._ufl_is_terminal_:
+            if isinstance(e, ufl.classes.Indexed):
+                indices = e.ufl_operands[1]
+                if not all(isinstance(i, ufl.classes.FixedIndex) for i in indices):
+                    raise UncacheableIR("free index in modified terminal")
+                modifiers.append(["Indexed", [int(i) for i in indices]])
+            else:
+                modifiers.append([e._ufl_class_.__name__])
+            e = e.ufl_operands[0]
+        key = _terminal_key(e, coefficient_numbering)
+        if key is not None:
+            return ["Terminal", list(key), modifiers]
+    elif not isinstance(e, ufl.classes.Indexed):
+        operands = [e2i.get(o) for o in e.ufl_operands]
+        if None not in operands:
+            return [e._ufl_class_.__name__, operands]
+    raise UncacheableIR("cannot encode {}".format(e._ufl_class_.__name__))
+
+
+def _decode_expression(code, nodes, terminals, domain):
+    """Rebuild expression encoded by _encode_expression."""
+    name = code[0]
+    if name == "Zero":
+        return ufl.classes.Zero()
+    elif name == "ComplexValue":
+        return ufl.classes.ComplexValue(complex(code[1], code[2]))
+    elif name in ("FloatValue", "IntValue"):
+        return getattr(ufl.classes, name)(code[1])
+    elif name == "Terminal":
+        key, modifiers = tuple(code[1]), code[2]
+        e = terminals.get(key)
+        if e is None:
+            if key[0] != "GeometricQuantity":
+                raise RuntimeError("Missing terminal {} in integrand.".format(key))
+            e = getattr(ufl.classes, key[1])(domain)
+        for modifier in reversed(modifiers):
+            if modifier[0] == "Indexed":
+                e = ufl.classes.Indexed(e, ufl.classes.MultiIndex(tuple(ufl.classes.FixedIndex(i)
+                                                                        for i in modifier[1])))
+            else:
+                e = getattr(ufl.classes, modifier[0])(e)
+        return e
+    else:
+        operands = [nodes[i].expression for i in code[1]]
+        return getattr(ufl.classes, name)(*operands)
+
+
+def _json_default(o):
+    """Convert numpy values for json."""
+    if isinstance(o, numpy.integer):
+        return int(o)
+    elif isinstance(o, numpy.floating):
+        return float(o)
+    elif isinstance(o, numpy.bool_):
+        return bool(o)
+    elif isinstance(o, numpy.ndarray):
+        return o.tolist()
+    raise TypeError("cannot encode {}".format(type(o).__name__))
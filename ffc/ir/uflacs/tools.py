@@ -31,7 +31,8 @@ def compute_quadrature_rules(rules, integral_type, cell):
     """Compute points and weights for a set of quadrature rules."""
     quadrature_rules = {}
     quadrature_rule_sizes = {}
-    for rule in rules:
+    schemes = {}
+    for rule in sorted(rules):
         scheme, degree = rule
 
         # Compute quadrature points and weights
@@ -47,16 +48,22 @@ def compute_quadrature_rules(rules, integral_type, cell):
         else:
             num_points = len(weights)
 
-        # Assuming all rules with the same number of points are equal
+        # Rules with the same number of points share one quadrature loop.
+        # Different rules of the same scheme, e.g. the default rules of
+        # two degrees on triangles with 6 points, use the rule of the
+        # highest degree, which is exact for the lower degree at the same
+        # cost. The rules are sorted, so this is the last one.
         if num_points in quadrature_rules:
-            assert quadrature_rules[num_points][0] == points
-            assert quadrature_rules[num_points][0] == weights
-            raise RuntimeError(
-                "This number of points is already present in the weight table:\n  {}".format(
-                    quadrature_rules))
+            existing_points, existing_weights = quadrature_rules[num_points]
+            if schemes[num_points] != scheme and not (numpy.allclose(existing_points, points)
+                                                      and numpy.allclose(existing_weights, weights)):
+                raise RuntimeError(
+                    "This number of points is already present in the weight table:\n  {}".format(
+                        quadrature_rules))
 
         quadrature_rules[num_points] = (points, weights)
         quadrature_rule_sizes[rule] = num_points
+        schemes[num_points] = scheme
     return quadrature_rules, quadrature_rule_sizes
 
 
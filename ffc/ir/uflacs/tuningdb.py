@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"""Database of uflacs parameters found by autotuning.
+
+The database is a JSON file mapping the CPU model of the host and a
+signature of the integral to the parameters of the fastest kernel
+variant, see ffc.codegeneration.autotune. Integrals found in the
+database are compiled with these parameters.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import platform
+import tempfile
+
+from ffc.ir.uflacs.ircache import uflacs_ir_signature
+
+logger = logging.getLogger(__name__)
+
+# uflacs parameters which may be chosen by autotuning
+tunable_parameters = ("enable_preintegration", "enable_premultiplication",
+                      "enable_sum_factorization", "enable_block_transpose_reuse",
+                      "enable_table_zero_compression", "enable_tensor_factorization",
+                      "vectorize", "alignas", "padlen",
+                      "use_symbol_array", "tensor_init_mode", "vectorize_points",
+                      "gemm_block_points", "max_unrolled_block_size", "enable_symmetry")
+
+
+def host_cpu_model():
+    """Return a string identifying the CPU model of this host."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def integral_tuning_signature(integral_type, entitytype, cell, integrands, tensor_shape,
+                              quadrature_rules, coefficient_numbering):
+    """Compute signature identifying an integral independently of uflacs parameters."""
+    return uflacs_ir_signature(integral_type, entitytype, cell, integrands, tensor_shape,
+                               quadrature_rules, coefficient_numbering, {})
+
+
+# Cache of database entries for this host, keyed by file name, with the
+# modification time and size of the file they were read from
+_cache = {}
+
+
+def load_tuning_db(filename):
+    """Return the tuning database entries for this host.
+
+    The entries are read again only if the file has changed since the
+    last call, so that the database is not parsed for every integral.
+    The returned dict must not be modified.
+
+    """
+    filename = os.path.abspath(os.path.expanduser(filename))
+    try:
+        st = os.stat(filename)
+    except FileNotFoundError:
+        return {}
+    except OSError as e:
+        logger.warning("Failed to read tuning database {}: {}".format(filename, e))
+        return {}
+
+    key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _cache.get(filename)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    try:
+        with open(filename) as f:
+            db = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning("Failed to read tuning database {}: {}".format(filename, e))
+        return {}
+    entries = db.get(host_cpu_model(), {})
+    _cache[filename] = (key, entries)
+    return entries
+
+
+def tuning_db_signature(filename):
+    """Return a signature of the tuning database entries for this host."""
+    entries = load_tuning_db(filename)
+    return hashlib.sha1(json.dumps(entries, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def lookup_tuned_parameters(filename, signature):
+    """Return the tuned parameters for the integral with given signature, or None."""
+    entry = load_tuning_db(filename).get(signature)
+    if entry is None:
+        return None
+    return {k: v for k, v in entry["parameters"].items() if k in tunable_parameters}
+
+
+def store_tuned_parameters(filename, results):
+    """Add results to the database entries for this host.
+
+    Results are {signature: (parameters, seconds per call)}.
+    """
+    filename = os.path.expanduser(filename)
+    try:
+        with open(filename) as f:
+            db = json.load(f)
+    except FileNotFoundError:
+        db = {}
+
+    entries = db.setdefault(host_cpu_model(), {})
+    for signature, (parameters, seconds) in results.items():
+        entries[signature] = {"parameters": parameters, "time": seconds}
+
+    # Write to a temporary file first, so that concurrent compilations
+    # never see a partially written file
+    dirname = os.path.dirname(os.path.abspath(filename))
+    os.makedirs(dirname, exist_ok=True)
+    fd, tmpname = tempfile.mkstemp(suffix=".json", dir=dirname)
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(db, f, indent=1, sort_keys=True)
+        os.replace(tmpname, filename)
+    except Exception:
+        os.remove(tmpname)
+        raise
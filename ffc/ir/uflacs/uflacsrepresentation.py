@@ -9,19 +9,41 @@ import logging
 
 from ffc.fiatinterface import create_element
 from ffc.ir.representationutils import initialize_integral_ir
-from ffc.ir.uflacs.build_uflacs_ir import build_uflacs_ir
+from ffc.ir.uflacs.blockcosts import format_block_mode_report
+from ffc.ir.uflacs.build_uflacs_ir import (build_uflacs_ir,
+                                           parse_uflacs_optimization_parameters)
+from ffc.ir.uflacs.ircache import cached_build_uflacs_ir
+from ffc.ir.uflacs.tuningdb import (integral_tuning_signature,
+                                    lookup_tuned_parameters)
 from ffc.ir.uflacs.tools import (accumulate_integrals,
                                  collect_quadrature_rules,
                                  compute_quadrature_rules)
-from ufl import custom_integral_types
+from ufl import Coefficient, custom_integral_types
 from ufl.algorithms import replace
+from ufl.algorithms.analysis import extract_arguments
 from ufl.utils.sorting import sorted_by_count
 
 logger = logging.getLogger(__name__)
 
 
-def compute_integral_ir(itg_data, form_data, form_id, element_numbers, classnames, parameters):
-    """Compute intermediate represention of integral."""
+def compute_integral_ir(itg_data, form_data, form_id, element_numbers, classnames, parameters,
+                        residual=None, action=False, diagonal=False):
+    """Compute intermediate represention of integral.
+
+    If residual is given as the (itg_data, form_data) of an integral of
+    a linear form with the same test function as the bilinear form of
+    itg_data, compute the representation of the fused kernel computing
+    both element tensors, with the coefficients of the linear form.
+
+    If action is true, compute the representation of the action kernel
+    of the bilinear form of itg_data, computing the element vector of
+    the linear form with the trial function replaced by a coefficient,
+    whose dofs are passed separately from the other coefficients.
+
+    If diagonal is true, compute the representation of the diagonal
+    kernel of the bilinear form of itg_data, computing only the
+    entries on the diagonal of the element tensor.
+    """
 
     logger.info("Computing uflacs representation")
 
@@ -50,6 +72,19 @@ def compute_integral_ir(itg_data, form_data, form_id, element_numbers, classname
     else:
         ir["tensor_shape"] = argument_dimensions
 
+    # Shape of the element vector of the linear form of fused kernels
+    ir["residual_shape"] = None
+    if residual is not None:
+        residual_itg_data, residual_form_data = residual
+        ir["residual_shape"] = ir["tensor_shape"][:1]
+
+    # Shape of the element vector of action kernels
+    if action:
+        ir["tensor_shape"] = ir["tensor_shape"][:1]
+
+    # Shape of the diagonal of the element tensor of diagonal kernels
+    ir["diagonal_shape"] = ir["tensor_shape"][:1] if diagonal else None
+
     integral_type = itg_data.integral_type
     cell = itg_data.domain.ufl_cell()
 
@@ -64,6 +99,10 @@ def compute_integral_ir(itg_data, form_data, form_id, element_numbers, classname
         default_scheme = itg_data.metadata["quadrature_rule"]
         default_degree = itg_data.metadata["quadrature_degree"]
         rules = collect_quadrature_rules(itg_data.integrals, default_scheme, default_degree)
+        if residual is not None:
+            rules |= collect_quadrature_rules(residual_itg_data.integrals,
+                                              residual_itg_data.metadata["quadrature_rule"],
+                                              residual_itg_data.metadata["quadrature_degree"])
         quadrature_integral_type = integral_type
 
     # Compute actual points and weights
@@ -79,6 +118,12 @@ def compute_integral_ir(itg_data, form_data, form_id, element_numbers, classname
 
     # Group and accumulate integrals on the format { num_points: integral data }
     sorted_integrals = accumulate_integrals(itg_data, quadrature_rule_sizes)
+    if residual is not None:
+        residual_integrals = accumulate_integrals(residual_itg_data, quadrature_rule_sizes)
+
+        # The coefficients are those of the linear form, which include
+        # all coefficients of the bilinear form
+        form_data = residual_form_data
 
     # Build coefficient numbering for UFC interface here, to avoid
     # renumbering in UFL and application of replace mapping
@@ -100,6 +145,30 @@ def compute_integral_ir(itg_data, form_data, form_id, element_numbers, classname
         for num_points in sorted(sorted_integrals)
     }
 
+    # Add the integrands of the linear form of fused kernels, such that
+    # both forms share the computations in each quadrature loop
+    if residual is not None:
+        for num_points, integral in residual_integrals.items():
+            integrand = replace(integral.integrand(), form_data.function_replace_map)
+            if num_points in integrands:
+                integrand = integrands[num_points] + integrand
+            integrands[num_points] = integrand
+
+    # Replace the trial function of action kernels by a coefficient,
+    # numbered after the coefficients of the form, such that its values
+    # are computed in each quadrature point before the test function
+    # loops
+    ir["action_coefficient"] = None
+    if action:
+        for num_points, integrand in integrands.items():
+            for argument in extract_arguments(integrand):
+                if argument.number() == 1:
+                    if ir["action_coefficient"] is None:
+                        ir["action_coefficient"] = Coefficient(argument.ufl_function_space())
+                    integrand = replace(integrand, {argument: ir["action_coefficient"]})
+            integrands[num_points] = integrand
+        coefficient_numbering[ir["action_coefficient"]] = len(coefficient_numbering)
+
     # Add coefficient numbering to IR
     ir["coefficient_numbering"] = coefficient_numbering
 
@@ -110,14 +179,52 @@ def compute_integral_ir(itg_data, form_data, form_id, element_numbers, classname
         offsets[k[1]] = _offset
         _offset += ir["element_dimensions"][el]
 
+    # The dofs of the coefficient of action kernels are not in w
+    if action:
+        offsets[ir["action_coefficient"]] = 0
+
     # Copy offsets also into IR
     ir["coefficient_offsets"] = offsets
 
-    # Build the more uflacs-specific intermediate representation
-    uflacs_ir = build_uflacs_ir(itg_data.domain.ufl_cell(), itg_data.integral_type,
-                                ir["entitytype"], integrands, ir["tensor_shape"],
-                                quadrature_rules, parameters)
+    # Use the parameters found by autotuning this integral, if any
+    ir["tuning_signature"] = None
+    tuning_db = parameters.get("tuning_db")
+    if tuning_db is not None:
+        ir["tuning_signature"] = integral_tuning_signature(
+            integral_type, ir["entitytype"], cell, integrands, ir["tensor_shape"], quadrature_rules,
+            coefficient_numbering)
+        tuned_parameters = lookup_tuned_parameters(tuning_db, ir["tuning_signature"])
+        if tuned_parameters:
+            logger.info("Using tuned parameters {}".format(tuned_parameters))
+            parameters = dict(parameters, **tuned_parameters)
+
+    # Diagonal kernels compute the entries on the diagonal of blocks
+    # accumulated point by point or preintegrated, so disable the
+    # optimizations computing whole blocks in other ways
+    if diagonal:
+        parameters = dict(parameters, enable_premultiplication=False, enable_tensor_factorization=False,
+                          enable_symmetry=False, enable_block_transpose_reuse=False, gemm_block_points=0,
+                          vectorize_points=0, batch_width=0)
+
+    # Build the more uflacs-specific intermediate representation, or
+    # load it from the persistent cache if enabled, except for fused,
+    # action and diagonal kernels
+    cache_dir = parameters.get("ir_cache_dir")
+    if cache_dir is None or residual is not None or action or diagonal:
+        uflacs_ir = build_uflacs_ir(cell, integral_type, ir["entitytype"], integrands,
+                                    ir["tensor_shape"], quadrature_rules, parameters,
+                                    ir["residual_shape"])
+    else:
+        p = parse_uflacs_optimization_parameters(parameters, integral_type)
+        uflacs_ir = cached_build_uflacs_ir(cache_dir, build_uflacs_ir, cell, integral_type,
+                                           ir["entitytype"], integrands, ir["tensor_shape"],
+                                           quadrature_rules, parameters, p, coefficient_numbering)
 
     ir.update(uflacs_ir)
 
+    # Report the block modes chosen by the cost model
+    if ir["block_mode_costs"]:
+        logger.info("Estimated block costs and block modes:\n{}".format(
+            format_block_mode_report(ir["block_mode_costs"])))
+
     return ir
@@ -37,7 +37,7 @@ parser.add_argument(
     "--quadrature-rule",
     type=str,
     default="auto",
-    help="quadrature rule to apply (default: %(default)s)")
+    help="quadrature rule to apply, e.g. default, vertex, symmetric or GLL (default: %(default)s)")
 parser.add_argument(
     "--quadrature-degree",
     type=int,
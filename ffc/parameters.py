@@ -15,8 +15,30 @@ logger = logging.getLogger(__name__)
 # signature, cache and log are not.
 _FFC_GENERATE_PARAMETERS = {
     "representation": "auto",  # form representation / code generation strategy
-    "quadrature_rule": None,  # quadrature rule used for integration of element tensors (None is auto)
+    # quadrature rule used for integration of element tensors: "default",
+    # "vertex", "symmetric" or "GLL" (None is auto)
+    "quadrature_rule": None,
     "quadrature_degree": None,  # quadrature degree used for computing integrals (None is auto)
+    # integrate terms of an integrand with separately estimated
+    # quadrature degrees, in separate quadrature loops
+    "split_quadrature_degrees": False,
+    # max number of quadrature points per integration entity, quadrature
+    # degrees are reduced to stay within this budget (None is unlimited)
+    "max_quadrature_points": None,
+    # generate tabulate_tensor_fused for the cell integrals of each
+    # bilinear form, computing the element vector of the first linear
+    # form with the same test function and all coefficients of the
+    # bilinear form, such as the residual of a Newton solve, in the
+    # same kernel
+    "fuse_forms": False,
+    # generate tabulate_action for the cell integrals of bilinear
+    # forms, computing the product of the element tensor with a vector
+    # of trial function dofs without computing the element tensor
+    "generate_action": False,
+    # generate tabulate_diagonal for the cell integrals of bilinear
+    # forms with both arguments in the same space, computing only the
+    # diagonal of the element tensor
+    "generate_diagonal": False,
     "precision": None,  # precision used when writing numbers (None for max precision)
     "epsilon": 1e-14,  # machine precision, used for dropping zero terms in tables
     # Scalar type to be used in generated code (real or complex
@@ -31,12 +53,24 @@ _FFC_BUILD_PARAMETERS = {
 _FFC_CACHE_PARAMETERS = {
     "cache_dir": "~/.cache/fenics",  # cache dir used by default
     "output_dir": ".",  # output directory for generated code
+    # directory for the persistent cache of uflacs IR, reused when only
+    # code generation parameters change (None disables the cache)
+    "ir_cache_dir": None,
+    # JSON file of uflacs parameters found by autotuning, consulted for
+    # each integral (None disables)
+    "tuning_db": None,
+    # time kernel variants of integrals not in the tuning database when
+    # JIT compiling forms, and add the fastest to the database
+    "autotune": False,
 }
 _FFC_LOG_PARAMETERS = {
     # "log_level": INFO + 5,  # log level, displaying only messages with level >= log_level
     "log_prefix": "",  # log prefix
     "visualise": False,
 }
+# Boolean parameters, which may be given as strings on the command line
+_FFC_BOOL_PARAMETERS = ("split_quadrature_degrees", "fuse_forms", "generate_action",
+                        "generate_diagonal", "autotune")
 FFC_PARAMETERS = {}
 FFC_PARAMETERS.update(_FFC_BUILD_PARAMETERS)
 FFC_PARAMETERS.update(_FFC_CACHE_PARAMETERS)
@@ -90,6 +124,25 @@ def _validate_parameters(parameters):
                              parameters.get("quadrature_degree"))
             raise
 
+    # Cast from str (command line) to bool
+    for name in _FFC_BOOL_PARAMETERS:
+        if parameters[name] in ("False", "false", "0"):
+            parameters[name] = False
+        else:
+            parameters[name] = bool(parameters[name])
+
+    # Convert all legal default values to None and cast nondefaults from
+    # str to int
+    if parameters["max_quadrature_points"] in ("auto", -1, None, "None"):
+        parameters["max_quadrature_points"] = None
+    else:
+        try:
+            parameters["max_quadrature_points"] = int(parameters["max_quadrature_points"])
+        except Exception:
+            logger.exception("Failed to convert max quadrature points '{}' to int".format(
+                parameters.get("max_quadrature_points")))
+            raise
+
     # Convert all legal default values to None and cast nondefaults from
     # str to int
     if parameters["precision"] in ["auto", None, "None"]:
@@ -115,5 +168,10 @@ def compilation_relevant_parameters(parameters):
 def compute_jit_signature(parameters):
     """Return parameters signature (some parameters must be ignored)."""
     from ufl.utils.sorting import canonicalize_metadata
+    tuning_db = parameters.get("tuning_db")
     parameters = compilation_relevant_parameters(parameters)
+    if tuning_db is not None:
+        # Tuned parameters change the generated code
+        from ffc.ir.uflacs.tuningdb import tuning_db_signature
+        parameters["tuning_db"] = tuning_db_signature(tuning_db)
     return str(canonicalize_metadata(parameters))
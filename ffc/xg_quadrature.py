@@ -0,0 +1,3969 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"""Tabulated fully symmetric quadrature rules on the UFC reference simplices.
+
+The rules are those computed by H. Xiao and Z. Gimbutas, "A numerical
+algorithm for the construction of efficient quadrature rules in two and
+higher dimensions", Comput. Math. Appl. 59(2), 663-676, 2010,
+http://dx.doi.org/10.1016/j.camwa.2009.10.027, as distributed with FIAT.
+They have been mapped from the equilateral reference simplex to the UFC
+reference triangle and tetrahedron. All weights are positive and all
+points are in the interior of the cell.
+
+The points and weights carry the 15 significant digits of the source
+data, not full double precision. The rules integrate polynomials up to
+their degree with a relative error below 5e-14.
+
+Tables map the polynomial degree integrated exactly to a tuple
+(points, weights).
+
+GENERATED, DO NOT EDIT.
+"""
+
+triangle_table = {
+    1: (
+        (
+            (0.333333333333333, 0.333333333333333),
+        ),
+        (
+            0.500000000000001,
+        ),
+    ),
+    2: (
+        (
+            (0.166666666666667, 0.166666666666667),
+            (0.666666666666667, 0.166666666666667),
+            (0.166666666666667, 0.666666666666667),
+        ),
+        (
+            0.166666666666667, 0.166666666666667, 0.166666666666667,
+        ),
+    ),
+    3: (
+        (
+            (0.445948490915965, 0.10810301816807),
+            (0.445948490915965, 0.445948490915965),
+            (0.10810301816807, 0.445948490915965),
+            (0.0915762135097713, 0.0915762135097704),
+            (0.816847572980459, 0.091576213509771),
+            (0.0915762135097706, 0.816847572980459),
+        ),
+        (
+            0.111690794839006, 0.111690794839006, 0.111690794839006, 0.0549758718276608,
+            0.0549758718276608, 0.0549758718276608,
+        ),
+    ),
+    4: (
+        (
+            (0.445948490915965, 0.10810301816807),
+            (0.445948490915965, 0.445948490915965),
+            (0.10810301816807, 0.445948490915965),
+            (0.0915762135097713, 0.0915762135097704),
+            (0.816847572980459, 0.091576213509771),
+            (0.0915762135097706, 0.816847572980459),
+        ),
+        (
+            0.111690794839006, 0.111690794839006, 0.111690794839006, 0.0549758718276608,
+            0.0549758718276608, 0.0549758718276608,
+        ),
+    ),
+    5: (
+        (
+            (0.101286507323457, 0.101286507323456),
+            (0.797426985353087, 0.101286507323456),
+            (0.101286507323456, 0.797426985353088),
+            (0.470142064105115, 0.05971587178977),
+            (0.470142064105115, 0.470142064105115),
+            (0.0597158717897699, 0.470142064105115),
+            (0.333333333333333, 0.333333333333333),
+        ),
+        (
+            0.0629695902724137, 0.0629695902724137, 0.0629695902724137, 0.0661970763942532,
+            0.0661970763942532, 0.0661970763942532, 0.1125,
+        ),
+    ),
+    6: (
+        (
+            (0.219429982549783, 0.219429982549783),
+            (0.561140034900434, 0.219429982549783),
+            (0.219429982549783, 0.561140034900434),
+            (0.480137964112215, 0.0397240717755698),
+            (0.480137964112215, 0.480137964112215),
+            (0.03972407177557, 0.480137964112215),
+            (0.141619015923968, 0.0193717243612407),
+            (0.839009259714791, 0.141619015923968),
+            (0.0193717243612406, 0.839009259714792),
+            (0.839009259714791, 0.0193717243612407),
+            (0.141619015923968, 0.839009259714792),
+            (0.0193717243612409, 0.141619015923968),
+        ),
+        (
+            0.0856665620764907, 0.0856665620764907, 0.0856665620764907, 0.0403655447965156,
+            0.0403655447965156, 0.0403655447965156, 0.0203172798968303, 0.0203172798968303,
+            0.0203172798968303, 0.0203172798968303, 0.0203172798968303, 0.0203172798968303,
+        ),
+    ),
+    7: (
+        (
+            (0.473195653689251, 0.0536086926214977),
+            (0.473195653689251, 0.473195653689251),
+            (0.0536086926214978, 0.473195653689251),
+            (0.0577976400545069, 0.0577976400545062),
+            (0.884404719890987, 0.0577976400545068),
+            (0.0577976400545062, 0.884404719890988),
+            (0.259339011865786, 0.0469712061300855),
+            (0.693689782004129, 0.259339011865786),
+            (0.0469712061300855, 0.693689782004129),
+            (0.693689782004129, 0.0469712061300855),
+            (0.259339011865786, 0.693689782004129),
+            (0.0469712061300857, 0.259339011865786),
+            (0.241663606397247, 0.241663606397247),
+            (0.516672787205505, 0.241663606397247),
+            (0.241663606397247, 0.516672787205506),
+        ),
+        (
+            0.0265904166483802, 0.0265904166483802, 0.0265904166483802, 0.0204590851970284,
+            0.0204590851970284, 0.0204590851970284, 0.0278772702703455, 0.0278772702703455,
+            0.0278772702703455, 0.0278772702703455, 0.0278772702703455, 0.0278772702703455,
+            0.0638626242805668, 0.0638626242805668, 0.0638626242805668,
+        ),
+    ),
+    8: (
+        (
+            (0.17056930775176, 0.17056930775176),
+            (0.658861384496479, 0.17056930775176),
+            (0.17056930775176, 0.65886138449648),
+            (0.459292588292723, 0.081414823414554),
+            (0.459292588292723, 0.459292588292723),
+            (0.0814148234145537, 0.459292588292724),
+            (0.333333333333333, 0.333333333333333),
+            (0.0505472283170311, 0.0505472283170309),
+            (0.898905543365938, 0.0505472283170309),
+            (0.0505472283170308, 0.898905543365938),
+            (0.263112829634638, 0.00839477740995742),
+            (0.728492392955404, 0.263112829634638),
+            (0.00839477740995753, 0.728492392955405),
+            (0.728492392955404, 0.00839477740995742),
+            (0.263112829634638, 0.728492392955404),
+            (0.00839477740995731, 0.263112829634638),
+        ),
+        (
+            0.0516086852673592, 0.0516086852673592, 0.0516086852673592, 0.0475458171336424,
+            0.0475458171336424, 0.0475458171336424, 0.0721578038388937, 0.016229248811599,
+            0.016229248811599, 0.016229248811599, 0.0136151570872175, 0.0136151570872175,
+            0.0136151570872175, 0.0136151570872175, 0.0136151570872175, 0.0136151570872175,
+        ),
+    ),
+    9: (
+        (
+            (0.489682519198738, 0.0206349616025247),
+            (0.489682519198738, 0.489682519198738),
+            (0.0206349616025244, 0.489682519198738),
+            (0.333333333333333, 0.333333333333333),
+            (0.188203535619033, 0.188203535619033),
+            (0.623592928761935, 0.188203535619033),
+            (0.188203535619033, 0.623592928761935),
+            (0.221962989160766, 0.0368384120547361),
+            (0.741198598784498, 0.221962989160765),
+            (0.0368384120547363, 0.741198598784498),
+            (0.741198598784498, 0.0368384120547361),
+            (0.221962989160766, 0.741198598784498),
+            (0.036838412054736, 0.221962989160766),
+            (0.437089591492937, 0.125820817014127),
+            (0.437089591492937, 0.437089591492937),
+            (0.125820817014127, 0.437089591492937),
+            (0.0447295133944526, 0.0447295133944527),
+            (0.910540973211095, 0.0447295133944527),
+            (0.0447295133944524, 0.910540973211095),
+        ),
+        (
+            0.0156673501135695, 0.0156673501135695, 0.0156673501135695, 0.0485678981413995,
+            0.0398238694636052, 0.0398238694636052, 0.0398238694636052, 0.0216417696886447,
+            0.0216417696886447, 0.0216417696886447, 0.0216417696886447, 0.0216417696886447,
+            0.0216417696886447, 0.0389137705023871, 0.0389137705023871, 0.0389137705023871,
+            0.012788837829349, 0.012788837829349, 0.012788837829349,
+        ),
+    ),
+    10: (
+        (
+            (0.49517345980117, 0.00965308039765912),
+            (0.49517345980117, 0.495173459801171),
+            (0.00965308039765911, 0.495173459801171),
+            (0.0191394152428415, 0.019139415242841),
+            (0.961721169514317, 0.0191394152428415),
+            (0.0191394152428421, 0.961721169514316),
+            (0.133734755100869, 0.0347236204823276),
+            (0.831541624416803, 0.133734755100869),
+            (0.0347236204823275, 0.831541624416804),
+            (0.831541624416803, 0.0347236204823276),
+            (0.133734755100869, 0.831541624416804),
+            (0.0347236204823273, 0.133734755100869),
+            (0.333333333333333, 0.333333333333333),
+            (0.326693136281337, 0.0375827273411915),
+            (0.635724136377471, 0.326693136281337),
+            (0.0375827273411916, 0.635724136377472),
+            (0.635724136377471, 0.0375827273411915),
+            (0.326693136281337, 0.635724136377472),
+            (0.0375827273411914, 0.326693136281337),
+            (0.184485012685247, 0.184485012685247),
+            (0.631029974629507, 0.184485012685247),
+            (0.184485012685246, 0.631029974629507),
+            (0.428234820943719, 0.143530358112562),
+            (0.428234820943719, 0.428234820943719),
+            (0.143530358112562, 0.428234820943719),
+        ),
+        (
+            0.00489629524920914, 0.00489629524920914, 0.00489629524920914, 0.00319267961505933,
+            0.00319267961505933, 0.00319267961505933, 0.0144811407316282, 0.0144811407316282,
+            0.0144811407316282, 0.0144811407316282, 0.0144811407316282, 0.0144811407316282,
+            0.041807437186987, 0.0193695245430094, 0.0193695245430094, 0.0193695245430094,
+            0.0193695245430094, 0.0193695245430094, 0.0193695245430094, 0.0393168848731887,
+            0.0393168848731887, 0.0393168848731887, 0.0376236639842721, 0.0376236639842721,
+            0.0376236639842721,
+        ),
+    ),
+    11: (
+        (
+            (0.0308468956355881, 0.0308468956355878),
+            (0.938306208728824, 0.0308468956355884),
+            (0.0308468956355866, 0.938306208728827),
+            (0.498780165178461, 0.0024396696430787),
+            (0.498780165178461, 0.498780165178461),
+            (0.00243966964307832, 0.498780165178461),
+            (0.159303619837694, 0.0143666625695558),
+            (0.826329717592751, 0.159303619837694),
+            (0.0143666625695554, 0.826329717592751),
+            (0.826329717592751, 0.0143666625695558),
+            (0.159303619837693, 0.826329717592751),
+            (0.0143666625695557, 0.159303619837694),
+            (0.333333333333333, 0.333333333333333),
+            (0.113207827286694, 0.113207827286694),
+            (0.773584345426612, 0.113207827286694),
+            (0.113207827286694, 0.773584345426612),
+            (0.436655016393176, 0.126689967213648),
+            (0.436655016393176, 0.436655016393176),
+            (0.126689967213648, 0.436655016393177),
+            (0.21448345861927, 0.214483458619269),
+            (0.571033082761461, 0.21448345861927),
+            (0.214483458619269, 0.571033082761461),
+            (0.310631216313463, 0.0476640669721507),
+            (0.641704716714386, 0.310631216313463),
+            (0.0476640669721507, 0.641704716714387),
+            (0.641704716714386, 0.0476640669721507),
+            (0.310631216313463, 0.641704716714387),
+            (0.0476640669721508, 0.310631216313463),
+        ),
+        (
+            0.00612464847535398, 0.00612464847535398, 0.00612464847535398, 0.00623274593694068,
+            0.00623274593694068, 0.00623274593694068, 0.00727881166890461, 0.00727881166890461,
+            0.00727881166890461, 0.00727881166890461, 0.00727881166890461, 0.00727881166890461,
+            0.0407225673546757, 0.0200646211906542, 0.0200646211906542, 0.0200646211906542,
+            0.0315474360799495, 0.0315474360799495, 0.0315474360799495, 0.0339225538718477,
+            0.0339225538718477, 0.0339225538718477, 0.0203214243279433, 0.0203214243279433,
+            0.0203214243279433, 0.0203214243279433, 0.0203214243279433, 0.0203214243279433,
+        ),
+    ),
+    12: (
+        (
+            (0.271462507014926, 0.271462507014926),
+            (0.457074985970148, 0.271462507014926),
+            (0.271462507014926, 0.457074985970148),
+            (0.109257827659354, 0.109257827659354),
+            (0.781484344681291, 0.109257827659354),
+            (0.109257827659354, 0.781484344681292),
+            (0.440111648658593, 0.119776702682814),
+            (0.440111648658593, 0.440111648658593),
+            (0.119776702682814, 0.440111648658593),
+            (0.255454228638517, 0.116296019677927),
+            (0.628249751683556, 0.255454228638517),
+            (0.116296019677926, 0.628249751683557),
+            (0.628249751683556, 0.116296019677927),
+            (0.255454228638517, 0.628249751683557),
+            (0.116296019677926, 0.255454228638517),
+            (0.127279717233589, 0.0213824902561705),
+            (0.85133779251024, 0.127279717233589),
+            (0.0213824902561708, 0.85133779251024),
+            (0.85133779251024, 0.0213824902561705),
+            (0.127279717233589, 0.85133779251024),
+            (0.0213824902561703, 0.127279717233589),
+            (0.291655679738341, 0.0230341563552669),
+            (0.685310163906392, 0.291655679738341),
+            (0.023034156355267, 0.685310163906392),
+            (0.685310163906392, 0.0230341563552669),
+            (0.291655679738341, 0.685310163906392),
+            (0.0230341563552668, 0.291655679738341),
+            (0.488203750945542, 0.0235924981089169),
+            (0.488203750945542, 0.488203750945542),
+            (0.0235924981089165, 0.488203750945542),
+            (0.0246463634363358, 0.0246463634363354),
+            (0.950707273127329, 0.0246463634363354),
+            (0.0246463634363354, 0.950707273127329),
+        ),
+        (
+            0.0312706065979515, 0.0312706065979515, 0.0312706065979515, 0.0142430260344388,
+            0.0142430260344388, 0.0142430260344388, 0.0249591674640305, 0.0249591674640305,
+            0.0249591674640305, 0.0216136818297071, 0.0216136818297071, 0.0216136818297071,
+            0.0216136818297071, 0.0216136818297071, 0.0216136818297071, 0.00754183878825572,
+            0.00754183878825572, 0.00754183878825572, 0.00754183878825572, 0.00754183878825572,
+            0.00754183878825572, 0.0108917925193038, 0.0108917925193038, 0.0108917925193038,
+            0.0108917925193038, 0.0108917925193038, 0.0108917925193038, 0.012133419040726,
+            0.012133419040726, 0.012133419040726, 0.00396582125498683, 0.00396582125498683,
+            0.00396582125498683,
+        ),
+    ),
+    13: (
+        (
+            (0.496135894741046, 0.00772821051790795),
+            (0.496135894741046, 0.496135894741046),
+            (0.00772821051790781, 0.496135894741046),
+            (0.469608689653492, 0.0607826206930164),
+            (0.469608689653492, 0.469608689653492),
+            (0.0607826206930158, 0.469608689653492),
+            (0.231110284949083, 0.231110284949082),
+            (0.537779430101835, 0.231110284949083),
+            (0.231110284949082, 0.537779430101836),
+            (0.292078688576637, 0.0189880043837587),
+            (0.688933307039605, 0.292078688576636),
+            (0.0189880043837591, 0.688933307039605),
+            (0.688933307039605, 0.0189880043837587),
+            (0.292078688576637, 0.688933307039605),
+            (0.0189880043837586, 0.292078688576637),
+            (0.333333333333333, 0.333333333333333),
+            (0.266745253310351, 0.0977360310660165),
+            (0.635518715623632, 0.266745253310351),
+            (0.0977360310660166, 0.635518715623633),
+            (0.635518715623632, 0.0977360310660165),
+            (0.266745253310351, 0.635518715623632),
+            (0.0977360310660163, 0.266745253310351),
+            (0.414477570279054, 0.171044859441891),
+            (0.414477570279055, 0.414477570279055),
+            (0.171044859441891, 0.414477570279055),
+            (0.113559912572134, 0.113559912572133),
+            (0.772880174855734, 0.113559912572133),
+            (0.113559912572133, 0.772880174855734),
+            (0.126799775783837, 0.0219663442065291),
+            (0.851233880009633, 0.126799775783837),
+            (0.0219663442065292, 0.851233880009634),
+            (0.851233880009633, 0.0219663442065291),
+            (0.126799775783837, 0.851233880009634),
+            (0.0219663442065291, 0.126799775783838),
+            (0.0248959314912163, 0.0248959314912164),
+            (0.950208137017567, 0.0248959314912164),
+            (0.0248959314912163, 0.950208137017567),
+        ),
+        (
+            0.0049707381805363, 0.0049707381805363, 0.0049707381805363, 0.0163906208018615,
+            0.0163906208018615, 0.0163906208018615, 0.0230312047963891, 0.0230312047963891,
+            0.0230312047963891, 0.00906274932310043, 0.00906274932310043, 0.00906274932310043,
+            0.00906274932310043, 0.00906274932310043, 0.00906274932310043, 0.0258113233321454,
+            0.0186059802286308, 0.0186059802286308, 0.0186059802286308, 0.0186059802286308,
+            0.0186059802286308, 0.0186059802286308, 0.0234735477710776, 0.0234735477710776,
+            0.0234735477710776, 0.0154515489878799, 0.0154515489878799, 0.0154515489878799,
+            0.00769653634189108, 0.00769653634189108, 0.00769653634189108, 0.00769653634189108,
+            0.00769653634189108, 0.00769653634189108, 0.0040146998976292, 0.0040146998976292,
+            0.0040146998976292,
+        ),
+    ),
+    14: (
+        (
+            (0.417644719340454, 0.164710561319092),
+            (0.417644719340454, 0.417644719340454),
+            (0.164710561319092, 0.417644719340454),
+            (0.298372882136258, 0.0146469500556547),
+            (0.686980167808088, 0.298372882136258),
+            (0.0146469500556544, 0.686980167808088),
+            (0.686980167808088, 0.0146469500556547),
+            (0.298372882136257, 0.686980167808088),
+            (0.0146469500556545, 0.298372882136258),
+            (0.0617998830908728, 0.0617998830908724),
+            (0.876400233818254, 0.061799883090873),
+            (0.0617998830908724, 0.876400233818255),
+            (0.336861459796345, 0.0929162493569721),
+            (0.570222290846683, 0.336861459796345),
+            (0.0929162493569719, 0.570222290846683),
+            (0.570222290846683, 0.0929162493569721),
+            (0.336861459796345, 0.570222290846683),
+            (0.0929162493569719, 0.336861459796345),
+            (0.273477528308839, 0.273477528308839),
+            (0.453044943382323, 0.273477528308839),
+            (0.273477528308838, 0.453044943382323),
+            (0.177205532412543, 0.177205532412543),
+            (0.645588935174913, 0.177205532412543),
+            (0.177205532412543, 0.645588935174914),
+            (0.0193909612487012, 0.0193909612487006),
+            (0.961218077502598, 0.0193909612487012),
+            (0.0193909612487018, 0.961218077502596),
+            (0.488963910362179, 0.0220721792756426),
+            (0.488963910362179, 0.488963910362179),
+            (0.0220721792756426, 0.488963910362179),
+            (0.172266687821355, 0.057124757403648),
+            (0.770608554774997, 0.172266687821356),
+            (0.057124757403648, 0.770608554774997),
+            (0.770608554774996, 0.057124757403648),
+            (0.172266687821356, 0.770608554774997),
+            (0.0571247574036477, 0.172266687821356),
+            (0.118974497696957, 0.00126833093287214),
+            (0.879757171370171, 0.118974497696957),
+            (0.00126833093287221, 0.879757171370172),
+            (0.879757171370171, 0.00126833093287214),
+            (0.118974497696957, 0.879757171370172),
+            (0.00126833093287203, 0.118974497696957),
+        ),
+        (
+            0.0163941767720627, 0.0163941767720627, 0.0163941767720627, 0.00721815405676691,
+            0.00721815405676691, 0.00721815405676691, 0.00721815405676691, 0.00721815405676691,
+            0.00721815405676691, 0.00721684983488833, 0.00721684983488833, 0.00721684983488833,
+            0.0192857553935304, 0.0192857553935304, 0.0192857553935304, 0.0192857553935304,
+            0.0192857553935304, 0.0192857553935304, 0.0258870522536458, 0.0258870522536458,
+            0.0258870522536458, 0.0210812943684965, 0.0210812943684965, 0.0210812943684965,
+            0.00246170180120004, 0.00246170180120004, 0.00246170180120004, 0.0109417906847145,
+            0.0109417906847145, 0.0109417906847145, 0.0123328766062819, 0.0123328766062819,
+            0.0123328766062819, 0.0123328766062819, 0.0123328766062819, 0.0123328766062819,
+            0.00250511441925034, 0.00250511441925034, 0.00250511441925034, 0.00250511441925034,
+            0.00250511441925034, 0.00250511441925034,
+        ),
+    ),
+    15: (
+        (
+            (0.129978229933078, 0.129978229933078),
+            (0.740043540133844, 0.129978229933078),
+            (0.129978229933078, 0.740043540133845),
+            (0.333333333333333, 0.333333333333333),
+            (0.46007694929706, 0.0798461014058805),
+            (0.46007694929706, 0.46007694929706),
+            (0.0798461014058806, 0.46007694929706),
+            (0.182321783407191, 0.0845942214821918),
+            (0.733083995110617, 0.182321783407191),
+            (0.084594221482192, 0.733083995110617),
+            (0.733083995110617, 0.0845942214821918),
+            (0.182321783407191, 0.733083995110618),
+            (0.0845942214821918, 0.182321783407191),
+            (0.150200384065239, 0.0160270897863455),
+            (0.833772526148416, 0.150200384065238),
+            (0.0160270897863455, 0.833772526148416),
+            (0.833772526148416, 0.0160270897863455),
+            (0.150200384065239, 0.833772526148416),
+            (0.0160270897863455, 0.150200384065239),
+            (0.323111315163713, 0.0976504424302425),
+            (0.579238242406045, 0.323111315163713),
+            (0.0976504424302423, 0.579238242406045),
+            (0.579238242406045, 0.0976504424302425),
+            (0.323111315163712, 0.579238242406045),
+            (0.0976504424302421, 0.323111315163713),
+            (0.491685816630297, 0.0166283667394055),
+            (0.491685816630297, 0.491685816630298),
+            (0.0166283667394052, 0.491685816630298),
+            (0.221532340795142, 0.221532340795142),
+            (0.556935318409716, 0.221532340795142),
+            (0.221532340795142, 0.556935318409716),
+            (0.39693373740906, 0.206132525181879),
+            (0.396933737409061, 0.39693373740906),
+            (0.206132525181878, 0.396933737409061),
+            (0.307947681483673, 0.0184542519046334),
+            (0.673598066611694, 0.307947681483673),
+            (0.0184542519046333, 0.673598066611694),
+            (0.673598066611694, 0.0184542519046334),
+            (0.307947681483673, 0.673598066611694),
+            (0.018454251904633, 0.307947681483673),
+            (0.0563419176961007, 0.0563419176960997),
+            (0.8873161646078, 0.0563419176961003),
+            (0.0563419176961, 0.8873161646078),
+            (0.0380352293011092, 0.00111353527401361),
+            (0.960851235424877, 0.0380352293011093),
+            (0.0011135352740127, 0.960851235424879),
+            (0.960851235424877, 0.00111353527401361),
+            (0.0380352293011081, 0.960851235424879),
+            (0.00111353527401385, 0.0380352293011093),
+        ),
+        (
+            0.00369875203352306, 0.00369875203352306, 0.00369875203352306, 0.0148652098740357,
+            0.0107970439682192, 0.0107970439682192, 0.0107970439682192, 0.0121150043915628,
+            0.0121150043915628, 0.0121150043915628, 0.0121150043915628, 0.0121150043915628,
+            0.0121150043915628, 0.00561425214943904, 0.00561425214943904, 0.00561425214943904,
+            0.00561425214943904, 0.00561425214943904, 0.00561425214943904, 0.0155376102352555,
+            0.0155376102352555, 0.0155376102352555, 0.0155376102352555, 0.0155376102352555,
+            0.0155376102352555, 0.0079161381750109, 0.0079161381750109, 0.0079161381750109,
+            0.023143643052599, 0.023143643052599, 0.023143643052599, 0.0231680206956036,
+            0.0231680206956036, 0.0231680206956036, 0.00821838104641396, 0.00821838104641396,
+            0.00821838104641396, 0.00821838104641396, 0.00821838104641396, 0.00821838104641396,
+            0.00754223712379853, 0.00754223712379853, 0.00754223712379853, 0.00123763300727896,
+            0.00123763300727896, 0.00123763300727896, 0.00123763300727896, 0.00123763300727896,
+            0.00123763300727896,
+        ),
+    ),
+    16: (
+        (
+            (0.413769485827086, 0.00966495440366),
+            (0.576565559769255, 0.413769485827085),
+            (0.00966495440365994, 0.576565559769255),
+            (0.576565559769254, 0.00966495440366),
+            (0.413769485827085, 0.576565559769255),
+            (0.00966495440366022, 0.413769485827086),
+            (0.30417944822948, 0.0303059433551861),
+            (0.665514608415334, 0.30417944822948),
+            (0.0303059433551863, 0.665514608415334),
+            (0.665514608415334, 0.0303059433551861),
+            (0.30417944822948, 0.665514608415334),
+            (0.030305943355186, 0.30417944822948),
+            (0.0666744722402385, 0.0666744722402379),
+            (0.866651055519523, 0.0666744722402385),
+            (0.0666744722402381, 0.866651055519524),
+            (0.0896090890227057, 0.0108129727761037),
+            (0.899577938201191, 0.0896090890227057),
+            (0.0108129727761038, 0.899577938201191),
+            (0.89957793820119, 0.0108129727761037),
+            (0.0896090890227059, 0.899577938201191),
+            (0.0108129727761034, 0.0896090890227062),
+            (0.296615372400383, 0.106653160536148),
+            (0.596731467063468, 0.296615372400383),
+            (0.106653160536149, 0.596731467063469),
+            (0.596731467063469, 0.106653160536148),
+            (0.296615372400383, 0.596731467063469),
+            (0.106653160536148, 0.296615372400383),
+            (0.241321680701378, 0.241321680701378),
+            (0.517356638597243, 0.241321680701378),
+            (0.241321680701378, 0.517356638597244),
+            (0.412798095955224, 0.174403808089552),
+            (0.412798095955223, 0.412798095955224),
+            (0.174403808089552, 0.412798095955224),
+            (0.16976335515029, 0.0513543153440131),
+            (0.778882329505697, 0.16976335515029),
+            (0.0513543153440131, 0.778882329505698),
+            (0.778882329505697, 0.0513543153440131),
+            (0.16976335515029, 0.778882329505698),
+            (0.051354315344013, 0.16976335515029),
+            (0.150063736587035, 0.150063736587035),
+            (0.69987252682593, 0.150063736587035),
+            (0.150063736587035, 0.69987252682593),
+            (0.214048779925847, 0.00369694270735536),
+            (0.782254277366797, 0.214048779925847),
+            (0.00369694270735582, 0.782254277366797),
+            (0.782254277366797, 0.00369694270735536),
+            (0.214048779925847, 0.782254277366797),
+            (0.00369694270735534, 0.214048779925847),
+            (0.469548030996685, 0.0609039380066302),
+            (0.469548030996685, 0.469548030996685),
+            (0.0609039380066299, 0.469548030996685),
+            (0.333333333333333, 0.333333333333333),
+            (0.0170416294057189, 0.0170416294057182),
+            (0.965916741188563, 0.0170416294057187),
+            (0.0170416294057193, 0.965916741188561),
+        ),
+        (
+            0.00409110527661107, 0.00409110527661107, 0.00409110527661107, 0.00409110527661107,
+            0.00409110527661107, 0.00409110527661107, 0.00699180356232678, 0.00699180356232678,
+            0.00699180356232678, 0.00699180356232678, 0.00699180356232678, 0.00699180356232678,
+            0.00621271279778052, 0.00621271279778052, 0.00621271279778052, 0.00287593498524858,
+            0.00287593498524858, 0.00287593498524858, 0.00287593498524858, 0.00287593498524858,
+            0.00287593498524858, 0.0158230308409916, 0.0158230308409916, 0.0158230308409916,
+            0.0158230308409916, 0.0158230308409916, 0.0158230308409916, 0.0205920205348963,
+            0.0205920205348963, 0.0205920205348963, 0.0204926098934077, 0.0204926098934077,
+            0.0204926098934077, 0.00882654052355165, 0.00882654052355165, 0.00882654052355165,
+            0.00882654052355165, 0.00882654052355165, 0.00882654052355165, 0.0143917483513745,
+            0.0143917483513745, 0.0143917483513745, 0.00230734531986457, 0.00230734531986457,
+            0.00230734531986457, 0.00230734531986457, 0.00230734531986457, 0.00230734531986457,
+            0.0135468347338552, 0.0135468347338552, 0.0135468347338552, 0.0231139551570957,
+            0.00189456761913211, 0.00189456761913211, 0.00189456761913211,
+        ),
+    ),
+    17: (
+        (
+            (0.417103444361599, 0.165793111276801),
+            (0.417103444361599, 0.4171034443616),
+            (0.165793111276802, 0.4171034443616),
+            (0.0725054707990022, 0.0115751759031806),
+            (0.915919353297817, 0.0725054707990024),
+            (0.0115751759031814, 0.915919353297816),
+            (0.915919353297817, 0.0115751759031806),
+            (0.072505470799003, 0.915919353297816),
+            (0.0115751759031808, 0.0725054707990024),
+            (0.180358116266371, 0.180358116266371),
+            (0.639283767467259, 0.180358116266371),
+            (0.18035811626637, 0.639283767467259),
+            (0.415475459295229, 0.013229672760087),
+            (0.571294867944684, 0.415475459295229),
+            (0.0132296727600867, 0.571294867944685),
+            (0.571294867944684, 0.013229672760087),
+            (0.415475459295229, 0.571294867944685),
+            (0.0132296727600869, 0.415475459295229),
+            (0.271791870055355, 0.0131358708340026),
+            (0.715072259110643, 0.271791870055355),
+            (0.0131358708340025, 0.715072259110643),
+            (0.715072259110643, 0.0131358708340026),
+            (0.271791870055355, 0.715072259110642),
+            (0.0131358708340026, 0.271791870055355),
+            (0.299218942476971, 0.15750547792687),
+            (0.54327557959616, 0.29921894247697),
+            (0.15750547792687, 0.54327557959616),
+            (0.54327557959616, 0.15750547792687),
+            (0.29921894247697, 0.54327557959616),
+            (0.15750547792687, 0.299218942476971),
+            (0.285706502436587, 0.285706502436587),
+            (0.428586995126827, 0.285706502436587),
+            (0.285706502436587, 0.428586995126827),
+            (0.306281591746186, 0.0673493778673614),
+            (0.626369030386452, 0.306281591746187),
+            (0.0673493778673612, 0.626369030386453),
+            (0.626369030386452, 0.0673493778673614),
+            (0.306281591746186, 0.626369030386453),
+            (0.0673493778673611, 0.306281591746187),
+            (0.168722513495259, 0.0780423405682823),
+            (0.753235145936458, 0.168722513495259),
+            (0.0780423405682824, 0.753235145936458),
+            (0.753235145936458, 0.0780423405682823),
+            (0.168722513495259, 0.753235145936458),
+            (0.078042340568282, 0.16872251349526),
+            (0.0666540634795972, 0.0666540634795968),
+            (0.866691873040806, 0.0666540634795973),
+            (0.0666540634795967, 0.866691873040807),
+            (0.159192287472793, 0.016017642362119),
+            (0.824790070165088, 0.159192287472793),
+            (0.0160176423621194, 0.824790070165088),
+            (0.824790070165088, 0.016017642362119),
+            (0.159192287472792, 0.824790070165088),
+            (0.0160176423621191, 0.159192287472793),
+            (0.014755491660754, 0.0147554916607539),
+            (0.970489016678492, 0.0147554916607539),
+            (0.0147554916607545, 0.970489016678491),
+            (0.46559787161889, 0.0688042567622195),
+            (0.46559787161889, 0.465597871618891),
+            (0.0688042567622192, 0.465597871618891),
+        ),
+        (
+            0.0136554632640511, 0.0136554632640511, 0.0136554632640511, 0.00229217420086794,
+            0.00229217420086794, 0.00229217420086794, 0.00229217420086794, 0.00229217420086794,
+            0.00229217420086794, 0.013156315294009, 0.013156315294009, 0.013156315294009,
+            0.00519921997791978, 0.00519921997791978, 0.00519921997791978, 0.00519921997791978,
+            0.00519921997791978, 0.00519921997791978, 0.00434610725050059, 0.00434610725050059,
+            0.00434610725050059, 0.00434610725050059, 0.00434610725050059, 0.00434610725050059,
+            0.0130858129676685, 0.0130858129676685, 0.0130858129676685, 0.0130858129676685,
+            0.0130858129676685, 0.0130858129676685, 0.0188581185763977, 0.0188581185763977,
+            0.0188581185763977, 0.0112438862733455, 0.0112438862733455, 0.0112438862733455,
+            0.0112438862733455, 0.0112438862733455, 0.0112438862733455, 0.0102789491602273,
+            0.0102789491602273, 0.0102789491602273, 0.0102789491602273, 0.0102789491602273,
+            0.0102789491602273, 0.00622950040115271, 0.00622950040115271, 0.00622950040115271,
+            0.0039891501029648, 0.0039891501029648, 0.0039891501029648, 0.0039891501029648,
+            0.0039891501029648, 0.0039891501029648, 0.00138694378881882, 0.00138694378881882,
+            0.00138694378881882, 0.0125097254752487, 0.0125097254752487, 0.0125097254752487,
+        ),
+    ),
+    18: (
+        (
+            (0.385044034413164, 0.0904270403543404),
+            (0.524528925232496, 0.385044034413164),
+            (0.0904270403543405, 0.524528925232496),
+            (0.524528925232496, 0.0904270403543404),
+            (0.385044034413164, 0.524528925232496),
+            (0.0904270403543405, 0.385044034413164),
+            (0.474918211324046, 0.0501635773519084),
+            (0.474918211324045, 0.474918211324046),
+            (0.0501635773519085, 0.474918211324046),
+            (0.151638506972605, 0.151638506972605),
+            (0.69672298605479, 0.151638506972605),
+            (0.151638506972605, 0.696722986054791),
+            (0.0472761418326519, 0.0124989324834952),
+            (0.940224925683853, 0.0472761418326515),
+            (0.0124989324834954, 0.940224925683853),
+            (0.940224925683853, 0.0124989324834952),
+            (0.0472761418326516, 0.940224925683853),
+            (0.012498932483495, 0.047276141832652),
+            (0.333333333333333, 0.333333333333333),
+            (0.302061957712871, 0.0540117353390244),
+            (0.643926306948105, 0.302061957712871),
+            (0.0540117353390243, 0.643926306948105),
+            (0.643926306948105, 0.0540117353390244),
+            (0.302061957712871, 0.643926306948105),
+            (0.054011735339024, 0.302061957712871),
+            (0.256506159774242, 0.0105050188192416),
+            (0.732988821406517, 0.256506159774242),
+            (0.0105050188192421, 0.732988821406517),
+            (0.732988821406517, 0.0105050188192416),
+            (0.256506159774242, 0.732988821406517),
+            (0.0105050188192417, 0.256506159774242),
+            (0.411067101875919, 0.177865796248161),
+            (0.411067101875919, 0.41106710187592),
+            (0.177865796248161, 0.41106710187592),
+            (0.178479125565888, 0.0661224580284037),
+            (0.755398416405709, 0.178479125565888),
+            (0.0661224580284034, 0.755398416405709),
+            (0.755398416405709, 0.0661224580284037),
+            (0.178479125565888, 0.755398416405709),
+            (0.0661224580284032, 0.178479125565888),
+            (0.265614609905374, 0.265614609905374),
+            (0.468770780189251, 0.265614609905374),
+            (0.265614609905374, 0.468770780189252),
+            (0.00375894434106839, 0.00375894434106826),
+            (0.992482111317863, 0.00375894434106826),
+            (0.00375894434106949, 0.992482111317861),
+            (0.268573306396014, 0.149066910125774),
+            (0.582359783478212, 0.268573306396014),
+            (0.149066910125774, 0.582359783478213),
+            (0.582359783478212, 0.149066910125774),
+            (0.268573306396014, 0.582359783478213),
+            (0.149066910125773, 0.268573306396014),
+            (0.411065668674619, 0.011691824674667),
+            (0.577242506650714, 0.411065668674619),
+            (0.011691824674667, 0.577242506650715),
+            (0.577242506650714, 0.011691824674667),
+            (0.411065668674618, 0.577242506650714),
+            (0.0116918246746672, 0.411065668674619),
+            (0.132778830271389, 0.0143315247789419),
+            (0.852889644949669, 0.132778830271389),
+            (0.0143315247789418, 0.852889644949669),
+            (0.852889644949669, 0.0143315247789419),
+            (0.132778830271389, 0.852889644949669),
+            (0.0143315247789419, 0.132778830271389),
+            (0.0724387055673332, 0.0724387055673327),
+            (0.855122588865334, 0.0724387055673327),
+            (0.0724387055673327, 0.855122588865335),
+        ),
+        (
+            0.00766412909727656, 0.00766412909727656, 0.00766412909727656, 0.00766412909727656,
+            0.00766412909727656, 0.00766412909727656, 0.00655351374586938, 0.00655351374586938,
+            0.00655351374586938, 0.0101591694227292, 0.0101591694227292, 0.0101591694227292,
+            0.00210875838737222, 0.00210875838737222, 0.00210875838737222, 0.00210875838737222,
+            0.00210875838737222, 0.00210875838737222, 0.0153742606195579, 0.00818295420699328,
+            0.00818295420699328, 0.00818295420699328, 0.00818295420699328, 0.00818295420699328,
+            0.00818295420699328, 0.00386491764000312, 0.00386491764000312, 0.00386491764000312,
+            0.00386491764000312, 0.00386491764000312, 0.00386491764000312, 0.0167359970299239,
+            0.0167359970299239, 0.0167359970299239, 0.00845582695874003, 0.00845582695874003,
+            0.00845582695874003, 0.00845582695874003, 0.00845582695874003, 0.00845582695874003,
+            0.015558198301003, 0.015558198301003, 0.015558198301003, 0.00026600280847389,
+            0.00026600280847389, 0.00026600280847389, 0.0137964432442897, 0.0137964432442897,
+            0.0137964432442897, 0.0137964432442897, 0.0137964432442897, 0.0137964432442897,
+            0.00479306223718075, 0.00479306223718075, 0.00479306223718075, 0.00479306223718075,
+            0.00479306223718075, 0.00479306223718075, 0.0038208524863598, 0.0038208524863598,
+            0.0038208524863598, 0.0038208524863598, 0.0038208524863598, 0.0038208524863598,
+            0.00689514330238346, 0.00689514330238346, 0.00689514330238346,
+        ),
+    ),
+    19: (
+        (
+            (0.142422282571127, 0.00500514235235044),
+            (0.852572575076523, 0.142422282571127),
+            (0.00500514235235044, 0.852572575076523),
+            (0.852572575076523, 0.00500514235235044),
+            (0.142422282571127, 0.852572575076523),
+            (0.00500514235234988, 0.142422282571127),
+            (0.0525262798541038, 0.0525262798541035),
+            (0.894947440291793, 0.0525262798541035),
+            (0.0525262798541035, 0.894947440291793),
+            (0.0600838999627026, 0.00977706143867686),
+            (0.930139038598621, 0.060083899962702),
+            (0.00977706143867835, 0.930139038598618),
+            (0.930139038598621, 0.00977706143867686),
+            (0.0600838999627037, 0.930139038598618),
+            (0.0097770614386767, 0.0600838999627027),
+            (0.130700669960535, 0.0391424494346086),
+            (0.830156880604857, 0.130700669960534),
+            (0.0391424494346088, 0.830156880604857),
+            (0.830156880604857, 0.0391424494346086),
+            (0.130700669960534, 0.830156880604857),
+            (0.0391424494346086, 0.130700669960535),
+            (0.311318383223987, 0.129312809767979),
+            (0.559368807008034, 0.311318383223987),
+            (0.129312809767979, 0.559368807008035),
+            (0.559368807008034, 0.129312809767979),
+            (0.311318383223987, 0.559368807008035),
+            (0.129312809767979, 0.311318383223987),
+            (0.111448055716999, 0.111448055716999),
+            (0.777103888566003, 0.111448055716999),
+            (0.111448055716999, 0.777103888566003),
+            (0.0116390273279229, 0.0116390273279221),
+            (0.976721945344155, 0.0116390273279227),
+            (0.0116390273279232, 0.976721945344154),
+            (0.255162133153125, 0.255162133153125),
+            (0.489675733693751, 0.255162133153125),
+            (0.255162133153125, 0.48967573369375),
+            (0.221433941889114, 0.0745611893043548),
+            (0.704004868806531, 0.221433941889113),
+            (0.0745611893043551, 0.704004868806532),
+            (0.704004868806531, 0.0745611893043548),
+            (0.221433941889113, 0.704004868806532),
+            (0.0745611893043553, 0.221433941889113),
+            (0.403969717966386, 0.192060564067228),
+            (0.403969717966386, 0.403969717966386),
+            (0.192060564067228, 0.403969717966386),
+            (0.354025926999712, 0.0408883144649782),
+            (0.60508575853531, 0.354025926999712),
+            (0.0408883144649778, 0.60508575853531),
+            (0.60508575853531, 0.0408883144649782),
+            (0.354025926999712, 0.60508575853531),
+            (0.0408883144649779, 0.354025926999712),
+            (0.178171006079627, 0.178171006079627),
+            (0.643657987840745, 0.178171006079628),
+            (0.178171006079627, 0.643657987840745),
+            (0.459194388956828, 0.081611222086345),
+            (0.459194388956828, 0.459194388956828),
+            (0.0816112220863446, 0.459194388956828),
+            (0.333333333333333, 0.333333333333333),
+            (0.492512449865874, 0.0149751002682514),
+            (0.492512449865874, 0.492512449865874),
+            (0.0149751002682518, 0.492512449865874),
+            (0.241894104006893, 0.0149236389074382),
+            (0.743182257085669, 0.241894104006893),
+            (0.0149236389074383, 0.743182257085669),
+            (0.743182257085669, 0.0149236389074382),
+            (0.241894104006892, 0.743182257085669),
+            (0.0149236389074381, 0.241894104006893),
+            (0.36462041433871, 0.00206910384910245),
+            (0.633310481812187, 0.36462041433871),
+            (0.00206910384910258, 0.633310481812188),
+            (0.633310481812188, 0.00206910384910245),
+            (0.36462041433871, 0.633310481812188),
+            (0.00206910384910233, 0.36462041433871),
+        ),
+        (
+            0.00146284624394003, 0.00146284624394003, 0.00146284624394003, 0.00146284624394003,
+            0.00146284624394003, 0.00146284624394003, 0.00355469681139747, 0.00355469681139747,
+            0.00355469681139747, 0.00166369442029695, 0.00166369442029695, 0.00166369442029695,
+            0.00166369442029695, 0.00166369442029695, 0.00166369442029695, 0.00484775954081211,
+            0.00484775954081211, 0.00484775954081211, 0.00484775954081211, 0.00484775954081211,
+            0.00484775954081211, 0.0131731323537227, 0.0131731323537227, 0.0131731323537227,
+            0.0131731323537227, 0.0131731323537227, 0.0131731323537227, 0.0076174782585024,
+            0.0076174782585024, 0.0076174782585024, 0.000882596209154271, 0.000882596209154271,
+            0.000882596209154271, 0.015876427293765, 0.015876427293765, 0.015876427293765,
+            0.00905403729521525, 0.00905403729521525, 0.00905403729521525, 0.00905403729521525,
+            0.00905403729521525, 0.00905403729521525, 0.0157686793226198, 0.0157686793226198,
+            0.0157686793226198, 0.00805110473046973, 0.00805110473046973, 0.00805110473046973,
+            0.00805110473046973, 0.00805110473046973, 0.00805110473046973, 0.0123259905267924,
+            0.0123259905267924, 0.0123259905267924, 0.0114917854885616, 0.0114917854885616,
+            0.0114917854885616, 0.0172345804254526, 0.00516094109120943, 0.00516094109120943,
+            0.00516094109120943, 0.00422796241954674, 0.00422796241954674, 0.00422796241954674,
+            0.00422796241954674, 0.00422796241954674, 0.00422796241954674, 0.00164106875741987,
+            0.00164106875741987, 0.00164106875741987, 0.00164106875741987, 0.00164106875741987,
+            0.00164106875741987,
+        ),
+    ),
+    20: (
+        (
+            (0.186294997744541, 0.186294997744541),
+            (0.627410004510918, 0.186294997744541),
+            (0.186294997744541, 0.627410004510918),
+            (0.0373108805988848, 0.0373108805988845),
+            (0.92537823880223, 0.037310880598885),
+            (0.0373108805988855, 0.925378238802229),
+            (0.476245611540499, 0.0475087769190018),
+            (0.476245611540499, 0.476245611540499),
+            (0.0475087769190018, 0.476245611540499),
+            (0.064090585608434, 0.00485493760762402),
+            (0.931054476783942, 0.0640905856084342),
+            (0.0048549376076239, 0.931054476783942),
+            (0.931054476783942, 0.00485493760762402),
+            (0.0640905856084341, 0.931054476783942),
+            (0.00485493760762338, 0.0640905856084342),
+            (0.215607057390095, 0.10622720472027),
+            (0.678165737889635, 0.215607057390095),
+            (0.10622720472027, 0.678165737889636),
+            (0.678165737889636, 0.10622720472027),
+            (0.215607057390094, 0.678165737889636),
+            (0.10622720472027, 0.215607057390095),
+            (0.445551056955925, 0.108897886088151),
+            (0.445551056955925, 0.445551056955925),
+            (0.10889788608815, 0.445551056955925),
+            (0.159133707657067, 0.00757078050469677),
+            (0.833295511838236, 0.159133707657067),
+            (0.00757078050469667, 0.833295511838237),
+            (0.833295511838236, 0.00757078050469677),
+            (0.159133707657067, 0.833295511838237),
+            (0.00757078050469617, 0.159133707657068),
+            (0.317860123835772, 0.1398080719918),
+            (0.542331804172428, 0.317860123835772),
+            (0.1398080719918, 0.542331804172428),
+            (0.542331804172428, 0.1398080719918),
+            (0.317860123835772, 0.542331804172428),
+            (0.1398080719918, 0.317860123835772),
+            (0.254579267673339, 0.254579267673339),
+            (0.490841464653322, 0.254579267673339),
+            (0.254579267673339, 0.490841464653322),
+            (0.333333333333333, 0.333333333333333),
+            (0.198518132228788, 0.0465603649076644),
+            (0.754921502863547, 0.198518132228788),
+            (0.046560364907664, 0.754921502863548),
+            (0.754921502863547, 0.0465603649076644),
+            (0.198518132228788, 0.754921502863548),
+            (0.0465603649076644, 0.198518132228788),
+            (0.3934253478171, 0.2131493043658),
+            (0.3934253478171, 0.3934253478171),
+            (0.2131493043658, 0.3934253478171),
+            (0.0999522962881386, 0.0383636847753748),
+            (0.861684018936487, 0.0999522962881384),
+            (0.0383636847753748, 0.861684018936487),
+            (0.861684018936487, 0.0383636847753748),
+            (0.0999522962881387, 0.861684018936487),
+            (0.0383636847753745, 0.0999522962881389),
+            (0.420023758816224, 0.00983154829280234),
+            (0.570144692890973, 0.420023758816224),
+            (0.00983154829280253, 0.570144692890974),
+            (0.570144692890973, 0.00983154829280234),
+            (0.420023758816224, 0.570144692890974),
+            (0.00983154829280225, 0.420023758816224),
+            (0.333134817309588, 0.0549874791429866),
+            (0.611877703547426, 0.333134817309587),
+            (0.0549874791429869, 0.611877703547426),
+            (0.611877703547426, 0.0549874791429866),
+            (0.333134817309588, 0.611877703547426),
+            (0.0549874791429866, 0.333134817309588),
+            (0.280581411423665, 0.010737212856011),
+            (0.708681375720324, 0.280581411423665),
+            (0.010737212856011, 0.708681375720324),
+            (0.708681375720324, 0.010737212856011),
+            (0.280581411423665, 0.708681375720324),
+            (0.0107372128560107, 0.280581411423666),
+            (0.0109761410283982, 0.0109761410283975),
+            (0.978047717943205, 0.010976141028398),
+            (0.0109761410283974, 0.978047717943205),
+            (0.109383596711715, 0.109383596711715),
+            (0.781232806576571, 0.109383596711715),
+            (0.109383596711714, 0.781232806576571),
+        ),
+        (
+            0.00917346297425291, 0.00917346297425291, 0.00917346297425291, 0.00216127541066558,
+            0.00216127541066558, 0.00216127541066558, 0.00710182530340845, 0.00710182530340845,
+            0.00710182530340845, 0.00112986960212586, 0.00112986960212586, 0.00112986960212586,
+            0.00112986960212586, 0.00112986960212586, 0.00112986960212586, 0.00772260782209923,
+            0.00772260782209923, 0.00772260782209923, 0.00772260782209923, 0.00772260782209923,
+            0.00772260782209923, 0.00945239993323244, 0.00945239993323244, 0.00945239993323244,
+            0.0022028974185585, 0.0022028974185585, 0.0022028974185585, 0.0022028974185585,
+            0.0022028974185585, 0.0022028974185585, 0.0116917457318277, 0.0116917457318277,
+            0.0116917457318277, 0.0116917457318277, 0.0116917457318277, 0.0116917457318277,
+            0.0140832013075202, 0.0140832013075202, 0.0140832013075202, 0.0139101107014531,
+            0.00598639857895469, 0.00598639857895469, 0.00598639857895469, 0.00598639857895469,
+            0.00598639857895469, 0.00598639857895469, 0.0137880506290705, 0.0137880506290705,
+            0.0137880506290705, 0.00414571152761387, 0.00414571152761387, 0.00414571152761387,
+            0.00414571152761387, 0.00414571152761387, 0.00414571152761387, 0.0036956815002553,
+            0.0036956815002553, 0.0036956815002553, 0.0036956815002553, 0.0036956815002553,
+            0.0036956815002553, 0.00866722556721932, 0.00866722556721932, 0.00866722556721932,
+            0.00866722556721932, 0.00866722556721932, 0.00866722556721932, 0.0035782002384577,
+            0.0035782002384577, 0.0035782002384577, 0.0035782002384577, 0.0035782002384577,
+            0.0035782002384577, 0.00079884079106662, 0.00079884079106662, 0.00079884079106662,
+            0.00783023077607455, 0.00783023077607455, 0.00783023077607455,
+        ),
+    ),
+    21: (
+        (
+            (0.298936235314983, 0.298936235314983),
+            (0.402127529370035, 0.298936235314983),
+            (0.298936235314982, 0.402127529370035),
+            (0.289189496078595, 0.205295559335161),
+            (0.505514944586243, 0.289189496078595),
+            (0.205295559335161, 0.505514944586244),
+            (0.505514944586244, 0.205295559335161),
+            (0.289189496078595, 0.505514944586244),
+            (0.205295559335162, 0.289189496078595),
+            (0.497007875468686, 0.00598424906262892),
+            (0.497007875468686, 0.497007875468686),
+            (0.0059842490626287, 0.497007875468686),
+            (0.237873382597994, 0.00693180903146818),
+            (0.755194808370538, 0.237873382597994),
+            (0.00693180903146767, 0.755194808370539),
+            (0.755194808370538, 0.00693180903146818),
+            (0.237873382597994, 0.755194808370538),
+            (0.00693180903146777, 0.237873382597994),
+            (0.403617586546385, 0.19276482690723),
+            (0.403617586546385, 0.403617586546385),
+            (0.19276482690723, 0.403617586546385),
+            (0.318865310794828, 0.123779400405493),
+            (0.557355288799679, 0.318865310794828),
+            (0.123779400405493, 0.557355288799679),
+            (0.557355288799679, 0.123779400405493),
+            (0.318865310794829, 0.557355288799679),
+            (0.123779400405493, 0.318865310794829),
+            (0.231873625370401, 0.0389913626232203),
+            (0.729135012006378, 0.231873625370401),
+            (0.0389913626232204, 0.729135012006379),
+            (0.729135012006379, 0.0389913626232203),
+            (0.231873625370401, 0.729135012006379),
+            (0.0389913626232204, 0.231873625370401),
+            (0.13316712294137, 0.00953624752971047),
+            (0.857296629528919, 0.133167122941371),
+            (0.00953624752971072, 0.85729662952892),
+            (0.857296629528919, 0.00953624752971047),
+            (0.13316712294137, 0.85729662952892),
+            (0.00953624752971023, 0.133167122941371),
+            (0.346807979809911, 0.053052191701217),
+            (0.600139828488872, 0.346807979809911),
+            (0.0530521917012168, 0.600139828488872),
+            (0.600139828488872, 0.053052191701217),
+            (0.346807979809911, 0.600139828488872),
+            (0.0530521917012168, 0.346807979809911),
+            (0.118988577622719, 0.118988577622719),
+            (0.762022844754561, 0.11898857762272),
+            (0.118988577622719, 0.762022844754562),
+            (0.190288718091279, 0.190288718091279),
+            (0.619422563817443, 0.190288718091279),
+            (0.190288718091278, 0.619422563817443),
+            (0.216599623189983, 0.100458020074115),
+            (0.682942356735903, 0.216599623189983),
+            (0.100458020074114, 0.682942356735904),
+            (0.682942356735903, 0.100458020074115),
+            (0.216599623189982, 0.682942356735904),
+            (0.100458020074114, 0.216599623189983),
+            (0.481597868653217, 0.036804262693567),
+            (0.481597868653217, 0.481597868653217),
+            (0.0368042626935664, 0.481597868653217),
+            (0.449812791775362, 0.100374416449275),
+            (0.449812791775362, 0.449812791775362),
+            (0.100374416449275, 0.449812791775362),
+            (0.128829807962052, 0.0494510655685403),
+            (0.821719126469408, 0.128829807962052),
+            (0.0494510655685406, 0.821719126469408),
+            (0.821719126469408, 0.0494510655685403),
+            (0.128829807962052, 0.821719126469408),
+            (0.0494510655685402, 0.128829807962052),
+            (0.0536275755461452, 0.0536275755461446),
+            (0.89274484890771, 0.0536275755461452),
+            (0.0536275755461448, 0.89274484890771),
+            (0.360953408018922, 0.0102546358729245),
+            (0.628791956108153, 0.360953408018922),
+            (0.0102546358729241, 0.628791956108154),
+            (0.628791956108153, 0.0102546358729245),
+            (0.360953408018922, 0.628791956108153),
+            (0.0102546358729242, 0.360953408018923),
+            (0.0107424564328284, 0.0107424564328283),
+            (0.978515087134343, 0.0107424564328283),
+            (0.0107424564328295, 0.978515087134341),
+            (0.0557195650723722, 0.0103019036434237),
+            (0.933978531284204, 0.0557195650723721),
+            (0.0103019036434252, 0.933978531284202),
+            (0.933978531284204, 0.0103019036434237),
+            (0.0557195650723732, 0.933978531284202),
+            (0.0103019036434235, 0.0557195650723721),
+        ),
+        (
+            0.0107255609645662, 0.0107255609645662, 0.0107255609645662, 0.00874770807788156,
+            0.00874770807788156, 0.00874770807788156, 0.00874770807788156, 0.00874770807788156,
+            0.00874770807788156, 0.00221891484853294, 0.00221891484853294, 0.00221891484853294,
+            0.00210306014407487, 0.00210306014407487, 0.00210306014407487, 0.00210306014407487,
+            0.00210306014407487, 0.00210306014407487, 0.0115003523266419, 0.0115003523266419,
+            0.0115003523266419, 0.00922374242396642, 0.00922374242396642, 0.00922374242396642,
+            0.00922374242396642, 0.00922374242396642, 0.00922374242396642, 0.00523495209266243,
+            0.00523495209266243, 0.00523495209266243, 0.00523495209266243, 0.00523495209266243,
+            0.00523495209266243, 0.00224040656095074, 0.00224040656095074, 0.00224040656095074,
+            0.00224040656095074, 0.00224040656095074, 0.00224040656095074, 0.0072501529594855,
+            0.0072501529594855, 0.0072501529594855, 0.0072501529594855, 0.0072501529594855,
+            0.0072501529594855, 0.0068280162261151, 0.0068280162261151, 0.0068280162261151,
+            0.00972762093037536, 0.00972762093037536, 0.00972762093037536, 0.00795201835271399,
+            0.00795201835271399, 0.00795201835271399, 0.00795201835271399, 0.00795201835271399,
+            0.00795201835271399, 0.00610720508169219, 0.00610720508169219, 0.00610720508169219,
+            0.009807237613912, 0.009807237613912, 0.009807237613912, 0.0049059859112752,
+            0.0049059859112752, 0.0049059859112752, 0.0049059859112752, 0.0049059859112752,
+            0.0049059859112752, 0.00357604255064183, 0.00357604255064183, 0.00357604255064183,
+            0.00341994242896717, 0.00341994242896717, 0.00341994242896717, 0.00341994242896717,
+            0.00341994242896717, 0.00341994242896717, 0.000754349636189346, 0.000754349636189346,
+            0.000754349636189346, 0.00163271429202204, 0.00163271429202204, 0.00163271429202204,
+            0.00163271429202204, 0.00163271429202204, 0.00163271429202204,
+        ),
+    ),
+    22: (
+        (
+            (0.385184524627302, 0.229630950745396),
+            (0.385184524627302, 0.385184524627302),
+            (0.229630950745396, 0.385184524627302),
+            (0.457769411367672, 0.0844611772646561),
+            (0.457769411367672, 0.457769411367672),
+            (0.0844611772646557, 0.457769411367673),
+            (0.0698421694674439, 0.00787628222158212),
+            (0.922281548310974, 0.0698421694674434),
+            (0.00787628222158293, 0.922281548310973),
+            (0.922281548310974, 0.00787628222158212),
+            (0.0698421694674441, 0.922281548310973),
+            (0.00787628222158201, 0.069842169467444),
+            (0.29455825902995, 0.29455825902995),
+            (0.4108834819401, 0.29455825902995),
+            (0.29455825902995, 0.4108834819401),
+            (0.188510523630284, 0.188510523630284),
+            (0.622978952739432, 0.188510523630284),
+            (0.188510523630284, 0.622978952739432),
+            (0.421981888793535, 0.15603622241293),
+            (0.421981888793535, 0.421981888793535),
+            (0.15603622241293, 0.421981888793535),
+            (0.0903988311664077, 0.0447522843483356),
+            (0.864848884485257, 0.0903988311664075),
+            (0.0447522843483358, 0.864848884485257),
+            (0.864848884485257, 0.0447522843483356),
+            (0.0903988311664076, 0.864848884485257),
+            (0.0447522843483355, 0.0903988311664081),
+            (0.411341764020559, 0.038275234700864),
+            (0.550383001278578, 0.411341764020559),
+            (0.0382752347008637, 0.550383001278578),
+            (0.550383001278578, 0.038275234700864),
+            (0.411341764020559, 0.550383001278578),
+            (0.0382752347008635, 0.411341764020559),
+            (0.332106105007446, 0.102747075986932),
+            (0.565146819005622, 0.332106105007446),
+            (0.102747075986931, 0.565146819005623),
+            (0.565146819005622, 0.102747075986932),
+            (0.332106105007446, 0.565146819005623),
+            (0.102747075986931, 0.332106105007447),
+            (0.362576280432467, 0.00740024123471043),
+            (0.630023478332822, 0.362576280432467),
+            (0.00740024123471089, 0.630023478332822),
+            (0.630023478332822, 0.00740024123471043),
+            (0.362576280432467, 0.630023478332822),
+            (0.0074002412347107, 0.362576280432468),
+            (0.290066824116669, 0.19108129796672),
+            (0.518851877916611, 0.290066824116669),
+            (0.19108129796672, 0.518851877916611),
+            (0.518851877916611, 0.19108129796672),
+            (0.290066824116669, 0.518851877916611),
+            (0.19108129796672, 0.290066824116669),
+            (0.496161178409709, 0.00767764318058258),
+            (0.496161178409709, 0.496161178409709),
+            (0.00767764318058264, 0.496161178409709),
+            (0.287931802824172, 0.0439916453934558),
+            (0.668076551782373, 0.287931802824172),
+            (0.0439916453934555, 0.668076551782373),
+            (0.668076551782372, 0.0439916453934558),
+            (0.287931802824172, 0.668076551782373),
+            (0.0439916453934559, 0.287931802824172),
+            (0.216786933364941, 0.108689941862672),
+            (0.674523124772387, 0.216786933364941),
+            (0.108689941862672, 0.674523124772387),
+            (0.674523124772386, 0.108689941862672),
+            (0.216786933364941, 0.674523124772387),
+            (0.108689941862672, 0.216786933364941),
+            (0.145873719873525, 0.00914471137496399),
+            (0.844981568751511, 0.145873719873525),
+            (0.00914471137496381, 0.844981568751511),
+            (0.844981568751511, 0.00914471137496399),
+            (0.145873719873525, 0.844981568751511),
+            (0.00914471137496382, 0.145873719873525),
+            (0.1762974348245, 0.0482549241146415),
+            (0.775447641060859, 0.1762974348245),
+            (0.0482549241146415, 0.775447641060859),
+            (0.775447641060858, 0.0482549241146415),
+            (0.1762974348245, 0.775447641060859),
+            (0.0482549241146412, 0.176297434824501),
+            (0.243990646039493, 0.00916390924818498),
+            (0.746845444712322, 0.243990646039493),
+            (0.00916390924818539, 0.746845444712322),
+            (0.746845444712322, 0.00916390924818498),
+            (0.243990646039493, 0.746845444712322),
+            (0.00916390924818479, 0.243990646039493),
+            (0.0291084706708079, 0.0291084706708073),
+            (0.941783058658385, 0.0291084706708079),
+            (0.0291084706708067, 0.941783058658387),
+            (0.115431538219205, 0.115431538219205),
+            (0.76913692356159, 0.115431538219205),
+            (0.115431538219205, 0.769136923561591),
+            (0.0179343210529387, 0.00179846498894857),
+            (0.980267213958112, 0.0179343210529391),
+            (0.00179846498894759, 0.980267213958115),
+            (0.980267213958113, 0.00179846498894857),
+            (0.0179343210529382, 0.980267213958115),
+            (0.00179846498894794, 0.0179343210529391),
+        ),
+        (
+            0.00674654194180535, 0.00674654194180535, 0.00674654194180535, 0.0069306997621171,
+            0.0069306997621171, 0.0069306997621171, 0.00129771923711564, 0.00129771923711564,
+            0.00129771923711564, 0.00129771923711564, 0.00129771923711564, 0.00129771923711564,
+            0.0105378819787261, 0.0105378819787261, 0.0105378819787261, 0.00801064956257445,
+            0.00801064956257445, 0.00801064956257445, 0.00942654627692065, 0.00942654627692065,
+            0.00942654627692065, 0.00375878890889418, 0.00375878890889418, 0.00375878890889418,
+            0.00375878890889418, 0.00375878890889418, 0.00375878890889418, 0.00559865673598139,
+            0.00559865673598139, 0.00559865673598139, 0.00559865673598139, 0.00559865673598139,
+            0.00559865673598139, 0.00885954674475511, 0.00885954674475511, 0.00885954674475511,
+            0.00885954674475511, 0.00885954674475511, 0.00885954674475511, 0.00245213019877848,
+            0.00245213019877848, 0.00245213019877848, 0.00245213019877848, 0.00245213019877848,
+            0.00245213019877848, 0.0108532097777545, 0.0108532097777545, 0.0108532097777545,
+            0.0108532097777545, 0.0108532097777545, 0.0108532097777545, 0.00264466983299221,
+            0.00264466983299221, 0.00264466983299221, 0.00583111143367151, 0.00583111143367151,
+            0.00583111143367151, 0.00583111143367151, 0.00583111143367151, 0.00583111143367151,
+            0.00785508131128516, 0.00785508131128516, 0.00785508131128516, 0.00785508131128516,
+            0.00785508131128516, 0.00785508131128516, 0.00205334353578778, 0.00205334353578778,
+            0.00205334353578778, 0.00205334353578778, 0.00205334353578778, 0.00205334353578778,
+            0.00528179248387346, 0.00528179248387346, 0.00528179248387346, 0.00528179248387346,
+            0.00528179248387346, 0.00528179248387346, 0.0025270384487923, 0.0025270384487923,
+            0.0025270384487923, 0.0025270384487923, 0.0025270384487923, 0.0025270384487923,
+            0.00178455458292819, 0.00178455458292819, 0.00178455458292819, 0.00720785656405229,
+            0.00720785656405229, 0.00720785656405229, 0.000320214265585714, 0.000320214265585714,
+            0.000320214265585714, 0.000320214265585714, 0.000320214265585714, 0.000320214265585714,
+        ),
+    ),
+    23: (
+        (
+            (0.159503798924757, 0.0238702536543534),
+            (0.816625947420889, 0.159503798924757),
+            (0.0238702536543539, 0.816625947420889),
+            (0.816625947420889, 0.0238702536543534),
+            (0.159503798924757, 0.816625947420889),
+            (0.0238702536543533, 0.159503798924757),
+            (0.114101360322365, 0.00518982176084422),
+            (0.880708817916791, 0.114101360322364),
+            (0.00518982176084426, 0.880708817916791),
+            (0.880708817916791, 0.00518982176084422),
+            (0.114101360322364, 0.880708817916791),
+            (0.00518982176084401, 0.114101360322365),
+            (0.0390072687570327, 0.0390072687570316),
+            (0.921985462485936, 0.0390072687570321),
+            (0.0390072687570333, 0.921985462485933),
+            (0.0955398781717349, 0.0327410291887062),
+            (0.871719092639559, 0.095539878171735),
+            (0.0327410291887065, 0.871719092639559),
+            (0.871719092639559, 0.0327410291887062),
+            (0.0955398781717349, 0.871719092639559),
+            (0.032741029188706, 0.095539878171735),
+            (0.311162268051702, 0.00244759985596619),
+            (0.686390132092332, 0.311162268051702),
+            (0.00244759985596654, 0.686390132092332),
+            (0.686390132092332, 0.00244759985596619),
+            (0.311162268051702, 0.686390132092332),
+            (0.00244759985596632, 0.311162268051702),
+            (0.205617232058052, 0.00872528958530841),
+            (0.785657478356639, 0.205617232058052),
+            (0.00872528958530855, 0.78565747835664),
+            (0.785657478356639, 0.00872528958530841),
+            (0.205617232058052, 0.78565747835664),
+            (0.00872528958530835, 0.205617232058052),
+            (0.0472616294497254, 0.00716253991024416),
+            (0.94557583064003, 0.0472616294497253),
+            (0.00716253991024474, 0.94557583064003),
+            (0.94557583064003, 0.00716253991024416),
+            (0.0472616294497255, 0.94557583064003),
+            (0.00716253991024408, 0.0472616294497259),
+            (0.358509593569625, 0.068526954187213),
+            (0.572963452243162, 0.358509593569625),
+            (0.0685269541872129, 0.572963452243162),
+            (0.572963452243162, 0.068526954187213),
+            (0.358509593569625, 0.572963452243162),
+            (0.0685269541872128, 0.358509593569625),
+            (0.480328877337308, 0.0393422453253831),
+            (0.480328877337309, 0.480328877337309),
+            (0.0393422453253831, 0.480328877337309),
+            (0.240482772035013, 0.101728329327284),
+            (0.657788898637703, 0.240482772035013),
+            (0.101728329327284, 0.657788898637704),
+            (0.657788898637703, 0.101728329327284),
+            (0.240482772035013, 0.657788898637704),
+            (0.101728329327284, 0.240482772035013),
+            (0.0868410482076335, 0.0868410482076331),
+            (0.826317903584734, 0.0868410482076331),
+            (0.0868410482076331, 0.826317903584734),
+            (0.394323506011542, 0.211352987976917),
+            (0.394323506011542, 0.394323506011542),
+            (0.211352987976917, 0.394323506011542),
+            (0.266251317877247, 0.266251317877247),
+            (0.467497364245505, 0.266251317877247),
+            (0.266251317877247, 0.467497364245506),
+            (0.172932303129224, 0.0583515752375155),
+            (0.768716121633261, 0.172932303129224),
+            (0.0583515752375155, 0.768716121633261),
+            (0.76871612163326, 0.0583515752375155),
+            (0.172932303129224, 0.768716121633261),
+            (0.0583515752375154, 0.172932303129224),
+            (0.316304307653838, 0.154830155405516),
+            (0.528865536940645, 0.316304307653838),
+            (0.154830155405516, 0.528865536940646),
+            (0.528865536940646, 0.154830155405516),
+            (0.316304307653838, 0.528865536940646),
+            (0.154830155405516, 0.316304307653838),
+            (0.137129387311648, 0.137129387311648),
+            (0.725741225376705, 0.137129387311648),
+            (0.137129387311647, 0.725741225376705),
+            (0.498959431209586, 0.0020811375808272),
+            (0.498959431209586, 0.498959431209586),
+            (0.00208113758082729, 0.498959431209586),
+            (0.397758576803008, 0.0147589697299449),
+            (0.587482453467047, 0.397758576803008),
+            (0.0147589697299453, 0.587482453467047),
+            (0.587482453467047, 0.0147589697299449),
+            (0.397758576803008, 0.587482453467047),
+            (0.0147589697299451, 0.397758576803008),
+            (0.444692442127728, 0.110615115744545),
+            (0.444692442127728, 0.444692442127728),
+            (0.110615115744545, 0.444692442127728),
+            (0.198749806396536, 0.198749806396536),
+            (0.602500387206928, 0.198749806396536),
+            (0.198749806396536, 0.602500387206928),
+            (0.278794169814102, 0.0329937081925325),
+            (0.688212121993365, 0.278794169814102),
+            (0.0329937081925329, 0.688212121993365),
+            (0.688212121993365, 0.0329937081925325),
+            (0.278794169814102, 0.688212121993365),
+            (0.0329937081925327, 0.278794169814103),
+            (0.00901644020559844, 0.00901644020559811),
+            (0.981967119588803, 0.00901644020559868),
+            (0.00901644020559689, 0.981967119588806),
+            (0.333333333333333, 0.333333333333333),
+        ),
+        (
+            0.00126408302769113, 0.00126408302769113, 0.00126408302769113, 0.00126408302769113,
+            0.00126408302769113, 0.00126408302769113, 0.00111250986486226, 0.00111250986486226,
+            0.00111250986486226, 0.00111250986486226, 0.00111250986486226, 0.00111250986486226,
+            0.00195787012951647, 0.00195787012951647, 0.00195787012951647, 0.0026640152155974,
+            0.0026640152155974, 0.0026640152155974, 0.0026640152155974, 0.0026640152155974,
+            0.0026640152155974, 0.00114055183812792, 0.00114055183812792, 0.00114055183812792,
+            0.00114055183812792, 0.00114055183812792, 0.00114055183812792, 0.00205737517220805,
+            0.00205737517220805, 0.00205737517220805, 0.00205737517220805, 0.00205737517220805,
+            0.00205737517220805, 0.000976295663945363, 0.000976295663945363, 0.000976295663945363,
+            0.000976295663945363, 0.000976295663945363, 0.000976295663945363, 0.0074905566965996,
+            0.0074905566965996, 0.0074905566965996, 0.0074905566965996, 0.0074905566965996,
+            0.0074905566965996, 0.0056989446339004, 0.0056989446339004, 0.0056989446339004,
+            0.00806062081850859, 0.00806062081850859, 0.00806062081850859, 0.00806062081850859,
+            0.00806062081850859, 0.00806062081850859, 0.00447995851275678, 0.00447995851275678,
+            0.00447995851275678, 0.011837304231564, 0.011837304231564, 0.011837304231564,
+            0.0119039314437499, 0.0119039314437499, 0.0119039314437499, 0.00523512824656503,
+            0.00523512824656503, 0.00523512824656503, 0.00523512824656503, 0.00523512824656503,
+            0.00523512824656503, 0.0104221979294844, 0.0104221979294844, 0.0104221979294844,
+            0.0104221979294844, 0.0104221979294844, 0.0104221979294844, 0.00727972469637089,
+            0.00727972469637089, 0.00727972469637089, 0.0012037723020907, 0.0012037723020907,
+            0.0012037723020907, 0.00354888941726091, 0.00354888941726091, 0.00354888941726091,
+            0.00354888941726091, 0.00354888941726091, 0.00354888941726091, 0.00947597533466946,
+            0.00947597533466946, 0.00947597533466946, 0.00996763894005252, 0.00996763894005252,
+            0.00996763894005252, 0.00508778732835351, 0.00508778732835351, 0.00508778732835351,
+            0.00508778732835351, 0.00508778732835351, 0.00508778732835351, 0.000532680616414658,
+            0.000532680616414658, 0.000532680616414658, 0.0126265301615181,
+        ),
+    ),
+    24: (
+        (
+            (0.333333333333333, 0.333333333333333),
+            (0.418890974910603, 0.162218050178795),
+            (0.418890974910603, 0.418890974910603),
+            (0.162218050178794, 0.418890974910603),
+            (0.162360633716926, 0.162360633716926),
+            (0.675278732566147, 0.162360633716926),
+            (0.162360633716926, 0.675278732566148),
+            (0.241479760073594, 0.170367282462444),
+            (0.588152957463962, 0.241479760073594),
+            (0.170367282462444, 0.588152957463963),
+            (0.588152957463962, 0.170367282462444),
+            (0.241479760073594, 0.588152957463963),
+            (0.170367282462443, 0.241479760073594),
+            (0.328975808924226, 0.169759795860736),
+            (0.501264395215037, 0.328975808924226),
+            (0.169759795860736, 0.501264395215038),
+            (0.501264395215037, 0.169759795860736),
+            (0.328975808924227, 0.501264395215038),
+            (0.169759795860736, 0.328975808924227),
+            (0.0409856290011176, 0.0409856290011168),
+            (0.918028741997766, 0.0409856290011174),
+            (0.0409856290011156, 0.918028741997769),
+            (0.00673127088788888, 0.00673127088788828),
+            (0.986537458224223, 0.00673127088788885),
+            (0.00673127088788766, 0.986537458224225),
+            (0.0931674097798815, 0.0383182258210191),
+            (0.868514364399099, 0.0931674097798812),
+            (0.0383182258210194, 0.8685143643991),
+            (0.868514364399099, 0.0383182258210191),
+            (0.0931674097798811, 0.8685143643991),
+            (0.0383182258210194, 0.0931674097798812),
+            (0.394520279800194, 0.0926564815207575),
+            (0.512823238679048, 0.394520279800195),
+            (0.0926564815207573, 0.512823238679048),
+            (0.512823238679048, 0.0926564815207575),
+            (0.394520279800194, 0.512823238679048),
+            (0.0926564815207571, 0.394520279800195),
+            (0.162677416394477, 0.0411887142484755),
+            (0.796133869357047, 0.162677416394477),
+            (0.0411887142484754, 0.796133869357047),
+            (0.796133869357047, 0.0411887142484755),
+            (0.162677416394477, 0.796133869357047),
+            (0.0411887142484751, 0.162677416394478),
+            (0.253589014218879, 0.0395709049701582),
+            (0.706840080810962, 0.25358901421888),
+            (0.0395709049701581, 0.706840080810963),
+            (0.706840080810962, 0.0395709049701582),
+            (0.25358901421888, 0.706840080810963),
+            (0.0395709049701582, 0.25358901421888),
+            (0.362252241317791, 0.0385927001748963),
+            (0.599155058507313, 0.362252241317791),
+            (0.0385927001748961, 0.599155058507313),
+            (0.599155058507312, 0.0385927001748963),
+            (0.362252241317791, 0.599155058507313),
+            (0.0385927001748962, 0.362252241317792),
+            (0.281622577706161, 0.0945349617365987),
+            (0.62384246055724, 0.281622577706161),
+            (0.0945349617365987, 0.623842460557241),
+            (0.62384246055724, 0.0945349617365987),
+            (0.281622577706161, 0.623842460557241),
+            (0.094534961736599, 0.281622577706161),
+            (0.383272664992659, 0.00738799463229424),
+            (0.609339340375046, 0.383272664992659),
+            (0.00738799463229406, 0.609339340375047),
+            (0.609339340375046, 0.00738799463229424),
+            (0.383272664992659, 0.609339340375047),
+            (0.00738799463229423, 0.38327266499266),
+            (0.273750352516261, 0.00754600316231256),
+            (0.718703644321427, 0.27375035251626),
+            (0.00754600316231296, 0.718703644321427),
+            (0.718703644321427, 0.00754600316231256),
+            (0.273750352516261, 0.718703644321427),
+            (0.0075460031623128, 0.27375035251626),
+            (0.496255277675735, 0.00748944464852999),
+            (0.496255277675735, 0.496255277675735),
+            (0.00748944464852982, 0.496255277675735),
+            (0.094121342797366, 0.00723455845778208),
+            (0.898644098744852, 0.0941213427973659),
+            (0.0072345584577822, 0.898644098744852),
+            (0.898644098744852, 0.00723455845778208),
+            (0.0941213427973661, 0.898644098744852),
+            (0.00723455845778177, 0.0941213427973665),
+            (0.264231315438273, 0.264231315438273),
+            (0.471537369123455, 0.264231315438273),
+            (0.264231315438273, 0.471537369123455),
+            (0.180396151886766, 0.0955662695273651),
+            (0.724037578585869, 0.180396151886766),
+            (0.0955662695273651, 0.724037578585869),
+            (0.724037578585869, 0.0955662695273651),
+            (0.180396151886766, 0.724037578585869),
+            (0.095566269527365, 0.180396151886766),
+            (0.480612561792503, 0.0387748764149934),
+            (0.480612561792503, 0.480612561792504),
+            (0.0387748764149932, 0.480612561792504),
+            (0.174737346282806, 0.0079879218808479),
+            (0.817274731836346, 0.174737346282805),
+            (0.00798792188084824, 0.817274731836347),
+            (0.817274731836346, 0.0079879218808479),
+            (0.174737346282806, 0.817274731836347),
+            (0.0079879218808475, 0.174737346282806),
+            (0.0963284955992154, 0.0963284955992152),
+            (0.807343008801569, 0.0963284955992152),
+            (0.0963284955992151, 0.80734300880157),
+            (0.0372914720512911, 0.00807491087020871),
+            (0.9546336170785, 0.037291472051291),
+            (0.00807491087020851, 0.954633617078501),
+            (0.9546336170785, 0.00807491087020871),
+            (0.037291472051291, 0.954633617078501),
+            (0.00807491087020874, 0.0372914720512915),
+            (0.375352926702086, 0.249294146595827),
+            (0.375352926702086, 0.375352926702086),
+            (0.249294146595827, 0.375352926702086),
+        ),
+        (
+            0.00627284492280016, 0.00655526635094262, 0.00655526635094262, 0.00655526635094262,
+            0.0051895080282001, 0.0051895080282001, 0.0051895080282001, 0.00707252290324241,
+            0.00707252290324241, 0.00707252290324241, 0.00707252290324241, 0.00707252290324241,
+            0.00707252290324241, 0.00763722130066232, 0.00763722130066232, 0.00763722130066232,
+            0.00763722130066232, 0.00763722130066232, 0.00763722130066232, 0.00191684986546459,
+            0.00191684986546459, 0.00191684986546459, 0.000308627252748322, 0.000308627252748322,
+            0.000308627252748322, 0.00268313572708389, 0.00268313572708389, 0.00268313572708389,
+            0.00268313572708389, 0.00268313572708389, 0.00268313572708389, 0.00751592717487066,
+            0.00751592717487066, 0.00751592717487066, 0.00751592717487066, 0.00751592717487066,
+            0.00751592717487066, 0.00360206708739871, 0.00360206708739871, 0.00360206708739871,
+            0.00360206708739871, 0.00360206708739871, 0.00360206708739871, 0.00445243846408179,
+            0.00445243846408179, 0.00445243846408179, 0.00445243846408179, 0.00445243846408179,
+            0.00445243846408179, 0.00497362593784122, 0.00497362593784122, 0.00497362593784122,
+            0.00497362593784122, 0.00497362593784122, 0.00497362593784122, 0.00717617578907874,
+            0.00717617578907874, 0.00717617578907874, 0.00717617578907874, 0.00717617578907874,
+            0.00717617578907874, 0.00212107463340189, 0.00212107463340189, 0.00212107463340189,
+            0.00212107463340189, 0.00212107463340189, 0.00212107463340189, 0.00204063753855823,
+            0.00204063753855823, 0.00204063753855823, 0.00204063753855823, 0.00204063753855823,
+            0.00204063753855823, 0.00217162336108535, 0.00217162336108535, 0.00217162336108535,
+            0.00129460619119899, 0.00129460619119899, 0.00129460619119899, 0.00129460619119899,
+            0.00129460619119899, 0.00129460619119899, 0.0102600043357549, 0.0102600043357549,
+            0.0102600043357549, 0.00592178107127156, 0.00592178107127156, 0.00592178107127156,
+            0.00592178107127156, 0.00592178107127156, 0.00592178107127156, 0.00517624738542629,
+            0.00517624738542629, 0.00517624738542629, 0.00185361338212316, 0.00185361338212316,
+            0.00185361338212316, 0.00185361338212316, 0.00185361338212316, 0.00185361338212316,
+            0.00501369653369445, 0.00501369653369445, 0.00501369653369445, 0.000898473792723289,
+            0.000898473792723289, 0.000898473792723289, 0.000898473792723289, 0.000898473792723289,
+            0.000898473792723289, 0.00949729325867634, 0.00949729325867634, 0.00949729325867634,
+        ),
+    ),
+    25: (
+        (
+            (0.387642030404563, 0.224715939190873),
+            (0.387642030404563, 0.387642030404564),
+            (0.224715939190873, 0.387642030404564),
+            (0.211004508061497, 0.211004508061497),
+            (0.577990983877007, 0.211004508061497),
+            (0.211004508061497, 0.577990983877007),
+            (0.440416927479343, 0.0018188666342742),
+            (0.557764205886382, 0.440416927479344),
+            (0.00181886663427411, 0.557764205886383),
+            (0.557764205886382, 0.0018188666342742),
+            (0.440416927479343, 0.557764205886382),
+            (0.00181886663427419, 0.440416927479344),
+            (0.299492315804508, 0.299492315804509),
+            (0.401015368390983, 0.299492315804509),
+            (0.299492315804509, 0.401015368390983),
+            (0.159007906197328, 0.0369601415796713),
+            (0.804031952223001, 0.159007906197328),
+            (0.0369601415796715, 0.804031952223001),
+            (0.804031952223001, 0.0369601415796713),
+            (0.159007906197328, 0.804031952223001),
+            (0.0369601415796714, 0.159007906197328),
+            (0.0372229259924413, 0.0372229259924403),
+            (0.925554148015119, 0.0372229259924409),
+            (0.037222925992442, 0.925554148015116),
+            (0.177353796757253, 0.0788580680056351),
+            (0.743788135237111, 0.177353796757253),
+            (0.0788580680056353, 0.743788135237112),
+            (0.743788135237112, 0.0788580680056351),
+            (0.177353796757253, 0.743788135237112),
+            (0.078858068005635, 0.177353796757253),
+            (0.1451092435745, 0.1451092435745),
+            (0.709781512850999, 0.145109243574501),
+            (0.1451092435745, 0.709781512851),
+            (0.27006673582096, 0.0688475294314977),
+            (0.661085734747543, 0.27006673582096),
+            (0.0688475294314979, 0.661085734747543),
+            (0.661085734747543, 0.0688475294314977),
+            (0.270066735820959, 0.661085734747543),
+            (0.0688475294314977, 0.27006673582096),
+            (0.34139103302115, 0.11599980764096),
+            (0.54260915933789, 0.34139103302115),
+            (0.11599980764096, 0.542609159337891),
+            (0.54260915933789, 0.11599980764096),
+            (0.34139103302115, 0.54260915933789),
+            (0.11599980764096, 0.34139103302115),
+            (0.373937979719584, 0.0483174342873772),
+            (0.577744585993039, 0.373937979719585),
+            (0.0483174342873771, 0.577744585993039),
+            (0.577744585993038, 0.0483174342873772),
+            (0.373937979719585, 0.577744585993039),
+            (0.0483174342873766, 0.373937979719585),
+            (0.0991330633416823, 0.00712831450125736),
+            (0.893738622157061, 0.0991330633416819),
+            (0.00712831450125734, 0.893738622157061),
+            (0.89373862215706, 0.00712831450125736),
+            (0.099133063341682, 0.893738622157061),
+            (0.0071283145012573, 0.0991330633416825),
+            (0.299506418629675, 0.203692910584251),
+            (0.496800670786075, 0.299506418629675),
+            (0.203692910584251, 0.496800670786075),
+            (0.496800670786075, 0.203692910584251),
+            (0.299506418629674, 0.496800670786075),
+            (0.203692910584251, 0.299506418629675),
+            (0.424759304540575, 0.15048139091885),
+            (0.424759304540574, 0.424759304540575),
+            (0.15048139091885, 0.424759304540575),
+            (0.178629848603616, 0.00723616174794822),
+            (0.814133989648435, 0.178629848603616),
+            (0.00723616174794794, 0.814133989648436),
+            (0.814133989648435, 0.00723616174794822),
+            (0.178629848603616, 0.814133989648436),
+            (0.00723616174794758, 0.178629848603617),
+            (0.362068801895972, 0.0129138832500323),
+            (0.625017314853995, 0.362068801895972),
+            (0.0129138832500325, 0.625017314853996),
+            (0.625017314853995, 0.0129138832500323),
+            (0.362068801895972, 0.625017314853996),
+            (0.0129138832500324, 0.362068801895972),
+            (0.0887929154893666, 0.0376879497842588),
+            (0.873519134726374, 0.0887929154893668),
+            (0.0376879497842593, 0.873519134726374),
+            (0.873519134726375, 0.0376879497842588),
+            (0.0887929154893666, 0.873519134726374),
+            (0.0376879497842586, 0.0887929154893668),
+            (0.233622810141715, 0.137006694087071),
+            (0.629370495771214, 0.233622810141715),
+            (0.137006694087071, 0.629370495771214),
+            (0.629370495771214, 0.137006694087071),
+            (0.233622810141715, 0.629370495771214),
+            (0.137006694087071, 0.233622810141715),
+            (0.462208708748706, 0.075582582502588),
+            (0.462208708748706, 0.462208708748706),
+            (0.0755825825025879, 0.462208708748706),
+            (0.25659540970902, 0.0245400602475245),
+            (0.718864530043456, 0.25659540970902),
+            (0.0245400602475247, 0.718864530043456),
+            (0.718864530043456, 0.0245400602475245),
+            (0.25659540970902, 0.718864530043456),
+            (0.0245400602475246, 0.25659540970902),
+            (0.09294970170077, 0.0929497017007699),
+            (0.81410059659846, 0.0929497017007699),
+            (0.0929497017007695, 0.814100596598461),
+            (0.0410688191117844, 0.00718882826169323),
+            (0.951742352626522, 0.0410688191117847),
+            (0.00718882826169182, 0.951742352626525),
+            (0.951742352626522, 0.00718882826169323),
+            (0.0410688191117835, 0.951742352626525),
+            (0.00718882826169268, 0.0410688191117847),
+            (0.00783534428260374, 0.00783534428260358),
+            (0.984329311434793, 0.00783534428260358),
+            (0.00783534428260463, 0.984329311434791),
+            (0.489039369660396, 0.0219212606792089),
+            (0.489039369660395, 0.489039369660396),
+            (0.0219212606792089, 0.489039369660396),
+            (0.279416188649261, 0.000891464317498256),
+            (0.719692347033241, 0.279416188649261),
+            (0.000891464317498147, 0.719692347033242),
+            (0.719692347033241, 0.000891464317498256),
+            (0.279416188649261, 0.719692347033242),
+            (0.000891464317498009, 0.279416188649261),
+        ),
+        (
+            0.00684492577413613, 0.00684492577413613, 0.00684492577413613, 0.00579363161800529,
+            0.00579363161800529, 0.00579363161800529, 0.000837408915967352, 0.000837408915967352,
+            0.000837408915967352, 0.000837408915967352, 0.000837408915967352, 0.000837408915967352,
+            0.00900882035085073, 0.00900882035085073, 0.00900882035085073, 0.00315573901237963,
+            0.00315573901237963, 0.00315573901237963, 0.00315573901237963, 0.00315573901237963,
+            0.00315573901237963, 0.00169864886095237, 0.00169864886095237, 0.00169864886095237,
+            0.0047575107837279, 0.0047575107837279, 0.0047575107837279, 0.0047575107837279,
+            0.0047575107837279, 0.0047575107837279, 0.0057457629312824, 0.0057457629312824,
+            0.0057457629312824, 0.00544219680621846, 0.00544219680621846, 0.00544219680621846,
+            0.00544219680621846, 0.00544219680621846, 0.00544219680621846, 0.00792017614394922,
+            0.00792017614394922, 0.00792017614394922, 0.00792017614394922, 0.00792017614394922,
+            0.00792017614394922, 0.0053200853477544, 0.0053200853477544, 0.0053200853477544,
+            0.0053200853477544, 0.0053200853477544, 0.0053200853477544, 0.00127263581267451,
+            0.00127263581267451, 0.00127263581267451, 0.00127263581267451, 0.00127263581267451,
+            0.00127263581267451, 0.00895691044613804, 0.00895691044613804, 0.00895691044613804,
+            0.00895691044613804, 0.00895691044613804, 0.00895691044613804, 0.00795565506872921,
+            0.00795565506872921, 0.00795565506872921, 0.00163186984102462, 0.00163186984102462,
+            0.00163186984102462, 0.00163186984102462, 0.00163186984102462, 0.00163186984102462,
+            0.00272731918398721, 0.00272731918398721, 0.00272731918398721, 0.00272731918398721,
+            0.00272731918398721, 0.00272731918398721, 0.00263628096071471, 0.00263628096071471,
+            0.00263628096071471, 0.00263628096071471, 0.00263628096071471, 0.00263628096071471,
+            0.00687004129601127, 0.00687004129601127, 0.00687004129601127, 0.00687004129601127,
+            0.00687004129601127, 0.00687004129601127, 0.00682713759376401, 0.00682713759376401,
+            0.00682713759376401, 0.00365717045396643, 0.00365717045396643, 0.00365717045396643,
+            0.00365717045396643, 0.00365717045396643, 0.00365717045396643, 0.00459141062991003,
+            0.00459141062991003, 0.00459141062991003, 0.000846491817063667, 0.000846491817063667,
+            0.000846491817063667, 0.000846491817063667, 0.000846491817063667, 0.000846491817063667,
+            0.000403255144162308, 0.000403255144162308, 0.000403255144162308, 0.00422204297326053,
+            0.00422204297326053, 0.00422204297326053, 0.000755851039229439, 0.000755851039229439,
+            0.000755851039229439, 0.000755851039229439, 0.000755851039229439, 0.000755851039229439,
+        ),
+    ),
+    26: (
+        (
+            (0.0800716549403167, 0.00479466097543649),
+            (0.915133684084247, 0.0800716549403165),
+            (0.00479466097543557, 0.915133684084249),
+            (0.915133684084247, 0.00479466097543649),
+            (0.0800716549403153, 0.915133684084249),
+            (0.00479466097543674, 0.0800716549403165),
+            (0.0316436115715307, 0.0291551962068357),
+            (0.939201192221634, 0.0316436115715308),
+            (0.029155196206835, 0.939201192221635),
+            (0.939201192221634, 0.0291551962068357),
+            (0.0316436115715299, 0.939201192221635),
+            (0.0291551962068356, 0.0316436115715308),
+            (0.0667371225764666, 0.0667371225764658),
+            (0.866525754847067, 0.0667371225764664),
+            (0.0667371225764661, 0.866525754847068),
+            (0.0753800475153986, 0.0262093640224988),
+            (0.898410588462103, 0.0753800475153988),
+            (0.0262093640224986, 0.898410588462103),
+            (0.898410588462103, 0.0262093640224988),
+            (0.0753800475153986, 0.898410588462103),
+            (0.0262093640224986, 0.0753800475153988),
+            (0.0331000343360323, 0.00569811791687541),
+            (0.961201847747092, 0.033100034336032),
+            (0.00569811791687613, 0.961201847747091),
+            (0.961201847747092, 0.00569811791687541),
+            (0.0331000343360331, 0.961201847747091),
+            (0.0056981179168747, 0.0331000343360326),
+            (0.00634011649207727, 0.00634011649207644),
+            (0.987319767015846, 0.00634011649207702),
+            (0.00634011649207583, 0.987319767015848),
+            (0.132486189614567, 0.0417247227421208),
+            (0.825789087643312, 0.132486189614567),
+            (0.0417247227421206, 0.825789087643313),
+            (0.825789087643312, 0.0417247227421208),
+            (0.132486189614567, 0.825789087643312),
+            (0.0417247227421208, 0.132486189614567),
+            (0.108687132914402, 0.100045659106528),
+            (0.791267207979071, 0.108687132914402),
+            (0.100045659106528, 0.79126720797907),
+            (0.79126720797907, 0.100045659106528),
+            (0.108687132914402, 0.79126720797907),
+            (0.100045659106527, 0.108687132914403),
+            (0.493753032896385, 0.0124939342072304),
+            (0.493753032896385, 0.493753032896385),
+            (0.0124939342072306, 0.493753032896385),
+            (0.250272313290527, 0.120614402205249),
+            (0.629113284504225, 0.250272313290527),
+            (0.120614402205249, 0.629113284504225),
+            (0.629113284504225, 0.120614402205249),
+            (0.250272313290527, 0.629113284504225),
+            (0.120614402205249, 0.250272313290527),
+            (0.389022062042762, 0.0295379425169075),
+            (0.581439995440331, 0.389022062042762),
+            (0.0295379425169074, 0.581439995440331),
+            (0.581439995440331, 0.0295379425169075),
+            (0.389022062042762, 0.581439995440331),
+            (0.0295379425169074, 0.389022062042762),
+            (0.358509296427662, 0.0873784651638444),
+            (0.554112238408494, 0.358509296427662),
+            (0.0873784651638443, 0.554112238408494),
+            (0.554112238408494, 0.0873784651638444),
+            (0.358509296427661, 0.554112238408494),
+            (0.0873784651638446, 0.358509296427662),
+            (0.388787497107594, 0.222425005784812),
+            (0.388787497107594, 0.388787497107594),
+            (0.222425005784812, 0.388787497107594),
+            (0.186869179476222, 0.0763119015129593),
+            (0.736818919010819, 0.186869179476221),
+            (0.0763119015129593, 0.736818919010819),
+            (0.736818919010819, 0.0763119015129593),
+            (0.186869179476221, 0.736818919010819),
+            (0.076311901512959, 0.186869179476222),
+            (0.273147100929079, 0.273147100929079),
+            (0.453705798141843, 0.273147100929079),
+            (0.273147100929079, 0.453705798141843),
+            (0.414705909590306, 0.00205753096537093),
+            (0.583236559444323, 0.414705909590306),
+            (0.00205753096537076, 0.583236559444324),
+            (0.583236559444323, 0.00205753096537093),
+            (0.414705909590307, 0.583236559444323),
+            (0.00205753096537056, 0.414705909590307),
+            (0.319415305383438, 0.170478728497249),
+            (0.510105966119312, 0.319415305383439),
+            (0.170478728497249, 0.510105966119313),
+            (0.510105966119312, 0.170478728497249),
+            (0.319415305383439, 0.510105966119313),
+            (0.170478728497249, 0.319415305383439),
+            (0.143737626199764, 0.00799960809148417),
+            (0.848262765708751, 0.143737626199764),
+            (0.00799960809148437, 0.848262765708752),
+            (0.848262765708752, 0.00799960809148417),
+            (0.143737626199764, 0.848262765708752),
+            (0.00799960809148398, 0.143737626199764),
+            (0.471828563321166, 0.0563428733576679),
+            (0.471828563321166, 0.471828563321166),
+            (0.056342873357668, 0.471828563321166),
+            (0.154201430364544, 0.154201430364544),
+            (0.691597139270911, 0.154201430364544),
+            (0.154201430364544, 0.691597139270912),
+            (0.283788138859471, 0.0511658736851376),
+            (0.665045987455392, 0.28378813885947),
+            (0.0511658736851381, 0.665045987455392),
+            (0.665045987455392, 0.0511658736851376),
+            (0.283788138859471, 0.665045987455392),
+            (0.0511658736851376, 0.283788138859471),
+            (0.212043163302206, 0.212043163302206),
+            (0.575913673395589, 0.212043163302206),
+            (0.212043163302205, 0.575913673395589),
+            (0.435985419384383, 0.128029161231233),
+            (0.435985419384383, 0.435985419384383),
+            (0.128029161231234, 0.435985419384383),
+            (0.216546666473477, 0.0227845992508955),
+            (0.760668734275627, 0.216546666473477),
+            (0.0227845992508956, 0.760668734275628),
+            (0.760668734275627, 0.0227845992508955),
+            (0.216546666473477, 0.760668734275627),
+            (0.0227845992508953, 0.216546666473477),
+            (0.333333333333333, 0.333333333333333),
+            (0.31289850307488, 0.00947329791221337),
+            (0.677628199012906, 0.31289850307488),
+            (0.00947329791221369, 0.677628199012907),
+            (0.677628199012906, 0.00947329791221337),
+            (0.31289850307488, 0.677628199012907),
+            (0.00947329791221335, 0.31289850307488),
+            (0.226434797407718, 0.00046400773217546),
+            (0.773101194860107, 0.226434797407717),
+            (0.000464007732175364, 0.773101194860107),
+            (0.773101194860107, 0.00046400773217546),
+            (0.226434797407717, 0.773101194860107),
+            (0.000464007732175614, 0.226434797407718),
+        ),
+        (
+            0.000699263224080135, 0.000699263224080135, 0.000699263224080135, 0.000699263224080135,
+            0.000699263224080135, 0.000699263224080135, 0.000602782386858442, 0.000602782386858442,
+            0.000602782386858442, 0.000602782386858442, 0.000602782386858442, 0.000602782386858442,
+            0.00245691265148301, 0.00245691265148301, 0.00245691265148301, 0.00165277235648384,
+            0.00165277235648384, 0.00165277235648384, 0.00165277235648384, 0.00165277235648384,
+            0.00165277235648384, 0.000542853671498378, 0.000542853671498378, 0.000542853671498378,
+            0.000542853671498378, 0.000542853671498378, 0.000542853671498378, 0.000263476558340936,
+            0.000263476558340936, 0.000263476558340936, 0.00320179894985642, 0.00320179894985642,
+            0.00320179894985642, 0.00320179894985642, 0.00320179894985642, 0.00320179894985642,
+            0.00230710553818916, 0.00230710553818916, 0.00230710553818916, 0.00230710553818916,
+            0.00230710553818916, 0.00230710553818916, 0.00265107959093368, 0.00265107959093368,
+            0.00265107959093368, 0.00718973661379939, 0.00718973661379939, 0.00718973661379939,
+            0.00718973661379939, 0.00718973661379939, 0.00718973661379939, 0.00412988360854342,
+            0.00412988360854342, 0.00412988360854342, 0.00412988360854342, 0.00412988360854342,
+            0.00412988360854342, 0.00686397910804287, 0.00686397910804287, 0.00686397910804287,
+            0.00686397910804287, 0.00686397910804287, 0.00686397910804287, 0.00973403391859144,
+            0.00973403391859144, 0.00973403391859144, 0.00519882276408717, 0.00519882276408717,
+            0.00519882276408717, 0.00519882276408717, 0.00519882276408717, 0.00519882276408717,
+            0.00976782346162378, 0.00976782346162378, 0.00976782346162378, 0.000928573735499042,
+            0.000928573735499042, 0.000928573735499042, 0.000928573735499042, 0.000928573735499042,
+            0.000928573735499042, 0.0087995835903476, 0.0087995835903476, 0.0087995835903476,
+            0.0087995835903476, 0.0087995835903476, 0.0087995835903476, 0.00148338083132825,
+            0.00148338083132825, 0.00148338083132825, 0.00148338083132825, 0.00148338083132825,
+            0.00148338083132825, 0.00576425181732845, 0.00576425181732845, 0.00576425181732845,
+            0.00662762972427263, 0.00662762972427263, 0.00662762972427263, 0.00505356221604433,
+            0.00505356221604433, 0.00505356221604433, 0.00505356221604433, 0.00505356221604433,
+            0.00505356221604433, 0.00847217253926404, 0.00847217253926404, 0.00847217253926404,
+            0.00820620030129395, 0.00820620030129395, 0.00820620030129395, 0.00313466892304029,
+            0.00313466892304029, 0.00313466892304029, 0.00313466892304029, 0.00313466892304029,
+            0.00313466892304029, 0.0102433312946116, 0.00229577919369932, 0.00229577919369932,
+            0.00229577919369932, 0.00229577919369932, 0.00229577919369932, 0.00229577919369932,
+            0.000569774457934107, 0.000569774457934107, 0.000569774457934107, 0.000569774457934107,
+            0.000569774457934107, 0.000569774457934107,
+        ),
+    ),
+    27: (
+        (
+            (0.380714021181187, 0.238571957637626),
+            (0.380714021181187, 0.380714021181187),
+            (0.238571957637626, 0.380714021181187),
+            (0.446667803703864, 0.106664392592271),
+            (0.446667803703865, 0.446667803703865),
+            (0.106664392592271, 0.446667803703865),
+            (0.416141378805412, 0.167717242389176),
+            (0.416141378805412, 0.416141378805413),
+            (0.167717242389176, 0.416141378805413),
+            (0.0803046477884389, 0.0803046477884383),
+            (0.839390704423123, 0.0803046477884388),
+            (0.0803046477884382, 0.839390704423124),
+            (0.287042196593497, 0.0307306047272727),
+            (0.682227198679231, 0.287042196593497),
+            (0.0307306047272725, 0.682227198679231),
+            (0.682227198679231, 0.0307306047272727),
+            (0.287042196593497, 0.682227198679231),
+            (0.0307306047272725, 0.287042196593497),
+            (0.345087841715569, 0.12915264006345),
+            (0.525759518220982, 0.345087841715568),
+            (0.12915264006345, 0.525759518220982),
+            (0.525759518220982, 0.12915264006345),
+            (0.345087841715568, 0.525759518220982),
+            (0.12915264006345, 0.345087841715569),
+            (0.233400406669871, 0.233400406669871),
+            (0.533199186660258, 0.233400406669871),
+            (0.233400406669871, 0.533199186660258),
+            (0.375930157048662, 0.0280334860952501),
+            (0.596036356856088, 0.375930157048662),
+            (0.0280334860952497, 0.596036356856089),
+            (0.596036356856088, 0.0280334860952501),
+            (0.375930157048662, 0.596036356856089),
+            (0.0280334860952499, 0.375930157048662),
+            (0.301165465166509, 0.301165465166509),
+            (0.397669069666982, 0.301165465166509),
+            (0.301165465166509, 0.397669069666982),
+            (0.1747799663549, 0.1747799663549),
+            (0.6504400672902, 0.1747799663549),
+            (0.1747799663549, 0.6504400672902),
+            (0.316945588933132, 0.209130921137669),
+            (0.4739234899292, 0.316945588933132),
+            (0.209130921137669, 0.4739234899292),
+            (0.473923489929199, 0.209130921137669),
+            (0.316945588933132, 0.4739234899292),
+            (0.209130921137668, 0.316945588933132),
+            (0.40722839304272, 0.0660389128497388),
+            (0.526732694107541, 0.40722839304272),
+            (0.0660389128497387, 0.526732694107542),
+            (0.526732694107542, 0.0660389128497388),
+            (0.40722839304272, 0.526732694107542),
+            (0.0660389128497383, 0.40722839304272),
+            (0.213553598457824, 0.0410305768191818),
+            (0.745415824722994, 0.213553598457824),
+            (0.0410305768191816, 0.745415824722995),
+            (0.745415824722994, 0.0410305768191818),
+            (0.213553598457824, 0.745415824722995),
+            (0.041030576819182, 0.213553598457824),
+            (0.328852878068893, 0.00529964037179878),
+            (0.665847481559308, 0.328852878068893),
+            (0.00529964037179909, 0.665847481559309),
+            (0.665847481559309, 0.00529964037179878),
+            (0.328852878068893, 0.665847481559309),
+            (0.00529964037179897, 0.328852878068893),
+            (0.485565054185163, 0.0288698916296745),
+            (0.485565054185163, 0.485565054185163),
+            (0.0288698916296746, 0.485565054185163),
+            (0.139295306142148, 0.0630739954149511),
+            (0.797630698442901, 0.139295306142149),
+            (0.0630739954149508, 0.797630698442901),
+            (0.7976306984429, 0.0630739954149511),
+            (0.139295306142149, 0.797630698442901),
+            (0.0630739954149506, 0.139295306142149),
+            (0.0325715201801819, 0.0325715201801811),
+            (0.934856959639637, 0.0325715201801817),
+            (0.0325715201801822, 0.934856959639636),
+            (0.255246254696978, 0.14896285093824),
+            (0.595790894364782, 0.255246254696978),
+            (0.14896285093824, 0.595790894364782),
+            (0.595790894364782, 0.14896285093824),
+            (0.255246254696978, 0.595790894364782),
+            (0.14896285093824, 0.255246254696978),
+            (0.208376015600374, 0.0946970824331308),
+            (0.696926901966496, 0.208376015600374),
+            (0.0946970824331305, 0.696926901966496),
+            (0.696926901966495, 0.0946970824331308),
+            (0.208376015600374, 0.696926901966496),
+            (0.0946970824331302, 0.208376015600375),
+            (0.440010551946215, 0.00558071701526018),
+            (0.554408731038524, 0.440010551946215),
+            (0.00558071701525992, 0.554408731038525),
+            (0.554408731038524, 0.00558071701526018),
+            (0.440010551946215, 0.554408731038525),
+            (0.00558071701526, 0.440010551946216),
+            (0.127570901904678, 0.127570901904678),
+            (0.744858196190645, 0.127570901904678),
+            (0.127570901904678, 0.744858196190645),
+            (0.302220941227821, 0.0750769024331965),
+            (0.622702156338982, 0.302220941227821),
+            (0.075076902433196, 0.622702156338983),
+            (0.622702156338983, 0.0750769024331965),
+            (0.302220941227821, 0.622702156338983),
+            (0.0750769024331963, 0.302220941227821),
+            (0.0819468025835335, 0.00698252932445908),
+            (0.911070668092007, 0.0819468025835336),
+            (0.00698252932445975, 0.911070668092006),
+            (0.911070668092007, 0.00698252932445908),
+            (0.0819468025835344, 0.911070668092006),
+            (0.0069825293244589, 0.0819468025835342),
+            (0.0343649699121421, 0.00609356940376477),
+            (0.959541460684093, 0.034364969912142),
+            (0.00609356940376438, 0.959541460684094),
+            (0.959541460684093, 0.00609356940376477),
+            (0.0343649699121416, 0.959541460684094),
+            (0.00609356940376449, 0.034364969912142),
+            (0.0801120738471012, 0.0350344225276975),
+            (0.884853503625201, 0.080112073847101),
+            (0.0350344225276975, 0.884853503625202),
+            (0.884853503625201, 0.0350344225276975),
+            (0.0801120738471012, 0.884853503625202),
+            (0.0350344225276972, 0.0801120738471015),
+            (0.0066392191809593, 0.0066392191809584),
+            (0.986721561638082, 0.00663921918095898),
+            (0.00663921918095839, 0.986721561638083),
+            (0.147213431898922, 0.0193520013180392),
+            (0.833434566783039, 0.147213431898923),
+            (0.019352001318039, 0.833434566783039),
+            (0.833434566783038, 0.0193520013180392),
+            (0.147213431898923, 0.833434566783039),
+            (0.0193520013180387, 0.147213431898923),
+            (0.229719653257843, 0.0073324725490402),
+            (0.762947874193116, 0.229719653257843),
+            (0.00733247254904068, 0.762947874193117),
+            (0.762947874193116, 0.0073324725490402),
+            (0.229719653257843, 0.762947874193117),
+            (0.0073324725490401, 0.229719653257844),
+            (0.14765552111987, 0.000490328443462782),
+            (0.851854150436667, 0.14765552111987),
+            (0.000490328443463195, 0.851854150436668),
+            (0.851854150436667, 0.000490328443462782),
+            (0.14765552111987, 0.851854150436668),
+            (0.000490328443462335, 0.14765552111987),
+        ),
+        (
+            0.00478004248372995, 0.00478004248372995, 0.00478004248372995, 0.00470507990472712,
+            0.00470507990472712, 0.00470507990472712, 0.0060251135120752, 0.0060251135120752,
+            0.0060251135120752, 0.00260631093640093, 0.00260631093640093, 0.00260631093640093,
+            0.00276589741688336, 0.00276589741688336, 0.00276589741688336, 0.00276589741688336,
+            0.00276589741688336, 0.00276589741688336, 0.00627871810201826, 0.00627871810201826,
+            0.00627871810201826, 0.00627871810201826, 0.00627871810201826, 0.00627871810201826,
+            0.00673565769902467, 0.00673565769902467, 0.00673565769902467, 0.00319757634972721,
+            0.00319757634972721, 0.00319757634972721, 0.00319757634972721, 0.00319757634972721,
+            0.00319757634972721, 0.00787398289068132, 0.00787398289068132, 0.00787398289068132,
+            0.00564122127234919, 0.00564122127234919, 0.00564122127234919, 0.00685769661527542,
+            0.00685769661527542, 0.00685769661527542, 0.00685769661527542, 0.00685769661527542,
+            0.00685769661527542, 0.00493113505949479, 0.00493113505949479, 0.00493113505949479,
+            0.00493113505949479, 0.00493113505949479, 0.00493113505949479, 0.00322768645246484,
+            0.00322768645246484, 0.00322768645246484, 0.00322768645246484, 0.00322768645246484,
+            0.00322768645246484, 0.00146391318089955, 0.00146391318089955, 0.00146391318089955,
+            0.00146391318089955, 0.00146391318089955, 0.00146391318089955, 0.00355861870643731,
+            0.00355861870643731, 0.00355861870643731, 0.00356531765524351, 0.00356531765524351,
+            0.00356531765524351, 0.00356531765524351, 0.00356531765524351, 0.00356531765524351,
+            0.00138866976447709, 0.00138866976447709, 0.00138866976447709, 0.00617383156543066,
+            0.00617383156543066, 0.00617383156543066, 0.00617383156543066, 0.00617383156543066,
+            0.00617383156543066, 0.00534685029480812, 0.00534685029480812, 0.00534685029480812,
+            0.00534685029480812, 0.00534685029480812, 0.00534685029480812, 0.00162123379881967,
+            0.00162123379881967, 0.00162123379881967, 0.00162123379881967, 0.00162123379881967,
+            0.00162123379881967, 0.00487162246140886, 0.00487162246140886, 0.00487162246140886,
+            0.00546530554645665, 0.00546530554645665, 0.00546530554645665, 0.00546530554645665,
+            0.00546530554645665, 0.00546530554645665, 0.00100756156364485, 0.00100756156364485,
+            0.00100756156364485, 0.00100756156364485, 0.00100756156364485, 0.00100756156364485,
+            0.000598386804236581, 0.000598386804236581, 0.000598386804236581, 0.000598386804236581,
+            0.000598386804236581, 0.000598386804236581, 0.00216357901768035, 0.00216357901768035,
+            0.00216357901768035, 0.00216357901768035, 0.00216357901768035, 0.00216357901768035,
+            0.000287721202835251, 0.000287721202835251, 0.000287721202835251, 0.00231119355589055,
+            0.00231119355589055, 0.00231119355589055, 0.00231119355589055, 0.00231119355589055,
+            0.00231119355589055, 0.00169712686940351, 0.00169712686940351, 0.00169712686940351,
+            0.00169712686940351, 0.00169712686940351, 0.00169712686940351, 0.000423303067881924,
+            0.000423303067881924, 0.000423303067881924, 0.000423303067881924, 0.000423303067881924,
+            0.000423303067881924,
+        ),
+    ),
+    28: (
+        (
+            (0.303982922516484, 0.303982922516484),
+            (0.392034154967032, 0.303982922516484),
+            (0.303982922516484, 0.392034154967032),
+            (0.0455054005583466, 0.0215243853694559),
+            (0.932970214072197, 0.0455054005583462),
+            (0.0215243853694568, 0.932970214072196),
+            (0.932970214072198, 0.0215243853694559),
+            (0.0455054005583471, 0.932970214072196),
+            (0.0215243853694556, 0.0455054005583468),
+            (0.213394454767087, 0.0490696693575595),
+            (0.737535875875353, 0.213394454767087),
+            (0.0490696693575591, 0.737535875875354),
+            (0.737535875875353, 0.0490696693575595),
+            (0.213394454767087, 0.737535875875353),
+            (0.0490696693575591, 0.213394454767088),
+            (0.00480412619665817, 0.00480412619665767),
+            (0.990391747606684, 0.00480412619665825),
+            (0.00480412619665888, 0.990391747606682),
+            (0.458279904240412, 0.0834401915191761),
+            (0.458279904240412, 0.458279904240412),
+            (0.0834401915191759, 0.458279904240412),
+            (0.24210251191932, 0.17765845029637),
+            (0.58023903778431, 0.24210251191932),
+            (0.17765845029637, 0.58023903778431),
+            (0.58023903778431, 0.17765845029637),
+            (0.24210251191932, 0.58023903778431),
+            (0.17765845029637, 0.24210251191932),
+            (0.386267973570042, 0.227464052859916),
+            (0.386267973570042, 0.386267973570042),
+            (0.227464052859916, 0.386267973570042),
+            (0.32719073201917, 0.189812356292737),
+            (0.482996911688093, 0.32719073201917),
+            (0.189812356292737, 0.482996911688093),
+            (0.482996911688093, 0.189812356292737),
+            (0.32719073201917, 0.482996911688093),
+            (0.189812356292737, 0.32719073201917),
+            (0.141998166933174, 0.00445838202328926),
+            (0.853543451043536, 0.141998166933174),
+            (0.00445838202328941, 0.853543451043537),
+            (0.853543451043536, 0.00445838202328926),
+            (0.141998166933174, 0.853543451043537),
+            (0.00445838202328933, 0.141998166933174),
+            (0.175396393191462, 0.0876779764843519),
+            (0.736925630324186, 0.175396393191462),
+            (0.0876779764843518, 0.736925630324187),
+            (0.736925630324187, 0.0876779764843519),
+            (0.175396393191462, 0.736925630324186),
+            (0.0876779764843521, 0.175396393191462),
+            (0.392139613334415, 0.0631803276344104),
+            (0.544680059031175, 0.392139613334414),
+            (0.0631803276344104, 0.544680059031175),
+            (0.544680059031175, 0.0631803276344104),
+            (0.392139613334414, 0.544680059031175),
+            (0.0631803276344105, 0.392139613334415),
+            (0.258264072150462, 0.258264072150462),
+            (0.483471855699075, 0.258264072150462),
+            (0.258264072150462, 0.483471855699076),
+            (0.334145615035921, 0.00414946413392374),
+            (0.661704920830155, 0.334145615035921),
+            (0.00414946413392325, 0.661704920830156),
+            (0.661704920830155, 0.00414946413392374),
+            (0.334145615035921, 0.661704920830155),
+            (0.00414946413392364, 0.334145615035922),
+            (0.174146196051183, 0.0227948049259159),
+            (0.803058999022902, 0.174146196051182),
+            (0.022794804925916, 0.803058999022902),
+            (0.803058999022902, 0.0227948049259159),
+            (0.174146196051182, 0.803058999022902),
+            (0.0227948049259162, 0.174146196051183),
+            (0.275839008071824, 0.0227008443717972),
+            (0.701460147556379, 0.275839008071824),
+            (0.0227008443717968, 0.701460147556379),
+            (0.701460147556379, 0.0227008443717972),
+            (0.275839008071824, 0.701460147556379),
+            (0.0227008443717968, 0.275839008071824),
+            (0.0262226671646526, 0.00614964854266384),
+            (0.967627684292684, 0.0262226671646522),
+            (0.00614964854266403, 0.967627684292684),
+            (0.967627684292684, 0.00614964854266384),
+            (0.0262226671646523, 0.967627684292684),
+            (0.0061496485426636, 0.0262226671646528),
+            (0.243047202365926, 0.112033629342271),
+            (0.644919168291803, 0.243047202365926),
+            (0.112033629342271, 0.644919168291803),
+            (0.644919168291803, 0.112033629342271),
+            (0.243047202365926, 0.644919168291803),
+            (0.112033629342271, 0.243047202365927),
+            (0.229992984057907, 0.00478148977298713),
+            (0.765225526169106, 0.229992984057907),
+            (0.00478148977298709, 0.765225526169106),
+            (0.765225526169105, 0.00478148977298713),
+            (0.229992984057907, 0.765225526169106),
+            (0.00478148977298669, 0.229992984057908),
+            (0.105895844178628, 0.105895844178627),
+            (0.788208311642745, 0.105895844178627),
+            (0.105895844178627, 0.788208311642745),
+            (0.429552202118899, 0.140895595762201),
+            (0.429552202118899, 0.4295522021189),
+            (0.140895595762201, 0.4295522021189),
+            (0.295608280872402, 0.0624487421796329),
+            (0.641942976947966, 0.295608280872402),
+            (0.0624487421796325, 0.641942976947966),
+            (0.641942976947966, 0.0624487421796329),
+            (0.295608280872402, 0.641942976947966),
+            (0.0624487421796326, 0.295608280872402),
+            (0.121393450754091, 0.0502111859134279),
+            (0.828395363332481, 0.121393450754091),
+            (0.0502111859134283, 0.828395363332481),
+            (0.828395363332481, 0.0502111859134279),
+            (0.121393450754091, 0.828395363332481),
+            (0.0502111859134278, 0.121393450754091),
+            (0.37382380031021, 0.0257279987428785),
+            (0.600448200946912, 0.37382380031021),
+            (0.0257279987428787, 0.600448200946912),
+            (0.600448200946912, 0.0257279987428785),
+            (0.37382380031021, 0.600448200946912),
+            (0.0257279987428785, 0.37382380031021),
+            (0.442783406520244, 0.00564656599346597),
+            (0.55157002748629, 0.442783406520244),
+            (0.00564656599346608, 0.551570027486291),
+            (0.551570027486291, 0.00564656599346597),
+            (0.442783406520243, 0.55157002748629),
+            (0.00564656599346608, 0.442783406520244),
+            (0.337798663200582, 0.118089069715095),
+            (0.544112267084323, 0.337798663200582),
+            (0.118089069715095, 0.544112267084323),
+            (0.544112267084323, 0.118089069715095),
+            (0.337798663200582, 0.544112267084323),
+            (0.118089069715095, 0.337798663200582),
+            (0.0922291891952821, 0.0182422910122948),
+            (0.889528519792423, 0.0922291891952819),
+            (0.0182422910122947, 0.889528519792423),
+            (0.889528519792423, 0.0182422910122948),
+            (0.0922291891952822, 0.889528519792423),
+            (0.0182422910122943, 0.0922291891952825),
+            (0.48484113256259, 0.030317734874821),
+            (0.48484113256259, 0.484841132562589),
+            (0.030317734874821, 0.48484113256259),
+            (0.15863768886306, 0.15863768886306),
+            (0.682724622273881, 0.15863768886306),
+            (0.15863768886306, 0.682724622273881),
+            (0.0608391923927587, 0.0608391923927586),
+            (0.878321615214482, 0.0608391923927591),
+            (0.0608391923927585, 0.878321615214483),
+            (0.0702907404781329, 0.00120025560148709),
+            (0.92850900392038, 0.0702907404781325),
+            (0.00120025560148806, 0.928509003920379),
+            (0.92850900392038, 0.00120025560148709),
+            (0.0702907404781336, 0.928509003920379),
+            (0.00120025560148698, 0.0702907404781331),
+        ),
+        (
+            0.00718123315032306, 0.00718123315032306, 0.00718123315032306, 0.00105876977884045,
+            0.00105876977884045, 0.00105876977884045, 0.00105876977884045, 0.00105876977884045,
+            0.00105876977884045, 0.00294783611725712, 0.00294783611725712, 0.00294783611725712,
+            0.00294783611725712, 0.00294783611725712, 0.00294783611725712, 0.000155567604340748,
+            0.000155567604340748, 0.000155567604340748, 0.00442585250544659, 0.00442585250544659,
+            0.00442585250544659, 0.00627862810833844, 0.00627862810833844, 0.00627862810833844,
+            0.00627862810833844, 0.00627862810833844, 0.00627862810833844, 0.0071052931952241,
+            0.0071052931952241, 0.0071052931952241, 0.00655305706204969, 0.00655305706204969,
+            0.00655305706204969, 0.00655305706204969, 0.00655305706204969, 0.00655305706204969,
+            0.000889447709627757, 0.000889447709627757, 0.000889447709627757, 0.000889447709627757,
+            0.000889447709627757, 0.000889447709627757, 0.00400596464334747, 0.00400596464334747,
+            0.00400596464334747, 0.00400596464334747, 0.00400596464334747, 0.00400596464334747,
+            0.0042323478671383, 0.0042323478671383, 0.0042323478671383, 0.0042323478671383,
+            0.0042323478671383, 0.0042323478671383, 0.00654637429454448, 0.00654637429454448,
+            0.00654637429454448, 0.00118838213384389, 0.00118838213384389, 0.00118838213384389,
+            0.00118838213384389, 0.00118838213384389, 0.00118838213384389, 0.00213847116750897,
+            0.00213847116750897, 0.00213847116750897, 0.00213847116750897, 0.00213847116750897,
+            0.00213847116750897, 0.00256563869101865, 0.00256563869101865, 0.00256563869101865,
+            0.00256563869101865, 0.00256563869101865, 0.00256563869101865, 0.000474270212944699,
+            0.000474270212944699, 0.000474270212944699, 0.000474270212944699, 0.000474270212944699,
+            0.000474270212944699, 0.00512299328085209, 0.00512299328085209, 0.00512299328085209,
+            0.00512299328085209, 0.00512299328085209, 0.00512299328085209, 0.00116227268223203,
+            0.00116227268223203, 0.00116227268223203, 0.00116227268223203, 0.00116227268223203,
+            0.00116227268223203, 0.00390497168554317, 0.00390497168554317, 0.00390497168554317,
+            0.00677379780166275, 0.00677379780166275, 0.00677379780166275, 0.00446255807013827,
+            0.00446255807013827, 0.00446255807013827, 0.00446255807013827, 0.00446255807013827,
+            0.00446255807013827, 0.00295894188617694, 0.00295894188617694, 0.00295894188617694,
+            0.00295894188617694, 0.00295894188617694, 0.00295894188617694, 0.00313026732148427,
+            0.00313026732148427, 0.00313026732148427, 0.00313026732148427, 0.00313026732148427,
+            0.00313026732148427, 0.00157008882174402, 0.00157008882174402, 0.00157008882174402,
+            0.00157008882174402, 0.00157008882174402, 0.00157008882174402, 0.0063935692114779,
+            0.0063935692114779, 0.0063935692114779, 0.0063935692114779, 0.0063935692114779,
+            0.0063935692114779, 0.00160245809539652, 0.00160245809539652, 0.00160245809539652,
+            0.00160245809539652, 0.00160245809539652, 0.00160245809539652, 0.00384105528929751,
+            0.00384105528929751, 0.00384105528929751, 0.0059713348201241, 0.0059713348201241,
+            0.0059713348201241, 0.00256412600233903, 0.00256412600233903, 0.00256412600233903,
+            0.000362567297493043, 0.000362567297493043, 0.000362567297493043, 0.000362567297493043,
+            0.000362567297493043, 0.000362567297493043,
+        ),
+    ),
+    29: (
+        (
+            (0.058942108840229, 0.00272874324792101),
+            (0.93832914791185, 0.0589421088402293),
+            (0.00272874324792122, 0.93832914791185),
+            (0.93832914791185, 0.00272874324792101),
+            (0.0589421088402293, 0.93832914791185),
+            (0.00272874324792086, 0.0589421088402293),
+            (0.349788010009332, 0.157177699867193),
+            (0.493034290123474, 0.349788010009332),
+            (0.157177699867194, 0.493034290123475),
+            (0.493034290123475, 0.157177699867193),
+            (0.349788010009332, 0.493034290123475),
+            (0.157177699867193, 0.349788010009332),
+            (0.32300182354355, 0.0021009666448275),
+            (0.674897209811622, 0.32300182354355),
+            (0.00210096664482778, 0.674897209811622),
+            (0.674897209811622, 0.0021009666448275),
+            (0.32300182354355, 0.674897209811622),
+            (0.00210096664482731, 0.32300182354355),
+            (0.498914824637686, 0.00217035072462751),
+            (0.498914824637686, 0.498914824637687),
+            (0.00217035072462773, 0.498914824637687),
+            (0.158145854249516, 0.0681658088137462),
+            (0.773688336936737, 0.158145854249516),
+            (0.0681658088137462, 0.773688336936738),
+            (0.773688336936737, 0.0681658088137462),
+            (0.158145854249516, 0.773688336936738),
+            (0.0681658088137463, 0.158145854249516),
+            (0.0295494682613533, 0.0108309586036094),
+            (0.959619573135037, 0.0295494682613532),
+            (0.0108309586036086, 0.959619573135039),
+            (0.959619573135037, 0.0108309586036094),
+            (0.0295494682613525, 0.959619573135039),
+            (0.0108309586036091, 0.0295494682613538),
+            (0.291819173426537, 0.218932341980173),
+            (0.48924848459329, 0.291819173426537),
+            (0.218932341980173, 0.48924848459329),
+            (0.48924848459329, 0.218932341980173),
+            (0.291819173426537, 0.48924848459329),
+            (0.218932341980172, 0.291819173426537),
+            (0.075522178512996, 0.0212868962407331),
+            (0.903190925246271, 0.0755221785129955),
+            (0.0212868962407332, 0.903190925246271),
+            (0.903190925246271, 0.0212868962407331),
+            (0.0755221785129956, 0.903190925246271),
+            (0.021286896240733, 0.0755221785129961),
+            (0.117116669508899, 0.0408472165761023),
+            (0.842036113914998, 0.117116669508899),
+            (0.0408472165761025, 0.842036113914999),
+            (0.842036113914999, 0.0408472165761023),
+            (0.117116669508899, 0.842036113914999),
+            (0.040847216576102, 0.117116669508899),
+            (0.0111662181081691, 0.00160349649604389),
+            (0.987230285395787, 0.0111662181081692),
+            (0.00160349649604402, 0.987230285395787),
+            (0.987230285395787, 0.00160349649604389),
+            (0.0111662181081694, 0.987230285395787),
+            (0.00160349649604341, 0.0111662181081692),
+            (0.434380426761731, 0.131239146476539),
+            (0.43438042676173, 0.434380426761731),
+            (0.131239146476538, 0.434380426761731),
+            (0.041097335627118, 0.0410973356271179),
+            (0.917805328745764, 0.0410973356271179),
+            (0.041097335627119, 0.917805328745762),
+            (0.208045649279087, 0.101545985226834),
+            (0.690408365494079, 0.208045649279087),
+            (0.101545985226834, 0.690408365494079),
+            (0.690408365494079, 0.101545985226834),
+            (0.208045649279087, 0.690408365494079),
+            (0.101545985226834, 0.208045649279087),
+            (0.392210114980435, 0.0415270612688228),
+            (0.566262823750742, 0.392210114980435),
+            (0.0415270612688226, 0.566262823750743),
+            (0.566262823750743, 0.0415270612688228),
+            (0.392210114980435, 0.566262823750743),
+            (0.0415270612688225, 0.392210114980435),
+            (0.359711275509976, 0.0938490411451326),
+            (0.546439683344891, 0.359711275509976),
+            (0.0938490411451324, 0.546439683344892),
+            (0.546439683344892, 0.0938490411451326),
+            (0.359711275509976, 0.546439683344892),
+            (0.0938490411451324, 0.359711275509976),
+            (0.245874699482875, 0.00868602980438407),
+            (0.74543927071274, 0.245874699482876),
+            (0.00868602980438393, 0.745439270712741),
+            (0.745439270712741, 0.00868602980438407),
+            (0.245874699482875, 0.745439270712741),
+            (0.00868602980438415, 0.245874699482876),
+            (0.167002738174923, 0.0175891240440458),
+            (0.815408137781031, 0.167002738174923),
+            (0.0175891240440457, 0.815408137781031),
+            (0.815408137781031, 0.0175891240440458),
+            (0.167002738174923, 0.815408137781031),
+            (0.0175891240440453, 0.167002738174923),
+            (0.208405305132401, 0.208405305132401),
+            (0.583189389735198, 0.208405305132401),
+            (0.208405305132401, 0.583189389735198),
+            (0.115008598631947, 0.00552352451221223),
+            (0.879467876855841, 0.115008598631946),
+            (0.00552352451221239, 0.879467876855841),
+            (0.879467876855841, 0.00552352451221223),
+            (0.115008598631946, 0.879467876855841),
+            (0.00552352451221227, 0.115008598631946),
+            (0.160745884431964, 0.160745884431963),
+            (0.678508231136073, 0.160745884431964),
+            (0.160745884431963, 0.678508231136073),
+            (0.315395398117319, 0.0238589269426557),
+            (0.660745674940025, 0.315395398117319),
+            (0.0238589269426558, 0.660745674940025),
+            (0.660745674940025, 0.0238589269426557),
+            (0.315395398117319, 0.660745674940025),
+            (0.0238589269426553, 0.315395398117319),
+            (0.223222650224821, 0.0402953345447716),
+            (0.736482015230408, 0.223222650224821),
+            (0.0402953345447722, 0.736482015230408),
+            (0.736482015230408, 0.0402953345447716),
+            (0.223222650224821, 0.736482015230408),
+            (0.0402953345447716, 0.223222650224821),
+            (0.288395859918732, 0.0678784043114471),
+            (0.643725735769821, 0.288395859918732),
+            (0.0678784043114471, 0.643725735769821),
+            (0.64372573576982, 0.0678784043114471),
+            (0.288395859918733, 0.643725735769821),
+            (0.0678784043114466, 0.288395859918733),
+            (0.488401602932603, 0.0231967941347945),
+            (0.488401602932603, 0.488401602932603),
+            (0.0231967941347946, 0.488401602932603),
+            (0.267366350272776, 0.139535607181083),
+            (0.593098042546142, 0.267366350272776),
+            (0.139535607181082, 0.593098042546142),
+            (0.593098042546142, 0.139535607181083),
+            (0.267366350272775, 0.593098042546142),
+            (0.139535607181083, 0.267366350272776),
+            (0.302386411215128, 0.302386411215128),
+            (0.395227177569743, 0.302386411215129),
+            (0.302386411215128, 0.395227177569743),
+            (0.405765395298892, 0.00806658570416681),
+            (0.586168018996942, 0.405765395298892),
+            (0.00806658570416641, 0.586168018996942),
+            (0.586168018996942, 0.00806658570416681),
+            (0.405765395298891, 0.586168018996942),
+            (0.00806658570416646, 0.405765395298892),
+            (0.114426812994426, 0.114426812994426),
+            (0.771146374011149, 0.114426812994426),
+            (0.114426812994425, 0.771146374011149),
+            (0.464762431080739, 0.0704751378385219),
+            (0.464762431080739, 0.464762431080739),
+            (0.0704751378385219, 0.464762431080739),
+            (0.0737218813901003, 0.0737218813900995),
+            (0.852556237219801, 0.0737218813901),
+            (0.0737218813900997, 0.852556237219801),
+            (0.390619178783264, 0.218761642433472),
+            (0.390619178783264, 0.390619178783264),
+            (0.218761642433473, 0.390619178783264),
+            (0.18632072767536, 0.000123446812287149),
+            (0.813555825512353, 0.18632072767536),
+            (0.000123446812287153, 0.813555825512354),
+            (0.813555825512353, 0.000123446812287149),
+            (0.18632072767536, 0.813555825512353),
+            (0.000123446812287098, 0.18632072767536),
+        ),
+        (
+            0.000384626485738126, 0.000384626485738126, 0.000384626485738126, 0.000384626485738126,
+            0.000384626485738126, 0.000384626485738126, 0.00522610734846122, 0.00522610734846122,
+            0.00522610734846122, 0.00522610734846122, 0.00522610734846122, 0.00522610734846122,
+            0.000676411974626207, 0.000676411974626207, 0.000676411974626207, 0.000676411974626207,
+            0.000676411974626207, 0.000676411974626207, 0.000758231051578454, 0.000758231051578454,
+            0.000758231051578454, 0.00321956835376689, 0.00321956835376689, 0.00321956835376689,
+            0.00321956835376689, 0.00321956835376689, 0.00321956835376689, 0.000636097218585817,
+            0.000636097218585817, 0.000636097218585817, 0.000636097218585817, 0.000636097218585817,
+            0.000636097218585817, 0.00677262328600379, 0.00677262328600379, 0.00677262328600379,
+            0.00677262328600379, 0.00677262328600379, 0.00677262328600379, 0.00138076537479522,
+            0.00138076537479522, 0.00138076537479522, 0.00138076537479522, 0.00138076537479522,
+            0.00138076537479522, 0.00225634342274367, 0.00225634342274367, 0.00225634342274367,
+            0.00225634342274367, 0.00225634342274367, 0.00225634342274367, 0.000134746115929351,
+            0.000134746115929351, 0.000134746115929351, 0.000134746115929351, 0.000134746115929351,
+            0.000134746115929351, 0.00558555014758393, 0.00558555014758393, 0.00558555014758393,
+            0.00143024575307845, 0.00143024575307845, 0.00143024575307845, 0.00469316533814185,
+            0.00469316533814185, 0.00469316533814185, 0.00469316533814185, 0.00469316533814185,
+            0.00469316533814185, 0.00391145922915324, 0.00391145922915324, 0.00391145922915324,
+            0.00391145922915324, 0.00391145922915324, 0.00391145922915324, 0.00531519818159832,
+            0.00531519818159832, 0.00531519818159832, 0.00531519818159832, 0.00531519818159832,
+            0.00531519818159832, 0.0015256194116726, 0.0015256194116726, 0.0015256194116726,
+            0.0015256194116726, 0.0015256194116726, 0.0015256194116726, 0.00191268333586501,
+            0.00191268333586501, 0.00191268333586501, 0.00191268333586501, 0.00191268333586501,
+            0.00191268333586501, 0.00626960172131161, 0.00626960172131161, 0.00626960172131161,
+            0.000870847615650876, 0.000870847615650876, 0.000870847615650876, 0.000870847615650876,
+            0.000870847615650876, 0.000870847615650876, 0.00528570892911381, 0.00528570892911381,
+            0.00528570892911381, 0.00283457674083274, 0.00283457674083274, 0.00283457674083274,
+            0.00283457674083274, 0.00283457674083274, 0.00283457674083274, 0.00329099888192612,
+            0.00329099888192612, 0.00329099888192612, 0.00329099888192612, 0.00329099888192612,
+            0.00329099888192612, 0.00458946208246382, 0.00458946208246382, 0.00458946208246382,
+            0.00458946208246382, 0.00458946208246382, 0.00458946208246382, 0.00306720058235947,
+            0.00306720058235947, 0.00306720058235947, 0.00625918324941723, 0.00625918324941723,
+            0.00625918324941723, 0.00625918324941723, 0.00625918324941723, 0.00625918324941723,
+            0.00815511940387162, 0.00815511940387162, 0.00815511940387162, 0.00182067020564037,
+            0.00182067020564037, 0.00182067020564037, 0.00182067020564037, 0.00182067020564037,
+            0.00182067020564037, 0.00408643922061356, 0.00408643922061356, 0.00408643922061356,
+            0.00515655831762925, 0.00515655831762925, 0.00515655831762925, 0.00280442356641566,
+            0.00280442356641566, 0.00280442356641566, 0.00795660764204446, 0.00795660764204446,
+            0.00795660764204446, 0.00034433631252088, 0.00034433631252088, 0.00034433631252088,
+            0.00034433631252088, 0.00034433631252088, 0.00034433631252088,
+        ),
+    ),
+    30: (
+        (
+            (0.259053884521067, 0.0478351231407725),
+            (0.69311099233816, 0.259053884521068),
+            (0.0478351231407727, 0.693110992338161),
+            (0.69311099233816, 0.0478351231407725),
+            (0.259053884521067, 0.693110992338161),
+            (0.0478351231407722, 0.259053884521068),
+            (0.00331872493664488, 0.00331872493664429),
+            (0.993362550126711, 0.00331872493664486),
+            (0.00331872493664542, 0.993362550126709),
+            (0.391572188291256, 0.0796595269316007),
+            (0.528768284777143, 0.391572188291256),
+            (0.0796595269316004, 0.528768284777143),
+            (0.528768284777143, 0.0796595269316007),
+            (0.391572188291256, 0.528768284777143),
+            (0.0796595269316006, 0.391572188291257),
+            (0.356140283296233, 0.057693401273874),
+            (0.586166315429892, 0.356140283296234),
+            (0.0576934012738742, 0.586166315429893),
+            (0.586166315429893, 0.057693401273874),
+            (0.356140283296233, 0.586166315429893),
+            (0.057693401273874, 0.356140283296234),
+            (0.0723724072246781, 0.0723724072246777),
+            (0.855255185550644, 0.0723724072246777),
+            (0.0723724072246777, 0.855255185550645),
+            (0.283012497349589, 0.0772614375768842),
+            (0.639726065073527, 0.283012497349589),
+            (0.0772614375768841, 0.639726065073528),
+            (0.639726065073527, 0.0772614375768842),
+            (0.283012497349589, 0.639726065073528),
+            (0.077261437576884, 0.283012497349589),
+            (0.0471579102421723, 0.0471579102421715),
+            (0.905684179515656, 0.0471579102421721),
+            (0.0471579102421717, 0.905684179515657),
+            (0.241613762451524, 0.0227583842950001),
+            (0.735627853253476, 0.241613762451524),
+            (0.0227583842949999, 0.735627853253476),
+            (0.735627853253475, 0.0227583842950001),
+            (0.241613762451524, 0.735627853253476),
+            (0.0227583842949998, 0.241613762451524),
+            (0.252781247187933, 0.123811978770675),
+            (0.623406774041393, 0.252781247187933),
+            (0.123811978770675, 0.623406774041393),
+            (0.623406774041393, 0.123811978770675),
+            (0.252781247187933, 0.623406774041393),
+            (0.123811978770674, 0.252781247187933),
+            (0.184906106383917, 0.1158819672361),
+            (0.699211926379982, 0.184906106383917),
+            (0.115881967236101, 0.699211926379982),
+            (0.699211926379982, 0.1158819672361),
+            (0.184906106383917, 0.699211926379982),
+            (0.1158819672361, 0.184906106383917),
+            (0.468030173651125, 0.063939652697749),
+            (0.468030173651125, 0.468030173651125),
+            (0.0639396526977492, 0.468030173651125),
+            (0.0126866046744682, 0.0126866046744676),
+            (0.974626790651065, 0.0126866046744676),
+            (0.0126866046744687, 0.974626790651063),
+            (0.19370437715364, 0.0665174447818813),
+            (0.739778178064478, 0.19370437715364),
+            (0.0665174447818817, 0.739778178064479),
+            (0.739778178064478, 0.0665174447818813),
+            (0.19370437715364, 0.739778178064479),
+            (0.0665174447818812, 0.193704377153641),
+            (0.0764012484393874, 0.0044387813770613),
+            (0.919159970183551, 0.0764012484393876),
+            (0.00443878137706122, 0.919159970183552),
+            (0.919159970183551, 0.0044387813770613),
+            (0.0764012484393873, 0.919159970183552),
+            (0.0044387813770612, 0.0764012484393876),
+            (0.121591508222728, 0.121591508222728),
+            (0.756816983554544, 0.121591508222728),
+            (0.121591508222728, 0.756816983554544),
+            (0.20904808745269, 0.0046635793926885),
+            (0.786288333154622, 0.20904808745269),
+            (0.00466357939268841, 0.786288333154622),
+            (0.786288333154622, 0.0046635793926885),
+            (0.209048087452689, 0.786288333154622),
+            (0.00466357939268859, 0.20904808745269),
+            (0.298542994059242, 0.00470368176447717),
+            (0.69675332417628, 0.298542994059243),
+            (0.00470368176447705, 0.696753324176281),
+            (0.69675332417628, 0.00470368176447717),
+            (0.298542994059243, 0.696753324176281),
+            (0.00470368176447702, 0.298542994059243),
+            (0.334379040034031, 0.0251820667038685),
+            (0.6404388932621, 0.334379040034031),
+            (0.0251820667038689, 0.6404388932621),
+            (0.6404388932621, 0.0251820667038685),
+            (0.334379040034031, 0.6404388932621),
+            (0.0251820667038684, 0.334379040034031),
+            (0.123230802380695, 0.0657765738247429),
+            (0.810992623794562, 0.123230802380695),
+            (0.0657765738247427, 0.810992623794563),
+            (0.810992623794562, 0.0657765738247429),
+            (0.123230802380695, 0.810992623794563),
+            (0.0657765738247429, 0.123230802380695),
+            (0.338514162429846, 0.126124094984989),
+            (0.535361742585165, 0.338514162429846),
+            (0.126124094984989, 0.535361742585165),
+            (0.535361742585165, 0.126124094984989),
+            (0.338514162429845, 0.535361742585165),
+            (0.126124094984989, 0.338514162429846),
+            (0.354403602180687, 0.194870950923519),
+            (0.450725446895794, 0.354403602180688),
+            (0.194870950923518, 0.450725446895794),
+            (0.450725446895794, 0.194870950923519),
+            (0.354403602180687, 0.450725446895794),
+            (0.194870950923518, 0.354403602180688),
+            (0.263068297757809, 0.191001424572283),
+            (0.545930277669909, 0.263068297757808),
+            (0.191001424572283, 0.545930277669909),
+            (0.545930277669908, 0.191001424572283),
+            (0.263068297757808, 0.545930277669909),
+            (0.191001424572283, 0.263068297757808),
+            (0.182409561517453, 0.182409561517453),
+            (0.635180876965094, 0.182409561517453),
+            (0.182409561517453, 0.635180876965094),
+            (0.43456617396467, 0.02753340612455),
+            (0.53790041991078, 0.43456617396467),
+            (0.0275334061245496, 0.537900419910781),
+            (0.537900419910781, 0.02753340612455),
+            (0.43456617396467, 0.537900419910781),
+            (0.0275334061245495, 0.43456617396467),
+            (0.164070987069879, 0.0280639219813728),
+            (0.807865090948749, 0.164070987069878),
+            (0.0280639219813728, 0.807865090948749),
+            (0.807865090948749, 0.0280639219813728),
+            (0.164070987069878, 0.807865090948749),
+            (0.0280639219813728, 0.164070987069878),
+            (0.36228727935295, 0.2754254412941),
+            (0.36228727935295, 0.36228727935295),
+            (0.2754254412941, 0.36228727935295),
+            (0.0426819997060807, 0.0159024162689346),
+            (0.941415584024985, 0.0426819997060802),
+            (0.0159024162689336, 0.941415584024988),
+            (0.941415584024985, 0.0159024162689346),
+            (0.0426819997060792, 0.941415584024988),
+            (0.0159024162689346, 0.0426819997060808),
+            (0.0939597946527301, 0.0272942306520958),
+            (0.878745974695175, 0.0939597946527299),
+            (0.0272942306520957, 0.878745974695175),
+            (0.878745974695174, 0.0272942306520958),
+            (0.0939597946527297, 0.878745974695175),
+            (0.0272942306520955, 0.0939597946527299),
+            (0.135408853519935, 0.00569121144541585),
+            (0.858899935034649, 0.135408853519934),
+            (0.00569121144541596, 0.85889993503465),
+            (0.85889993503465, 0.00569121144541585),
+            (0.135408853519934, 0.85889993503465),
+            (0.00569121144541561, 0.135408853519935),
+            (0.43674324854846, 0.12651350290308),
+            (0.43674324854846, 0.43674324854846),
+            (0.126513502903079, 0.43674324854846),
+            (0.272428040783928, 0.272428040783928),
+            (0.455143918432143, 0.272428040783928),
+            (0.272428040783928, 0.455143918432144),
+            (0.396221514739659, 0.00516234701662132),
+            (0.598616138243719, 0.396221514739659),
+            (0.00516234701662105, 0.59861613824372),
+            (0.59861613824372, 0.00516234701662132),
+            (0.396221514739659, 0.59861613824372),
+            (0.00516234701662133, 0.396221514739659),
+            (0.497319339000309, 0.0053613219993828),
+            (0.497319339000309, 0.497319339000309),
+            (0.00536132199938238, 0.497319339000309),
+            (0.0294840425976737, 0.000533708660694683),
+            (0.969982248741632, 0.0294840425976736),
+            (0.000533708660695409, 0.96998224874163),
+            (0.969982248741632, 0.000533708660694683),
+            (0.0294840425976749, 0.96998224874163),
+            (0.000533708660694444, 0.0294840425976742),
+        ),
+        (
+            0.00210737923195622, 0.00210737923195622, 0.00210737923195622, 0.00210737923195622,
+            0.00210737923195622, 0.00210737923195622, 8.58649506855248e-05, 8.58649506855248e-05,
+            8.58649506855248e-05, 0.002962461372546, 0.002962461372546, 0.002962461372546,
+            0.002962461372546, 0.002962461372546, 0.002962461372546, 0.00297211009221226,
+            0.00297211009221226, 0.00297211009221226, 0.00297211009221226, 0.00297211009221226,
+            0.00297211009221226, 0.00190096633420776, 0.00190096633420776, 0.00190096633420776,
+            0.00343859219376797, 0.00343859219376797, 0.00343859219376797, 0.00343859219376797,
+            0.00343859219376797, 0.00343859219376797, 0.00142221683384375, 0.00142221683384375,
+            0.00142221683384375, 0.0020462494841736, 0.0020462494841736, 0.0020462494841736,
+            0.0020462494841736, 0.0020462494841736, 0.0020462494841736, 0.00443632725300868,
+            0.00443632725300868, 0.00443632725300868, 0.00443632725300868, 0.00443632725300868,
+            0.00443632725300868, 0.00376716146477324, 0.00376716146477324, 0.00376716146477324,
+            0.00376716146477324, 0.00376716146477324, 0.00376716146477324, 0.00389206436616541,
+            0.00389206436616541, 0.00389206436616541, 0.000423275072664444, 0.000423275072664444,
+            0.000423275072664444, 0.00340200337805092, 0.00340200337805092, 0.00340200337805092,
+            0.00340200337805092, 0.00340200337805092, 0.00340200337805092, 0.00060334828427106,
+            0.00060334828427106, 0.00060334828427106, 0.00060334828427106, 0.00060334828427106,
+            0.00060334828427106, 0.00369345591745715, 0.00369345591745715, 0.00369345591745715,
+            0.000979474288946623, 0.000979474288946623, 0.000979474288946623, 0.000979474288946623,
+            0.000979474288946623, 0.000979474288946623, 0.00113722295049934, 0.00113722295049934,
+            0.00113722295049934, 0.00113722295049934, 0.00113722295049934, 0.00113722295049934,
+            0.00268234242309315, 0.00268234242309315, 0.00268234242309315, 0.00268234242309315,
+            0.00268234242309315, 0.00268234242309315, 0.00293503490153276, 0.00293503490153276,
+            0.00293503490153276, 0.00293503490153276, 0.00293503490153276, 0.00293503490153276,
+            0.00565151177146874, 0.00565151177146874, 0.00565151177146874, 0.00565151177146874,
+            0.00565151177146874, 0.00565151177146874, 0.0071582426348338, 0.0071582426348338,
+            0.0071582426348338, 0.0071582426348338, 0.0071582426348338, 0.0071582426348338,
+            0.00646301172505914, 0.00646301172505914, 0.00646301172505914, 0.00646301172505914,
+            0.00646301172505914, 0.00646301172505914, 0.00537642548271641, 0.00537642548271641,
+            0.00537642548271641, 0.00314079829044583, 0.00314079829044583, 0.00314079829044583,
+            0.00314079829044583, 0.00314079829044583, 0.00314079829044583, 0.00235096849705298,
+            0.00235096849705298, 0.00235096849705298, 0.00235096849705298, 0.00235096849705298,
+            0.00235096849705298, 0.00779804566291289, 0.00779804566291289, 0.00779804566291289,
+            0.000915253438074414, 0.000915253438074414, 0.000915253438074414, 0.000915253438074414,
+            0.000915253438074414, 0.000915253438074414, 0.00191094027354751, 0.00191094027354751,
+            0.00191094027354751, 0.00191094027354751, 0.00191094027354751, 0.00191094027354751,
+            0.000959940278734457, 0.000959940278734457, 0.000959940278734457, 0.000959940278734457,
+            0.000959940278734457, 0.000959940278734457, 0.006202479514073, 0.006202479514073,
+            0.006202479514073, 0.00745727538134288, 0.00745727538134288, 0.00745727538134288,
+            0.00132128396158163, 0.00132128396158163, 0.00132128396158163, 0.00132128396158163,
+            0.00132128396158163, 0.00132128396158163, 0.00139565905987038, 0.00139565905987038,
+            0.00139565905987038, 0.000167810855733201, 0.000167810855733201, 0.000167810855733201,
+            0.000167810855733201, 0.000167810855733201, 0.000167810855733201,
+        ),
+    ),
+}
+
+tetrahedron_table = {
+    1: (
+        (
+            (0.25, 0.25, 0.25),
+        ),
+        (
+            0.166666666666667,
+        ),
+    ),
+    2: (
+        (
+            (0.180029693510365, 0.365314518814635, 0.0069232355736274),
+            (0.155933120499186, 0.457461587085596, 0.381765356069347),
+            (0.216076429184848, 0.00037551502872929, 0.430701707077836),
+            (0.82157254096762, 0.123666800328458, 0.0399330486414984),
+        ),
+        (
+            0.0500868232228294, 0.0464629294477613, 0.0531823225835791, 0.0169345914124968,
+        ),
+    ),
+    3: (
+        (
+            (0.190117002439284, 0.439858947649275, 0.0114033294445573),
+            (0.158685163227441, 0.124804862165247, 0.585662805655216),
+            (0.0109052122111891, 0.345444155719731, 0.281523802123546),
+            (0.571226052149115, 0.141482751969504, 0.14691839008717),
+            (0.170816925164989, 0.0378716317823568, 0.152818143090927),
+            (0.162001491698524, 0.641429791495697, 0.183850350492098),
+        ),
+        (
+            0.0220946711907408, 0.0374025278195929, 0.0213444021184578, 0.0420006634682505,
+            0.0234374016100672, 0.0203870004595575,
+        ),
+    ),
+    4: (
+        (
+            (0.0972046445875833, 0.106604172561994, 0.68439041545304),
+            (0.0295694952064799, 0.329232959742647, 0.317903560213394),
+            (0.432710239047768, 0.103844116410993, 0.353823239209297),
+            (0.240276664928073, 0.304448402434497, 0.126801725915392),
+            (0.12941137378891, 0.538007203916186, 0.330190414837465),
+            (0.121541991333928, 0.00899126009333574, 0.30649398842969),
+            (0.450765876091277, 0.432953490481356, 0.0594566162994339),
+            (0.419266313879513, 0.0533412395357452, 0.0477814355590864),
+            (0.0672232948933833, 0.741228882093623, 0.0351839297735986),
+            (0.752508507009655, 0.0814049184028594, 0.0680993709382064),
+            (0.0404905067275903, 0.174694058697231, 0.0135607018798026),
+        ),
+        (
+            0.0177446723592484, 0.0183723720714162, 0.0258293526693744, 0.0322351353416057,
+            0.0126937858742597, 0.0132377800113376, 0.0115783276562726, 0.00998886419109325,
+            0.0092322998119294, 0.00921222819265614, 0.00654184848747333,
+        ),
+    ),
+    5: (
+        (
+            (0.0927352503108912, 0.0927352503108913, 0.721794249067326),
+            (0.45449629587435, 0.0455037041256496, 0.454496295874351),
+            (0.0455037041256497, 0.45449629587435, 0.45449629587435),
+            (0.0455037041256496, 0.0455037041256498, 0.45449629587435),
+            (0.310885919263301, 0.310885919263301, 0.0673422422100982),
+            (0.0673422422100983, 0.310885919263301, 0.310885919263301),
+            (0.310885919263301, 0.0673422422100984, 0.310885919263301),
+            (0.310885919263301, 0.310885919263301, 0.310885919263301),
+            (0.721794249067326, 0.0927352503108914, 0.0927352503108912),
+            (0.0927352503108912, 0.0927352503108914, 0.0927352503108912),
+            (0.0927352503108914, 0.721794249067326, 0.0927352503108912),
+            (0.454496295874351, 0.454496295874351, 0.0455037041256493),
+            (0.45449629587435, 0.0455037041256496, 0.0455037041256499),
+            (0.0455037041256496, 0.454496295874351, 0.0455037041256493),
+        ),
+        (
+            0.0122488405193937, 0.00709100346284691, 0.00709100346284691, 0.00709100346284693,
+            0.0187813209530026, 0.0187813209530026, 0.0187813209530026, 0.0187813209530026,
+            0.0122488405193936, 0.0122488405193937, 0.0122488405193936, 0.00709100346284691,
+            0.00709100346284691, 0.00709100346284691,
+        ),
+    ),
+    6: (
+        (
+            (0.0388360843448845, 0.0243189742481429, 0.902928799013611),
+            (0.064769436930053, 0.267844198183576, 0.636767508558514),
+            (0.0647751604471054, 0.0234677955730541, 0.390862050671012),
+            (0.277903669330078, 0.0637328952949977, 0.594909689021796),
+            (0.0660986624146807, 0.0836788140600551, 0.63005455511099),
+            (0.325119658577025, 0.329379718549199, 0.326833504619046),
+            (0.319194280348931, 0.304169265349782, 0.0443833443572083),
+            (0.328388171231222, 0.0382886707382454, 0.320287433697692),
+            (0.0550990224907258, 0.351939197334704, 0.38108430890631),
+            (0.124649963637486, 0.152103811309931, 0.201234567364421),
+            (0.0659249231600097, 0.62432136355343, 0.2535936747432),
+            (0.00735452383806949, 0.211297658581586, 0.25118449527753),
+            (0.617455720147269, 0.0631999809425698, 0.258449148983926),
+            (0.279420052945988, 0.255820784264986, 0.269569929633272),
+            (0.287725094826464, 0.577345781389727, 0.0646206380733686),
+            (0.594717301875796, 0.0651779927633704, 0.0666032980076033),
+            (0.0667895997817378, 0.530063275481017, 0.0769927171009673),
+            (0.626540201708882, 0.248449540118895, 0.0621155331835986),
+            (0.0600105830202691, 0.213041183236186, 0.0258426862607031),
+            (0.275786300469851, 0.0539961408359145, 0.0600161491661685),
+            (0.0513252061652029, 0.841138951662319, 0.0372647521383556),
+            (0.040576051066818, 0.00878195777751883, 0.0886003504689103),
+            (0.903770001332182, 0.0228658238140232, 0.0293357210831789),
+        ),
+        (
+            0.00118263247527659, 0.0052515683137844, 0.00403854781290739, 0.00814834598374036,
+            0.00883888731802823, 0.00720654944924556, 0.0111893027020928, 0.00997022461023819,
+            0.0104357458802186, 0.0107223369955146, 0.00726506634343819, 0.00376094454635714,
+            0.00776885568776345, 0.0187665674156779, 0.008989168438052, 0.00829477168191904,
+            0.0105110603142534, 0.0078580050787102, 0.00425072071117373, 0.00661901627484704,
+            0.00265424653083396, 0.00173722262061599, 0.00120687948197783,
+        ),
+    ),
+    7: (
+        (
+            (0.0192079934885852, 0.00199682581830005, 0.651334895848238),
+            (0.323456841789598, 0.0609221845854507, 0.615170988311871),
+            (0.0624740225231503, 0.063969430325799, 0.812872555571),
+            (0.0140330844733053, 0.23078490023767, 0.566163074530697),
+            (0.062444412712909, 0.323948070989182, 0.586321285830122),
+            (0.261508769176583, 0.350115304507171, 0.0119758768891575),
+            (0.260420587998262, 0.0225329834938323, 0.564650102467691),
+            (0.258280547367444, 0.500378669849816, 0.0826690956073922),
+            (0.397174402994917, 0.289861281908691, 0.171048877818778),
+            (0.550455941624859, 0.157241855986003, 0.0437434701607318),
+            (0.0258331677317302, 0.631548473918005, 0.280405238101906),
+            (0.107462430783153, 0.111251133426943, 0.475849161739315),
+            (0.252130530629395, 0.217554444216353, 0.448739255383575),
+            (0.601823577631812, 0.0446302679066366, 0.289994034365513),
+            (0.0331656998310358, 0.0762414702839689, 0.274801534897994),
+            (0.109895976327021, 0.437248089764549, 0.276571682738858),
+            (0.410358095994939, 0.0740087021391156, 0.244761650919342),
+            (0.176438223014948, 0.218812622547505, 0.175766110266451),
+            (0.199110572052884, 0.00161353261998982, 0.263747375338565),
+            (0.528711306413653, 0.234396497335962, 0.216998299345866),
+            (0.00392965148708803, 0.350528406837283, 0.241844613058583),
+            (0.223470202530143, 0.550888978142213, 0.225528537697264),
+            (0.297785234383524, 0.068011104899261, 0.0476494431008926),
+            (0.293770036523707, 0.627983229358598, 0.0274823781928344),
+            (0.0528776293788548, 0.599019239879897, 0.0549795828955138),
+            (0.0530001383345468, 0.275309810687132, 0.0449776631268799),
+            (0.599100943620026, 0.319658376097012, 0.0352137952974545),
+            (0.820745300741595, 0.0628150728452369, 0.0589104128256089),
+            (0.059894195069987, 0.824544066695395, 0.0567758666899469),
+            (0.062011091936644, 0.0521366890580111, 0.057182154516779),
+            (0.635521510583761, 0.000500433444271947, 0.0598944722319086),
+        ),
+        (
+            0.00128469686033342, 0.00200063203136997, 0.00386946822131037, 0.00373522756589855,
+            0.0038818311595533, 0.00455498571960775, 0.00479938059920576, 0.00716519366066345,
+            0.00879694427559229, 0.00697308860126673, 0.00345201369396048, 0.010050252598535,
+            0.011118534527622, 0.00523518790924995, 0.0047187979353221, 0.0111232482368135,
+            0.0106981398225767, 0.013723028130095, 0.0034787841936317, 0.00409373831432888,
+            0.0037247785804307, 0.0036967198625353, 0.00615596818523976, 0.00278366684394081,
+            0.00563264421712517, 0.00467686305232218, 0.00351546097364643, 0.00343172477204676,
+            0.00320046863269647, 0.00300951291402631, 0.00208568457572011,
+        ),
+    ),
+    8: (
+        (
+            (0.00885559427870508, 0.0176071561268779, 0.948563929799007),
+            (0.0362046719285183, 0.189074468870033, 0.731367360036089),
+            (0.611336533691884, 0.230743496794649, 0.00557577303043841),
+            (0.0277767579935652, 0.0258068488725325, 0.466540585890919),
+            (0.156486685040066, 0.0464861294110926, 0.751496536151838),
+            (0.195546081922602, 0.249637083057875, 0.541793182461809),
+            (0.0414941590182784, 0.0490853443274963, 0.71717735709395),
+            (0.220977464998818, 0.257916673154309, 0.0123959233601952),
+            (0.415076584269989, 0.0431223833778798, 0.494799169319991),
+            (0.479406653352866, 0.199906729032922, 0.320095606750398),
+            (0.0622443994610204, 0.123978489327818, 0.403654775010059),
+            (0.212519226117529, 0.0338367380972241, 0.50564195098037),
+            (0.397275457461443, 0.382880501165727, 0.0817336282047912),
+            (0.0454473742628587, 0.472133219549673, 0.435666994545663),
+            (0.216139692630079, 0.49359008083402, 0.0391905731975355),
+            (0.0452907498885834, 0.250227446293039, 0.493144767959065),
+            (0.428407770736019, 0.182246049223361, 0.0619469615468447),
+            (0.142514629908895, 0.228080184055079, 0.128143739766618),
+            (0.181262191170946, 0.0308224720999308, 0.25934638915961),
+            (0.249520766079953, 0.164695505900328, 0.249905550725755),
+            (0.48622524586616, 0.0424303011456227, 0.275236027299907),
+            (0.227462049986755, 0.200330706877803, 0.448954528663698),
+            (0.15825909334589, 0.411896203648412, 0.207391735140623),
+            (0.0288272589009353, 0.511106071913577, 0.229540713072655),
+            (0.229540615063575, 0.48351828029101, 0.24201755731748),
+            (0.485313557638069, 0.209642302870646, 0.198619977669231),
+            (0.0226109096366603, 0.250471921917321, 0.222434642492779),
+            (0.720511165717872, 0.036780649734748, 0.204368923907325),
+            (0.465315160413036, 0.461811725168263, 0.00542218330717833),
+            (0.0393802186845057, 0.0504550069317246, 0.173195608683351),
+            (0.0454345303521095, 0.748574560745763, 0.163299343299354),
+            (0.424650054079589, 0.0309505292161331, 0.136206241225198),
+            (0.216264148890651, 0.0543830156062337, 0.0512537651338736),
+            (0.204491813747223, 0.70165677606439, 0.0468686532808732),
+            (0.719573330071695, 0.0447802154960319, 0.055990644682102),
+            (0.0462005821486643, 0.723709495041749, 0.0434988144519503),
+            (0.500329672032977, 0.03576257087872, 0.00811205075570582),
+            (0.0410502981454823, 0.448778007752482, 0.045685365746118),
+            (0.0398566779234231, 0.164386930984808, 0.0344820754789427),
+            (0.762367884954453, 0.150637711781425, 0.0524383899287031),
+            (0.498254961782204, 0.41392128343882, 0.0797578709669054),
+            (0.048689004639022, 0.00457118437451567, 0.0221620710966623),
+            (0.0300522477759329, 0.940808202831601, 0.00671967882215312),
+            (0.957381626058303, 0.000971878369015138, 0.0160079842312983),
+        ),
+        (
+            0.000290863922550942, 0.00251062824751719, 0.00164608613248112, 0.00168815354179144,
+            0.00293542269752225, 0.00260273153396344, 0.00299814831630999, 0.00275489446675872,
+            0.00375076099467019, 0.00213323056210327, 0.00454248932241218, 0.00538216677347439,
+            0.00469761431666784, 0.0040263906546356, 0.0053735422239879, 0.00609168178460551,
+            0.00692791506924557, 0.00651045165815844, 0.00418984767843145, 0.00881048811767084,
+            0.00545454579225691, 0.00929874796628791, 0.0088923004079759, 0.00451958974758093,
+            0.00668313419022168, 0.00862993732316807, 0.00379062010575061, 0.00245331786257121,
+            0.00114957138606261, 0.00282920487633579, 0.00289820042708525, 0.00375987312558373,
+            0.00391648725644885, 0.00335778514113157, 0.00342417272409378, 0.00298313396788215,
+            0.00125352505864347, 0.00365408310108693, 0.00228929542638091, 0.00256474090206848,
+            0.00197757011617887, 0.000424483419890496, 0.000346514094503147, 0.000252324232519177,
+        ),
+    ),
+    9: (
+        (
+            (0.223347667813601, 0.0403857712760578, 0.723724094807067),
+            (0.0420664854098777, 0.0419547320076868, 0.875196026528408),
+            (0.0149238239784767, 0.213353780462222, 0.72761122983064),
+            (0.0396771205159149, 0.0116791877673534, 0.47317164143189),
+            (0.0331316669554184, 0.0401113782404464, 0.713691124061697),
+            (0.18095213245167, 0.0254593439902071, 0.682058612968494),
+            (0.143214340397824, 0.612340802182086, 0.000666217908743621),
+            (0.194621680265471, 0.380737034941527, 0.420505174202867),
+            (0.435066176799438, 0.00580738125855215, 0.447184150342226),
+            (0.416782083325252, 0.226837319964301, 0.00779839281859601),
+            (0.124285648730518, 0.192371795270148, 0.656138223504377),
+            (0.444345247810464, 0.0610766003173578, 0.474856882867235),
+            (0.132883433039591, 0.356752136898719, 0.0205145714017884),
+            (0.0155201159921829, 0.361950881374389, 0.39243368052707),
+            (0.0366754648901351, 0.458244669513536, 0.463585726400412),
+            (0.231314248871532, 0.103011513806395, 0.0028645779883964),
+            (0.0528125899288534, 0.183985390917369, 0.579144072483221),
+            (0.0274327152138569, 0.124235622988202, 0.412543124292685),
+            (0.17990450159705, 0.0391203352168918, 0.476509401004044),
+            (0.227159869315033, 0.141716159874522, 0.517598979528501),
+            (0.374496979076987, 0.222247573716264, 0.363925352762609),
+            (0.360156713211527, 0.45874567579555, 0.0368998311021248),
+            (0.228984009070693, 0.336434527121508, 0.0827335053473291),
+            (0.333619190568023, 0.270966213108107, 0.199823030101454),
+            (0.572956368580224, 0.166874972870679, 0.0777442683512466),
+            (0.147687068101471, 0.152468317173524, 0.09407076219108),
+            (0.422228601671921, 0.0834237885206363, 0.303141864574498),
+            (0.414761922299037, 0.363356680112364, 0.162526363750601),
+            (0.353700358434539, 0.10961245832859, 0.117934406191923),
+            (0.165062840907306, 0.181977223477481, 0.309246440579088),
+            (0.143482922419707, 0.378744394121169, 0.34694080625476),
+            (0.13066568757553, 0.0458087378144925, 0.235477104647691),
+            (0.132504385419056, 0.557160321974948, 0.12240359518817),
+            (0.339432294095281, 0.0153895998106674, 0.241869511998084),
+            (0.0550373938296805, 0.351609177188374, 0.196941061937647),
+            (0.645449463437002, 0.103157146828274, 0.202551715395404),
+            (0.72038072033592, 0.00689136683929528, 0.244078663540675),
+            (0.04483105915111, 0.709802719558639, 0.211317992359171),
+            (0.215845533526719, 0.565516352082529, 0.186190938826938),
+            (0.0175868132550815, 0.604426299960603, 0.20371686346026),
+            (0.0230247668978292, 0.0313878366926267, 0.201015109996088),
+            (0.633534755777452, 0.276077439823471, 0.0202948586616075),
+            (0.020944276301084, 0.183854997817626, 0.170438917807265),
+            (0.644358309838968, 0.0196505604208401, 0.134094535449186),
+            (0.737898449375068, 0.0513736820386086, 0.0105248700657299),
+            (0.586619406367851, 0.273754969152287, 0.133173713253393),
+            (0.187147292114549, 0.730498994262046, 0.0370698658976922),
+            (0.483732396697471, 0.0333272032037564, 0.0372285314523823),
+            (0.0317115615353829, 0.23077311207171, 0.0291491310298441),
+            (0.030209714970184, 0.751889344488304, 0.0393132826972472),
+            (0.783023838067657, 0.155578908302726, 0.0372273140607444),
+            (0.0244822382813637, 0.500770113322834, 0.0493321397035169),
+            (0.440521404847323, 0.515285061557277, 0.0330743569254283),
+            (0.218303550548395, 0.00837326895113064, 0.0638376081133777),
+            (0.0458983297924951, 0.0458590194760227, 0.0393006512570472),
+            (0.873984284469283, 0.0347402244184288, 0.0480297338872504),
+            (0.0374671558210409, 0.884773595262315, 0.0431398494500381),
+        ),
+        (
+            0.000975026613831308, 0.00118228135581844, 0.00118429668270625, 0.00119996437017436,
+            0.00196042275654108, 0.00209548452041231, 0.00131335682970415, 0.0016375601841337,
+            0.00162990042902499, 0.0023777410142238, 0.00248259139178539, 0.00193749218890169,
+            0.00221437506516127, 0.00251979649860076, 0.00261956287890696, 0.00136638338062151,
+            0.00438008211395809, 0.0033148017677618, 0.00439593140299428, 0.00543995147133687,
+            0.00421543780280764, 0.00423208523439122, 0.00587006043890192, 0.00697922461888153,
+            0.00530755076835146, 0.00468786977428942, 0.0063701809856589, 0.00427531366363023,
+            0.0058798941238469, 0.0081836874269581, 0.00753523051320257, 0.00383491487029506,
+            0.00595275544970582, 0.00274589846301463, 0.00552017907037966, 0.00373011850287772,
+            0.000716201604404541, 0.00216458852296825, 0.00355904995165305, 0.00216254303722398,
+            0.00117446211572625, 0.00171858097726706, 0.00227953923475883, 0.00256395546581887,
+            0.0011900066193666, 0.00117194188244435, 0.00218097825718004, 0.00221231934112489,
+            0.00152753239921568, 0.00152442844748309, 0.000907777114462998, 0.00220518381760796,
+            0.00110019009257318, 0.00138270596047503, 0.00133686842254267, 0.00112356673693757,
+            0.000916842041640024,
+        ),
+    ),
+    10: (
+        (
+            (0.532588923650052, 0.112124386464979, 0.236241958845761),
+            (0.119044731039276, 0.532588923649935, 0.236241958845661),
+            (0.112124386465023, 0.119044731039283, 0.236241958845699),
+            (0.490895346760997, 0.114537986315841, 0.0249540220672382),
+            (0.369612644856217, 0.490895346760553, 0.02495402206724),
+            (0.114537986316024, 0.369612644856148, 0.0249540220671653),
+            (0.0307019608706963, 0.126639490878871, 0.811477229498195),
+            (0.031181318752211, 0.030701960870745, 0.811477229497971),
+            (0.126639490878582, 0.0311813187522021, 0.81147722949849),
+            (0.329984187563428, 0.620258301289887, 0.0324034637009128),
+            (0.0173540474457836, 0.329984187563712, 0.0324034637009263),
+            (0.620258301290051, 0.0173540474456844, 0.0324034637009165),
+            (0.298635089789364, 0.453485924358789, 0.128556392359953),
+            (0.119322593491917, 0.298635089789335, 0.128556392359763),
+            (0.453485924358994, 0.119322593491742, 0.128556392359958),
+            (0.41747625187081, 0.404377014488369, 0.16133714217116),
+            (0.0168095914696485, 0.417476251870908, 0.161337142171081),
+            (0.404377014488366, 0.016809591469599, 0.161337142171075),
+            (0.035189582268768, 0.780572245824389, 0.0330735998255434),
+            (0.15116457208164, 0.0351895822687084, 0.033073599825577),
+            (0.780572245824151, 0.151164572081518, 0.0330735998255728),
+            (0.0230972587755699, 0.633928034390357, 0.17336085927366),
+            (0.169613847560395, 0.0230972587755565, 0.173360859273732),
+            (0.633928034390302, 0.169613847560402, 0.173360859273759),
+            (0.177018351018918, 0.633587565314398, 0.1650530553464),
+            (0.0243410283202735, 0.177018351018947, 0.165053055346375),
+            (0.633587565314261, 0.0243410283202642, 0.165053055346507),
+            (0.351030926661913, 0.0302939377577043, 0.0326605800532648),
+            (0.586014555527252, 0.351030926661772, 0.0326605800532899),
+            (0.0302939377577212, 0.586014555527477, 0.0326605800532721),
+            (0.328345521473841, 0.302001907326645, 0.303026128942095),
+            (0.0666264422574019, 0.328345521473828, 0.303026128941855),
+            (0.302001907326744, 0.0666264422573127, 0.303026128942078),
+            (0.0126764316485511, 0.413701128449536, 0.409075224011871),
+            (0.164547215889915, 0.0126764316485456, 0.409075224011948),
+            (0.413701128449435, 0.164547215890011, 0.409075224012007),
+            (0.339513062621138, 0.120713111635809, 0.411092657494867),
+            (0.12868116824813, 0.339513062620902, 0.411092657494958),
+            (0.120713111635856, 0.128681168248194, 0.411092657495011),
+            (0.0830249468821679, 0.150268790251704, 0.0384967818689645),
+            (0.728209480997427, 0.0830249468819634, 0.0384967818689939),
+            (0.150268790251755, 0.728209480997069, 0.0384967818689951),
+            (0.132467010744772, 0.515916816614274, 0.107446461585058),
+            (0.244169711055904, 0.132467010744642, 0.107446461585154),
+            (0.515916816614441, 0.244169711055665, 0.107446461585192),
+            (0.41260083617917, 0.0122804285624346, 0.397904362185717),
+            (0.177214373072707, 0.412600836179202, 0.397904362185566),
+            (0.0122804285624442, 0.177214373072742, 0.397904362185593),
+            (0.814902282940503, 0.0322052864177143, 0.119376795136335),
+            (0.0335156355054199, 0.814902282940798, 0.11937679513607),
+            (0.0322052864177286, 0.0335156355054174, 0.119376795135861),
+            (0.029355116860418, 0.175799607249302, 0.620841510435642),
+            (0.174003765454579, 0.0293551168603719, 0.620841510435722),
+            (0.175799607249215, 0.174003765454628, 0.620841510435776),
+            (0.599273801139227, 0.0311446124900868, 0.336597526383027),
+            (0.0329840599876766, 0.599273801139516, 0.336597526382707),
+            (0.0311446124900784, 0.0329840599876794, 0.336597526382512),
+            (0.0357390844115414, 0.337948919826428, 0.592532870170898),
+            (0.0337791255911184, 0.0357390844115455, 0.592532870170714),
+            (0.337948919826095, 0.0337791255911395, 0.592532870171223),
+            (0.180760249570227, 0.55966008885546, 0.00743879573116746),
+            (0.252140865843321, 0.180760249570057, 0.00743879573119928),
+            (0.559660088855702, 0.252140865843034, 0.00743879573121461),
+            (0.00666708044834984, 0.946719848292357, 0.00806750556190454),
+            (0.0385455656973747, 0.00666708044865896, 0.00806750556177962),
+            (0.946719848291852, 0.0385455656974802, 0.00806750556217401),
+            (0.103593660247555, 0.874025132764932, 0.0185543150543456),
+            (0.00382689193304408, 0.103593660248003, 0.018554315054337),
+            (0.874025132765168, 0.00382689193302942, 0.0185543150543572),
+            (0.257071980762551, 0.257071980762428, 0.228784057712463),
+            (0.00484488952757245, 0.00484488952776735, 0.98546533141674),
+            (0.16695976931758, 0.166959769317206, 0.499120692048112),
+            (0.318206200820592, 0.318206200820324, 0.045381397538629),
+            (0.133659949532611, 0.133659949532392, 0.599020151402528),
+        ),
+        (
+            0.00344509888933502, 0.00344509888934208, 0.00344509888934151, 0.00206466077766168,
+            0.00206466077766224, 0.00206466077765784, 0.00110339098374803, 0.00110339098374875,
+            0.0011033909837475, 0.00102319237330752, 0.00102319237330796, 0.00102319237330425,
+            0.00423451264186065, 0.00423451264185952, 0.00423451264185865, 0.00209468598437527,
+            0.00209468598437312, 0.0020946859843699, 0.00116416016749959, 0.0011641601675004,
+            0.00116416016750061, 0.00219141969444067, 0.00219141969443943, 0.00219141969443908,
+            0.00228445078028979, 0.00228445078028919, 0.0022844507802884, 0.00152299665603331,
+            0.00152299665603406, 0.00152299665603491, 0.00447115747295042, 0.00447115747295148,
+            0.00447115747295201, 0.00187369855848443, 0.00187369855848235, 0.0018736985584836,
+            0.00468209374248614, 0.00468209374249022, 0.00468209374249107, 0.00208391316671667,
+            0.00208391316671416, 0.00208391316671529, 0.00455388319916118, 0.00455388319916175,
+            0.00455388319916338, 0.00196949386481855, 0.00196949386482532, 0.00196949386481997,
+            0.00119146190910779, 0.00119146190910661, 0.00119146190910698, 0.00277740490917949,
+            0.00277740490917553, 0.00277740490917619, 0.00169583101522394, 0.00169583101522512,
+            0.00169583101522427, 0.0018987030975038, 0.00189870309750302, 0.00189870309750405,
+            0.00136867455413507, 0.00136867455413691, 0.00136867455413722, 0.000131683185790954,
+            0.000131683185791975, 0.000131683185792775, 0.000282094306525975, 0.000282094306524526,
+            0.000282094306524114, 0.0077630869974032, 6.36527193831801e-05, 0.00195918431534477,
+            0.00465192794803736, 0.00190282889458296,
+        ),
+    ),
+    11: (
+        (
+            (0.116023081854425, 0.728873249484653, 0.135592364575494),
+            (0.0195113040854561, 0.116023081854311, 0.135592364575472),
+            (0.728873249484144, 0.0195113040853996, 0.135592364576106),
+            (0.00762104076479356, 0.473392726282396, 0.50683735576362),
+            (0.0121488771892922, 0.00762104076469391, 0.506837355764064),
+            (0.473392726283015, 0.0121488771892419, 0.506837355763665),
+            (0.363347525696901, 0.0168886401897683, 0.280802863730816),
+            (0.338960970382143, 0.363347525697624, 0.280802863730395),
+            (0.0168886401897473, 0.338960970382072, 0.280802863730256),
+            (0.0173048958376224, 0.680860745134595, 0.157779396731644),
+            (0.14405496229638, 0.0173048958374877, 0.15777939673188),
+            (0.680860745134503, 0.144054962296286, 0.157779396731746),
+            (0.142994640166548, 0.474182128645855, 0.144348866503299),
+            (0.238474364684594, 0.142994640166434, 0.144348866502935),
+            (0.474182128645578, 0.238474364684246, 0.14434886650385),
+            (0.0177983897923629, 0.811198981443021, 0.145295910885661),
+            (0.0257067178790109, 0.017798389792311, 0.145295910885563),
+            (0.811198981442227, 0.0257067178790228, 0.145295910886405),
+            (0.0295177425032737, 0.494502062127404, 0.296998009659033),
+            (0.178982185709863, 0.0295177425035284, 0.296998009659455),
+            (0.494502062126534, 0.178982185709254, 0.296998009660745),
+            (0.268993301708489, 0.556351869431588, 0.0221892132299923),
+            (0.152465615629864, 0.268993301708777, 0.0221892132300193),
+            (0.556351869431363, 0.152465615629879, 0.0221892132301093),
+            (0.0272384438972303, 0.121338199233652, 0.822137157904796),
+            (0.0292861989641831, 0.0272384438973111, 0.822137157904945),
+            (0.121338199237199, 0.0292861989645277, 0.822137157900739),
+            (0.544675004555141, 0.0296027258670736, 0.227882722511225),
+            (0.19783954706604, 0.544675004555976, 0.227882722510874),
+            (0.0296027258670366, 0.197839547066301, 0.227882722510613),
+            (0.0118674337483946, 0.828341131139443, 0.0334920286219497),
+            (0.126299406490287, 0.0118674337485698, 0.0334920286219081),
+            (0.828341131139332, 0.126299406490289, 0.0334920286218664),
+            (0.0322988133183323, 0.498482050332391, 0.132050066271645),
+            (0.337169070077692, 0.0322988133182835, 0.132050066271586),
+            (0.49848205033292, 0.337169070077169, 0.132050066271644),
+            (0.556669403476659, 0.01942383515148, 0.077401388721152),
+            (0.346505372650919, 0.5566694034766, 0.0774013887210277),
+            (0.0194238351515508, 0.346505372651122, 0.0774013887207087),
+            (0.0932838602527992, 0.737515826090928, 0.0118757474130082),
+            (0.157324566243233, 0.0932838602532346, 0.0118757474130364),
+            (0.737515826090206, 0.157324566242965, 0.0118757474136775),
+            (0.0338895066707501, 0.280166444545332, 0.657524551760272),
+            (0.0284194970236362, 0.033889506670835, 0.657524551760484),
+            (0.280166444548593, 0.0284194970232856, 0.657524551757306),
+            (0.310774423669185, 0.127545627361565, 0.260990145113875),
+            (0.300689803854399, 0.310774423669647, 0.260990145114484),
+            (0.127545627361447, 0.30068980385497, 0.260990145113821),
+            (0.286494911377532, 0.491088052617867, 0.11082033247165),
+            (0.111596703533136, 0.286494911377242, 0.110820332471535),
+            (0.491088052617963, 0.111596703533013, 0.110820332471767),
+            (0.12553611316684, 0.460111304675022, 0.299470385376176),
+            (0.114882196781783, 0.125536113167282, 0.299470385375898),
+            (0.460111304673332, 0.114882196781495, 0.299470385377665),
+            (0.250053241237449, 0.0406042421911239, 0.458580906651289),
+            (0.250761609920117, 0.250053241237633, 0.458580906651255),
+            (0.0406042421910058, 0.250761609920906, 0.458580906650393),
+            (0.0234461159320504, 0.635319477206719, 0.0326609860400843),
+            (0.308573420821199, 0.0234461159321115, 0.0326609860399893),
+            (0.635319477206775, 0.308573420821234, 0.0326609860399005),
+            (0.0902935356263499, 0.309093680236532, 0.507996039113848),
+            (0.0926167450230191, 0.0902935356265845, 0.507996039113706),
+            (0.30909368023533, 0.0926167450231031, 0.507996039115837),
+            (0.100235474598686, 0.67783513645382, 0.101178135308516),
+            (0.120751253639031, 0.100235474598534, 0.101178135308674),
+            (0.677835136452938, 0.120751253638675, 0.101178135309797),
+            (0.154928587401345, 0.0121600892353427, 0.67495628076497),
+            (0.157955042597938, 0.154928587401735, 0.674956280765046),
+            (0.0121600892351609, 0.157955042598642, 0.674956280764345),
+            (0.138106941917312, 0.49369562707906, 0.032736634172222),
+            (0.335460796831543, 0.138106941917413, 0.0327366341721368),
+            (0.493695627078928, 0.335460796831434, 0.0327366341722011),
+            (0.116898196693367, 0.422621045899046, 0.450468335150446),
+            (0.010012422257117, 0.116898196693389, 0.450468335150402),
+            (0.422621045898729, 0.0100124222569324, 0.450468335150789),
+            (0.105521930421362, 0.006072578389162, 0.482547152473874),
+            (0.405858338714324, 0.105521930421264, 0.482547152475786),
+            (0.00607257838914552, 0.40585833871604, 0.482547152473637),
+            (0.0388428646249604, 0.906620021088922, 0.0279126021220968),
+            (0.0266245121640003, 0.0388428646249558, 0.0279126021220655),
+            (0.906620021088838, 0.0266245121640049, 0.0279126021222462),
+            (0.185161386691705, 0.757055676475516, 0.0260784340060859),
+            (0.031704502826692, 0.185161386691674, 0.0260784340060994),
+            (0.757055676475585, 0.0317045028266909, 0.0260784340061992),
+            (0.0370774799197033, 0.613355585987273, 0.314724910389794),
+            (0.0348420237031946, 0.0370774799197207, 0.314724910389817),
+            (0.613355585985641, 0.0348420237032174, 0.314724910391352),
+            (0.528053533786363, 0.0341321238405651, 0.00412497450827182),
+            (0.433689367865032, 0.528053533786073, 0.00412497450826203),
+            (0.034132123840637, 0.433689367865469, 0.00412497450795279),
+            (0.021743561621235, 0.0217435616197466, 0.934769315139362),
+            (0.113969534811609, 0.113969534812368, 0.658091395563691),
+            (0.327771112724047, 0.327771112724207, 0.0166866618275803),
+            (0.296008469913485, 0.296008469913471, 0.111974590259687),
+            (0.19682686450449, 0.196826864504454, 0.409519406486427),
+        ),
+        (
+            0.00106215421722562, 0.00106215421722652, 0.00106215421722855, 0.00024392157839705,
+            0.000243921578397798, 0.000243921578387081, 0.0016274985904982, 0.00162749859050594,
+            0.001627498590494, 0.00116975980437409, 0.00116975980437177, 0.00116975980437112,
+            0.00328196718211018, 0.00328196718210375, 0.0032819671821298, 0.000527992042630886,
+            0.000527992042630874, 0.000527992042634342, 0.0019496326390221, 0.00194963263903071,
+            0.00194963263904846, 0.00187370721298583, 0.001873707212985, 0.00187370721299133,
+            0.000723268523270527, 0.000723268523269129, 0.000723268523286702, 0.0020715041247248,
+            0.00207150412472533, 0.00207150412472298, 0.000442654479885368, 0.000442654479888878,
+            0.000442654479887118, 0.00214980660578145, 0.00214980660578066, 0.00214980660578469,
+            0.00138414861402597, 0.00138414861402562, 0.00138414861403043, 0.000857082947889229,
+            0.000857082947890771, 0.000857082947911588, 0.00105566299698917, 0.0010556629969899,
+            0.00105566299696657, 0.00459738038343119, 0.00459738038343209, 0.00459738038343334,
+            0.00334172523821579, 0.0033417252382084, 0.00334172523821018, 0.0036081871202103,
+            0.00360818712020865, 0.00360818712021631, 0.00289288771535987, 0.00289288771534858,
+            0.00289288771535386, 0.00101286812825209, 0.0010128681282524, 0.00101286812824897,
+            0.0029018056586777, 0.00290180565868023, 0.00290180565867408, 0.00253409922583232,
+            0.0025340992258334, 0.00253409922583179, 0.00120029407350264, 0.00120029407349782,
+            0.00120029407349766, 0.00259712047121927, 0.00259712047121478, 0.00259712047122127,
+            0.00120425712625689, 0.00120425712625649, 0.00120425712624566, 0.000852258543364974,
+            0.000852258543339524, 0.000852258543363201, 0.000465627489653514, 0.000465627489652738,
+            0.000465627489655192, 0.00101284225059295, 0.00101284225059305, 0.00101284225059641,
+            0.00150515576819436, 0.00150515576819552, 0.00150515576820166, 0.000545054359464089,
+            0.000545054359463543, 0.000545054359456992, 0.000185205077648042, 0.00299937125248925,
+            0.00193958466403962, 0.00496076555210352, 0.00450476478426666,
+        ),
+    ),
+    12: (
+        (
+            (0.431274828111507, 0.522471551355402, 0.0108332023128508),
+            (0.0354204182202371, 0.43127482811151, 0.0108332023128508),
+            (0.522471551355408, 0.0354204182202328, 0.0108332023128459),
+            (0.0288780033877441, 0.10216956909429, 0.247431243635563),
+            (0.621521183882406, 0.0288780033877445, 0.247431243635559),
+            (0.102169569094283, 0.621521183882401, 0.247431243635572),
+            (0.0895525091070139, 0.410693314090151, 0.364760249193369),
+            (0.13499392760946, 0.0895525091070087, 0.364760249193379),
+            (0.410693314090152, 0.134993927609458, 0.364760249193382),
+            (0.260055987362752, 0.076567784209284, 0.0619341779789966),
+            (0.601442050448967, 0.260055987362767, 0.0619341779789935),
+            (0.0765677842092809, 0.601442050448957, 0.0619341779789935),
+            (0.259903154085836, 0.114767516763106, 0.233453931951302),
+            (0.391875397199764, 0.259903154085834, 0.233453931951304),
+            (0.114767516763099, 0.391875397199757, 0.23345393195131),
+            (0.305060966577211, 0.655079631029842, 0.0264703515098401),
+            (0.0133890508831076, 0.305060966577206, 0.0264703515098401),
+            (0.655079631029834, 0.0133890508831104, 0.0264703515098407),
+            (0.0799434865871737, 0.602148546636171, 0.197260085334115),
+            (0.120647881442537, 0.0799434865871708, 0.197260085334122),
+            (0.602148546636172, 0.120647881442539, 0.197260085334123),
+            (0.0201343353228147, 0.545950460998921, 0.315572302857257),
+            (0.11834290082101, 0.0201343353228129, 0.31557230285726),
+            (0.545950460998918, 0.118342900821009, 0.315572302857261),
+            (0.233792173057883, 0.481042632269802, 0.269781924982593),
+            (0.0153832696897249, 0.233792173057882, 0.26978192498259),
+            (0.481042632269803, 0.0153832696897248, 0.269781924982592),
+            (0.220841759313371, 0.100249754372136, 0.451459949509977),
+            (0.227448536804515, 0.220841759313376, 0.451459949509971),
+            (0.100249754372136, 0.227448536804512, 0.451459949509978),
+            (0.130127094762025, 0.426127974255653, 0.127383168726021),
+            (0.316361762256309, 0.130127094762023, 0.127383168726013),
+            (0.426127974255657, 0.316361762256301, 0.127383168726015),
+            (0.128036327678861, 0.0746260513272086, 0.080261017892951),
+            (0.717076603100972, 0.128036327678866, 0.0802610178929497),
+            (0.0746260513272115, 0.717076603100971, 0.0802610178929497),
+            (0.0591969943784214, 0.851985048949244, 0.0176569601908347),
+            (0.0711609964814982, 0.0591969943784211, 0.0176569601908334),
+            (0.851985048949248, 0.0711609964814968, 0.0176569601908334),
+            (0.0856815735302436, 0.464161060804975, 0.426828186751401),
+            (0.0233291789133806, 0.0856815735302423, 0.426828186751395),
+            (0.464161060804988, 0.0233291789133804, 0.426828186751395),
+            (0.232417998956387, 0.0612354874441952, 0.697518900952387),
+            (0.00882761264703505, 0.232417998956387, 0.69751890095239),
+            (0.0612354874441864, 0.00882761264703297, 0.697518900952386),
+            (0.185900408683766, 0.292248264310623, 0.502598623355028),
+            (0.0192527036505831, 0.185900408683767, 0.502598623355022),
+            (0.292248264310634, 0.0192527036505839, 0.502598623355023),
+            (0.0243599100699363, 0.0246152168196158, 0.852514471650136),
+            (0.0985104014603153, 0.024359910069936, 0.852514471650132),
+            (0.024615216819615, 0.0985104014603047, 0.852514471650145),
+            (0.404502368563266, 0.0947626190290203, 0.291823515567251),
+            (0.208911496840468, 0.404502368563276, 0.291823515567244),
+            (0.0947626190290194, 0.208911496840467, 0.29182351556725),
+            (0.0620182193026911, 0.296222795087948, 0.561713963720754),
+            (0.0800450218886008, 0.0620182193026887, 0.561713963720765),
+            (0.296222795087942, 0.0800450218886069, 0.561713963720764),
+            (0.00917208007007439, 0.342531997950151, 0.485862460739408),
+            (0.162433461240372, 0.00917208007007467, 0.48586246073941),
+            (0.342531997950151, 0.162433461240369, 0.485862460739407),
+            (0.0236276413144429, 0.694139972529529, 0.264381081506819),
+            (0.0178513046492102, 0.0236276413144453, 0.264381081506813),
+            (0.694139972529533, 0.0178513046492099, 0.264381081506813),
+            (0.29729015531711, 0.0249315640402739, 0.297442217416373),
+            (0.380336063226243, 0.297290155317107, 0.297442217416377),
+            (0.0249315640402728, 0.380336063226246, 0.297442217416372),
+            (0.560665883770014, 0.270890203928969, 0.150162560127795),
+            (0.0182813521732222, 0.560665883770021, 0.150162560127791),
+            (0.270890203928966, 0.0182813521732233, 0.150162560127792),
+            (0.574872758913607, 0.377106399417617, 0.0304912794861779),
+            (0.0175295621825991, 0.574872758913612, 0.0304912794861779),
+            (0.377106399417613, 0.0175295621826015, 0.0304912794861797),
+            (0.483342697532054, 0.0299575541295913, 0.476493674683287),
+            (0.01020607365507, 0.483342697532047, 0.476493674683293),
+            (0.0299575541295919, 0.0102060736550684, 0.476493674683286),
+            (0.526759566994199, 0.236378033338292, 0.025424765116052),
+            (0.211437634551462, 0.526759566994189, 0.0254247651160508),
+            (0.236378033338299, 0.211437634551458, 0.0254247651160502),
+            (0.0045795557428785, 0.954618484866729, 0.017905866007425),
+            (0.0228960933829685, 0.00457955574287577, 0.0179058660074231),
+            (0.954618484866734, 0.0228960933829667, 0.0179058660074225),
+            (0.0256118593510931, 0.16333095462719, 0.115447871299236),
+            (0.695609314722481, 0.0256118593510928, 0.115447871299236),
+            (0.163330954627191, 0.695609314722476, 0.115447871299239),
+            (0.402881624628451, 0.446315518264942, 0.0261995607562526),
+            (0.124603296350356, 0.402881624628445, 0.0261995607562526),
+            (0.446315518264951, 0.124603296350348, 0.026199560756252),
+            (0.231647695217254, 0.507548605120255, 0.126623713234391),
+            (0.134179986428097, 0.231647695217251, 0.126623713234393),
+            (0.507548605120259, 0.134179986428095, 0.126623713234395),
+            (0.0343858276593476, 0.84303254607834, 0.0990866132622775),
+            (0.0234950130000349, 0.0343858276593468, 0.0990866132622733),
+            (0.843032546078344, 0.0234950130000358, 0.0990866132622727),
+            (0.027420024867733, 0.118317157542655, 0.701648904118847),
+            (0.152613913470765, 0.0274200248677316, 0.701648904118846),
+            (0.118317157542651, 0.152613913470766, 0.70164890411885),
+            (0.689839510369901, 0.0831251561121387, 0.0240810955367416),
+            (0.202954237981221, 0.689839510369895, 0.0240810955367423),
+            (0.0831251561121398, 0.20295423798122, 0.0240810955367423),
+            (0.367009893737499, 0.489109814726799, 0.11512444438173),
+            (0.0287558471539709, 0.367009893737501, 0.115124444381727),
+            (0.489109814726801, 0.0287558471539702, 0.115124444381729),
+            (0.00430783216071402, 0.744238507663164, 0.152343720516269),
+            (0.0991099396598517, 0.00430783216071219, 0.152343720516272),
+            (0.744238507663162, 0.0991099396598549, 0.152343720516271),
+            (0.117645344816038, 0.858904439184522, 0.0198161779595623),
+            (0.0036340380398754, 0.117645344816035, 0.0198161779595611),
+            (0.858904439184525, 0.00363403803987445, 0.0198161779595611),
+            (0.00355709537726904, 0.793988849912225, 0.0330547791775566),
+            (0.169399275532951, 0.00355709537726853, 0.0330547791775572),
+            (0.793988849912227, 0.169399275532948, 0.0330547791775572),
+            (0.290641762236923, 0.0021909123983451, 0.672266868777166),
+            (0.0349004565875677, 0.290641762236919, 0.672266868777173),
+            (0.00219091239833891, 0.0349004565875678, 0.672266868777167),
+            (0.0728291271168854, 0.692501417588048, 0.000524571221017625),
+            (0.234144884074049, 0.0728291271168831, 0.000524571221016401),
+            (0.692501417588051, 0.23414488407405, 0.000524571221014565),
+            (0.117684339714559, 0.117684339714556, 0.646946980856328),
+            (0.00533607701965166, 0.00533607701964373, 0.983991768941055),
+            (0.33249695997665, 0.332496959976636, 0.00250912007007451),
+            (0.305329584336061, 0.305329584336056, 0.0840112469918197),
+            (0.248212371556224, 0.248212371556229, 0.255362885331328),
+        ),
+        (
+            0.000347716882206747, 0.000347716882206762, 0.000347716882206595, 0.00104984618571289,
+            0.00104984618571292, 0.00104984618571296, 0.00218990865476049, 0.0021899086547604,
+            0.00218990865476035, 0.00143062584229013, 0.0014306258422901, 0.00143062584229007,
+            0.00258777979011139, 0.00258777979011114, 0.00258777979011088, 0.00046939308112214,
+            0.000469393081122119, 0.000469393081122183, 0.00198133086526867, 0.00198133086526874,
+            0.00198133086526871, 0.00122967281632228, 0.00122967281632218, 0.00122967281632213,
+            0.00130117266131188, 0.00130117266131205, 0.00130117266131203, 0.00325142680513292,
+            0.00325142680513294, 0.0032514268051328, 0.00281807848122357, 0.00281807848122326,
+            0.0028180784812234, 0.00144812622511859, 0.00144812622511871, 0.00144812622511867,
+            0.000521121787570755, 0.000521121787570737, 0.000521121787570744, 0.00128605263861694,
+            0.00128605263861695, 0.00128605263861694, 0.000525662267089361, 0.000525662267089492,
+            0.000525662267089409, 0.00152013101811932, 0.0015201310181193, 0.00152013101811934,
+            0.000527197863852778, 0.000527197863852785, 0.000527197863852737, 0.00313056307282158,
+            0.0031305630728215, 0.00313056307282157, 0.00192529672408034, 0.0019252967240803,
+            0.00192529672408035, 0.000888715359063222, 0.000888715359063243, 0.000888715359063133,
+            0.000556604527949476, 0.000556604527949537, 0.00055660452794953, 0.00195063892674594,
+            0.00195063892674587, 0.00195063892674588, 0.0014030871341773, 0.00140308713417735,
+            0.00140308713417738, 0.000700869070648374, 0.000700869070648404, 0.000700869070648516,
+            0.000536930072547806, 0.000536930072547865, 0.000536930072547847, 0.001856646795433,
+            0.00185664679543295, 0.00185664679543292, 8.42904799400505e-05, 8.42904799400373e-05,
+            8.4290479940035e-05, 0.00138596805891823, 0.00138596805891822, 0.00138596805891831,
+            0.00190993338236152, 0.00190993338236155, 0.00190993338236157, 0.00365870685474073,
+            0.0036587068547408, 0.00365870685474077, 0.000612956946352151, 0.000612956946352127,
+            0.00061295694635215, 0.00133343267067583, 0.00133343267067581, 0.00133343267067583,
+            0.00130775142572828, 0.00130775142572835, 0.00130775142572834, 0.00202612293640233,
+            0.00202612293640228, 0.00202612293640226, 0.00047266648548846, 0.000472666485488428,
+            0.000472666485488428, 0.000214909345361699, 0.000214909345361669, 0.000214909345361661,
+            0.000349388969417617, 0.000349388969417617, 0.000349388969417621, 0.000369510728130109,
+            0.000369510728130022, 0.000369510728129998, 0.000435807242934791, 0.000435807242934766,
+            0.000435807242934738, 0.00185099751221657, 3.33666570393405e-05, 0.000823825906947065,
+            0.00425285880021638, 0.00491749456299964,
+        ),
+    ),
+    13: (
+        (
+            (0.013371428943564, 0.818026162194412, 0.107457129743794),
+            (0.0611452791183259, 0.0133714289435259, 0.107457129743809),
+            (0.818026162194297, 0.0611452791182965, 0.107457129743849),
+            (0.0829145204330442, 0.400097929629891, 0.4641321089537),
+            (0.0528554409833557, 0.08291452043304, 0.464132108953597),
+            (0.400097929630127, 0.0528554409833097, 0.464132108953625),
+            (0.030670867576084, 0.486917892917434, 0.41644212779929),
+            (0.0659691117071546, 0.0306708675760624, 0.41644212779934),
+            (0.486917892917536, 0.0659691117071846, 0.416442127799194),
+            (0.0518298141536549, 0.168227625703714, 0.0127590379000878),
+            (0.767183522242568, 0.0518298141536327, 0.0127590379000584),
+            (0.168227625703764, 0.767183522242537, 0.0127590379000645),
+            (0.484774657158783, 0.0158306343508985, 0.018330570787562),
+            (0.481064137702813, 0.484774657158741, 0.0183305707875626),
+            (0.0158306343509015, 0.481064137702793, 0.0183305707875515),
+            (0.370442555958176, 0.212441759266561, 0.0106815230635503),
+            (0.406434161711828, 0.370442555958057, 0.0106815230635699),
+            (0.212441759266615, 0.406434161711731, 0.0106815230635699),
+            (0.287470635892888, 0.0178260609007785, 0.385617293714959),
+            (0.309086009491372, 0.287470635892881, 0.38561729371497),
+            (0.017826060900782, 0.30908600949137, 0.385617293714966),
+            (0.00960895234835522, 0.272077441542799, 0.217347346263903),
+            (0.500966259845028, 0.00960895234833775, 0.217347346263923),
+            (0.272077441542766, 0.500966259844967, 0.21734734626392),
+            (0.0788509969514413, 0.533327730920419, 0.16634216529448),
+            (0.221479106833696, 0.0788509969514029, 0.16634216529448),
+            (0.533327730920471, 0.221479106833624, 0.16634216529446),
+            (0.780025722472745, 0.16038086409574, 0.0414431673398119),
+            (0.0181502460917099, 0.780025722472704, 0.0414431673398045),
+            (0.160380864095821, 0.0181502460917111, 0.0414431673397763),
+            (0.276668775818295, 0.102430878922965, 0.402000548240723),
+            (0.218899797017987, 0.276668775818374, 0.402000548240724),
+            (0.102430878922911, 0.218899797017973, 0.402000548240698),
+            (0.0175623092363263, 0.48197145243094, 0.341432014866781),
+            (0.159034223465929, 0.0175623092363335, 0.341432014866806),
+            (0.481971452430908, 0.159034223465936, 0.341432014866819),
+            (0.0122725481672794, 0.661983417474541, 0.173645669158286),
+            (0.152098365199949, 0.012272548167264, 0.173645669158309),
+            (0.661983417474465, 0.152098365199895, 0.173645669158357),
+            (0.5438135338904, 0.0773186488433035, 0.196086175513052),
+            (0.182781641753255, 0.543813533890327, 0.196086175513082),
+            (0.0773186488433085, 0.182781641753172, 0.196086175513172),
+            (0.0863975719064644, 0.779622092897011, 0.0721728979421853),
+            (0.0618074372543111, 0.0863975719063821, 0.0721728979422067),
+            (0.779622092897153, 0.0618074372542841, 0.072172897942132),
+            (0.00891301236246709, 0.941281149352309, 0.0302368745109997),
+            (0.0195689637742392, 0.00891301236248347, 0.0302368745110071),
+            (0.941281149352236, 0.019568963774271, 0.0302368745110064),
+            (0.0289043635248353, 0.173580235845092, 0.357082484218002),
+            (0.440432916412, 0.0289043635248875, 0.357082484218023),
+            (0.173580235845064, 0.440432916412081, 0.357082484217992),
+            (0.0227008501117891, 0.0903518334035945, 0.865817656785225),
+            (0.0211296596993916, 0.0227008501117925, 0.865817656785194),
+            (0.0903518334034977, 0.02112965969938, 0.865817656785341),
+            (0.0214883127020706, 0.445169479233205, 0.212734909199721),
+            (0.320607298865048, 0.0214883127020671, 0.212734909199735),
+            (0.445169479233177, 0.320607298865013, 0.212734909199736),
+            (0.617486648324989, 0.0802385011622645, 0.0719578452270716),
+            (0.230317005285725, 0.617486648324915, 0.0719578452270637),
+            (0.0802385011623274, 0.230317005285633, 0.0719578452271304),
+            (0.0945288121975531, 0.659637499955212, 0.0706560126462563),
+            (0.175177675200956, 0.0945288121975157, 0.0706560126462949),
+            (0.659637499955318, 0.175177675200921, 0.0706560126462178),
+            (0.691284914660533, 0.282093867541703, 0.00589668853655636),
+            (0.0207245292612111, 0.691284914660524, 0.00589668853655086),
+            (0.282093867541785, 0.020724529261209, 0.00589668853653675),
+            (0.0175775419409821, 0.584552241935574, 0.0808011880664407),
+            (0.317069028057004, 0.0175775419409739, 0.0808011880664321),
+            (0.584552241935619, 0.317069028056945, 0.0808011880664639),
+            (0.358943001077193, 0.0966346181353642, 0.230580859444538),
+            (0.313841521342927, 0.358943001077144, 0.230580859444564),
+            (0.0966346181353584, 0.313841521342904, 0.230580859444533),
+            (0.0890256669907117, 0.547115266351136, 0.0252548503950358),
+            (0.3386042162631, 0.089025666990687, 0.0252548503950389),
+            (0.547115266351173, 0.338604216263121, 0.0252548503950499),
+            (0.349775871867066, 0.561185464162414, 0.0100132749524234),
+            (0.0790253890181476, 0.349775871866966, 0.0100132749524375),
+            (0.561185464162456, 0.0790253890181085, 0.0100132749524283),
+            (0.0336131453302365, 0.878818746835957, 0.00841215865842364),
+            (0.0791559491753922, 0.0336131453302445, 0.00841215865841508),
+            (0.87881874683591, 0.0791559491754356, 0.00841215865838873),
+            (0.0314518100476792, 0.810872665144813, 0.14652045906117),
+            (0.0111550657463499, 0.0314518100476595, 0.146520459061148),
+            (0.810872665144839, 0.0111550657463447, 0.146520459061166),
+            (0.156191534162669, 0.703560141816559, 0.128232413502758),
+            (0.012015910518012, 0.156191534162667, 0.128232413502748),
+            (0.703560141816627, 0.0120159105180016, 0.128232413502744),
+            (0.236242305861953, 0.532135976831517, 0.0306611166321087),
+            (0.200960600674485, 0.236242305861898, 0.0306611166321185),
+            (0.53213597683155, 0.200960600674406, 0.0306611166321387),
+            (0.390929607439404, 0.122749062866959, 0.0875638865524712),
+            (0.398757443141171, 0.390929607439354, 0.0875638865525011),
+            (0.122749062866968, 0.398757443141132, 0.0875638865525005),
+            (0.0776379207679784, 0.606895467300538, 0.305895247233166),
+            (0.00957136469831839, 0.0776379207679861, 0.305895247233132),
+            (0.606895467300527, 0.00957136469829901, 0.305895247233178),
+            (0.164569131215242, 0.0354595140750025, 0.538551546842193),
+            (0.261419807867527, 0.164569131215226, 0.538551546842231),
+            (0.0354595140750056, 0.261419807867579, 0.5385515468422),
+            (0.0654176689080234, 0.63847471898315, 0.220672862895764),
+            (0.075434749213081, 0.0654176689079866, 0.220672862895759),
+            (0.638474718983192, 0.0754347492130387, 0.22067286289572),
+            (0.100319853633252, 0.243413562240788, 0.590605933231053),
+            (0.0656606508949499, 0.100319853633265, 0.590605933231018),
+            (0.243413562240951, 0.0656606508949012, 0.590605933230827),
+            (0.0814557826085821, 0.884492068224789, 0.0254490039036401),
+            (0.00860314526297602, 0.081455782608604, 0.025449003903626),
+            (0.884492068224839, 0.00860314526296272, 0.0254490039036199),
+            (0.505432376991336, 0.0265723408459754, 0.096901871563156),
+            (0.371093410599567, 0.505432376991312, 0.0969018715631425),
+            (0.0265723408459749, 0.371093410599533, 0.0969018715631303),
+            (0.117142028395503, 0.0151571582474894, 0.737075571829331),
+            (0.130625241527677, 0.117142028395487, 0.737075571829356),
+            (0.015157158247513, 0.130625241527669, 0.737075571829337),
+            (0.110849502299599, 0.4002127949623, 0.326319710535485),
+            (0.162617992202608, 0.110849502299585, 0.326319710535487),
+            (0.400212794962304, 0.16261799220257, 0.326319710535522),
+            (0.0247742969059819, 0.446414699962637, 0.521328780953973),
+            (0.00748222217739222, 0.0247742969059783, 0.521328780953992),
+            (0.446414699962571, 0.00748222217740138, 0.521328780954065),
+            (0.206922362630268, 0.441805588880389, 0.140434894083911),
+            (0.210837154405425, 0.206922362630213, 0.140434894083957),
+            (0.441805588880393, 0.210837154405392, 0.14043489408396),
+            (0.00741446097725774, 0.268842851768175, 0.0282138124054504),
+            (0.695528874849135, 0.00741446097723568, 0.0282138124054632),
+            (0.268842851768176, 0.695528874849122, 0.028213812405462),
+            (0.0271249110341806, 0.235908125275048, 0.714803025662879),
+            (0.0221639380278989, 0.0271249110341817, 0.714803025662853),
+            (0.235908125274959, 0.0221639380279052, 0.714803025662953),
+            (0.00259416526518724, 0.341793074232021, 0.579768534585111),
+            (0.0758442259176827, 0.00259416526521036, 0.579768534585075),
+            (0.341793074232085, 0.0758442259176957, 0.579768534585002),
+            (0.120828704769109, 0.70864310892357, 0.00291446664138588),
+            (0.167613719665954, 0.120828704769109, 0.00291446664141036),
+            (0.708643108923496, 0.167613719666, 0.00291446664135648),
+            (0.00423850950551784, 0.660612504418027, 0.3059064193537),
+            (0.0292425667227536, 0.00423850950552483, 0.305906419353717),
+            (0.660612504417956, 0.0292425667227547, 0.305906419353755),
+            (0.137450394796745, 0.300649769447687, 0.560869397778206),
+            (0.00103043797737709, 0.137450394796727, 0.56086939777825),
+            (0.300649769447711, 0.00103043797733851, 0.560869397778215),
+            (0.0951170007290064, 0.0951170007288927, 0.714648997813214),
+            (0.0103451072565228, 0.0103451072565872, 0.968964678230291),
+            (0.309555018343096, 0.309555018343051, 0.0713349449707514),
+            (0.16686328704156, 0.166863287041671, 0.499410138875189),
+            (0.250558886939549, 0.250558886939582, 0.248323339181307),
+        ),
+        (
+            0.000355122590730197, 0.000355122590729773, 0.000355122590730102, 0.00117787438827569,
+            0.00117787438827672, 0.00117787438827386, 0.000814475858471621, 0.000814475858470378,
+            0.000814475858470226, 0.000453023783872946, 0.000453023783872361, 0.000453023783872437,
+            0.000415435229691715, 0.000415435229691505, 0.000415435229691703, 0.000931706441200221,
+            0.000931706441201159, 0.000931706441201039, 0.00126388507718553, 0.00126388507718567,
+            0.00126388507718574, 0.000793454804453154, 0.000793454804452631, 0.000793454804453006,
+            0.00191045836471949, 0.00191045836471885, 0.00191045836472014, 0.00051835735749529,
+            0.000518357357495405, 0.000518357357495327, 0.00257113625207803, 0.00257113625207729,
+            0.00257113625207782, 0.00112777042362736, 0.00112777042362779, 0.00112777042362776,
+            0.000773104946958153, 0.000773104946957443, 0.000773104946958139, 0.00212744665688283,
+            0.00212744665688412, 0.00212744665688324, 0.000921279112410639, 0.000921279112410236,
+            0.000921279112409964, 0.000108415327037175, 0.000108415327037362, 0.000108415327037518,
+            0.00152355843901176, 0.00152355843901458, 0.00152355843901324, 0.000371173748022568,
+            0.000371173748022627, 0.000371173748022264, 0.00138249522388977, 0.0013824952238897,
+            0.00138249522388994, 0.00155338808945736, 0.00155338808945773, 0.00155338808945882,
+            0.00157856195345324, 0.001578561953453, 0.00157856195345323, 0.000238534691571853,
+            0.000238534691571802, 0.000238534691571559, 0.000938800900399809, 0.000938800900399439,
+            0.000938800900399499, 0.00296168855545435, 0.00296168855545414, 0.00296168855545391,
+            0.00115585785731692, 0.00115585785731662, 0.00115585785731674, 0.000690462196069176,
+            0.000690462196069875, 0.0006904621960693, 0.000223475257978512, 0.000223475257978406,
+            0.000223475257978215, 0.000348065102024544, 0.00034806510202476, 0.000348065102024562,
+            0.000751737440499891, 0.000751737440499853, 0.000751737440499212, 0.00168021613929826,
+            0.00168021613929846, 0.00168021613929871, 0.00256011618791495, 0.00256011618791535,
+            0.00256011618791534, 0.000655090858734336, 0.000655090858734412, 0.000655090858733901,
+            0.00180873861279846, 0.00180873861279886, 0.00180873861279867, 0.00160977886828975,
+            0.00160977886828939, 0.00160977886828975, 0.00177645291290384, 0.00177645291290502,
+            0.00177645291290616, 0.000215162492826108, 0.000215162492825874, 0.000215162492825646,
+            0.00130986012194257, 0.00130986012194273, 0.00130986012194251, 0.000800262046369655,
+            0.000800262046369241, 0.00080026204637039, 0.00330336656820915, 0.00330336656820813,
+            0.00330336656820949, 0.000369144565833457, 0.000369144565833091, 0.000369144565833133,
+            0.00311676099511338, 0.00311676099511391, 0.00311676099511339, 0.00035608395080397,
+            0.000356083950803674, 0.000356083950803747, 0.000661923529819911, 0.000661923529820049,
+            0.00066192352982044, 0.000402131228691471, 0.000402131228691888, 0.000402131228692274,
+            0.000426698597925255, 0.000426698597925759, 0.000426698597924656, 0.000336131664248088,
+            0.000336131664248137, 0.000336131664248356, 0.000534172706193964, 0.000534172706194436,
+            0.000534172706193335, 0.00143856507984606, 4.13432445861467e-05, 0.00283428043724523,
+            0.00234002278061759, 0.00430394076989728,
+        ),
+    ),
+    14: (
+        (
+            (0.0716238048007973, 0.21536932251428, 0.0661407842999458),
+            (0.646866088384849, 0.0716238048001564, 0.0661407842993249),
+            (0.215369322515079, 0.646866088384544, 0.0661407842992802),
+            (0.240326325974372, 0.0840031187301689, 0.10503653090557),
+            (0.570634024389719, 0.240326325971861, 0.105036530908253),
+            (0.0840031187298654, 0.570634024389941, 0.105036530907377),
+            (0.0145553762630799, 0.722007497840839, 0.243111580834535),
+            (0.0203255450614076, 0.0145553762634444, 0.243111580835629),
+            (0.722007497840107, 0.0203255450614587, 0.243111580835371),
+            (0.012529059808041, 0.54975956322041, 0.121940646122286),
+            (0.315770730850069, 0.0125290598081036, 0.121940646121559),
+            (0.549759563218567, 0.315770730851296, 0.121940646122027),
+            (0.384562096865036, 0.517513525717231, 0.0129463331518484),
+            (0.0849780442656663, 0.384562096864772, 0.0129463331518912),
+            (0.517513525717932, 0.0849780442659304, 0.0129463331516059),
+            (0.358544527163581, 0.167752470281799, 0.346556326285293),
+            (0.127146676269758, 0.358544527164529, 0.346556326284038),
+            (0.167752470283245, 0.127146676269092, 0.3465563262838),
+            (0.224732675518662, 0.653388018866312, 0.0169926270656682),
+            (0.104886678548849, 0.224732675518587, 0.0169926270659982),
+            (0.653388018866976, 0.10488667854954, 0.0169926270658286),
+            (0.0892356846875985, 0.306404774778961, 0.0928171540005135),
+            (0.511542386532909, 0.0892356846886177, 0.0928171539998075),
+            (0.306404774778727, 0.511542386532587, 0.0928171540004167),
+            (0.00729435538130417, 0.540479768065727, 0.245376315222932),
+            (0.206849561330101, 0.00729435538155165, 0.245376315221688),
+            (0.540479768065415, 0.20684956133125, 0.24537631522196),
+            (0.0973720336353291, 0.308984692817387, 0.492908872135997),
+            (0.100734401412185, 0.0973720336363444, 0.492908872132838),
+            (0.308984692817731, 0.100734401410623, 0.492908872136955),
+            (0.399013906227181, 0.00924736361783252, 0.582903743612111),
+            (0.00883498654301948, 0.399013906225403, 0.58290374361367),
+            (0.009247363618204, 0.00883498654308645, 0.582903743616869),
+            (0.0215208255345608, 0.583278015992227, 0.379120808460464),
+            (0.0160803500126917, 0.0215208255345079, 0.379120808464382),
+            (0.583278015993719, 0.0160803500131377, 0.379120808458791),
+            (0.0688331739588598, 0.898965060538575, 0.0144676216404636),
+            (0.0177341438621546, 0.0688331739583353, 0.0144676216406485),
+            (0.898965060538664, 0.0177341438623078, 0.0144676216402168),
+            (0.0027476239716157, 0.384645703607397, 0.276455708804184),
+            (0.336150963616514, 0.00274762397135517, 0.276455708803799),
+            (0.384645703604847, 0.336150963618088, 0.27645570880599),
+            (0.530397783966068, 0.227356386877528, 0.00856896690510551),
+            (0.233676862250729, 0.530397783966474, 0.0085689669051355),
+            (0.227356386876841, 0.233676862250474, 0.00856896690519614),
+            (0.473082394578608, 0.376181813691294, 0.0723615512045186),
+            (0.0783742405257317, 0.473082394578429, 0.0723615512046557),
+            (0.376181813693192, 0.0783742405253043, 0.0723615512049001),
+            (0.552218210434529, 0.350859996445968, 0.00493132522606714),
+            (0.0919904678936557, 0.552218210434273, 0.00493132522642724),
+            (0.350859996445082, 0.0919904678930438, 0.00493132522695203),
+            (0.661298203678224, 0.0134111646469711, 0.0960128293407927),
+            (0.229277802333868, 0.661298203678323, 0.0960128293406574),
+            (0.0134111646470756, 0.229277802334997, 0.0960128293404185),
+            (0.0222896364443384, 0.834383890577588, 0.124280339121779),
+            (0.0190461338562967, 0.0222896364443877, 0.124280339120884),
+            (0.83438389057594, 0.019046133856306, 0.124280339123369),
+            (0.00766750793953513, 0.261259669495948, 0.430441339819085),
+            (0.300631482744546, 0.00766750793968274, 0.430441339819725),
+            (0.261259669495217, 0.300631482744768, 0.430441339820285),
+            (0.216006544345622, 0.0623040467790808, 0.214511628108885),
+            (0.507177780764677, 0.216006544346219, 0.214511628110329),
+            (0.0623040467788092, 0.507177780765179, 0.214511628109916),
+            (0.394299156898155, 0.473925854915257, 0.114533594128679),
+            (0.0172413940579185, 0.394299156900111, 0.114533594128509),
+            (0.473925854914619, 0.0172413940579387, 0.114533594128916),
+            (0.0188309925640213, 0.0796873305615781, 0.881916327466509),
+            (0.0195653494076861, 0.018830992563699, 0.881916327468806),
+            (0.0796873305625426, 0.0195653494079892, 0.881916327465425),
+            (0.0197499513461521, 0.098577040799585, 0.0758618120329567),
+            (0.805811195822628, 0.0197499513461392, 0.0758618120323107),
+            (0.0985770407990897, 0.805811195821979, 0.0758618120327289),
+            (0.0195229126276658, 0.770990022926281, 0.0101562087925883),
+            (0.199330855653668, 0.0195229126276985, 0.0101562087926593),
+            (0.77099002292622, 0.199330855653424, 0.0101562087927047),
+            (0.178343490613546, 0.452648871995361, 0.21415536427039),
+            (0.15485227311972, 0.178343490613104, 0.21415536427179),
+            (0.452648871994808, 0.154852273120587, 0.214155364270965),
+            (0.0460496575093692, 0.0407593267408239, 0.516322768208848),
+            (0.396868247541765, 0.0460496575090222, 0.516322768209083),
+            (0.0407593267406208, 0.39686824754113, 0.516322768209267),
+            (0.0541112613089666, 0.2056632530542, 0.206114517270472),
+            (0.534110968365748, 0.054111261309288, 0.206114517269766),
+            (0.205663253054063, 0.534110968366232, 0.206114517270704),
+            (0.650210097913948, 0.223533146236679, 0.0264215941749921),
+            (0.0998351616742985, 0.650210097915271, 0.026421594174907),
+            (0.223533146235424, 0.0998351616745544, 0.0264215941747992),
+            (0.0771453147297705, 0.071365091252099, 0.658252879686536),
+            (0.193236714328253, 0.0771453147294131, 0.658252879690726),
+            (0.0713650912511827, 0.193236714329183, 0.65825287968999),
+            (0.019406750685966, 0.7061532545902, 0.0754366247922551),
+            (0.199003369931178, 0.0194067506859868, 0.0754366247922416),
+            (0.706153254589724, 0.199003369931599, 0.0754366247926758),
+            (0.0940950006430409, 0.787767898624377, 0.0193107884933717),
+            (0.0988263122394027, 0.0940950006428947, 0.0193107884933748),
+            (0.787767898624153, 0.0988263122397103, 0.0193107884933742),
+            (0.203923191200666, 0.761555055760951, 0.0144005374203603),
+            (0.0201212156180305, 0.203923191200236, 0.0144005374203021),
+            (0.76155505576108, 0.0201212156180453, 0.0144005374202973),
+            (0.046375777617011, 0.350261451517994, 0.241238715357575),
+            (0.362124055506635, 0.0463757776170433, 0.241238715357848),
+            (0.35026145151815, 0.362124055507801, 0.241238715357409),
+            (0.0383054671100451, 0.161004565613499, 0.38636881567317),
+            (0.414321151603789, 0.0383054671097919, 0.38636881567304),
+            (0.161004565613873, 0.414321151602714, 0.386368815673321),
+            (0.285151067515758, 0.0970412542592, 0.363985089583656),
+            (0.25382258864259, 0.285151067515384, 0.363985089582452),
+            (0.0970412542593522, 0.253822588642379, 0.363985089583363),
+            (0.101440509622378, 0.01877419874738, 0.184304953149283),
+            (0.695480338480568, 0.101440509622356, 0.184304953149556),
+            (0.0187741987475053, 0.695480338480578, 0.184304953149368),
+            (0.675694927668797, 0.0182320377168822, 0.210284481894713),
+            (0.0957885527190889, 0.675694927669442, 0.21028448189463),
+            (0.0182320377167812, 0.0957885527196004, 0.21028448189458),
+            (0.293548850577753, 0.00820980056996953, 0.600621351466888),
+            (0.0976199973853832, 0.293548850577034, 0.600621351467699),
+            (0.00820980056996778, 0.0976199973850211, 0.600621351466928),
+            (0.503544547262571, 0.207677080283025, 0.079081518682363),
+            (0.209696853771787, 0.503544547262585, 0.079081518682243),
+            (0.207677080282593, 0.209696853771923, 0.0790815186829546),
+            (0.382300946491867, 0.578344735427168, 0.0225554241212269),
+            (0.0167988939596846, 0.382300946491731, 0.0225554241211662),
+            (0.578344735427275, 0.0167988939597069, 0.0225554241212667),
+            (0.0193223727481763, 0.847905447599425, 0.0563838544470134),
+            (0.0763883252052794, 0.0193223727481832, 0.0563838544473551),
+            (0.847905447600313, 0.0763883252049607, 0.0563838544466196),
+            (0.111455158338512, 0.11548607976973, 0.762756409274305),
+            (0.0103023526168254, 0.111455158338697, 0.762756409274348),
+            (0.115486079770071, 0.0103023526170701, 0.762756409274021),
+            (0.17754788331361, 0.0294603567291927, 0.403024150799614),
+            (0.389967609156404, 0.177547883314335, 0.403024150800095),
+            (0.0294603567291844, 0.389967609156757, 0.403024150800324),
+            (0.0382221895288287, 0.195522193757886, 0.562855207221547),
+            (0.203400409491504, 0.0382221895291047, 0.562855207221458),
+            (0.195522193757697, 0.2034004094916, 0.562855207221453),
+            (0.0174828789609679, 0.580195762401336, 0.0230457271156523),
+            (0.379275631522244, 0.0174828789608984, 0.0230457271156303),
+            (0.580195762401411, 0.379275631522015, 0.0230457271156327),
+            (0.00411013141124852, 0.0912071842858757, 0.398990492863493),
+            (0.505692191439168, 0.00411013141151736, 0.398990492865036),
+            (0.0912071842855746, 0.505692191438336, 0.398990492864471),
+            (0.952659191058426, 0.00478884476429822, 0.0332996103306337),
+            (0.00925235384642661, 0.952659191059027, 0.0332996103302411),
+            (0.00478884476393093, 0.00925235384606446, 0.0332996103300427),
+            (0.391993350183891, 0.385980189187548, 0.0306082825276456),
+            (0.191418178100784, 0.391993350183357, 0.0306082825277234),
+            (0.385980189186922, 0.191418178100992, 0.0306082825276407),
+            (0.0679470990326355, 0.547935626185202, 0.303613592364941),
+            (0.0805036824168603, 0.0679470990322548, 0.303613592365006),
+            (0.547935626184952, 0.0805036824174767, 0.303613592364535),
+            (0.332296083385487, 0.153806036080323, 0.164432709777014),
+            (0.349465170756816, 0.332296083385749, 0.164432709777204),
+            (0.153806036080343, 0.34946517075658, 0.164432709777114),
+            (0.101517159170244, 0.680146917763508, 0.116272488104425),
+            (0.102063434961844, 0.101517159169978, 0.11627248810455),
+            (0.680146917763664, 0.102063434961655, 0.11627248810427),
+            (0.104034774509157, 0.00560141769488315, 0.602941331965744),
+            (0.287422475829685, 0.104034774509461, 0.602941331966148),
+            (0.00560141769466369, 0.287422475830375, 0.602941331965925),
+            (0.212942537145956, 0.0220692941586693, 0.743707421056966),
+            (0.0212807476383707, 0.212942537144676, 0.743707421058246),
+            (0.0220692941588894, 0.0212807476385624, 0.743707421060142),
+            (0.0132755319408291, 0.923299965157476, 0.00201005864911609),
+            (0.0614144442527852, 0.0132755319407076, 0.00201005864980989),
+            (0.923299965158544, 0.0614144442524977, 0.00201005864838737),
+            (0.0840088766143168, 0.00323980932956963, 0.386296150270937),
+            (0.526455163784271, 0.0840088766149804, 0.38629615027056),
+            (0.00323980932993692, 0.526455163784847, 0.386296150271221),
+            (0.234940612488403, 0.51564396354686, 0.247491278386732),
+            (0.00192414557825688, 0.234940612489976, 0.24749127838584),
+            (0.515643963545392, 0.00192414557823027, 0.247491278387476),
+            (0.302918119329376, 0.302918119329301, 0.0912456420123426),
+            (0.00685770368146077, 0.00685770368096011, 0.979426888957841),
+            (0.165887520255045, 0.165887520255092, 0.502337439235168),
+            (0.0778159231681737, 0.077815923168826, 0.766552230491879),
+            (0.33172395261399, 0.331723952615002, 0.00482814215598708),
+            (0.24322103194167, 0.243221031941515, 0.270336904174709),
+        ),
+        (
+            0.000720031112913155, 0.000720031112915738, 0.000720031112920658, 0.0011166085861902,
+            0.00111660858618896, 0.00111660858618454, 0.000259506187261259, 0.000259506187271861,
+            0.000259506187255337, 0.000613929670049347, 0.000613929670052711, 0.00061392967005407,
+            0.000579078825377455, 0.000579078825377983, 0.000579078825374612, 0.00184827051921223,
+            0.00184827051921533, 0.00184827051919827, 0.00064521156282136, 0.000645211562828702,
+            0.000645211562824943, 0.00142509188144315, 0.00142509188143405, 0.00142509188144633,
+            0.000505119620061448, 0.000505119620066688, 0.000505119620066997, 0.00151797793529333,
+            0.00151797793528503, 0.00151797793529448, 0.000167511052504023, 0.000167511052505897,
+            0.00016751105250895, 0.000344118815078893, 0.000344118815077656, 0.000344118815079639,
+            0.000166425155970553, 0.000166425155972615, 0.000166425155969555, 0.00033555287854752,
+            0.000335552878545443, 0.000335552878538353, 0.000633695346548281, 0.000633695346547891,
+            0.000633695346550302, 0.00136816631991585, 0.00136816631990722, 0.0013681663198939,
+            0.000339722531788545, 0.000339722531798349, 0.000339722531806725, 0.000634879019907674,
+            0.000634879019912238, 0.000634879019910352, 0.00028962346741147, 0.000289623467412124,
+            0.000289623467414298, 0.00065831086309692, 0.000658310863103026, 0.000658310863097794,
+            0.00174438323903163, 0.00174438323901998, 0.00174438323902718, 0.000904068216443267,
+            0.000904068216445615, 0.000904068216448499, 0.000262350856778439, 0.000262350856771837,
+            0.000262350856780621, 0.000511927282581139, 0.000511927282580741, 0.000511927282580447,
+            0.000251730549083688, 0.000251730549084934, 0.000251730549085242, 0.00250786570237871,
+            0.00250786570237947, 0.00250786570238695, 0.000954543630631291, 0.00095454363062003,
+            0.000954543630626891, 0.00167390023674491, 0.00167390023675842, 0.00167390023675795,
+            0.00091016488188182, 0.00091016488187414, 0.000910164881863647, 0.00122491690704115,
+            0.00122491690703488, 0.00122491690703484, 0.000680212590102381, 0.000680212590102055,
+            0.000680212590109286, 0.000604003424044969, 0.000604003424045938, 0.00060400342404584,
+            0.000327932689101103, 0.000327932689100437, 0.000327932689100458, 0.00191279023267428,
+            0.0019127902326829, 0.00191279023267536, 0.00160302645492624, 0.00160302645491984,
+            0.00160302645492198, 0.0024502975742324, 0.00245029757423934, 0.00245029757424629,
+            0.000807655469932782, 0.000807655469943326, 0.000807655469940986, 0.000821835135767157,
+            0.000821835135760645, 0.000821835135760097, 0.000577393240794584, 0.00057739324079175,
+            0.000577393240793467, 0.00220492904019759, 0.00220492904019696, 0.0022049290402085,
+            0.000472513744109698, 0.000472513744107538, 0.000472513744109679, 0.000436823849034062,
+            0.000436823849030258, 0.000436823849035619, 0.000523973759579743, 0.000523973759564208,
+            0.000523973759571332, 0.00152176985549029, 0.00152176985548511, 0.00152176985548926,
+            0.00154999254095989, 0.00154999254095941, 0.00154999254096108, 0.000513427407599624,
+            0.000513427407596769, 0.0005134274075983, 0.000379540378060186, 0.000379540378064084,
+            0.000379540378068704, 5.10403786354303e-05, 5.10403786342037e-05, 5.10403786319347e-05,
+            0.00157445661700822, 0.00157445661700819, 0.00157445661701097, 0.0016792656914285,
+            0.00167926569142439, 0.0016792656914316, 0.0029834456580178, 0.00298344565801924,
+            0.00298344565801934, 0.00167642837131837, 0.00167642837131832, 0.00167642837131997,
+            0.00051583716490033, 0.000515837164896778, 0.000515837164893621, 0.000478075850519566,
+            0.000478075850518576, 0.000478075850524332, 6.44253894862882e-05, 6.4425389488643e-05,
+            6.44253894828939e-05, 0.00037611053899941, 0.000376110539012671, 0.000376110539006709,
+            0.000434443759296111, 0.000434443759303334, 0.000434443759304937, 0.0024815884502454,
+            2.2105078592572e-05, 0.00270321173084177, 0.000793287232567707, 0.000479325475605318,
+            0.00317815971815885,
+        ),
+    ),
+    15: (
+        (
+            (0.267805847317026, 0.402153395912455, 0.320387028932336),
+            (0.00965372783817751, 0.267805847317044, 0.320387028932319),
+            (0.402153395912491, 0.00965372783817807, 0.320387028932303),
+            (0.267326785868425, 0.477411856648227, 0.162728234374927),
+            (0.0925331231083883, 0.267326785868413, 0.162728234374953),
+            (0.477411856648248, 0.0925331231084193, 0.162728234374932),
+            (0.255795941906351, 0.208457799408109, 0.0113344782305251),
+            (0.52441178045503, 0.255795941906343, 0.0113344782305275),
+            (0.208457799408117, 0.524411780455004, 0.0113344782305239),
+            (0.0731393403677088, 0.154374253798279, 0.704703873882069),
+            (0.0677825319519276, 0.0731393403677068, 0.704703873882079),
+            (0.15437425379826, 0.067782531951944, 0.704703873882076),
+            (0.0476594460606897, 0.0151184354245822, 0.0750995589695264),
+            (0.862122559545204, 0.0476594460606902, 0.075099558969524),
+            (0.015118435424583, 0.862122559545201, 0.075099558969532),
+            (0.235285750794224, 0.74269158348725, 0.0116727591178494),
+            (0.0103499066006745, 0.235285750794233, 0.0116727591178433),
+            (0.742691583487255, 0.0103499066006715, 0.0116727591178464),
+            (0.00882912276839026, 0.0718595893919928, 0.363125126637097),
+            (0.556186161202529, 0.00882912276839642, 0.363125126637092),
+            (0.071859589391979, 0.556186161202537, 0.363125126637095),
+            (0.0484857732603446, 0.273898899050255, 0.605341640005943),
+            (0.0722736876834418, 0.0484857732603445, 0.605341640005955),
+            (0.273898899050245, 0.0722736876834459, 0.60534164000596),
+            (0.451058467949059, 0.0136722640125435, 0.0102920818969312),
+            (0.524977186141473, 0.451058467949049, 0.0102920818969337),
+            (0.0136722640125398, 0.52497718614148, 0.0102920818969294),
+            (0.00940743474102826, 0.18566957142053, 0.498715106027506),
+            (0.306207887810909, 0.00940743474103237, 0.49871510602753),
+            (0.185669571420528, 0.306207887810928, 0.498715106027515),
+            (0.00909794171229086, 0.371858381761708, 0.605704636558363),
+            (0.0133390399676399, 0.00909794171229436, 0.605704636558364),
+            (0.3718583817617, 0.0133390399676394, 0.605704636558374),
+            (0.0290441392868165, 0.00884804648943732, 0.937266061300961),
+            (0.0248417529227802, 0.0290441392868121, 0.937266061300955),
+            (0.00884804648943321, 0.0248417529227844, 0.937266061300961),
+            (0.0148809324152256, 0.770601840442029, 0.145750781988841),
+            (0.0687664451539022, 0.0148809324152253, 0.145750781988846),
+            (0.770601840442021, 0.0687664451539044, 0.145750781988849),
+            (0.068829388779572, 0.666734932699803, 0.232066567804036),
+            (0.0323691107165825, 0.0688293887795737, 0.232066567804036),
+            (0.666734932699818, 0.032369110716585, 0.23206656780404),
+            (0.343030573977829, 0.0910900179584052, 0.235433868754166),
+            (0.330445539309592, 0.343030573977809, 0.235433868754169),
+            (0.0910900179584174, 0.330445539309609, 0.235433868754155),
+            (0.382826132321645, 0.225555068788837, 0.0126442918856654),
+            (0.378974507003853, 0.382826132321636, 0.012644291885666),
+            (0.225555068788825, 0.378974507003849, 0.0126442918856678),
+            (0.333784772736308, 0.175288263255126, 0.15365688986232),
+            (0.337270074146264, 0.333784772736311, 0.1536568898623),
+            (0.175288263255117, 0.337270074146239, 0.1536568898623),
+            (0.423660805665255, 0.0160230796339643, 0.189701660181996),
+            (0.370614454518775, 0.42366080566525, 0.18970166018201),
+            (0.0160230796339624, 0.370614454518771, 0.189701660182),
+            (0.128608112153654, 0.302386926524839, 0.506936134632715),
+            (0.0620688266887797, 0.12860811215365, 0.506936134632725),
+            (0.302386926524842, 0.0620688266887944, 0.506936134632728),
+            (0.0137104510586181, 0.451820102412816, 0.354024102363695),
+            (0.180445344164867, 0.0137104510586193, 0.354024102363681),
+            (0.451820102412822, 0.180445344164869, 0.354024102363693),
+            (0.109575547548148, 0.0127714803610068, 0.863012752765893),
+            (0.0146402193249516, 0.109575547548146, 0.863012752765899),
+            (0.0127714803610069, 0.0146402193249543, 0.863012752765899),
+            (0.298238620313726, 0.0241862526630114, 0.328276689484856),
+            (0.349298437538428, 0.298238620313714, 0.328276689484844),
+            (0.0241862526630167, 0.349298437538417, 0.328276689484834),
+            (0.172551366066798, 0.343066772448071, 0.291028042550599),
+            (0.193353818934539, 0.172551366066847, 0.291028042550647),
+            (0.343066772448103, 0.193353818934486, 0.291028042550592),
+            (0.452269887306733, 0.0219855041555484, 0.365652845101929),
+            (0.160091763435773, 0.452269887306771, 0.365652845101903),
+            (0.0219855041555533, 0.160091763435806, 0.365652845101891),
+            (0.195597672240866, 0.0161066476285062, 0.504888949609758),
+            (0.283406730520856, 0.19559767224087, 0.504888949609769),
+            (0.0161066476285064, 0.283406730520853, 0.504888949609762),
+            (0.172112737761709, 0.473859783075318, 0.162468866833266),
+            (0.191558612329691, 0.172112737761722, 0.162468866833286),
+            (0.47385978307533, 0.191558612329699, 0.162468866833269),
+            (0.0113254032838463, 0.608123092139794, 0.296091788088397),
+            (0.0844597164879614, 0.0113254032838497, 0.296091788088401),
+            (0.608123092139788, 0.0844597164879628, 0.2960917880884),
+            (0.083645286104761, 0.172764400522924, 0.28369432202267),
+            (0.459895991349659, 0.0836452861047331, 0.283694322022679),
+            (0.17276440052292, 0.45989599134965, 0.28369432202267),
+            (0.146884718449437, 0.649951635549552, 0.0182999648331872),
+            (0.184863681167814, 0.146884718449427, 0.0182999648331872),
+            (0.649951635549572, 0.184863681167803, 0.0182999648331872),
+            (0.016510934311897, 0.741516029707965, 0.228212657161731),
+            (0.0137603788184071, 0.0165109343118983, 0.22821265716174),
+            (0.741516029707968, 0.0137603788184043, 0.228212657161732),
+            (0.642534016257412, 0.149498332264701, 0.177734249077034),
+            (0.0302334024008537, 0.642534016257424, 0.17773424907704),
+            (0.149498332264693, 0.0302334024008515, 0.17773424907704),
+            (0.0493519007432764, 0.486998239792346, 0.149725236712158),
+            (0.31392462275222, 0.0493519007432854, 0.149725236712157),
+            (0.486998239792331, 0.313924622752226, 0.149725236712162),
+            (0.0862424016770104, 0.328874443626288, 0.432331128508379),
+            (0.152552026188312, 0.0862424016770116, 0.432331128508386),
+            (0.328874443626274, 0.152552026188339, 0.432331128508377),
+            (0.0135684748258194, 0.559647144007178, 0.409015522247993),
+            (0.0177688589190095, 0.0135684748258198, 0.409015522247997),
+            (0.559647144007177, 0.0177688589190101, 0.409015522247994),
+            (0.289852700316415, 0.0851402862219276, 0.38910094543047),
+            (0.235906068031189, 0.289852700316443, 0.389100945430451),
+            (0.0851402862219273, 0.23590606803119, 0.38910094543046),
+            (0.194821777558372, 0.632408604110489, 0.0797649834727109),
+            (0.0930046348584222, 0.194821777558361, 0.079764983472728),
+            (0.632408604110494, 0.0930046348584268, 0.0797649834727115),
+            (0.195894463180211, 0.716898888020733, 0.0158635157491921),
+            (0.0713431330498588, 0.19589446318021, 0.0158635157491958),
+            (0.716898888020737, 0.0713431330498538, 0.0158635157491915),
+            (0.0122514981411778, 0.85813195995647, 0.0188057482031822),
+            (0.11081079369917, 0.0122514981411757, 0.0188057482031809),
+            (0.858131959956473, 0.110810793699169, 0.0188057482031803),
+            (0.0134395201221561, 0.720864489405751, 0.0767176683216291),
+            (0.188978322150464, 0.0134395201221535, 0.0767176683216285),
+            (0.720864489405759, 0.18897832215046, 0.0767176683216254),
+            (0.0787740768184683, 0.0187195076655648, 0.817464709540279),
+            (0.0850417059756909, 0.078774076818469, 0.817464709540276),
+            (0.0187195076655652, 0.0850417059756929, 0.817464709540278),
+            (0.00783983320806736, 0.100724525378687, 0.681257697378422),
+            (0.21017794403482, 0.00783983320807366, 0.68125769737842),
+            (0.100724525378693, 0.210177944034819, 0.681257697378414),
+            (0.0149909317108765, 0.40317650797845, 0.502106631164005),
+            (0.0797259291466702, 0.0149909317108774, 0.502106631164002),
+            (0.403176507978447, 0.0797259291466685, 0.502106631164005),
+            (0.0698898746008776, 0.479624556176078, 0.257293140079446),
+            (0.193192429143604, 0.0698898746008939, 0.257293140079458),
+            (0.479624556176067, 0.193192429143603, 0.257293140079451),
+            (0.22389067731113, 0.561348432347315, 0.189835104483064),
+            (0.0249257858584866, 0.223890677311116, 0.189835104483061),
+            (0.561348432347325, 0.0249257858584885, 0.189835104483052),
+            (0.108352902538992, 0.629185887095386, 0.17589822412858),
+            (0.086562986237041, 0.108352902538975, 0.175898224128594),
+            (0.629185887095383, 0.0865629862370393, 0.175898224128595),
+            (0.140296415952602, 0.449849274559982, 0.068105587551874),
+            (0.341748721935546, 0.140296415952606, 0.068105587551874),
+            (0.449849274559965, 0.341748721935557, 0.0681055875518764),
+            (0.16525047454901, 0.0509087234595361, 0.606894649086132),
+            (0.176946152905315, 0.165250474549021, 0.60689464908612),
+            (0.0509087234595319, 0.176946152905304, 0.606894649086141),
+            (0.26055902569048, 0.481985201364133, 0.0651935573644126),
+            (0.192262215580967, 0.260559025690468, 0.0651935573644145),
+            (0.481985201364128, 0.19226221558098, 0.0651935573644163),
+            (0.112643597753789, 0.331408497762104, 0.0134868064234793),
+            (0.542461098060611, 0.112643597753794, 0.0134868064234806),
+            (0.331408497762118, 0.542461098060611, 0.01348680642348),
+            (0.7059180690514, 0.22896225807556, 0.0170323187293365),
+            (0.048087354143702, 0.705918069051398, 0.0170323187293371),
+            (0.228962258075567, 0.0480873541436898, 0.0170323187293371),
+            (0.0158826143750248, 0.0651912939675188, 0.532580403618771),
+            (0.386345688038688, 0.0158826143750233, 0.532580403618781),
+            (0.0651912939675148, 0.386345688038682, 0.532580403618777),
+            (0.0915568727490534, 0.610756489884835, 0.0868292128362023),
+            (0.21085742452991, 0.0915568727490544, 0.0868292128362066),
+            (0.610756489884832, 0.210857424529914, 0.0868292128361998),
+            (0.376653215624741, 0.0810520623738858, 0.0151894508664419),
+            (0.527105271134929, 0.376653215624739, 0.0151894508664425),
+            (0.0810520623738842, 0.527105271134923, 0.0151894508664419),
+            (0.215420862140539, 0.688797160634863, 0.0779441205594219),
+            (0.0178378566651732, 0.21542086214055, 0.0779441205594128),
+            (0.688797160634867, 0.0178378566651758, 0.077944120559417),
+            (0.0670060501118294, 0.495650718185935, 0.362874044201664),
+            (0.0744691875005655, 0.0670060501118349, 0.362874044201665),
+            (0.49565071818592, 0.0744691875005779, 0.362874044201664),
+            (0.0215355664446811, 0.222146433641716, 0.736831906669808),
+            (0.0194860932437939, 0.0215355664446781, 0.73683190666982),
+            (0.222146433641712, 0.0194860932437949, 0.736831906669812),
+            (0.089466287453629, 0.783190190804705, 0.109398094390016),
+            (0.0179454273516508, 0.0894662874536357, 0.109398094390016),
+            (0.783190190804698, 0.0179454273516488, 0.109398094390021),
+            (0.586686678533797, 0.0241059655532889, 0.0192045879174373),
+            (0.370002767995478, 0.5866866785338, 0.0192045879174361),
+            (0.0241059655532883, 0.370002767995488, 0.0192045879174379),
+            (0.494791505465874, 0.0586261448900714, 0.0797762381765806),
+            (0.366806111467477, 0.494791505465885, 0.0797762381765775),
+            (0.0586261448900775, 0.366806111467468, 0.0797762381765806),
+            (0.0739439684097597, 0.775446737784912, 0.0608872016505132),
+            (0.0897220921548167, 0.0739439684097538, 0.0608872016505138),
+            (0.775446737784909, 0.0897220921548126, 0.0608872016505193),
+            (0.0199121066091268, 0.943379208507337, 0.0160859786513149),
+            (0.0206227062322205, 0.0199121066091265, 0.0160859786513155),
+            (0.943379208507339, 0.0206227062322205, 0.0160859786513136),
+            (0.0745911424654964, 0.827877848865186, 0.00411031172598632),
+            (0.0934206969433273, 0.0745911424654926, 0.0041103117259857),
+            (0.827877848865184, 0.0934206969433279, 0.00411031172598941),
+            (0.0190977327148691, 0.560793513977681, 0.0634892906576508),
+            (0.356619462649796, 0.0190977327148681, 0.0634892906576538),
+            (0.560793513977684, 0.35661946264979, 0.0634892906576575),
+            (0.635837625185532, 0.00192202346444373, 0.226082229966677),
+            (0.13615812138335, 0.635837625185554, 0.226082229966662),
+            (0.00192202346443365, 0.136158121383348, 0.226082229966665),
+            (0.86030781907455, 0.0172018730067492, 0.0218233687948385),
+            (0.100666939123863, 0.860307819074551, 0.0218233687948373),
+            (0.0172018730067486, 0.100666939123864, 0.0218233687948379),
+            (0.00316346535220153, 0.019416855254406, 0.0922534713374789),
+            (0.885166208055921, 0.00316346535220329, 0.0922534713374703),
+            (0.0194168552544043, 0.885166208055927, 0.0922534713374722),
+            (0.709847918239123, 0.279251760813055, 0.00782663616837439),
+            (0.0030736847794467, 0.709847918239126, 0.00782663616837439),
+            (0.279251760813076, 0.00307368477943658, 0.0078266361683695),
+            (0.00300915267100105, 0.213749749548486, 0.688367350645103),
+            (0.0948737471354112, 0.00300915267100163, 0.688367350645104),
+            (0.213749749548485, 0.0948737471354105, 0.688367350645095),
+            (0.541644794758494, 0.263214069283374, 0.19400964245214),
+            (0.00113149350599209, 0.541644794758496, 0.19400964245214),
+            (0.263214069283379, 0.00113149350599961, 0.19400964245214),
+            (0.528723493573472, 1.42801265834783e-06, 0.0883575261899216),
+            (0.38291755222395, 0.52872349357347, 0.0883575261899277),
+            (1.42801266309056e-06, 0.382917552223954, 0.0883575261899241),
+            (0.311317746110987, 0.311317746110995, 0.066046761667013),
+            (0.162728432016166, 0.162728432016174, 0.511814703951478),
+            (0.220307180915861, 0.220307180915872, 0.339078457252562),
+            (0.271898409127019, 0.27189840912706, 0.184304772618955),
+        ),
+        (
+            0.000440340443919353, 0.000440340443919061, 0.000440340443919117, 0.00115411944191648,
+            0.00115411944191594, 0.00115411944191633, 0.000529628362682954, 0.000529628362683027,
+            0.000529628362682922, 0.000763312417968712, 0.000763312417968606, 0.000763312417968758,
+            0.000203420107255822, 0.000203420107255823, 0.000203420107255852, 0.000143568614027785,
+            0.000143568614027736, 0.000143568614027728, 0.000320549953125458, 0.000320549953125529,
+            0.000320549953125364, 0.000732009583755559, 0.000732009583755433, 0.000732009583755412,
+            0.000177955463843945, 0.000177955463843986, 0.000177955463843896, 0.0004972651138408,
+            0.000497265113841005, 0.000497265113840881, 0.000170476192312178, 0.000170476192312225,
+            0.000170476192312151, 5.09494994612921e-05, 5.09494994613637e-05, 5.09494994612566e-05,
+            0.000357511187619174, 0.000357511187619211, 0.00035751118761923, 0.000606319939491788,
+            0.000606319939491635, 0.000606319939491531, 0.00169121480026986, 0.00169121480027021,
+            0.00169121480026989, 0.000766511792019059, 0.000766511792019115, 0.000766511792019126,
+            0.00182709434857074, 0.00182709434856959, 0.00182709434857017, 0.000748752943390329,
+            0.000748752943390403, 0.000748752943390292, 0.00120393150812177, 0.0012039315081216,
+            0.00120393150812179, 0.000701873874495603, 0.000701873874495599, 0.000701873874495498,
+            0.000143011296422981, 0.000143011296422974, 0.00014301129642299, 0.000977108272962538,
+            0.000977108272962412, 0.000977108272962585, 0.00204945857018569, 0.00204945857018728,
+            0.00204945857018569, 0.000840190499580667, 0.000840190499580766, 0.000840190499580874,
+            0.000782684926528276, 0.000782684926528308, 0.000782684926528382, 0.00190961170899739,
+            0.00190961170899771, 0.00190961170899714, 0.000505360666258975, 0.000505360666259049,
+            0.000505360666259082, 0.00153682940127861, 0.00153682940127828, 0.00153682940127859,
+            0.000678467224432874, 0.000678467224432896, 0.000678467224432773, 0.000247024907094365,
+            0.000247024907094367, 0.0002470249070943, 0.000864969123112684, 0.000864969123112678,
+            0.000864969123112689, 0.00130753467119911, 0.00130753467119902, 0.00130753467119909,
+            0.0018093524420685, 0.00180935244206846, 0.00180935244206857, 0.000298943820676524,
+            0.000298943820676532, 0.000298943820676516, 0.00188921906549155, 0.00188921906549104,
+            0.00188921906549144, 0.00118888697816397, 0.00118888697816412, 0.00118888697816402,
+            0.000504620961499817, 0.000504620961499902, 0.000504620961499782, 0.000188532543511936,
+            0.000188532543511904, 0.000188532543511921, 0.00049216835139694, 0.00049216835139688,
+            0.000492168351396901, 0.000451017608994596, 0.000451017608994599, 0.000451017608994611,
+            0.000420690809360328, 0.000420690809360455, 0.000420690809360514, 0.000649043733846409,
+            0.00064904373384643, 0.00064904373384654, 0.00166800986485301, 0.00166800986485345,
+            0.00166800986485301, 0.00100322614044447, 0.00100322614044429, 0.00100322614044428,
+            0.0013386099794469, 0.00133860997944683, 0.00133860997944706, 0.00163717050770325,
+            0.00163717050770336, 0.00163717050770333, 0.00111070687821185, 0.0011107068782118,
+            0.00111070687821172, 0.00168014151842651, 0.00168014151842651, 0.00168014151842659,
+            0.000712321085625566, 0.000712321085625648, 0.000712321085625632, 0.000480925360648537,
+            0.000480925360648538, 0.00048092536064856, 0.000596139112295176, 0.000596139112295158,
+            0.000596139112295268, 0.00139835819525594, 0.0013983581952561, 0.00139835819525601,
+            0.000704499861267003, 0.000704499861267019, 0.000704499861267009, 0.000630510688763144,
+            0.000630510688763042, 0.000630510688763091, 0.00126775481009071, 0.00126775481009068,
+            0.00126775481009082, 0.00033519883966692, 0.000335198839666853, 0.0003351988396669,
+            0.000507488410074817, 0.000507488410074863, 0.000507488410074817, 0.000417056004570739,
+            0.000417056004570699, 0.000417056004570755, 0.00134546897642314, 0.00134546897642303,
+            0.00134546897642315, 0.00082164627656141, 0.000821646276561408, 0.00082164627656142,
+            0.00011096788435523, 0.000110967884355231, 0.000110967884355218, 0.000187912510080084,
+            0.000187912510080073, 0.000187912510080114, 0.00071808405051488, 0.000718084050514898,
+            0.000718084050514907, 0.000238312025381466, 0.000238312025381285, 0.000238312025381225,
+            0.000265583230932477, 0.000265583230932468, 0.000265583230932468, 9.00385846815515e-05,
+            9.00385846815536e-05, 9.00385846815101e-05, 8.09157802534175e-05, 8.09157802534107e-05,
+            8.09157802533384e-05, 0.000297687496918032, 0.000297687496918059, 0.000297687496918182,
+            0.000376659364138836, 0.000376659364138845, 0.000376659364138982, 0.000258487190138545,
+            0.000258487190138472, 0.000258487190138619, 0.00187471677519958, 0.00240748955310756,
+            0.00156849676594474, 0.00151172217578493,
+        ),
+    ),
+}
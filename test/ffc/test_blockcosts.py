@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"Unit tests for the static cost model choosing block modes"
+
+import ufl
+from ffc.analysis import analyze_ufl_objects
+from ffc.ir.representation import compute_ir
+from ffc.ir.uflacs.blockcosts import (estimate_block_costs, select_block_mode,
+                                      valid_block_modes)
+from ffc.parameters import validate_parameters
+
+
+def test_select_block_mode():
+    # Piecewise factor and arguments, e.g. Laplacian on affine cells
+    ttypes = ("piecewise", "piecewise")
+    modes = valid_block_modes(ttypes, True)
+    assert modes == ("preintegrated", "premultiplied", "partial", "full", "safe")
+    costs = estimate_block_costs(modes, ttypes, (3, 3), 3, 1, "cell")
+    assert select_block_mode(costs) == "preintegrated"
+
+    # Varying factor with arguments constant over the cell
+    modes = valid_block_modes(ttypes, False)
+    costs = estimate_block_costs(modes, ttypes, (3, 3), 3, 1, "cell")
+    assert select_block_mode(costs) == "premultiplied"
+    del costs["premultiplied"]
+    assert select_block_mode(costs) == "partial"
+
+    # Interior facet tables are larger than the block for each facet pair
+    costs = estimate_block_costs(["preintegrated"], ttypes, (3, 3), 2, 3, "interior_facet")
+    assert costs["preintegrated"].table_size == 9 * 9
+
+    # Sum factorisation over the last argument of a Q4 element on
+    # hexahedra, with 6 points in each direction
+    ttypes = ("uniform", "uniform")
+    modes = valid_block_modes(ttypes, False, True)
+    assert modes == ("factorized", "full", "safe")
+    costs = estimate_block_costs(modes, ttypes, (125, 125), 216, 1, "cell", ((6, 5), ) * 3)
+    assert select_block_mode(costs) == "factorized"
+    assert "factorized" not in valid_block_modes(ttypes, False)
+
+    # Derivatives of a P5 element on tetrahedra in collapsed coordinates,
+    # with a change from 125 tensor product polynomials to 56 dofs
+    costs_basis = estimate_block_costs(modes, ttypes, (56, 56), 512, 1, "cell", ((8, 5), ) * 3, (125, 56))
+    assert select_block_mode(costs_basis) == "factorized"
+    costs = estimate_block_costs(modes, ttypes, (56, 56), 512, 1, "cell", ((8, 5), ) * 3)
+    assert costs_basis["factorized"].flops > costs["factorized"].flops
+
+    # No alternative to quadrature mode
+    assert valid_block_modes(("quadrature", "varying"), True) == ("quadrature", )
+
+
+def test_block_mode_costs_in_ir():
+    element = ufl.FiniteElement("Lagrange", ufl.triangle, 2)
+    u, v = ufl.TrialFunction(element), ufl.TestFunction(element)
+    f = ufl.Coefficient(element)
+    a = ufl.inner(ufl.grad(u), ufl.grad(v)) * ufl.dx + f * u * v * ufl.dx
+
+    parameters = validate_parameters(None)
+    analysis = analyze_ufl_objects([a], parameters)
+    ir = compute_ir(analysis, {}, "block_costs", parameters)
+    integral_ir, = ir.integrals
+
+    records = integral_ir.block_mode_costs
+    assert records
+    for record in records:
+        # The cheapest of the estimated modes is chosen
+        costs = record["costs"]
+        cost = {mode: c["flops"] + c["memory"] for mode, c in costs.items()}
+        assert cost[record["block_mode"]] == min(cost.values())
+
+    # Premultiplication is disabled by default
+    modes = set(record["block_mode"] for record in records)
+    assert modes == set(["preintegrated", "full"])
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"Unit tests for element table optimisation"
+
+import functools
+
+import numpy
+
+import ufl
+from ffc.fiatinterface import create_quadrature
+from ffc.ir.uflacs.analysis.modified_terminals import analyse_modified_terminal
+from ffc.ir.uflacs.elementtables import (build_collapsed_factor_tables, build_optimized_tables, build_unique_tables,
+                                         clamp_table_small_numbers, collapsed_line_points, equal_tables,
+                                         get_collapsed_factor_values, get_ffc_table_values,
+                                         get_tensor_factor_values, strip_table_zeros,
+                                         tensor_product_line_points)
+
+
+def pairwise_unique_tables(tables, keys):
+    unique = []
+    mapping = {}
+    for k in keys:
+        for i, u in enumerate(unique):
+            if equal_tables(u, tables[k]):
+                break
+        else:
+            i = len(unique)
+            unique.append(tables[k])
+        mapping[k] = i
+    return unique, mapping
+
+
+def test_build_unique_tables():
+    rng = numpy.random.RandomState(1)
+    base = [rng.uniform(-1.0, 1.0, (2, 3, 4)), rng.uniform(-1.0, 1.0, (1, 3, 4)),
+            numpy.zeros((2, 3, 4)), numpy.ones((1, 3, 4))]
+    tables = {}
+    for k in range(200):
+        t = base[k % len(base)]
+        # Perturbations around the comparison tolerance
+        scale = [0.0, 1e-9, 1e-6, 1e-5, 1e-4][k % 5]
+        tables["t%d" % k] = t + scale * rng.uniform(-1.0, 1.0, t.shape)
+    keys = sorted(tables)
+
+    unique, mapping = build_unique_tables(tables)
+    reference_unique, reference_mapping = pairwise_unique_tables(tables, keys)
+    assert mapping == reference_mapping
+    assert len(unique) == len(reference_unique)
+    assert all(u is r for u, r in zip(unique, reference_unique))
+
+    unique, mapping = build_unique_tables([tables[k] for k in keys])
+    assert [mapping[i] for i in range(len(keys))] == [reference_mapping[k] for k in keys]
+
+
+def test_clamp_table_small_numbers():
+    values = numpy.array([-1.0, -0.5, 0.0, 0.5, 1.0, 0.25, 0.75, 2.0, -2.0])
+    perturbations = numpy.array([0.0, 1e-9, -1e-9, 1e-6, -1e-6, 1e-4])
+    table = (values[:, None] + perturbations[None, :]).reshape(1, 9, 6)
+    expected = table.copy()
+    for n in (-1.0, -0.5, 0.0, 0.5, 1.0):
+        expected[numpy.isclose(expected, n)] = n
+    assert numpy.array_equal(clamp_table_small_numbers(table), expected)
+
+
+def test_strip_table_zeros():
+    table = numpy.zeros((2, 3, 5))
+    table[0, 1, 1] = 1e-9
+    table[1, 2, 2] = 0.5
+    table[0, 0, 4] = -1e-3
+    dofrange, dofmap, stripped = strip_table_zeros(table, True)
+    assert dofrange == (2, 5)
+    assert dofmap == (2, 4)
+    assert numpy.array_equal(stripped, table[..., [2, 4]])
+    dofrange, dofmap, stripped = strip_table_zeros(table, False)
+    assert dofmap == (2, 3, 4)
+    assert strip_table_zeros(numpy.zeros((1, 2, 3)), True)[:2] == ((0, 0), ())
+
+
+def test_tensor_factor_values():
+    points, weights = create_quadrature("hexahedron", 4, "default")
+    line_points = tensor_product_line_points(points)
+    assert [len(x) for x in line_points] == [3, 3, 3]
+    assert tensor_product_line_points(create_quadrature("triangle", 4, "default")[0]) is None
+
+    # Derivative of the second component of a vector element, with
+    # zero columns for the dofs of the other components
+    element = ufl.VectorElement("Q", ufl.hexahedron, 2)
+    derivatives = (0, 1, 0)
+    table = get_ffc_table_values(points, ufl.hexahedron, "cell", element, None, "cell", derivatives, 1)
+    factors = get_tensor_factor_values(line_points, element, derivatives, 1)
+    assert [f.shape for f in factors] == [(3, 3), (3, 3), (3, 3)]
+    assert numpy.allclose(table[0][:, 27:54], functools.reduce(numpy.kron, factors))
+
+    # Not a tensor product of elements on the interval
+    element = ufl.FiniteElement("Lagrange", ufl.triangle, 2)
+    line_points = tensor_product_line_points(create_quadrature("quadrilateral", 2, "default")[0])
+    assert get_tensor_factor_values(line_points, element, (0, 0), 0) is None
+
+
+def test_collapsed_factor_values():
+    # Collapsed Gauss-Jacobi rule for degrees above 6
+    points, weights = create_quadrature("tetrahedron", 8, "default")
+    line_points = collapsed_line_points(points)
+    assert [len(x) for x in line_points] == [5, 5, 5]
+    assert collapsed_line_points(create_quadrature("tetrahedron", 4, "default")[0]) is None
+
+    # Derivatives of a cubic element are quadratic in each collapsed coordinate
+    factors = get_collapsed_factor_values(line_points, 2)
+    assert [f.shape for f in factors] == [(5, 3), (5, 3), (5, 3)]
+
+    # The factor tables and the change of basis reproduce the element table
+    element = ufl.FiniteElement("Lagrange", ufl.tetrahedron, 3)
+    f = ufl.classes.ReferenceValue(ufl.Coefficient(element))
+    mt = analyse_modified_terminal(ufl.classes.ReferenceGrad(f)[1])
+    num_points = len(weights)
+    unique_tables, unique_table_types, unique_table_num_dofs, mt_unique_table_reference = build_optimized_tables(
+        num_points, {num_points: (points, weights)}, ufl.tetrahedron, "cell", "cell", [mt], {}, False)
+    factor_tables, tensor_factors, tensor_bases = build_collapsed_factor_tables(
+        num_points, line_points, [mt], mt_unique_table_reference, unique_tables)
+    name = mt_unique_table_reference[mt].name
+    assert [factor_tables[t].shape for t in tensor_factors[name]] == [(5, 3), (5, 3), (5, 3)]
+    assert factor_tables[tensor_bases[name]].shape == (27, 20)
+    product = functools.reduce(numpy.kron, [factor_tables[t] for t in tensor_factors[name]])
+    assert numpy.allclose(numpy.dot(product, factor_tables[tensor_bases[name]]), unique_tables[name][0])
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"Unit tests for the persistent cache of uflacs IR"
+
+import os
+
+import pytest
+
+import ufl
+from ffc.compiler import compile_ufl_objects
+
+
+def test_ir_cache(tmpdir):
+    element = ufl.FiniteElement("Lagrange", ufl.triangle, 2)
+    u, v = ufl.TrialFunction(element), ufl.TestFunction(element)
+    f = ufl.Coefficient(element)
+    n = ufl.FacetNormal(ufl.triangle)
+    a = ufl.exp(f) * ufl.inner(ufl.grad(u), ufl.grad(v)) * ufl.dx + f * u * v * ufl.inner(n, n) * ufl.ds
+    L = ufl.conditional(ufl.lt(f, 0.5), f**2, ufl.sqrt(f)) * v * ufl.dx
+
+    cache_dir = str(tmpdir)
+    cache_files = os.path.join(cache_dir, "uflacs_ir")
+    for parameters in [{"tensor_init_mode": "upfront"}, {"tensor_init_mode": "direct"}]:
+        expected = compile_ufl_objects([a, L], prefix="ir_cache", parameters=parameters)
+        cached_parameters = dict(parameters, ir_cache_dir=cache_dir)
+
+        # Build and store the IR
+        code = compile_ufl_objects([a, L], prefix="ir_cache", parameters=cached_parameters)
+        assert code == expected
+        assert len(os.listdir(cache_files)) == 3
+
+        # Load the IR
+        code = compile_ufl_objects([a, L], prefix="ir_cache", parameters=cached_parameters)
+        assert code == expected
+
+    # Parameters used in building the IR give new cache entries
+    compile_ufl_objects([a, L], prefix="ir_cache", parameters={"ir_cache_dir": cache_dir, "table_rtol": 1e-4})
+    assert len(os.listdir(cache_files)) == 6
+
+
+@pytest.mark.parametrize("family,cell,degree", [("Q", ufl.quadrilateral, 3), ("P", ufl.triangle, 5)])
+def test_ir_cache_tensor_factors(tmpdir, family, cell, degree):
+    element = ufl.FiniteElement(family, cell, degree)
+    u, v = ufl.TrialFunction(element), ufl.TestFunction(element)
+    f = ufl.Coefficient(element)
+    a = (1 + f**2) * ufl.inner(ufl.grad(u), ufl.grad(v)) * ufl.dx
+
+    parameters = {"enable_tensor_factorization": True}
+    expected = compile_ufl_objects([a], prefix="ir_cache", parameters=parameters)
+    assert "block mode: factorized" in expected[1]
+
+    cached_parameters = dict(parameters, ir_cache_dir=str(tmpdir))
+    for i in range(2):
+        code = compile_ufl_objects([a], prefix="ir_cache", parameters=cached_parameters)
+        assert code == expected
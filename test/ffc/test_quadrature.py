@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"Unit tests for quadrature schemes"
+
+import itertools
+import math
+
+import numpy
+import pytest
+
+import ufl
+from ffc.analysis import analyze_ufl_objects
+from ffc.fiatinterface import create_quadrature
+from ffc.parameters import validate_parameters
+from ffc.xg_quadrature import tetrahedron_table, triangle_table
+
+
+def monomial_integral(exponents):
+    """Exact integral of prod(x_i**a_i) over the UFC reference simplex."""
+    numerator = 1
+    for a in exponents:
+        numerator *= math.factorial(a)
+    return numerator / math.factorial(sum(exponents) + len(exponents))
+
+
+def monomial_exponents(dim, degree):
+    return [a for a in itertools.product(range(degree + 1), repeat=dim) if sum(a) <= degree]
+
+
+@pytest.mark.parametrize("cellname,table", [("triangle", triangle_table),
+                                            ("tetrahedron", tetrahedron_table)])
+def test_symmetric_quadrature_exactness(cellname, table):
+    dim = {"triangle": 2, "tetrahedron": 3}[cellname]
+    for degree in sorted(table):
+        points, weights = create_quadrature(cellname, degree, "symmetric")
+        assert points.shape == (len(weights), dim)
+        assert all(weights > 0.0)
+        assert numpy.all(points > 0.0) and numpy.all(points.sum(axis=1) < 1.0)
+        for a in monomial_exponents(dim, degree):
+            approx = numpy.dot(weights, numpy.prod(points**numpy.array(a), axis=1))
+            assert numpy.isclose(approx, monomial_integral(a), rtol=1e-12, atol=1e-14)
+
+
+@pytest.mark.parametrize("cellname,degree", [("triangle", 10), ("tetrahedron", 8)])
+def test_symmetric_quadrature_fewer_points(cellname, degree):
+    points, weights = create_quadrature(cellname, degree, "symmetric")
+    default_points, default_weights = create_quadrature(cellname, degree, "default")
+    assert len(weights) < len(default_weights)
+
+
+@pytest.mark.parametrize("cellname,degree", [("interval", 4), ("quadrilateral", 3),
+                                             ("hexahedron", 2), ("triangle", 40)])
+def test_symmetric_quadrature_fallback(cellname, degree):
+    points, weights = create_quadrature(cellname, degree, "symmetric")
+    default_points, default_weights = create_quadrature(cellname, degree, "default")
+    assert numpy.allclose(points, default_points)
+    assert numpy.allclose(weights, default_weights)
+
+
+@pytest.mark.parametrize("cellname,dim", [("interval", 1), ("quadrilateral", 2), ("hexahedron", 3)])
+def test_gll_quadrature(cellname, dim):
+    for degree in range(0, 8):
+        points, weights = create_quadrature(cellname, degree, "GLL")
+        m = round(len(weights)**(1.0 / dim))
+        assert len(weights) == m**dim
+        assert 2 * m - 3 >= degree
+        # Vertices of the cell are included
+        for vertex in itertools.product([0.0, 1.0], repeat=dim):
+            assert numpy.any(numpy.all(numpy.isclose(points, vertex), axis=1))
+        for a in itertools.product(range(degree + 1), repeat=dim):
+            approx = numpy.dot(weights, numpy.prod(points**numpy.array(a), axis=1))
+            exact = numpy.prod([1.0 / (ai + 1) for ai in a])
+            assert numpy.isclose(approx, exact)
+
+
+def test_gll_quadrature_simplex():
+    with pytest.raises(RuntimeError):
+        create_quadrature("triangle", 2, "GLL")
+
+
+@pytest.mark.parametrize("max_points", [None, 100, 20, 5])
+def test_max_quadrature_points(max_points):
+    element = ufl.FiniteElement("Lagrange", ufl.triangle, 2)
+    v = ufl.TestFunction(element)
+    f = ufl.Coefficient(element)
+    parameters = validate_parameters({"max_quadrature_points": max_points})
+    form_data = analyze_ufl_objects([f**3 * v * ufl.dx], parameters).form_data[0]
+    integral_data, = form_data.integral_data
+    integral, = integral_data.integrals
+    degree = integral.metadata()["quadrature_degree"]
+    assert integral_data.metadata["quadrature_degree"] == degree
+    if max_points is None or max_points == 100:
+        assert degree == 8
+        assert "estimated_quadrature_degree" not in integral.metadata()
+    else:
+        # Highest degree within the budget
+        assert degree < 8
+        assert integral.metadata()["estimated_quadrature_degree"] == 8
+        assert len(create_quadrature("triangle", degree, "default")[1]) <= max_points
+        assert len(create_quadrature("triangle", degree + 1, "default")[1]) > max_points
+
+
+def test_max_quadrature_points_metadata():
+    element = ufl.FiniteElement("Lagrange", ufl.triangle, 2)
+    v = ufl.TestFunction(element)
+    f = ufl.Coefficient(element)
+    dx = ufl.dx(metadata={"max_quadrature_points": 5})
+    parameters = validate_parameters(None)
+    with pytest.warns(UserWarning):
+        form_data = analyze_ufl_objects([f**3 * v * dx], parameters).form_data[0]
+    integral, = form_data.integral_data[0].integrals
+    assert integral.metadata()["estimated_quadrature_degree"] == 8
+    assert len(create_quadrature("triangle", integral.metadata()["quadrature_degree"], "default")[1]) <= 5
+
+
+def test_split_quadrature_degrees_non_affine():
+    # The lowered terms have higher estimated degrees than the integral
+    mesh = ufl.Mesh(ufl.VectorElement("Lagrange", ufl.triangle, 2))
+    V = ufl.FunctionSpace(mesh, ufl.FiniteElement("Lagrange", ufl.triangle, 2))
+    u, v = ufl.TrialFunction(V), ufl.TestFunction(V)
+    f = ufl.Coefficient(V)
+    a = (ufl.inner(ufl.grad(u), ufl.grad(v)) + f**2 * u * v) * ufl.dx
+    parameters = validate_parameters({"split_quadrature_degrees": True})
+    integral_data, = analyze_ufl_objects([a], parameters).form_data[0].integral_data
+    qd = integral_data.metadata["quadrature_degree"]
+    assert all(integral.metadata()["quadrature_degree"] <= qd for integral in integral_data.integrals)
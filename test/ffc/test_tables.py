@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"Unit tests for static tables shared by the kernels of a module"
+
+import re
+
+import ufl
+from ffc.compiler import compile_ufl_objects
+
+
+def test_shared_tables():
+    element = ufl.FiniteElement("Lagrange", ufl.triangle, 2)
+    u, v = ufl.TrialFunction(element), ufl.TestFunction(element)
+    f = ufl.Coefficient(element)
+    a = f * ufl.inner(u, v) * ufl.dx + f * ufl.inner(u, v) * ufl.dx(1)
+    L = f * v * ufl.dx(1) + f * v * ufl.dx(2)
+    code_h, code_c = compile_ufl_objects([a, L], prefix="shared_tables")
+
+    # Each table is declared once, at file scope
+    declarations = re.findall(r"^(\s*)(?:alignas\(\d+\) )?static const ufc_scalar_t (FE\w+)\[", code_c, re.M)
+    names = [name for indent, name in declarations]
+    assert names
+    assert len(names) == len(set(names))
+    assert all(indent == "" for indent, name in declarations)
+
+    # The kernels refer to the shared tables
+    kernels = code_c.split("void tabulate_tensor")[1:]
+    assert len(kernels) == 4
+    for kernel in kernels:
+        assert any(name in kernel for name in names)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019 FEniCS Project
+#
+# This file is part of FFC (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    LGPL-3.0-or-later
+"Unit tests for autotuning of uflacs parameters"
+
+import json
+
+import ufl
+from ffc.analysis import analyze_ufl_objects
+from ffc.codegeneration.autotune import autotune_forms
+from ffc.ir.representation import compute_ir
+from ffc.ir.uflacs.tuningdb import host_cpu_model, load_tuning_db, store_tuned_parameters
+from ffc.parameters import validate_parameters
+
+
+def test_autotune(tmpdir):
+    element = ufl.FiniteElement("Lagrange", ufl.triangle, 1)
+    u, v = ufl.TrialFunction(element), ufl.TestFunction(element)
+    a = ufl.inner(ufl.grad(u), ufl.grad(v)) * ufl.dx + u * v * ufl.ds
+
+    tuning_db = str(tmpdir.join("tuning.json"))
+    parameters = validate_parameters({"tuning_db": tuning_db, "cache_dir": str(tmpdir.join("cache"))})
+    variants = [{}, {"enable_preintegration": False}]
+    autotune_forms([a], parameters, variants=variants, num_calls=10)
+
+    # The fastest variant of each integral is stored for this host
+    with open(tuning_db) as f:
+        entries = json.load(f)[host_cpu_model()]
+    assert len(entries) == 2
+    for entry in entries.values():
+        assert entry["parameters"] in variants
+        assert entry["time"] > 0
+
+    # and used in later compilations
+    ir = compute_ir(analyze_ufl_objects([a], parameters), {}, "JIT", parameters)
+    for integral_ir in ir.integrals:
+        entry = entries[integral_ir.tuning_signature]
+        enabled = entry["parameters"].get("enable_preintegration", True)
+        assert integral_ir.params["enable_preintegration"] == enabled
+
+
+def test_tuning_db_reload(tmpdir):
+    tuning_db = str(tmpdir.join("tuning.json"))
+    assert load_tuning_db(tuning_db) == {}
+
+    # The database is parsed once, and again after it has been changed
+    store_tuned_parameters(tuning_db, {"a": ({"vectorize": True}, 1.0)})
+    entries = load_tuning_db(tuning_db)
+    assert set(entries) == {"a"}
+    assert load_tuning_db(tuning_db) is entries
+    store_tuned_parameters(tuning_db, {"b": ({"vectorize": False}, 2.0)})
+    assert set(load_tuning_db(tuning_db)) == {"a", "b"}
@@ -9,7 +9,11 @@ import numpy as np
 import pytest
 import cffi
 
+import ffc.analysis
 import ffc.codegeneration.jit
+import ffc.compiler
+import ffc.fiatinterface
+import ffc.parameters
 import ufl
 
 
@@ -29,6 +33,54 @@ def float_to_type(name):
         raise RuntimeError("Unknown C type for: {}".format(name))
 
 
+def _cell_data(form, seed=0):
+    """Return the coordinate dofs of a perturbed reference cell and random
+    coefficient values for the cell integrals of form."""
+    rng = np.random.RandomState(seed)
+    coordinate_element = form.ufl_domain().ufl_coordinate_element().sub_elements()[0]
+    dual_basis = ffc.fiatinterface.create_element(coordinate_element).dual_basis()
+    points = np.array([next(iter(f.get_point_dict())) for f in dual_basis])
+    coords = (points + 0.05 * rng.rand(*points.shape)).flatten()
+    w = rng.rand(sum(ffc.fiatinterface.create_element(c.ufl_element()).space_dimension()
+                     for c in form.coefficients()))
+    return coords, w
+
+
+def _cell_integrals(forms, parameters=None):
+    """Compile forms and return the cell integral of each."""
+    compiled_forms, module = ffc.codegeneration.jit.compile_forms(forms, parameters=parameters)
+    return [compiled_form[0].create_cell_integral(-1) for compiled_form in compiled_forms]
+
+
+def _tabulate_cell(integral, form, coords, w, scalar_type="double"):
+    """Return the element tensor of the cell integral of form."""
+    c_type, np_type = float_to_type(scalar_type)
+    shape = tuple(ffc.fiatinterface.create_element(a.ufl_element()).space_dimension()
+                  for a in form.arguments())
+    A = np.zeros(shape, dtype=np_type)
+    w = w.astype(np_type)
+    ffi = cffi.FFI()
+    integral.tabulate_tensor(
+        ffi.cast('{type} *'.format(type=c_type), A.ctypes.data),
+        ffi.cast('{type} *'.format(type=c_type), w.ctypes.data),
+        ffi.cast('double *', coords.ctypes.data), 0)
+    return A
+
+
+def _tabulate_cells(forms, parameters=None):
+    """Return the element tensors of the cell integrals of forms compiled
+    with parameters, on a perturbed reference cell with random
+    coefficients."""
+    integrals = _cell_integrals(forms, parameters)
+    return [_tabulate_cell(integral, form, *_cell_data(form)) for integral, form in zip(integrals, forms)]
+
+
+def _generated_code(forms, parameters=None):
+    """Return the C code generated for forms compiled with parameters."""
+    code_h, code_c = ffc.compiler.compile_ufl_objects(forms, prefix="cffi_test", parameters=parameters)
+    return code_c
+
+
 @pytest.fixture(scope="module")
 def lagrange_element():
     """Compile list of Lagrange elements"""
@@ -288,6 +340,135 @@ def test_form_coefficient():
     assert np.isclose(A_diff.min(), 0.0)
 
 
+@pytest.mark.parametrize("degree", [1, 2])
+def test_gll_lumped_mass_quadrilateral(degree):
+    cell = ufl.quadrilateral
+    element = ufl.FiniteElement("Q", cell, degree)
+    u, v = ufl.TrialFunction(element), ufl.TestFunction(element)
+    g = ufl.Coefficient(element)
+    dx_gll = ufl.dx(scheme="GLL", degree=2 * degree - 1)
+    a0 = ufl.inner(u, v) * dx_gll
+    a1 = g * ufl.inner(u, v) * dx_gll
+    L = ufl.conj(v) * ufl.dx
+    forms = [a0, a1, L]
+    compiled_forms, module = ffc.codegeneration.jit.compile_forms(forms)
+
+    ffi = cffi.FFI()
+    ndofs = (degree + 1)**2
+    w = np.ones(ndofs, dtype=np.float64)
+    coords = np.array([0.0, 0.0, 0.5, 1.0, 2.0, 0.0, 2.5, 1.0], dtype=np.float64)
+    tensors = []
+    for compiled_f, shape in zip(compiled_forms, [(ndofs, ndofs), (ndofs, ndofs), (ndofs, )]):
+        A = np.zeros(shape, dtype=np.float64)
+        compiled_f[0].create_cell_integral(-1).tabulate_tensor(
+            ffi.cast('double *', A.ctypes.data), ffi.cast('double *', w.ctypes.data),
+            ffi.cast('double *', coords.ctypes.data), 0)
+        tensors.append(A)
+    A0, A1, b = tensors
+
+    # Lumped mass matrix, with the integrals of the basis functions on the diagonal
+    assert np.allclose(A0, np.diag(np.diag(A0)))
+    assert np.allclose(np.diag(A0), b)
+    assert np.allclose(A1, A0)
+
+
+def test_split_quadrature_degrees():
+    cell = ufl.triangle
+    element = ufl.FiniteElement("Lagrange", cell, 2)
+    u, v = ufl.TrialFunction(element), ufl.TestFunction(element)
+    f = ufl.Coefficient(element)
+    a = (ufl.inner(ufl.grad(u), ufl.grad(v)) + f**4 * u * v) * ufl.dx
+    L = (f**3 + f + 1.0) * v * ufl.dx
+    # Split into degrees 3, 4 and 6, where the default rules of degree 3
+    # and 4 differ but both have 6 points
+    c = (1 + f**2) * ufl.inner(ufl.grad(u), ufl.grad(v)) * ufl.dx + u.dx(0) * v * ufl.dx
+    forms = [a, L, c]
+
+    ffi = cffi.FFI()
+    w = np.array([0.5, 1.0, 2.0, 0.1, 0.2, 0.3], dtype=np.float64)
+    coords = np.array([0.0, 0.0, 2.0, 0.0, 0.5, 1.0], dtype=np.float64)
+    tensors = {}
+    for split in (False, True):
+        compiled_forms, module = ffc.codegeneration.jit.compile_forms(
+            forms, parameters={"split_quadrature_degrees": split})
+        for i, shape in enumerate([(6, 6), (6, ), (6, 6)]):
+            A = np.zeros(shape, dtype=np.float64)
+            compiled_forms[i][0].create_cell_integral(-1).tabulate_tensor(
+                ffi.cast('double *', A.ctypes.data), ffi.cast('double *', w.ctypes.data),
+                ffi.cast('double *', coords.ctypes.data), 0)
+            tensors[(split, i)] = A
+
+    for i in range(len(forms)):
+        assert np.allclose(tensors[(True, i)], tensors[(False, i)])
+
+    # Terms are integrated with separate rules, none above the degree
+    # of the unsplit integral
+    for split in (False, True):
+        parameters = ffc.parameters.validate_parameters({"split_quadrature_degrees": split})
+        for form in forms:
+            form_data = ffc.analysis.analyze_ufl_objects([form], parameters).form_data[0]
+            integral_data, = form_data.integral_data
+            degrees = [integral.metadata()["quadrature_degree"] for integral in integral_data.integrals]
+            assert max(degrees) == integral_data.metadata["quadrature_degree"]
+            assert (len(set(degrees)) > 1) == split
+    assert sorted(degrees) == [3, 4, 6]
+    points3, weights3 = ffc.fiatinterface.create_quadrature("triangle", 3, "default")
+    points4, weights4 = ffc.fiatinterface.create_quadrature("triangle", 4, "default")
+    assert len(weights3) == len(weights4) and not np.allclose(points3, points4)
+
+
+def test_facet_normal_exterior_facet():
+    cell = ufl.triangle
+    element = ufl.FiniteElement("Lagrange", cell, 1)
+    v = ufl.TestFunction(element)
+    g = ufl.Coefficient(element)
+    n = ufl.FacetNormal(cell)
+    L0 = n[0] * v * ufl.ds
+    L1 = g * n[0] * v * ufl.ds
+    compiled_forms, module = ffc.codegeneration.jit.compile_forms([L0, L1])
+
+    ffi = cffi.FFI()
+    w = np.ones(3, dtype=np.float64)
+    coords = np.array([0.0, 0.0, 1.0, 0.0, 0.0, 1.0], dtype=np.float64)
+    expected = {0: [0.0, 0.5, 0.5], 1: [-0.5, 0.0, -0.5], 2: [0.0, 0.0, 0.0]}
+    for compiled_f in compiled_forms:
+        integral = compiled_f[0].create_exterior_facet_integral(-1)
+        for facet in range(3):
+            b = np.zeros(3, dtype=np.float64)
+            integral.tabulate_tensor(
+                ffi.cast('double *', b.ctypes.data), ffi.cast('double *', w.ctypes.data),
+                ffi.cast('double *', coords.ctypes.data), facet, 0)
+            assert np.allclose(b, expected[facet])
+
+
+def test_preintegrated_functional():
+    cell = ufl.triangle
+    element = ufl.FiniteElement("DG", cell, 0)
+    f = ufl.Coefficient(element)
+    M = f * f * ufl.dx(metadata={"quadrature_degree": 4}) + f * ufl.ds
+    compiled_forms, module = ffc.codegeneration.jit.compile_forms([M])
+
+    ffi = cffi.FFI()
+    w = np.array([2.0], dtype=np.float64)
+    coords = np.array([0.0, 0.0, 1.0, 0.0, 0.0, 1.0], dtype=np.float64)
+
+    A = np.zeros(1, dtype=np.float64)
+    integral = compiled_forms[0][0].create_cell_integral(-1)
+    integral.tabulate_tensor(
+        ffi.cast('double *', A.ctypes.data), ffi.cast('double *', w.ctypes.data),
+        ffi.cast('double *', coords.ctypes.data), 0)
+    assert np.isclose(A[0], 2.0)
+
+    expected = [2.0 * np.sqrt(2.0), 2.0, 2.0]
+    integral = compiled_forms[0][0].create_exterior_facet_integral(-1)
+    for facet in range(3):
+        A = np.zeros(1, dtype=np.float64)
+        integral.tabulate_tensor(
+            ffi.cast('double *', A.ctypes.data), ffi.cast('double *', w.ctypes.data),
+            ffi.cast('double *', coords.ctypes.data), facet, 0)
+        assert np.isclose(A[0], expected[facet])
+
+
 def test_subdomains():
     cell = ufl.triangle
     element = ufl.FiniteElement("Lagrange", cell, 1)
@@ -378,3 +559,213 @@ def test_conditional(mode):
 
     expected_result = np.ones(3, dtype=np_type)
     assert np.allclose(A2, expected_result)
+
+
+def test_tabulate_tensor_batch():
+    cell = ufl.triangle
+    element = ufl.FiniteElement("Lagrange", cell, 2)
+    u, v = ufl.TrialFunction(element), ufl.TestFunction(element)
+    f = ufl.Coefficient(element)
+    a = (1 + f**2) * ufl.inner(ufl.grad(u), ufl.grad(v)) * ufl.dx
+    integral, = _cell_integrals([a], {"batch_width": 4})
+
+    # Number of cells not divisible by the batch width
+    num_cells = 7
+    coords, w = zip(*[_cell_data(a, seed) for seed in range(num_cells)])
+    A = [_tabulate_cell(integral, a, *data).flatten() for data in zip(coords, w)]
+
+    # Batched arguments are stored with the cell index innermost
+    ffi = cffi.FFI()
+    A_batch = np.zeros((36, num_cells), dtype=np.float64)
+    w_batch = np.ascontiguousarray(np.transpose(w))
+    coords_batch = np.ascontiguousarray(np.transpose(coords))
+    integral.tabulate_tensor_batch(
+        ffi.cast('double *', A_batch.ctypes.data), ffi.cast('double *', w_batch.ctypes.data),
+        ffi.cast('double *', coords_batch.ctypes.data), ffi.NULL, num_cells)
+    assert np.allclose(A_batch.T, A)
+
+    # Not generated unless requested
+    integral, = _cell_integrals([a])
+    assert integral.tabulate_tensor_batch == ffi.NULL
+
+
+@pytest.mark.parametrize("use_symbol_array", [True, False])
+def test_vectorize_points(use_symbol_array):
+    cell = ufl.quadrilateral
+    element = ufl.FiniteElement("Q", cell, 2)
+    u, v = ufl.TrialFunction(element), ufl.TestFunction(element)
+    f = ufl.Coefficient(element)
+    a = (1 + f**2) * ufl.inner(ufl.grad(u), ufl.grad(v)) * ufl.dx
+
+    # 36 quadrature points padded to 40
+    parameters = {"use_symbol_array": use_symbol_array}
+    vectorized_parameters = dict(parameters, vectorize_points=8)
+    A, = _tabulate_cells([a], parameters)
+    A_vectorized, = _tabulate_cells([a], vectorized_parameters)
+    assert np.allclose(A_vectorized, A)
+
+    comment = "Quadrature loop vectorised over 36 points padded to 40"
+    assert comment not in _generated_code([a], parameters)
+    assert comment in _generated_code([a], vectorized_parameters)
+
+
+def test_small_gemm():
+    cell = ufl.triangle
+    element = ufl.FiniteElement("P", cell, 3)
+    element1 = ufl.FiniteElement("P", cell, 1)
+    u, v = ufl.TrialFunction(element), ufl.TestFunction(element)
+    u1 = ufl.TrialFunction(element1)
+    f = ufl.Coefficient(element)
+    # Blocks in "full" mode of rank 2 and 1, and in "partial" mode
+    a = (1 + f**2) * ufl.inner(ufl.grad(u), ufl.grad(v)) * ufl.dx
+    L = f**2 * v * ufl.dx
+    b = f * u1.dx(0) * v * ufl.dx
+
+    tensors = _tabulate_cells([a, L, b])
+    for A, A_gemm in zip(tensors, _tabulate_cells([a, L, b], {"gemm_block_points": 5})):
+        assert np.allclose(A_gemm, A)
+
+    # Points in blocks of 5, with a last block of 1 point for a and of 2
+    # points for b
+    assert "matrix product over points" not in _generated_code([a, L, b])
+    for form, num_points, block_mode in [(a, 36, "full"), (L, 25, "full"), (b, 12, "partial")]:
+        code = _generated_code([form], {"gemm_block_points": 5})
+        assert "Quadrature loop vectorised over {} points\n".format(num_points) in code
+        assert "UFLACS block mode: {}, matrix product over points".format(block_mode) in code
+
+
+def test_preintegrated_loops():
+    cell = ufl.triangle
+    element = ufl.VectorElement("P", cell, 2)
+    u, v = ufl.TrialFunction(element), ufl.TestFunction(element)
+    c = ufl.Constant(cell)
+    # Preintegrated blocks with transposed tables
+    a = c * ufl.inner(ufl.grad(u) + ufl.grad(u).T, ufl.grad(v)) * ufl.dx + ufl.div(u) * ufl.div(v) * ufl.dx
+
+    A, = _tabulate_cells([a], {"max_unrolled_block_size": 128})
+    A_loops, = _tabulate_cells([a], {"max_unrolled_block_size": 0})
+    assert np.allclose(A_loops, A)
+
+    # Unrolled blocks inline the preintegrated tables, blocks in loops
+    # index them
+    assert "PI0" not in _generated_code([a], {"max_unrolled_block_size": 128})
+    assert "* PI0[0][i][j];" in _generated_code([a], {"max_unrolled_block_size": 0})
+
+
+@pytest.mark.parametrize("domain,degree", [(ufl.hexahedron, 2),
+                                           (ufl.Mesh(ufl.VectorElement("Lagrange", ufl.triangle, 2)), 5)])
+def test_tensor_factorization(domain, degree):
+    # On simplices the factors are tabulated in collapsed coordinates;
+    # quadratic geometry makes the Jacobian vary over the points
+    element = ufl.FiniteElement("Lagrange", ufl.as_domain(domain).ufl_cell(), degree)
+    u, v = ufl.TrialFunction(element), ufl.TestFunction(element)
+    f = ufl.Coefficient(element)
+    dx = ufl.dx(domain=domain)
+    a = (1 + f**2) * ufl.inner(ufl.grad(u), ufl.grad(v)) * dx
+    L = f**3 * v * dx + ufl.inner(ufl.grad(f), ufl.grad(v)) * dx
+
+    tensors = _tabulate_cells([a, L])
+    for A, A_factorized in zip(tensors, _tabulate_cells([a, L], {"enable_tensor_factorization": True})):
+        assert np.allclose(A_factorized, A)
+
+
+def test_symmetry():
+    cell = ufl.triangle
+    element = ufl.VectorElement("P", cell, 2)
+    u, v = ufl.TrialFunction(element), ufl.TestFunction(element)
+    f = ufl.Coefficient(ufl.FiniteElement("P", cell, 1))
+    # Symmetric blocks of the divergence term, and blocks mirrored by
+    # swapping the arguments of the symmetric gradient term
+    a = (1 + f**2) * (ufl.inner(ufl.sym(ufl.grad(u)), ufl.sym(ufl.grad(v))) + ufl.div(u) * ufl.div(v)) * ufl.dx
+    b = ufl.inner(ufl.grad(u), ufl.grad(v)) * ufl.dx + u[0].dx(1) * v[0] * ufl.dx
+
+    integral, integral_b = _cell_integrals([a, b], {"enable_symmetry": True})
+    assert integral.symmetric
+    assert not integral_b.symmetric
+    A, = _tabulate_cells([a], {"enable_symmetry": False})
+    A_symmetric = _tabulate_cell(integral, a, *_cell_data(a))
+    assert np.allclose(A_symmetric, A)
+    assert np.allclose(A_symmetric, A_symmetric.T)
+
+
+@pytest.mark.parametrize("degree,residual", [
+    (2, lambda u, v, f: (1 + u**2) * ufl.inner(ufl.grad(u), ufl.grad(v)) * ufl.dx - f * v * ufl.dx),
+    # The Jacobian has degree 3 and the residual degree 4, with different
+    # default rules of 6 points
+    (1, lambda u, v, f: 0.5 * u**2 * v * ufl.dx + f**3 * v * ufl.dx)])
+def test_tabulate_tensor_fused(degree, residual):
+    cell = ufl.triangle
+    element = ufl.FiniteElement("Lagrange", cell, degree)
+    # The load comes first in the coefficients of the residual and is
+    # not used by the Jacobian
+    f = ufl.Coefficient(ufl.FiniteElement("Lagrange", cell, 1))
+    v = ufl.TestFunction(element)
+    u = ufl.Coefficient(element)
+    F = residual(u, v, f)
+    J = ufl.derivative(F, u)
+    assert F.coefficients() == (f, u)
+
+    ffi = cffi.FFI()
+    coords, w = _cell_data(F)
+    J_integral, F_integral = _cell_integrals([J, F])
+    assert J_integral.tabulate_tensor_fused == ffi.NULL
+    A = _tabulate_cell(J_integral, J, coords, w[3:])
+    b = _tabulate_cell(F_integral, F, coords, w)
+
+    # The Jacobian kernel takes the coefficients of the residual
+    integral, F_integral = _cell_integrals([J, F], {"fuse_forms": True})
+    A_fused = np.zeros_like(A)
+    b_fused = np.zeros_like(b)
+    integral.tabulate_tensor_fused(
+        ffi.cast('double *', A_fused.ctypes.data), ffi.cast('double *', b_fused.ctypes.data),
+        ffi.cast('double *', w.ctypes.data), ffi.cast('double *', coords.ctypes.data), 0)
+    assert np.allclose(A_fused, A)
+    assert np.allclose(b_fused, b)
+    assert F_integral.tabulate_tensor_fused == ffi.NULL
+
+
+@pytest.mark.parametrize("cell,parameters", [(ufl.triangle, {}),
+                                             (ufl.quadrilateral, {"enable_tensor_factorization": True})])
+def test_tabulate_action(cell, parameters):
+    element = ufl.FiniteElement("Lagrange", cell, 2)
+    u, v = ufl.TrialFunction(element), ufl.TestFunction(element)
+    f = ufl.Coefficient(element)
+    a = (1 + f**2) * ufl.inner(ufl.grad(u), ufl.grad(v)) * ufl.dx + u * v * ufl.dx
+
+    ffi = cffi.FFI()
+    coords, w = _cell_data(a)
+    integral, = _cell_integrals([a], parameters)
+    assert integral.tabulate_action == ffi.NULL
+    A = _tabulate_cell(integral, a, coords, w)
+
+    integral, = _cell_integrals([a], dict(parameters, generate_action=True))
+    x = np.random.RandomState(1).rand(A.shape[1])
+    y = np.zeros(A.shape[0], dtype=np.float64)
+    integral.tabulate_action(
+        ffi.cast('double *', y.ctypes.data), ffi.cast('double *', x.ctypes.data),
+        ffi.cast('double *', w.ctypes.data), ffi.cast('double *', coords.ctypes.data), 0)
+    assert np.allclose(y, A.dot(x))
+
+
+@pytest.mark.parametrize("mode", ["double", "double complex"])
+def test_tabulate_diagonal(mode):
+    element = ufl.VectorElement("Lagrange", ufl.triangle, 2)
+    u, v = ufl.TrialFunction(element), ufl.TestFunction(element)
+    f = ufl.Coefficient(ufl.FiniteElement("Lagrange", ufl.triangle, 1))
+    a = f * ufl.inner(ufl.grad(u), ufl.grad(v)) * ufl.dx + ufl.inner(u, v) * ufl.dx
+
+    ffi = cffi.FFI()
+    c_type, np_type = float_to_type(mode)
+    coords, w = _cell_data(a)
+    integral, = _cell_integrals([a], {'scalar_type': mode})
+    assert integral.tabulate_diagonal == ffi.NULL
+    A = _tabulate_cell(integral, a, coords, w, mode)
+
+    integral, = _cell_integrals([a], {'scalar_type': mode, 'generate_diagonal': True})
+    w = w.astype(np_type)
+    d = np.zeros(12, dtype=np_type)
+    integral.tabulate_diagonal(
+        ffi.cast('{type} *'.format(type=c_type), d.ctypes.data),
+        ffi.cast('{type} *'.format(type=c_type), w.ctypes.data),
+        ffi.cast('double *', coords.ctypes.data), 0)
+    assert np.allclose(d, np.diag(A))